@@ -80,23 +80,23 @@ UPCALL_ID(PyDict_Next);
 int _PyDict_Next(PyObject *d, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue, Py_hash_t *phash) {
     PyObject *tresult = UPCALL_CEXT_O(_jls_PyDict_Next, native_to_java(d), *ppos);
     if (tresult == NULL) {
-    	if(pkey != NULL) {
-    		*pkey = NULL;
-    	}
-    	if(pvalue != NULL) {
-    		*pvalue = NULL;
-    	}
-    	return 0;
+        if(pkey != NULL) {
+            *pkey = NULL;
+        }
+        if(pvalue != NULL) {
+            *pvalue = NULL;
+        }
+        return 0;
     }
-    (*ppos)++;
+    *ppos = PyLong_AsSsize_t(PyTuple_GetItem(tresult, 3));
     if (pkey != NULL) {
-    	*pkey = PyTuple_GetItem(tresult, 0);
+        *pkey = PyTuple_GetItem(tresult, 0);
     }
     if (pvalue != NULL) {
-    	*pvalue = PyTuple_GetItem(tresult, 1);
+        *pvalue = PyTuple_GetItem(tresult, 1);
     }
     if (phash != NULL) {
-    	*phash = PyTuple_GetItem(tresult, 2);
+        *phash = PyLong_AsSsize_t(PyTuple_GetItem(tresult, 2));
     }
     return 1;
 
@@ -72,6 +72,7 @@ public class GraalPythonMain extends AbstractLanguageLauncher {
     private boolean quietFlag = false;
     private boolean noUserSite = false;
     private boolean noSite = false;
+    private boolean dontWriteBytecode = false;
     private boolean stdinIsInteractive = System.console() != null;
     private boolean unbufferedIO = false;
     private boolean multiContext = false;
@@ -93,6 +94,7 @@ public class GraalPythonMain extends AbstractLanguageLauncher {
             String arg = arguments.get(i);
             switch (arg) {
                 case "-B":
+                    dontWriteBytecode = true;
                     break;
                 case "-c":
                     i += 1;
@@ -333,6 +335,7 @@ public class GraalPythonMain extends AbstractLanguageLauncher {
             noUserSite = noUserSite || System.getenv("PYTHONNOUSERSITE") != null;
             verboseFlag = verboseFlag || System.getenv("PYTHONVERBOSE") != null;
             unbufferedIO = unbufferedIO || System.getenv("PYTHONUNBUFFERED") != null;
+            dontWriteBytecode = dontWriteBytecode || System.getenv("PYTHONDONTWRITEBYTECODE") != null;
         }
 
         String executable = getContextOptionIfSetViaCommandLine("python.Executable");
@@ -359,6 +362,7 @@ public class GraalPythonMain extends AbstractLanguageLauncher {
         contextBuilder.option("python.NoSiteFlag", Boolean.toString(noSite));
         contextBuilder.option("python.IgnoreEnvironmentFlag", Boolean.toString(ignoreEnv));
         contextBuilder.option("python.UnbufferedIO", Boolean.toString(unbufferedIO));
+        contextBuilder.option("python.DontWriteBytecodeFlag", Boolean.toString(dontWriteBytecode));
 
         ConsoleHandler consoleHandler = createConsoleHandler(System.in, System.out);
         contextBuilder.arguments(getLanguageId(), programArgs.toArray(new String[0])).in(consoleHandler.createInputStream());
@@ -496,8 +500,8 @@ public class GraalPythonMain extends AbstractLanguageLauncher {
     protected void printHelp(OptionCategory maxCategory) {
         print("usage: python [option] ... (-c cmd | file) [arg] ...\n" +
                         "Options and arguments (and corresponding environment variables):\n" +
-                        "-B     : on CPython, this disables writing .py[co] files on import;\n" +
-                        "         GraalPython does not use bytecode, and thus this flag has no effect\n" +
+                        "-B     : don't write parser cache files to __pycache__ on import;\n" +
+                        "         also PYTHONDONTWRITEBYTECODE=x\n" +
                         "-c cmd : program passed in as string (terminates option list)\n" +
                         // "-d : debug output from parser; also PYTHONDEBUG=x\n" +
                         "-E     : ignore PYTHON* environment variables (such as PYTHONPATH)\n" +
@@ -88,6 +88,12 @@ def _reference_next(args):
         return (0, None, None)
 
 
+def _dict_with_hole():
+    d = {'a': "hello", 'b': "world", 'c': "!"}
+    del d['b']
+    return d
+
+
 def _reference_copy(args):
     if not isinstance(args[0], dict):
         raise SystemError
@@ -224,8 +230,7 @@ class TestPyDict(CPyExtTestCase):
     # PyDict_Next
     test_PyDict_Next = CPyExtFunctionOutVars(
         _reference_next,
-        # lambda: (({'a': "hello"}, 0), ({'a': "hello", 'b': 'world'}, 1), ({'a': "hello"}, 1)),
-        lambda: (({'a': "hello"}, 1),),
+        lambda: (({'a': "hello"}, 0), ({'a': "hello", 'b': 'world'}, 1), ({'a': "hello"}, 1), (_dict_with_hole(), 1)),
         code='''int wrap_PyDict_Next(PyObject* dict, Py_ssize_t* ppos, PyObject** key, PyObject** value) {
             int res = 0;
             Py_ssize_t iterations = *ppos;
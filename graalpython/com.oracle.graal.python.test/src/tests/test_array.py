@@ -96,3 +96,59 @@ def test_add_int_to_long_array():
     y = array('l', [1, 2])
     y[0] = 42 # should not raise
     assert y[0] == 42
+
+def test_frombytes_tobytes():
+    import struct
+    from array import array
+    a = array('d', [1.0])
+    a.frombytes(struct.pack('=3d', 1.5, -2.0, 3.25))
+    assert list(a) == [1.0, 1.5, -2.0, 3.25]
+    assert a.tobytes() == struct.pack('=4d', 1.0, 1.5, -2.0, 3.25)
+    assert_raises(ValueError, a.frombytes, b'\x00' * 7)
+
+    a = array('i', [1, 2])
+    a.frombytes(bytearray(struct.pack('=2i', -3, 4)))
+    assert list(a) == [1, 2, -3, 4]
+    assert array('i', []).tobytes() == b''
+
+
+def test_byteswap():
+    import struct
+    from array import array
+    a = array('i', [1, 2])
+    a.byteswap()
+    swapped = '>2i' if struct.pack('=i', 1) == struct.pack('<i', 1) else '<2i'
+    assert a.tobytes() == struct.pack(swapped, 1, 2)
+    a.byteswap()
+    assert list(a) == [1, 2]
+
+
+def test_char_storage_bytes():
+    import struct
+    import sys
+    from array import array
+    if sys.implementation.name != "graalpython":
+        return
+    # only GraalPython supports typecode 'c', its items are stored as UTF-16 code units
+    a = array('c', 'ab')
+    assert a.itemsize == 2
+    assert a.tobytes() == struct.pack('=2H', ord('a'), ord('b'))
+    a.frombytes(struct.pack('=H', ord('c')))
+    assert a.tobytes() == struct.pack('=3H', ord('a'), ord('b'), ord('c'))
+    a.byteswap()
+    swapped = '>3H' if struct.pack('=H', 1) == struct.pack('<H', 1) else '<3H'
+    assert a.tobytes() == struct.pack(swapped, ord('a'), ord('b'), ord('c'))
+
+
+def test_fromfile_tofile():
+    import io
+    from array import array
+    a = array('d', [1.0, 2.0, 3.0])
+    f = io.BytesIO()
+    a.tofile(f)
+    f.seek(0)
+    b = array('d', [])
+    b.fromfile(f, 2)
+    assert list(b) == [1.0, 2.0]
+    assert_raises(EOFError, b.fromfile, f, 2)
+    assert list(b) == [1.0, 2.0, 3.0]
@@ -414,6 +414,13 @@ def test_count():
     assert b"hellohello".count(b"ll") == 2, "4"
     assert b"hellohello".count(b"ll", 5) == 1, "5"
 
+    assert b"aaaa".count(b"aa") == 2
+    assert b"hello".count(b"") == 6
+    assert b"hello".count(b"l", -2) == 1
+    assert b"hello".count(ord("l"), 0, 3) == 1
+    assert bytearray(b"hellohello").count(b"ll") == 2
+    assert bytearray(b"hello").count(ord("l")) == 2
+
 
 def test_rfind():
     assert b"".rfind(b"") == 0, "1"
@@ -559,6 +566,57 @@ def test_find():
         assert False, "should not reach here"
 
 
+def test_rfind_index():
+    for t in (bytes, bytearray):
+        b = t(b"mississippi")
+        assert b.rfind(b"ss") == 5
+        assert b.rfind(b"ss", 0, 6) == 2
+        assert b.rfind(b"ss", -3) == -1
+        assert b.rfind(ord("i"), 0, -1) == 7
+        assert b.rfind(memoryview(b"si")) == 6
+        assert b.rfind(b"", 3, 5) == 5
+        assert b.rfind(b"", 12) == -1
+        assert b.index(b"ss", 3) == 5
+        assert b.rindex(b"i") == 10
+        assert_raises(ValueError, b.index, b"w")
+        assert_raises(ValueError, b.rindex, b"ss", 6)
+        assert_raises(TypeError, b.rfind, "ss")
+        assert_raises(ValueError, b.find, 256)
+
+
+def test_find_long():
+    haystack = b"ab" * 5000 + b"needle" + b"ab" * 5000 + b"needle" + b"ab"
+    assert haystack.find(b"needle") == 10000
+    assert haystack.find(b"needle", 10001) == 20006
+    assert haystack.rfind(b"needle") == 20006
+    assert haystack.rfind(b"needle", 0, 20011) == 10000
+    assert haystack.count(b"needle") == 2
+    assert haystack.count(b"ab") == 10001
+    assert haystack.count(b"eab") == 2
+    assert bytearray(haystack).find(b"eedl") == 10001
+
+
+def test_replace():
+    for t in (bytes, bytearray):
+        b = t(b"one two one two")
+        assert b.replace(b"one", b"1") == b"1 two 1 two"
+        assert type(b.replace(b"one", b"1")) == t
+        assert b.replace(b"two", b"three", 1) == b"one three one two"
+        assert b.replace(b"x", b"y") == b
+        assert t(b"ab").replace(b"", b"-") == b"-a-b-"
+        assert t(b"ab").replace(b"", b"-", 2) == b"-a-b"
+        assert t(b"\xff\xfe\xff").replace(b"\xff", b"\x00") == b"\x00\xfe\x00"
+        assert b.replace(memoryview(b" "), b"") == b"onetwoonetwo"
+
+
+def test_split_sep():
+    for t in (bytes, bytearray):
+        assert t(b"a,b,,c,").split(b",") == [b"a", b"b", b"", b"c", b""]
+        assert t(b",a,b").rsplit(b",") == [b"", b"a", b"b"]
+        assert t(b"a::b::c").split(b"::", 1) == [b"a", b"b::c"]
+        assert t(b"a::b::c").rsplit(b"::", 1) == [b"a::b", b"c"]
+        assert t(b"ab").rsplit(b"xab") == [b"ab"]
+
 def test_same_id():
     empty_ids = set([id(bytes()) for i in range(100)])
     assert len(empty_ids) == 1
@@ -0,0 +1,155 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import contextvars
+import unittest
+
+
+class ContextVarTests(unittest.TestCase):
+
+    def test_get_set_reset(self):
+        var = contextvars.ContextVar("var")
+        self.assertEqual(var.name, "var")
+        self.assertRaises(LookupError, var.get)
+        self.assertEqual(var.get(42), 42)
+
+        t1 = var.set(1)
+        self.assertIs(t1.var, var)
+        self.assertIs(t1.old_value, contextvars.Token.MISSING)
+        self.assertEqual(var.get(), 1)
+
+        t2 = var.set(2)
+        self.assertEqual(t2.old_value, 1)
+        self.assertEqual(var.get(), 2)
+
+        var.reset(t2)
+        self.assertEqual(var.get(), 1)
+        self.assertRaises(RuntimeError, var.reset, t2)
+        var.reset(t1)
+        self.assertRaises(LookupError, var.get)
+
+    def test_default(self):
+        var = contextvars.ContextVar("var", default=None)
+        self.assertIsNone(var.get())
+        self.assertEqual(var.get(3), 3)
+        self.assertRaises(TypeError, contextvars.ContextVar, 1)
+
+    def test_reset_checks(self):
+        a = contextvars.ContextVar("a")
+        b = contextvars.ContextVar("b")
+        token = a.set(1)
+        self.assertRaises(ValueError, b.reset, token)
+        ctx = contextvars.copy_context()
+        self.assertRaises(ValueError, ctx.run, a.reset, token)
+        a.reset(token)
+        self.assertRaises(RuntimeError, contextvars.Token)
+
+    def test_copy_context_isolation(self):
+        var = contextvars.ContextVar("var")
+        token = var.set("outer")
+        ctx = contextvars.copy_context()
+        self.assertIn(var, ctx)
+        self.assertEqual(ctx[var], "outer")
+
+        def inner():
+            self.assertEqual(var.get(), "outer")
+            var.set("inner")
+            return var.get()
+
+        self.assertEqual(ctx.run(inner), "inner")
+        self.assertEqual(var.get(), "outer")
+        self.assertEqual(ctx[var], "inner")
+        var.reset(token)
+
+    def test_run_reentry(self):
+        ctx = contextvars.Context()
+        self.assertRaises(RuntimeError, ctx.run, ctx.run, lambda: None)
+        self.assertEqual(ctx.run(lambda *a, **kw: (a, kw), 1, x=2), ((1,), {"x": 2}))
+
+    def test_mapping(self):
+        a = contextvars.ContextVar("a")
+        b = contextvars.ContextVar("b")
+        ctx = contextvars.Context()
+        self.assertEqual(len(ctx), 0)
+
+        def fill():
+            a.set(1)
+            b.set(2)
+
+        ctx.run(fill)
+        self.assertEqual(len(ctx), 2)
+        self.assertEqual(set(ctx), {a, b})
+        self.assertEqual(set(ctx.keys()), {a, b})
+        self.assertEqual(sorted(ctx.values()), [1, 2])
+        self.assertEqual(set(ctx.items()), {(a, 1), (b, 2)})
+        self.assertEqual(ctx.get(a), 1)
+        self.assertIsNone(ctx.get(contextvars.ContextVar("c")))
+        self.assertEqual(ctx.get(contextvars.ContextVar("c"), 5), 5)
+        self.assertRaises(KeyError, lambda: ctx[contextvars.ContextVar("c")])
+        self.assertRaises(TypeError, lambda: ctx["a"])
+
+        copy = ctx.copy()
+        self.assertEqual(dict(copy.items()), dict(ctx.items()))
+        copy.run(a.set, 10)
+        self.assertEqual(ctx[a], 1)
+        self.assertEqual(copy[a], 10)
+
+    def test_many_vars(self):
+        # enough variables to force several trie levels and collisions in the mapping
+        variables = [contextvars.ContextVar("v%d" % i) for i in range(2000)]
+        ctx = contextvars.Context()
+
+        def fill():
+            for i, v in enumerate(variables):
+                v.set(i)
+
+        ctx.run(fill)
+        self.assertEqual(len(ctx), 2000)
+        for i, v in enumerate(variables):
+            self.assertEqual(ctx[v], i)
+
+        def drain():
+            for v in variables[::2]:
+                v.set(None)
+
+        snapshot = ctx.copy()
+        ctx.run(drain)
+        self.assertEqual(len(ctx), 2000)
+        self.assertEqual(snapshot[variables[0]], 0)
+        self.assertIsNone(ctx[variables[0]])
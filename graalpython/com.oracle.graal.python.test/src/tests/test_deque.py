@@ -55,6 +55,15 @@ class BadCmp:
         raise RuntimeError
 
 
+class RequeueCmp:
+    def __init__(self, deque):
+        self.deque = deque
+
+    def __eq__(self, other):
+        self.deque.append(self.deque.popleft())
+        return False
+
+
 class MutateCmp:
     def __init__(self, deque, result):
         self.deque = deque
@@ -284,6 +293,12 @@ class TestBasic(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 d.index(n)
 
+            # Test detection of mutation that keeps the length
+            d = deque(range(n))
+            d[n//2] = RequeueCmp(d)
+            with self.assertRaises(RuntimeError):
+                d.index(n)
+
             # Test detection of comparison exceptions
             d = deque(range(n))
             d[n//2] = BadCmp()
@@ -629,3 +644,25 @@ class TestBasic(unittest.TestCase):
         klass = type(reversed(deque()))
         for s in ('abcd', range(2000)):
             self.assertEqual(list(klass(deque(s))), list(reversed(s)))
+
+    def test_ring_wraparound(self):
+        d = deque(maxlen=5)
+        expected = []
+        for i in range(37):
+            if i % 3:
+                d.append(i)
+                expected = (expected + [i])[-5:]
+            else:
+                d.appendleft(i)
+                expected = ([i] + expected)[:5]
+            d.rotate(i % 4)
+            k = i % 4
+            if expected and k:
+                k %= len(expected)
+                expected = expected[-k:] + expected[:-k]
+            self.assertEqual(list(d), expected)
+            self.assertEqual([d[j] for j in range(-len(d), len(d))], expected * 2)
+        del d[1]
+        del expected[1]
+        self.assertEqual(list(d), expected)
+        self.assertEqual(list(reversed(d)), expected[::-1])
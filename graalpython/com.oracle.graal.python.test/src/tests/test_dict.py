@@ -597,3 +597,95 @@ def test_calling_hash_and_eq():
     assert b in d
     assert count_hash == 4, count_hash
     assert count_eq == 1, count_eq
+
+
+def test_update():
+    d = {'a': 1, 'b': 2}
+    d.update({'b': 3, 'c': 4})
+    assert d == {'a': 1, 'b': 3, 'c': 4}
+    assert list(d.keys()) == ['a', 'b', 'c']
+
+    d.update([('d', 5), ['a', 0]], e=6)
+    assert d == {'a': 0, 'b': 3, 'c': 4, 'd': 5, 'e': 6}
+
+    class Mapping:
+        def keys(self):
+            return ['x', 'y']
+
+        def __getitem__(self, key):
+            return key * 2
+
+    d = {}
+    d.update(Mapping())
+    assert d == {'x': 'xx', 'y': 'yy'}
+
+    d = {1: 1}
+    d.update(d)
+    d.update(d, a=2)
+    assert d == {1: 1, 'a': 2}
+
+    d = {}
+    d.update(a=1)
+    d.update()
+    assert d == {'a': 1}
+
+    try:
+        d.update({}, {})
+    except TypeError:
+        pass
+    else:
+        assert False
+
+    try:
+        d.update([('a', 1, 2)])
+    except ValueError:
+        pass
+    else:
+        assert False
+
+
+def test_update_keeps_hashes():
+    count_hash = 0
+
+    class Key:
+        def __init__(self, x):
+            self.x = x
+
+        def __hash__(self):
+            nonlocal count_hash
+            count_hash += 1
+            return hash(self.x)
+
+        def __eq__(self, other):
+            return isinstance(other, Key) and self.x == other.x
+
+    src = {Key(i): i for i in range(10)}
+    assert count_hash == 10
+    dst = {}
+    dst.update(src)
+    dst.update(src)
+    assert count_hash == 10, count_hash
+    assert len(dst) == 10
+
+
+def test_fromkeys_iterables():
+    assert dict.fromkeys({'a', 'b'}) == {'a': None, 'b': None}
+    assert dict.fromkeys({'a': 1, 'b': 2}, 0) == {'a': 0, 'b': 0}
+    assert dict.fromkeys(iter(range(3)), 'x') == {0: 'x', 1: 'x', 2: 'x'}
+    assert dict.fromkeys("aba") == {'a': None, 'b': None}
+    assert dict.fromkeys([]) == {}
+
+    class MyDict(dict):
+        def __setitem__(self, key, value):
+            dict.__setitem__(self, key, value + 1)
+
+    d = MyDict.fromkeys(['a', 'b'], 1)
+    assert type(d) is MyDict
+    assert d == {'a': 2, 'b': 2}
+
+    try:
+        dict.fromkeys(1)
+    except TypeError:
+        pass
+    else:
+        assert False
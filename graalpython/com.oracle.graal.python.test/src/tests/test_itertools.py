@@ -98,3 +98,83 @@ class CombinationsTests(unittest.TestCase):
         self.assertRaises(ExpectedError, gulp, [None], keyfunc)
         keyfunc.skip = 1
         self.assertRaises(ExpectedError, gulp, [None, None], keyfunc)
+
+    def test_groupby_stale_group(self):
+        groups = [(k, g) for k, g in groupby('aabbbc')]
+        self.assertEqual([k for k, g in groups], ['a', 'b', 'c'])
+        # advancing the groupby object invalidates the previous groups
+        self.assertEqual([list(g) for k, g in groups], [[], [], []])
+        it = groupby('aab')
+        k, g = next(it)
+        self.assertEqual(next(g), 'a')
+        self.assertEqual(next(it)[0], 'b')
+        self.assertRaises(StopIteration, next, g)
+
+    def test_chain(self):
+        self.assertEqual(list(chain('abc', 'def')), list('abcdef'))
+        self.assertEqual(list(chain('abc')), list('abc'))
+        self.assertEqual(list(chain('')), [])
+        self.assertEqual(list(chain()), [])
+        self.assertEqual(list(islice(chain('abc', 'def'), 4)), list('abcd'))
+        self.assertRaises(TypeError, list, chain(2, 3))
+        self.assertEqual(list(chain.from_iterable(['abc', [], 'de'])), list('abcde'))
+        self.assertEqual(list(chain.from_iterable(range(3) for _ in range(3))), [0, 1, 2] * 3)
+        self.assertRaises(TypeError, list, chain.from_iterable([2, 3]))
+        it = chain.from_iterable(['ab', 'c'])
+        self.assertIs(iter(it), it)
+        self.assertEqual(list(it), list('abc'))
+        self.assertEqual(list(it), [])
+
+    def test_islice(self):
+        for args in [(10, 20, 3), (10, 3, 20), (10, 20), (10, 10), (10, 3), (20,)]:
+            self.assertEqual(list(islice(range(100), *args)), list(range(*args)))
+        self.assertEqual(list(islice(range(100), None)), list(range(100)))
+        self.assertEqual(list(islice(range(100), 5, None)), list(range(5, 100)))
+        self.assertEqual(list(islice(range(100), None, 10, None)), list(range(10)))
+        self.assertEqual(list(islice(range(100), 0, 10, 4)), [0, 4, 8])
+        self.assertEqual(list(islice(count(), 5)), [0, 1, 2, 3, 4])
+        # stop is not checked eagerly against the iterator length
+        self.assertEqual(list(islice(range(10), 2, 2 ** 62)), list(range(2, 10)))
+        self.assertRaises(TypeError, islice, range(10))
+        self.assertRaises(TypeError, islice, range(10), 1, 2, 3, 4)
+        self.assertRaises(ValueError, islice, range(10), -5, 10, 1)
+        self.assertRaises(ValueError, islice, range(10), 1, -5, -1)
+        self.assertRaises(ValueError, islice, range(10), 1, 10, -1)
+        self.assertRaises(ValueError, islice, range(10), 1, 10, 0)
+        self.assertRaises(ValueError, islice, range(10), 'a')
+        self.assertRaises(ValueError, islice, range(10), 1.5)
+        # arguments are converted through __index__
+        class Index:
+            def __init__(self, value):
+                self.value = value
+
+            def __index__(self):
+                return self.value
+        self.assertEqual(list(islice(range(10), Index(3))), [0, 1, 2])
+        self.assertEqual(list(islice(range(10), Index(1), Index(7), Index(2))), [1, 3, 5])
+        self.assertRaises(ValueError, islice, range(10), Index(-1))
+        # consumes exactly the elements it needs
+        it = iter(range(10))
+        self.assertEqual(list(islice(it, 3)), [0, 1, 2])
+        self.assertEqual(list(it), list(range(3, 10)))
+        it = iter(range(10))
+        self.assertEqual(list(islice(it, 1, 5, 2)), [1, 3])
+        self.assertEqual(next(it), 5)
+
+    def test_accumulate(self):
+        self.assertEqual(list(accumulate(range(10))), [0, 1, 3, 6, 10, 15, 21, 28, 36, 45])
+        self.assertEqual(list(accumulate('abc')), ['a', 'ab', 'abc'])
+        self.assertEqual(list(accumulate([])), [])
+        self.assertEqual(list(accumulate([7])), [7])
+        self.assertEqual(list(accumulate([2, 8, 9, 5, 7, 0, 3], max)), [2, 8, 9, 9, 9, 9, 9])
+        self.assertEqual(list(accumulate([1, 2, 3], lambda a, b: a * b)), [1, 2, 6])
+        self.assertRaises(TypeError, accumulate, range(10), 5, 6)
+        self.assertRaises(TypeError, list, accumulate([1, []]))
+
+    def test_zip_longest(self):
+        self.assertEqual(list(zip_longest('abc', 'de')), [('a', 'd'), ('b', 'e'), ('c', None)])
+        self.assertEqual(list(zip_longest('ab', range(4), fillvalue=0)), [('a', 0), ('b', 1), (0, 2), (0, 3)])
+        self.assertEqual(list(zip_longest()), [])
+        self.assertEqual(list(zip_longest('ab')), [('a',), ('b',)])
+        self.assertRaises(TypeError, zip_longest, 3)
+        self.assertRaises(TypeError, zip_longest, 'ab', foo=1)
@@ -725,6 +725,64 @@ class ListTest(list_tests.CommonTest):
         l.extend(l)
         self.assertEqual([1,2,3,4,10,20,30,40], l)
 
+    def test_sort_key_called_once(self):
+        calls = []
+        def key(x):
+            calls.append(x)
+            return -x
+        l = list(range(100))
+        l.sort(key=key)
+        self.assertEqual(list(range(99, -1, -1)), l)
+        self.assertEqual(100, len(calls))
+
+    def test_sort_reverse_stable(self):
+        data = [(i % 3, i) for i in range(50)]
+        l = list(data)
+        l.sort(key=lambda t: t[0], reverse=True)
+        self.assertEqual(sorted(data, key=lambda t: -t[0]), l)
+        self.assertEqual(l, sorted(data, key=lambda t: t[0], reverse=True))
+        self.assertEqual([(0, 0), (0, 3)], [t for t in l if t[0] == 0][:2])
+
+    def test_sort_primitive_storage(self):
+        l = [5, 3, 9, -1, 3]
+        l.sort()
+        self.assertEqual([-1, 3, 3, 5, 9], l)
+        l.sort(reverse=True)
+        self.assertEqual([9, 5, 3, 3, -1], l)
+
+        l = [2**40, -2**40, 3, 2**35]
+        l.sort()
+        self.assertEqual([-2**40, 3, 2**35, 2**40], l)
+
+        l = [1.5, -2.0, 0.25]
+        l.sort()
+        self.assertEqual([-2.0, 0.25, 1.5], l)
+
+        l = [0.0, -0.0, 1.0, -0.0]
+        l.sort()
+        self.assertEqual("[0.0, -0.0, -0.0, 1.0]", repr(l))
+
+        l = ["pear", "apple", "fig"]
+        l.sort(reverse=True)
+        self.assertEqual(["pear", "fig", "apple"], l)
+
+    def test_sort_modified_by_key(self):
+        l = [3, 1, 2]
+        def key(x):
+            l.append(x)
+            return x
+        self.assertRaises(ValueError, l.sort, key=key)
+        self.assertEqual([1, 2, 3], l)
+
+    def test_sort_failed_comparison_keeps_order(self):
+        l = [3, 1, "a", 2]
+        self.assertRaises(TypeError, l.sort)
+        self.assertEqual([3, 1, "a", 2], l)
+
+        l = [5, 4, 3, 2, 1, "a"]
+        self.assertRaises(TypeError, l.sort, reverse=True)
+        self.assertEqual([5, 4, 3, 2, 1, "a"], l)
+
 class ListCompareTest(CompareTest):
 
     def test_compare(self):
@@ -50,3 +50,68 @@ def test_tobytes():
     b = b"\xff\x00\x00"
     v = memoryview(b)
     assert v.tobytes() == b
+
+
+def test_slice_shares_memory():
+    data = bytearray(b"0123456789")
+    v = memoryview(data)[1:9:2]
+    assert v.tobytes() == b"1357"
+    assert v.shape == (4,) and v.strides == (2,)
+    assert not v.contiguous
+    v[1] = ord("x")
+    assert data == bytearray(b"012x456789")
+    assert v[::-1].tolist() == [ord("7"), ord("5"), ord("x"), ord("1")]
+
+
+def test_cast_bytes():
+    v = memoryview(b"\x01\xff")
+    assert v.cast("b").tolist() == [1, -1]
+    assert v.cast("c").tolist() == [b"\x01", b"\xff"]
+    assert v.cast("B").format == "B"
+    assert v.readonly
+
+
+def test_release():
+    v = memoryview(bytearray(b"abc"))
+    with v as cm:
+        assert cm is v
+    try:
+        len(v)
+    except ValueError:
+        pass
+    else:
+        assert False
+    assert "released" in repr(v)
+    assert v == v
+    assert memoryview(b"abc") == b"abc"
+
+
+def test_bytearray_exports():
+    def assert_buffer_error(f, *args):
+        try:
+            f(*args)
+        except BufferError:
+            pass
+        else:
+            assert False, "resizing an exported bytearray did not raise"
+
+    data = bytearray(b"abc")
+    v = memoryview(data)
+    s = v[1:]
+    assert_buffer_error(data.append, 1)
+    assert_buffer_error(data.extend, b"de")
+    assert_buffer_error(data.clear)
+    assert_buffer_error(data.__delitem__, 0)
+    assert_buffer_error(data.__iadd__, b"d")
+    assert_buffer_error(data.__setitem__, slice(0, 1), b"xy")
+    # assignments that keep the size are allowed
+    data[0:2] = b"xy"
+    data[1:3] = [ord("z"), ord("z")]
+    del data[0:0]
+    assert data == bytearray(b"xzz")
+    v.release()
+    # the slice still exports the bytearray
+    assert_buffer_error(data.append, 1)
+    s.release()
+    data.append(ord("d"))
+    assert data == bytearray(b"xzzd")
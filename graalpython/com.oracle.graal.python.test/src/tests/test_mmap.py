@@ -162,6 +162,90 @@ class MmapTests(unittest.TestCase):
         self.assertEqual(m.read(-42), bytes(range(9, 16)))
         m.close()
 
+    def test_file_readline_find_write(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(b'first line\nsecond line\nlast')
+        with open(TESTFN, 'r+b') as f:
+            m = mmap.mmap(f.fileno(), 0)
+        self.assertEqual(len(m), 27)
+        self.assertEqual(m.readline(), b'first line\n')
+        # find starts at the current position by default
+        self.assertEqual(m.find(b'line'), 18)
+        self.assertEqual(m.find(b'line', 0), 6)
+        self.assertEqual(m.readline(), b'second line\n')
+        self.assertEqual(m.readline(), b'last')
+        self.assertEqual(m.readline(), b'')
+        m.seek(0)
+        self.assertEqual(m.write(b'FIRST'), 5)
+        self.assertEqual(m.tell(), 5)
+        m.seek(25)
+        self.assertRaises(ValueError, m.write, b'xyz')
+        m.flush()
+        m.close()
+        with open(TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), b'FIRST line\nsecond line\nlast')
+
+    def test_find_rfind_large(self):
+        data = b'x' * 200000 + b'needle' + b'y' * 100000 + b'needle' + b'z' * 50
+        with open(TESTFN, 'wb') as f:
+            f.write(data)
+        with open(TESTFN, 'r+b') as f:
+            m = mmap.mmap(f.fileno(), 0)
+        self.assertEqual(m.find(b'needle'), 200000)
+        self.assertEqual(m.find(b'needle', 200001), 300006)
+        self.assertEqual(m.rfind(b'needle'), 300006)
+        self.assertEqual(m.rfind(b'needle', 0, 300011), 200000)
+        self.assertEqual(m.rfind(b'needle', 0, 200005), -1)
+        self.assertEqual(m.find(b'missing'), -1)
+        if sys.implementation.name == "graalpython":
+            # a single byte can also be passed as an int
+            self.assertEqual(m.find(ord('n')), 200000)
+            self.assertEqual(m.rfind(ord('n')), 300006)
+            self.assertRaises(ValueError, m.find, 256)
+            self.assertRaises(ValueError, m.rfind, -1)
+        m.close()
+
+    def test_access_read(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(b'abcdef')
+        with open(TESTFN, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 3, access=mmap.ACCESS_READ, offset=0)
+        self.assertEqual(m[:], b'abc')
+        self.assertEqual(m[::-1], b'cba')
+        with self.assertRaises(TypeError):
+            m[0] = 1
+        self.assertRaises(TypeError, m.write, b'x')
+        m.close()
+
+    def test_access_copy(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(b'abcdef')
+        with open(TESTFN, 'rb') as f:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        m[0] = ord('x')
+        m[2:4] = b'yz'
+        self.assertEqual(m[:], b'xbyzef')
+        m.close()
+        with open(TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), b'abcdef')
+
+    def test_access_write_read_only_fd(self):
+        with open(TESTFN, 'wb') as f:
+            f.write(b'abcdef')
+        with open(TESTFN, 'rb') as f:
+            self.assertRaises(PermissionError, mmap.mmap, f.fileno(), 0, access=mmap.ACCESS_WRITE)
+            self.assertRaises(PermissionError, mmap.mmap, f.fileno(), 0)
+
+    def test_closed(self):
+        m = mmap.mmap(-1, 10)
+        m.close()
+        self.assertRaises(ValueError, m.__getitem__, 0)
+        self.assertRaises(ValueError, m.__getitem__, slice(0, 2))
+        self.assertRaises(ValueError, m.__setitem__, 0, 1)
+        self.assertRaises(ValueError, m.read)
+        self.assertRaises(ValueError, m.find, b'a')
+        self.assertRaises(ValueError, len, m)
+
 
 
     def test_context_manager(self):
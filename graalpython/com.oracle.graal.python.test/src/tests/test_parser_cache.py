@@ -0,0 +1,182 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+
+MODULE_NAME = "parser_cache_module"
+
+MODULE_SOURCE = '''
+"""module doc"""
+import functools
+from os import path as ospath
+
+counter = 0
+
+def count(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global counter
+        counter += 1
+        return func(*args, **kwargs)
+    return wrapper
+
+@count
+def make_adder(a, *rest, scale=1, **extra):
+    total = a
+    def add(b):
+        nonlocal total
+        total += b * scale
+        return total
+    return add
+
+class Base:
+    def name(self):
+        return "base"
+
+class Derived(Base):
+    value: int = 3
+    def name(self):
+        return "derived<" + super().name() + ">"
+
+def squares(n):
+    return [i * i for i in range(n) if i % 2], {k: v for k, v in zip("ab", (1, 2))}, sum(x for x in range(n))
+
+def gen(n):
+    yield from range(n)
+    yield -1
+
+def control(items):
+    for item in items:
+        if item is None:
+            break
+    else:
+        return "no break"
+    i = 0
+    while i < 3:
+        i += 1
+    try:
+        raise ValueError(i)
+    except ValueError as e:
+        return "caught %s" % e.args
+    finally:
+        pass
+
+key = lambda x, y=2: (x ** y, -x, not x, x if x else ~x)
+'''
+
+
+def write_module(directory, source):
+    with open(os.path.join(directory, MODULE_NAME + ".py"), "w") as f:
+        f.write(source)
+
+
+def import_fresh():
+    sys.modules.pop(MODULE_NAME, None)
+    importlib.invalidate_caches()
+    return importlib.import_module(MODULE_NAME)
+
+
+def check_module(mod):
+    assert mod.__doc__ == "module doc"
+    adder = mod.make_adder(1, 2, scale=10, x=1)
+    assert adder(1) == 11
+    assert adder(2) == 31
+    assert mod.counter == 1
+    assert mod.make_adder.__name__ == "make_adder"
+    assert mod.Derived().name() == "derived<base>"
+    assert mod.Derived.__annotations__ == {"value": int}
+    assert mod.squares(5) == ([1, 9], {"a": 1, "b": 2}, 10)
+    assert list(mod.gen(3)) == [0, 1, 2, -1]
+    assert mod.control([1, None]) == "caught 3"
+    assert mod.control([1]) == "no break"
+    assert mod.key(3) == (9, -3, False, 3)
+    assert mod.key(0, 1) == (0, 0, True, -1)
+
+
+if sys.implementation.name == "graalpython":
+    def test_parser_cache():
+        with tempfile.TemporaryDirectory() as directory:
+            write_module(directory, MODULE_SOURCE)
+            sys.path.insert(0, directory)
+            try:
+                check_module(import_fresh())
+                cache_file = os.path.join(directory, "__pycache__", MODULE_NAME + ".graalpython.sst")
+                assert os.path.exists(cache_file)
+
+                # the second import uses the cached tree
+                check_module(import_fresh())
+
+                # a modified source invalidates the cache entry
+                write_module(directory, MODULE_SOURCE + "\nadded = 42\n")
+                assert import_fresh().added == 42
+            finally:
+                sys.path.remove(directory)
+                sys.modules.pop(MODULE_NAME, None)
+
+    def test_parser_cache_dont_write_bytecode():
+        with tempfile.TemporaryDirectory() as directory:
+            write_module(directory, MODULE_SOURCE)
+            env = dict(os.environ)
+            env.pop("PYTHONDONTWRITEBYTECODE", None)
+            code = "import %s" % MODULE_NAME
+            subprocess.check_call([sys.executable, "-B", "-c", code], cwd=directory, env=env)
+            assert not os.path.exists(os.path.join(directory, "__pycache__"))
+            env["PYTHONDONTWRITEBYTECODE"] = "1"
+            subprocess.check_call([sys.executable, "-c", code], cwd=directory, env=env)
+            assert not os.path.exists(os.path.join(directory, "__pycache__"))
+
+    def test_parser_cache_readonly_directory():
+        if os.getuid() == 0:
+            # the superuser can write to any directory
+            return
+        with tempfile.TemporaryDirectory() as directory:
+            write_module(directory, MODULE_SOURCE)
+            os.chmod(directory, 0o555)
+            sys.path.insert(0, directory)
+            try:
+                check_module(import_fresh())
+                assert not os.path.exists(os.path.join(directory, "__pycache__"))
+            finally:
+                os.chmod(directory, 0o755)
+                sys.path.remove(directory)
+                sys.modules.pop(MODULE_NAME, None)
@@ -0,0 +1,117 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+import unittest
+from functools import partial
+
+
+def capture(*args, **kwargs):
+    return args, kwargs
+
+
+class PartialTests(unittest.TestCase):
+
+    def test_call(self):
+        p = partial(capture, 1, 2, a=3)
+        self.assertEqual(p(), ((1, 2), {"a": 3}))
+        self.assertEqual(p(4), ((1, 2, 4), {"a": 3}))
+        self.assertEqual(p(4, a=5, b=6), ((1, 2, 4), {"a": 5, "b": 6}))
+        # call-site keywords must not leak into the stored ones
+        self.assertEqual(p.keywords, {"a": 3})
+        self.assertEqual(p(), ((1, 2), {"a": 3}))
+
+    def test_attributes(self):
+        p = partial(capture, 1, a=2)
+        self.assertIs(p.func, capture)
+        self.assertEqual(p.args, (1,))
+        self.assertEqual(p.keywords, {"a": 2})
+        p.keywords["b"] = 3
+        self.assertEqual(p(), ((1,), {"a": 2, "b": 3}))
+        p.attr = 4
+        self.assertEqual(p.attr, 4)
+        self.assertEqual(p.__dict__, {"attr": 4})
+
+    def test_errors(self):
+        self.assertRaises(TypeError, partial)
+        self.assertRaises(TypeError, partial, 1)
+
+    def test_nested(self):
+        inner = partial(capture, 1, a=2)
+        outer = partial(inner, 3, a=4, b=5)
+        self.assertIs(outer.func, capture)
+        self.assertEqual(outer.args, (1, 3))
+        self.assertEqual(outer.keywords, {"a": 4, "b": 5})
+        self.assertEqual(outer(6), ((1, 3, 6), {"a": 4, "b": 5}))
+
+    def test_nested_with_attributes(self):
+        inner = partial(capture, 1)
+        inner.attr = 2
+        outer = partial(inner, 3)
+        self.assertIs(outer.func, inner)
+        self.assertEqual(outer.args, (3,))
+        self.assertEqual(outer(4), ((1, 3, 4), {}))
+
+    def test_subclass(self):
+        class MyPartial(partial):
+            pass
+
+        p = MyPartial(capture, 1)
+        self.assertEqual(p(2), ((1, 2), {}))
+        self.assertTrue(repr(p).startswith("MyPartial("))
+
+    def test_repr(self):
+        p = partial(capture, 1, a=2)
+        self.assertEqual(repr(p), "functools.partial(%r, 1, a=2)" % capture)
+
+    def test_reduce(self):
+        p = partial(capture, 1, a=2)
+        p.attr = 3
+        self.assertEqual(p.__reduce__(), (partial, (capture,), (capture, (1,), {"a": 2}, {"attr": 3})))
+        q = pickle.loads(pickle.dumps(p))
+        self.assertEqual(q(4), ((1, 4), {"a": 2}))
+        self.assertEqual(q.attr, 3)
+
+    def test_setstate(self):
+        p = partial(capture)
+        p.__setstate__((capture, (1,), None, None))
+        self.assertEqual(p(2), ((1, 2), {}))
+        self.assertRaises(TypeError, p.__setstate__, (capture, (1,), None))
+        self.assertRaises(TypeError, p.__setstate__, (capture, [1], None, None))
+        self.assertRaises(TypeError, p.__setstate__, (1, (1,), None, None))
@@ -124,6 +124,21 @@ def test_find_all_none():
         assert result[i] == r
 
 
+if sys.implementation.name == "graalpython":
+    def test_compiled_regex_cache():
+        import _sre
+        pattern = r"cache-(?P<n>\d+)"
+        re.compile(pattern).search("cache-1")
+        hits, misses, currsize, maxsize = _sre.tregex_cache_info()
+        assert 0 < currsize <= maxsize
+        # bypass the cache of the 're' module to create a new pattern object
+        re.purge()
+        p = re.compile(pattern)
+        assert p.groupindex == {"n": 1}
+        assert p.search("x cache-42").group("n") == "42"
+        assert _sre.tregex_cache_info()[0] > hits
+
+
 class S(str):
     def __getitem__(self, index):
         return S(super().__getitem__(index))
@@ -303,6 +318,22 @@ class ReTests(unittest.TestCase):
         self.assertEqual(re.subn("b*", "x", "xyz", 2), ('xxxyz', 2))
         self.assertEqual(re.subn("b*", "x", "xyz", count=2), ('xxxyz', 2))
 
+    def test_sub_template(self):
+        pat = re.compile('(a)(b)(c)(d)(e)(f)(g)(h)(i)(j)(k)(l)')
+        self.assertEqual(pat.sub(r'\12\11-\1\10', 'xabcdefghijkly'), 'xlk-ajy')
+        self.assertEqual(pat.sub(r'\g<12>', 'abcdefghijkl' * 3), 'lll')
+        self.assertEqual(re.sub('(a)|(b)', r'[\1\2]', 'ab'), '[a][b]')
+        self.assertEqual(re.sub('a', r'\101\0', 'a'), 'A\x00')
+        self.assertEqual(re.sub(b'(?P<x>a)', br'<\g<x>\\>', b'xay'), b'x<a\\>y')
+        pat = re.compile('(?P<w>\\w+)')
+        for i in range(3):
+            self.assertEqual(pat.subn(r'<\g<w>>', 'ab cd'), ('<ab> <cd>', 2))
+        self.assertRaises(re.error, re.sub, '(a)', r'\2', 'a')
+        self.assertRaises(IndexError, re.sub, '(a)', r'\g<b>', 'a')
+        self.assertEqual(re.sub('a', r'\t\.\\', 'a'), '\t\\.\\')
+        self.assertRaisesRegex(re.error, r'bad escape \\q', re.sub, 'a', r'\q', 'a')
+        self.assertRaisesRegex(re.error, r'bad escape \\x', re.sub, b'a', br'\x41', b'a')
+
     def test_re_split(self):
         for string in ":a:b::c", S(":a:b::c"):
             self.assertTypedEqual(re.split(":", string),
@@ -489,3 +520,35 @@ class ReTests(unittest.TestCase):
             r"(//?| ==?)|([[]]+)")
         for m in regex.finditer(''):
             self.fail()
+
+    def test_endpos(self):
+        for subject in ("abcabc", b"abcabc", bytearray(b"abcabc"), memoryview(b"abcabc")):
+            pat = re.compile("c$" if isinstance(subject, str) else b"c$")
+            self.assertIsNone(pat.search(subject, 0, 0))
+            self.assertIsNone(pat.search(subject, 0, 2))
+            self.assertEqual(pat.search(subject, 0, 3).span(), (2, 3))
+            self.assertEqual(pat.match(subject, 2, 3).span(), (2, 3))
+            self.assertEqual(pat.search(subject, 0, 100).span(), (5, 6))
+            self.assertIs(pat.search(subject, 0, 3).string, subject)
+        pat = re.compile("b+")
+        self.assertEqual(pat.fullmatch("abbbc", 1, 4).span(), (1, 4))
+        self.assertIsNone(pat.fullmatch("abbbc", 1, 5))
+        self.assertEqual(pat.findall("abbbcbb", 0, 3), ["bb"])
+        self.assertEqual([m.span() for m in pat.finditer("abbbcbb", 0, 6)], [(1, 4), (5, 6)])
+        self.assertEqual(pat.findall("abc", 0, -1), [])
+        self.assertEqual(list(pat.finditer("abc", 0, -1)), [])
+        self.assertEqual(pat.findall("abbc", 0, -2), [])
+        # empty matches are found at endpos, too
+        self.assertEqual(re.compile("x*").findall("ab"), ["", "", ""])
+        self.assertEqual(re.compile("x*").findall("ab", 0, 1), ["", ""])
+
+    def test_many_matches(self):
+        text = "k1=v1; k2=; k3=v3; " * 200
+        pat = re.compile(r'(\w+)=(\w+)?')
+        self.assertEqual(pat.findall(text), [('k1', 'v1'), ('k2', ''), ('k3', 'v3')] * 200)
+        self.assertEqual(re.findall(r'\w+', text), ['k1', 'v1', 'k2', 'k3', 'v3'] * 200)
+        spans = [m.span(2) for m in pat.finditer(text)]
+        self.assertEqual(spans[:3], [(3, 5), (-1, -1), (15, 17)])
+        self.assertEqual(len(spans), 600)
+        self.assertEqual(re.split(r'; ', text, 2), ['k1=v1', 'k2=', text[12:]])
+        self.assertEqual(re.split(br'(,)|(;)', b'a,b;c'), [b'a', b',', None, b'b', None, b';', b'c'])
@@ -0,0 +1,164 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import select
+import socket
+import sys
+import time
+import unittest
+
+
+class SelectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.r, self.w = os.pipe()
+
+    def tearDown(self):
+        os.close(self.r)
+        os.close(self.w)
+
+    def test_select_ready(self):
+        self.assertEqual(([], [self.w], []), select.select([self.r], [self.w], [], 0))
+        os.write(self.w, b"x")
+        self.assertEqual(([self.r], [], []), select.select([self.r], [], [], 1))
+
+    def test_select_timeout(self):
+        start = time.time()
+        self.assertEqual(([], [], []), select.select([self.r], [], [], 0.1))
+        self.assertGreaterEqual(time.time() - start, 0.09)
+
+    def test_select_fileno_object(self):
+        class F:
+            def __init__(self, fd):
+                self.fd = fd
+
+            def fileno(self):
+                return self.fd
+
+        f = F(self.r)
+        os.write(self.w, b"x")
+        self.assertEqual(([f], [], []), select.select([f], [], [], 0))
+        self.assertRaises(TypeError, select.select, [object()], [], [], 0)
+        self.assertRaises(ValueError, select.select, [-1], [], [], 0)
+        self.assertRaises(ValueError, select.select, [], [], [], -1)
+
+    def test_poll(self):
+        p = select.poll()
+        p.register(self.r, select.POLLIN)
+        self.assertEqual([], p.poll(0))
+        os.write(self.w, b"x")
+        self.assertEqual([(self.r, select.POLLIN)], p.poll(1000))
+        p.modify(self.r, select.POLLOUT)
+        self.assertEqual([], p.poll(0))
+        p.unregister(self.r)
+        self.assertRaises(KeyError, p.unregister, self.r)
+
+    def test_poll_timeout(self):
+        # the timeout of poll is in milliseconds
+        p = select.poll()
+        p.register(self.r, select.POLLIN)
+        start = time.time()
+        self.assertEqual([], p.poll(100))
+        elapsed = time.time() - start
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 5)
+        self.assertEqual([], p.poll(0.5))
+
+    @unittest.skipUnless(hasattr(select, "epoll"), "requires epoll")
+    def test_epoll(self):
+        with select.epoll() as ep:
+            self.assertGreaterEqual(ep.fileno(), 0)
+            ep.register(self.r, select.EPOLLIN)
+            ep.register(self.w, select.EPOLLOUT)
+            self.assertRaises(FileExistsError, ep.register, self.r)
+            self.assertEqual([(self.w, select.EPOLLOUT)], ep.poll(0))
+            os.write(self.w, b"x")
+            self.assertEqual(sorted([(self.r, select.EPOLLIN), (self.w, select.EPOLLOUT)]), sorted(ep.poll(1)))
+            self.assertEqual(1, len(ep.poll(1, 1)))
+            ep.unregister(self.w)
+            self.assertRaises(FileNotFoundError, ep.unregister, self.w)
+        self.assertTrue(ep.closed)
+        self.assertRaises(ValueError, ep.poll)
+
+
+class SelectSocketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.client.connect(self.server.getsockname())
+        self.conn, _ = self.server.accept()
+
+    def tearDown(self):
+        self.conn.close()
+        self.client.close()
+        self.server.close()
+
+    def test_select_sockets(self):
+        self.assertEqual(([], [self.client], []), select.select([self.conn], [self.client], [], 0))
+        self.client.sendall(b"x")
+        self.assertEqual(([self.conn], [], []), select.select([self.conn], [], [], 5))
+        # without out-of-band data, there are no exceptional conditions
+        self.assertEqual(([self.conn], [], []), select.select([self.conn], [], [self.conn, self.client], 5))
+
+    def test_select_accept(self):
+        other = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            self.assertEqual(([], [], []), select.select([self.server], [], [], 0))
+            other.connect(self.server.getsockname())
+            self.assertEqual(([self.server], [], []), select.select([self.server], [], [], 5))
+            self.server.accept()[0].close()
+        finally:
+            other.close()
+
+    @unittest.skipUnless(hasattr(select, "epoll"), "requires epoll")
+    def test_epoll_sockets(self):
+        with select.epoll() as ep:
+            ep.register(self.conn, select.EPOLLIN | select.EPOLLEXCLUSIVE)
+            self.assertEqual([], ep.poll(0))
+            self.client.sendall(b"x")
+            self.assertEqual([(self.conn.fileno(), select.EPOLLIN)], ep.poll(5))
+            # EPOLLEXCLUSIVE cannot be modified or combined with EPOLLONESHOT
+            self.assertRaises(OSError, ep.modify, self.conn, select.EPOLLIN)
+            self.assertRaises(OSError, ep.register, self.client, select.EPOLLOUT | select.EPOLLEXCLUSIVE | select.EPOLLONESHOT)
+            if sys.implementation.name == "graalpython":
+                self.assertRaises(NotImplementedError, ep.register, self.client, select.EPOLLOUT | select.EPOLLET)
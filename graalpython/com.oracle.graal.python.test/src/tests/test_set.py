@@ -218,7 +218,7 @@ def test_intersection():
         assert (c in i) == (c in d and c in otherword)
 
     assert s == set(word)
-    # assert type(i) == set
+    assert type(i) == set
     assert_raises(PassThru, s.intersection, check_pass_thru())
 
     for C in set, frozenset, dict.fromkeys, str, list, tuple:
@@ -323,3 +323,34 @@ def test_hashable_frozenset():
     d = {key1: 42}
     assert hash(key1) == hash(key2)
     assert d[key2] == 42
+
+
+def test_set_algebra_result_types():
+    fs = frozenset('abcba')
+    assert type(fs.intersection('bcd')) == frozenset
+    assert type(fs.difference('bcd')) == frozenset
+    assert fs.intersection('bcd') == frozenset('bc')
+    assert fs.difference('bcd') == frozenset('a')
+    assert type(set('ab').difference()) == set
+
+
+def test_update_variants():
+    s = set('ab')
+    assert s.update('bc', ['d'], {'e': 1}) is None
+    assert s == set('abcde')
+
+    s = set(range(10))
+    s.intersection_update(range(5, 20), {4, 5, 6, 7})
+    assert s == {5, 6, 7}
+    assert_raises(PassThru, s.intersection_update, check_pass_thru())
+
+    s = set(range(10))
+    s.difference_update(s)
+    assert s == set()
+
+    # both the smaller and the larger other side
+    s = set(range(10))
+    s.difference_update([1, 2])
+    assert s == {0, 3, 4, 5, 6, 7, 8, 9}
+    s.difference_update(range(5, 100))
+    assert s == {0, 3, 4}
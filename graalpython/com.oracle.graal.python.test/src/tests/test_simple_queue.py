@@ -0,0 +1,109 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+import unittest
+
+from _queue import SimpleQueue, Empty
+
+try:
+    import _sysconfig as syscfg
+except Exception:
+    import sysconfig as syscfg
+
+
+class SimpleQueueTest(unittest.TestCase):
+
+    def test_fifo(self):
+        q = SimpleQueue()
+        self.assertTrue(q.empty())
+        self.assertEqual(q.qsize(), 0)
+        for i in range(100):
+            q.put(i)
+        q.put_nowait(None)
+        self.assertFalse(q.empty())
+        self.assertEqual(q.qsize(), 101)
+        self.assertEqual([q.get() for i in range(100)], list(range(100)))
+        self.assertIsNone(q.get_nowait())
+        self.assertTrue(q.empty())
+
+    def test_empty(self):
+        q = SimpleQueue()
+        self.assertTrue(issubclass(Empty, Exception))
+        self.assertRaises(Empty, q.get_nowait)
+        self.assertRaises(Empty, q.get, False)
+        self.assertRaises(Empty, q.get, block=False, timeout=10)
+        # an explicit None is a false value, not the default
+        self.assertRaises(Empty, q.get, None)
+        start = time.time()
+        self.assertRaises(Empty, q.get, timeout=0.05)
+        self.assertGreaterEqual(time.time() - start, 0.04)
+        self.assertRaises(ValueError, q.get, timeout=-1)
+        q.put(1)
+        self.assertEqual(q.get(timeout=0), 1)
+
+    def test_queue_module(self):
+        import queue
+        self.assertIs(queue.SimpleQueue, SimpleQueue)
+        self.assertIs(queue.Empty, Empty)
+
+    if syscfg.get_config_var('WITH_THREAD'):
+        def test_threads(self):
+            import threading
+            q = SimpleQueue()
+            results = SimpleQueue()
+
+            def worker():
+                while True:
+                    item = q.get(timeout=30)
+                    if item is None:
+                        break
+                    results.put(item * 2)
+
+            threads = [threading.Thread(target=worker) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for i in range(1000):
+                q.put(i)
+            for t in threads:
+                q.put(None)
+            for t in threads:
+                t.join()
+            self.assertEqual(sorted(results.get_nowait() for _ in range(1000)), [i * 2 for i in range(1000)])
+            self.assertTrue(results.empty())
@@ -0,0 +1,171 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import socket
+import sys
+import unittest
+
+
+class SocketRecvTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.client.connect(self.server.getsockname())
+        self.conn, _ = self.server.accept()
+
+    def tearDown(self):
+        self.conn.close()
+        self.client.close()
+        self.server.close()
+
+    def recv_exactly(self, n):
+        data = b""
+        while len(data) < n:
+            data += self.conn.recv(n - len(data))
+        return data
+
+    def test_recv(self):
+        self.client.sendall(b"hello")
+        self.assertEqual(b"hello", self.recv_exactly(5))
+        self.assertRaises(ValueError, self.conn.recv, -1)
+
+    def test_recv_into_bytearray(self):
+        buf = bytearray(8)
+        self.client.sendall(b"abc")
+        n = self.conn.recv_into(buf)
+        self.assertEqual(b"abc"[:n], buf[:n])
+        self.assertEqual(bytearray(8 - n), buf[n:])
+        self.assertRaises(ValueError, self.conn.recv_into, buf, 9)
+        self.assertRaises(ValueError, self.conn.recv_into, buf, -1)
+
+    def test_recv_into_memoryview(self):
+        buf = bytearray(b"........")
+        self.client.sendall(b"xy")
+        n = self.conn.recv_into(memoryview(buf)[2:], 1)
+        self.assertEqual(1, n)
+        self.assertEqual(bytearray(b"..x....."), buf)
+
+    def test_recvfrom_into(self):
+        buf = bytearray(4)
+        self.client.sendall(b"z")
+        n, _ = self.conn.recvfrom_into(buf)
+        self.assertEqual(1, n)
+        self.assertEqual(bytearray(b"z\0\0\0"), buf)
+
+    def test_recv_peek(self):
+        import select
+        self.client.sendall(b"abc")
+        self.assertEqual(b"a", self.conn.recv(1, socket.MSG_PEEK))
+        self.assertEqual([self.conn], select.select([self.conn], [], [], 5)[0])
+        buf = bytearray(1)
+        self.assertEqual(1, self.conn.recv_into(buf, 1, socket.MSG_PEEK))
+        self.assertEqual(bytearray(b"a"), buf)
+        self.assertEqual(b"abc", self.recv_exactly(3))
+
+    def test_unsupported_flags(self):
+        # MSG_OOB
+        self.assertRaises(OSError, self.conn.recv, 1, 0x1)
+        self.assertRaises(OSError, self.conn.recv_into, bytearray(1), 1, 0x1)
+
+
+class DatagramSocketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.client.bind(("127.0.0.1", 0))
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def test_sendto_recvfrom(self):
+        self.assertEqual(socket.SOCK_DGRAM, self.server.type)
+        self.assertEqual(4, self.client.sendto(b"ping", self.server.getsockname()))
+        data, addr = self.server.recvfrom(16)
+        self.assertEqual(b"ping", data)
+        self.assertEqual(self.client.getsockname(), addr)
+
+    def test_recvfrom_into(self):
+        buf = bytearray(8)
+        self.client.sendto(b"abc", self.server.getsockname())
+        n, addr = self.server.recvfrom_into(buf)
+        self.assertEqual(3, n)
+        self.assertEqual(bytearray(b"abc\0\0\0\0\0"), buf)
+        self.assertEqual(self.client.getsockname(), addr)
+
+    def test_recvfrom_peek(self):
+        self.client.sendto(b"ping", 0, self.server.getsockname())
+        data, addr = self.server.recvfrom(2, socket.MSG_PEEK)
+        self.assertEqual(b"pi", data)
+        self.assertEqual(self.client.getsockname(), addr)
+        self.assertEqual((b"ping", addr), self.server.recvfrom(16))
+
+    def test_unsupported_flags(self):
+        # MSG_OOB
+        self.assertRaises(OSError, self.client.sendto, b"!", 0x1, self.server.getsockname())
+
+    def test_connected_send(self):
+        self.client.connect(self.server.getsockname())
+        self.assertEqual(self.server.getsockname(), self.client.getpeername())
+        self.client.send(b"xyz")
+        self.assertEqual(b"xyz", self.server.recv(16))
+
+    def test_nonblocking(self):
+        self.server.setblocking(False)
+        self.assertRaises(BlockingIOError, self.server.recvfrom, 16)
+
+    def test_timeout(self):
+        self.server.settimeout(0.1)
+        self.assertEqual(0.1, self.server.gettimeout())
+        self.assertRaises(socket.timeout, self.server.recvfrom, 16)
+        if sys.implementation.name == "graalpython":
+            # socket.timeout only became an alias of TimeoutError in Python 3.10
+            self.assertTrue(issubclass(socket.timeout, OSError))
+            self.assertFalse(issubclass(socket.timeout, TimeoutError))
+
+    def test_select(self):
+        import select
+        self.assertEqual([], select.select([self.server], [], [], 0)[0])
+        self.client.sendto(b"!", self.server.getsockname())
+        self.assertEqual([self.server], select.select([self.server], [], [], 5)[0])
@@ -457,6 +457,99 @@ def test_cpython_format():
     assertRaises(TypeError, "{}".format, n)
 
 
+class EchoSpec:
+    def __format__(self, spec):
+        return "<" + spec + ">"
+
+
+def test_format_map():
+    class Missing(dict):
+        def __missing__(self, key):
+            return key.upper()
+
+    assertEqual("{a}-{b[0]}".format_map({'a': 1, 'b': [2]}), "1-2")
+    assertEqual("{a}{b}".format_map(Missing(a=1)), "1B")
+    assertRaises(KeyError, "{x}".format_map, {})
+    assertRaises(ValueError, "{}".format_map, {})
+    assertRaises(ValueError, "{0}".format_map, {})
+
+
+def test_format_nested_spec():
+    e = EchoSpec()
+    assertEqual("{0:{1}}".format(e, "x"), "<x>")
+    assertEqual("{:{}{}}".format(e, "a", "b"), "<ab>")
+    assertEqual("{e:{s}!}".format(e=e, s=">"), "<>!>")
+    assertEqual("{0!r:}".format("a"), "'a'")
+    assertEqual("{!a}".format("\xe9\U0001f600\n"), "'\\xe9\\U0001f600\\n'")
+    assertRaises(ValueError, "{0}{}".format, 1, 2)
+    assertRaises(ValueError, "{}{0}".format, 1, 2)
+    assertEqual("{a}{}{}".format(1, 2, a=3), "312")
+
+
+def test_format_errors():
+    def message(template, *args, **kwargs):
+        try:
+            template.format(*args, **kwargs)
+        except (ValueError, IndexError) as e:
+            return str(e)
+        assert False, "expected %r to fail" % template
+
+    assertEqual(message("}"), "Single '}' encountered in format string")
+    assertEqual(message("{"), "Single '{' encountered in format string")
+    assertEqual(message("{0"), "expected '}' before end of string")
+    assertEqual(message("{0!}", 0), "unmatched '{' in format spec")
+    assertEqual(message("{0!rs}", 0), "expected ':' after conversion specifier")
+    assertEqual(message("{0!x}", 0), "Unknown conversion specifier x")
+    assertEqual(message("{0.}", 0), "Empty attribute in format string")
+    assertEqual(message("{0[0]x}", [0]), "Only '.' or '[' may follow ']' in format field specifier")
+    assertEqual(message("{0:{1:{2}}}", 0, 1, 2), "Max string recursion exceeded")
+    assertEqual(message("{99999999999999999999}"), "Too many decimal digits in format string")
+    assertEqual(message("{2}", 0), "Replacement index 2 out of range for positional args tuple")
+
+
+def test_format_cached_template():
+    e = EchoSpec()
+    for i in range(20):
+        assertEqual("{}:{:x}".format(i, e), "%d:<x>" % i)
+        template = "{%d}" % (i % 3)
+        assertEqual(template.format("a", "b", "c"), "abc"[i % 3])
+        assertRaises(ValueError, ("{" + "x" * (i % 2)).format)
+
+
+def test_formatter_parser():
+    import _string
+    assertEqual(list(_string.formatter_parser('a{{b}}c{0!r:>{1}}d{x.y[z]}')),
+                [('a{', None, None, None), ('b}', None, None, None), ('c', '0', '>{1}', 'r'), ('d', 'x.y[z]', '', None)])
+    assertEqual(list(_string.formatter_parser('')), [])
+    assertEqual(list(_string.formatter_parser('{0:{1:{2:{3}}}}')), [('', '0', '{1:{2:{3}}}', None)])
+    first, rest = _string.formatter_field_name_split('0.a[b][1]')
+    assertEqual(first, 0)
+    assertEqual(list(rest), [(True, 'a'), (False, 'b'), (False, 1)])
+    assertRaises(ValueError, lambda: list(_string.formatter_field_name_split('a.')[1]))
+    assertEqual(string.Formatter().format("{0}-{x}", 1, x=2), "1-2")
+
+
+def test_iter():
+    s = "ab\xe9\u20ac"
+    it = iter(s)
+    assertEqual(it.__length_hint__(), 4)
+    assertEqual(next(it), "a")
+    assertEqual(it.__length_hint__(), 3)
+    assertEqual(list(it), ["b", "\xe9", "\u20ac"])
+    assertRaises(StopIteration, next, it)
+    assertEqual(list(""), [])
+
+    long_str = "x" * 50
+    for i in range(10):
+        long_str += "abc%d" % i
+    assertEqual("".join(iter(long_str)), long_str)
+    assertEqual(sum(1 for c in long_str if c == "a"), 10)
+
+    class MyStr(str):
+        pass
+    assertEqual(list(MyStr("xyz")), ["x", "y", "z"])
+
+
 class UnicodeTest(unittest.TestCase):
     # The type to be tested
     # Change in subclasses to change the behaviour of fixtesttype()
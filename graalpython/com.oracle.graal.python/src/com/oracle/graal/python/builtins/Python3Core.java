@@ -33,10 +33,14 @@ import java.math.BigInteger;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
 import java.util.Map;
 import java.util.Map.Entry;
 import java.util.ServiceLoader;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.locks.ReentrantLock;
 import java.util.function.Supplier;
 import java.util.logging.Level;
 
@@ -101,6 +105,11 @@ import com.oracle.graal.python.builtins.objects.bytes.BytesBuiltins;
 import com.oracle.graal.python.builtins.objects.cell.CellBuiltins;
 import com.oracle.graal.python.builtins.objects.code.CodeBuiltins;
 import com.oracle.graal.python.builtins.objects.complex.ComplexBuiltins;
+import com.oracle.graal.python.builtins.objects.contextvars.ContextBuiltins;
+import com.oracle.graal.python.builtins.objects.contextvars.ContextVarBuiltins;
+import com.oracle.graal.python.builtins.objects.contextvars.TokenBuiltins;
+import com.oracle.graal.python.builtins.objects.deque.DequeBuiltins;
+import com.oracle.graal.python.builtins.objects.deque.DequeIterBuiltins;
 import com.oracle.graal.python.builtins.objects.dict.DictBuiltins;
 import com.oracle.graal.python.builtins.objects.dict.DictItemsIteratorBuiltins;
 import com.oracle.graal.python.builtins.objects.dict.DictKeysIteratorBuiltins;
@@ -127,13 +136,17 @@ import com.oracle.graal.python.builtins.objects.ints.PInt;
 import com.oracle.graal.python.builtins.objects.iterator.ForeignIteratorBuiltins;
 import com.oracle.graal.python.builtins.objects.iterator.IteratorBuiltins;
 import com.oracle.graal.python.builtins.objects.iterator.PZipBuiltins;
+import com.oracle.graal.python.builtins.objects.itertools.AccumulateBuiltins;
+import com.oracle.graal.python.builtins.objects.itertools.ChainBuiltins;
+import com.oracle.graal.python.builtins.objects.itertools.GroupByBuiltins;
+import com.oracle.graal.python.builtins.objects.itertools.IsliceBuiltins;
+import com.oracle.graal.python.builtins.objects.itertools.ZipLongestBuiltins;
 import com.oracle.graal.python.builtins.objects.iterator.SentinelIteratorBuiltins;
 import com.oracle.graal.python.builtins.objects.list.ListBuiltins;
 import com.oracle.graal.python.builtins.objects.lzma.LZMACompressorBuiltins;
 import com.oracle.graal.python.builtins.objects.lzma.LZMADecompressorBuiltins;
 import com.oracle.graal.python.builtins.objects.mappingproxy.MappingproxyBuiltins;
 import com.oracle.graal.python.builtins.objects.memoryview.BufferBuiltins;
-import com.oracle.graal.python.builtins.objects.memoryview.MemoryviewBuiltins;
 import com.oracle.graal.python.builtins.objects.method.AbstractMethodBuiltins;
 import com.oracle.graal.python.builtins.objects.method.BuiltinMethodBuiltins;
 import com.oracle.graal.python.builtins.objects.method.ClassmethodBuiltins;
@@ -145,9 +158,11 @@ import com.oracle.graal.python.builtins.objects.module.ModuleBuiltins;
 import com.oracle.graal.python.builtins.objects.module.PythonModule;
 import com.oracle.graal.python.builtins.objects.object.ObjectBuiltins;
 import com.oracle.graal.python.builtins.objects.object.PythonObject;
+import com.oracle.graal.python.builtins.objects.partial.PartialBuiltins;
 import com.oracle.graal.python.builtins.objects.posix.DirEntryBuiltins;
 import com.oracle.graal.python.builtins.objects.posix.ScandirIteratorBuiltins;
 import com.oracle.graal.python.builtins.objects.random.RandomBuiltins;
+import com.oracle.graal.python.builtins.objects.queue.SimpleQueueBuiltins;
 import com.oracle.graal.python.builtins.objects.range.RangeBuiltins;
 import com.oracle.graal.python.builtins.objects.referencetype.ReferenceTypeBuiltins;
 import com.oracle.graal.python.builtins.objects.reversed.ReversedBuiltins;
@@ -170,6 +185,7 @@ import com.oracle.graal.python.nodes.BuiltinNames;
 import com.oracle.graal.python.nodes.call.GenericInvokeNode;
 import com.oracle.graal.python.runtime.PythonContext;
 import com.oracle.graal.python.runtime.PythonCore;
+import com.oracle.graal.python.runtime.PythonOptions;
 import com.oracle.graal.python.runtime.PythonParser;
 import com.oracle.graal.python.runtime.PythonParser.ParserMode;
 import com.oracle.graal.python.runtime.exception.PException;
@@ -237,12 +253,12 @@ public final class Python3Core implements PythonCore {
                         "function",
                         "_sysconfig",
                         "_socket",
+                        "select",
                         "ctypes",
                         "zlib",
                         "termios",
                         "zipimport",
                         "mmap",
-                        "_queue",
                         "_ast",
                         "java",
                         "pyio_patches",
@@ -255,6 +271,29 @@ public final class Python3Core implements PythonCore {
         return coreFiles.toArray(new String[coreFiles.size()]);
     }
 
+    /**
+     * Core files that only add to their own builtin module and have no other side effects. With
+     * {@link PythonOptions#LazyCoreFiles}, they are not executed during startup but the first time
+     * their module is looked up, e.g. when it is imported. Until then, their modules are also kept
+     * out of {@code sys.modules}, so that imports go through {@link #lookupBuiltinModule}.
+     */
+    private static final Set<String> LAZY_CORE_FILES = new HashSet<>(Arrays.asList(
+                    "_sre",
+                    "_socket",
+                    "select",
+                    "ctypes",
+                    "zlib",
+                    "mmap",
+                    "_ast",
+                    "pwd",
+                    "resource",
+                    "_contextvars",
+                    "_lzma"));
+
+    private final Set<String> pendingCoreFiles = ConcurrentHashMap.newKeySet();
+    // only accessed while holding the import lock
+    private final Set<String> loadingCoreFiles = new HashSet<>();
+
     private final PythonBuiltins[] builtins;
 
     private static final PythonBuiltins[] initializeBuiltins() {
@@ -325,10 +364,17 @@ public final class Python3Core implements PythonCore {
                         new IOModuleBuiltins(),
                         new StringModuleBuiltins(),
                         new ItertoolsModuleBuiltins(),
+                        new ChainBuiltins(),
+                        new IsliceBuiltins(),
+                        new GroupByBuiltins(),
+                        new AccumulateBuiltins(),
+                        new ZipLongestBuiltins(),
                         new FunctoolsModuleBuiltins(),
                         new ErrnoModuleBuiltins(),
                         new CodecsModuleBuiltins(),
                         new CollectionsModuleBuiltins(),
+                        new DequeBuiltins(),
+                        new DequeIterBuiltins(),
                         new JavaModuleBuiltins(),
                         new SREModuleBuiltins(),
                         new AstModuleBuiltins(),
@@ -344,7 +390,6 @@ public final class Python3Core implements PythonCore {
                         new LocaleModuleBuiltins(),
                         new SysModuleBuiltins(),
                         new BufferBuiltins(),
-                        new MemoryviewBuiltins(),
                         new SuperBuiltins(),
                         new BinasciiModuleBuiltins(),
                         new PosixSubprocessModuleBuiltins(),
@@ -360,6 +405,7 @@ public final class Python3Core implements PythonCore {
                         new FcntlModuleBuiltins(),
                         new MMapBuiltins(),
                         new QueueModuleBuiltins(),
+                        new SimpleQueueBuiltins(),
                         new ThreadModuleBuiltins(),
                         new ThreadBuiltins(),
                         new LockBuiltins(),
@@ -367,6 +413,10 @@ public final class Python3Core implements PythonCore {
                         new PwdModuleBuiltins(),
                         new ResourceModuleBuiltins(),
                         new ContextvarsModuleBuiltins(),
+                        new ContextVarBuiltins(),
+                        new ContextBuiltins(),
+                        new TokenBuiltins(),
+                        new PartialBuiltins(),
                         new LZMAModuleBuiltins(),
                         new LZMACompressorBuiltins(),
                         new LZMADecompressorBuiltins(),
@@ -438,6 +488,9 @@ public final class Python3Core implements PythonCore {
     private void initializeJavaCore() {
         initializeTypes();
         populateBuiltins();
+        if (PythonOptions.getOption(getContext(), PythonOptions.LazyCoreFiles)) {
+            pendingCoreFiles.addAll(LAZY_CORE_FILES);
+        }
         publishBuiltinModules();
         builtinsModule = builtinModules.get(BuiltinNames.BUILTINS);
     }
@@ -445,7 +498,9 @@ public final class Python3Core implements PythonCore {
     private void initializePythonCore(String coreHome) {
         loadFile(BuiltinNames.BUILTINS, coreHome);
         for (String s : coreFiles) {
-            loadFile(s, coreHome);
+            if (!pendingCoreFiles.contains(s)) {
+                loadFile(s, coreHome);
+            }
         }
         initialized = true;
     }
@@ -465,7 +520,30 @@ public final class Python3Core implements PythonCore {
 
     @TruffleBoundary
     public PythonModule lookupBuiltinModule(String name) {
-        return builtinModules.get(name);
+        PythonModule module = builtinModules.get(name);
+        if (initialized && pendingCoreFiles.contains(name)) {
+            loadPendingCoreFile(name);
+        }
+        return module;
+    }
+
+    private void loadPendingCoreFile(String name) {
+        ReentrantLock importLock = getContext().getImportLock();
+        importLock.lock();
+        try {
+            // the core file may look up its own module while it runs, that must not load it again
+            if (pendingCoreFiles.contains(name) && loadingCoreFiles.add(name)) {
+                try {
+                    loadFile(name, getContext().getCoreHomeOrFail());
+                    // only a successful load is final, a failed one is retried on the next lookup
+                    pendingCoreFiles.remove(name);
+                } finally {
+                    loadingCoreFiles.remove(name);
+                }
+            }
+        } finally {
+            importLock.unlock();
+        }
     }
 
     public PythonBuiltinClass lookupType(PythonBuiltinClassType type) {
@@ -499,7 +577,9 @@ public final class Python3Core implements PythonCore {
         PythonModule sysModule = builtinModules.get("sys");
         PDict sysModules = (PDict) sysModule.getAttribute("modules");
         for (Entry<String, PythonModule> entry : builtinModules.entrySet()) {
-            sysModules.setItem(entry.getKey(), entry.getValue());
+            if (!pendingCoreFiles.contains(entry.getKey())) {
+                sysModules.setItem(entry.getKey(), entry.getValue());
+            }
         }
     }
 
@@ -50,6 +50,7 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
     ForeignObject(BuiltinNames.FOREIGN),
     Boolean("bool", BuiltinNames.BUILTINS),
     GetSetDescriptor("get_set_desc"),
+    PAccumulate("accumulate", "itertools"),
     PArray("array", "array"),
     PArrayIterator("arrayiterator"),
     PIterator("iterator"),
@@ -58,7 +59,11 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
     PByteArray("bytearray", BuiltinNames.BUILTINS),
     PBytes("bytes", BuiltinNames.BUILTINS),
     PCell("cell"),
+    PChain("chain", "itertools"),
     PComplex("complex", BuiltinNames.BUILTINS),
+    PDeque("deque", "_collections"),
+    PDequeIter("_deque_iterator", "_collections"),
+    PDequeRevIter("_deque_reverse_iterator", "_collections"),
     PDict("dict", BuiltinNames.BUILTINS),
     PDictKeysView("dict_keys"),
     PDictItemsIterator("dict_itemsiterator"),
@@ -73,7 +78,10 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
     PFrozenSet("frozenset", BuiltinNames.BUILTINS),
     PFunction("function"),
     PGenerator("generator"),
+    PGroupBy("groupby", "itertools"),
+    PGrouper("_grouper", "itertools"),
     PInt("int", BuiltinNames.BUILTINS),
+    PIslice("islice", "itertools"),
     PList("list", BuiltinNames.BUILTINS),
     PMappingproxy("mappingproxy"),
     PMemoryView("memoryview", BuiltinNames.BUILTINS),
@@ -98,12 +106,18 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
     Super("super", BuiltinNames.BUILTINS),
     PCode("code"),
     PZip("zip", BuiltinNames.BUILTINS),
+    PZipLongest("zip_longest", "itertools"),
     PZipImporter("zipimporter", "zipimport"),
     PBuffer("buffer", BuiltinNames.BUILTINS),
     PThread("start_new_thread", "_thread"),
     PLock("LockType", "_thread"),
     PRLock("RLock", "_thread"),
     PSemLock("SemLock", "_multiprocessing"),
+    PSimpleQueue("SimpleQueue", "_queue"),
+    PContextVar("ContextVar", "_contextvars"),
+    PContextVarsContext("Context", "_contextvars"),
+    PContextVarsToken("Token", "_contextvars"),
+    PPartial("partial", "_functools"),
     PSocket("socket", "_socket"),
     PStaticmethod("staticmethod", BuiltinNames.BUILTINS),
     PClassmethod("classmethod", BuiltinNames.BUILTINS),
@@ -156,6 +170,8 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
     ZipImportError("ZipImportError", "zipimport"),
     ZLibError("error", "zlib"),
     LZMAError("LZMAError", "_lzma"),
+    QueueEmpty("Empty", "_queue"),
+    SocketTimeout("timeout", "_socket"),
 
     // todo: all OS errors
 
@@ -288,6 +304,8 @@ public enum PythonBuiltinClassType implements LazyPythonClass {
         ZipImportError.base = ImportError;
         ZLibError.base = Exception;
         LZMAError.base = Exception;
+        QueueEmpty.base = Exception;
+        SocketTimeout.base = OSError;
 
         ReferenceError.base = Exception;
         RuntimeError.base = Exception;
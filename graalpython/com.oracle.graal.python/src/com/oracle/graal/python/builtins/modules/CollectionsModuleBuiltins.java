@@ -40,18 +40,88 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.util.ArrayList;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+
 import java.util.List;
 
+import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.deque.PDeque;
+import com.oracle.graal.python.builtins.objects.deque.PDequeIter;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.util.CastToIndexNode;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.Fallback;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
 
 @CoreFunctions(defineModule = "_collections")
 public class CollectionsModuleBuiltins extends PythonBuiltins {
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return new ArrayList<>();
+        return CollectionsModuleBuiltinsFactory.getFactories();
+    }
+
+    // _collections.deque([iterable[, maxlen]])
+    @Builtin(name = "deque", minNumOfPositionalArgs = 1, takesVarArgs = true, takesVarKeywordArgs = true, constructsClass = PythonBuiltinClassType.PDeque)
+    @GenerateNodeFactory
+    abstract static class DequeNode extends PythonBuiltinNode {
+        @Specialization
+        @SuppressWarnings("unused")
+        PDeque doGeneric(LazyPythonClass cls, Object[] args, PKeyword[] kwargs) {
+            // the contents are set up by deque.__init__
+            return factory().createDeque(cls);
+        }
+    }
+
+    // _collections._deque_iterator(deque[, index])
+    @Builtin(name = "_deque_iterator", minNumOfPositionalArgs = 2, parameterNames = {"cls", "deque", "index"}, constructsClass = PythonBuiltinClassType.PDequeIter, isPublic = false)
+    @GenerateNodeFactory
+    abstract static class DequeIterNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PDequeIter doGeneric(VirtualFrame frame, @SuppressWarnings("unused") LazyPythonClass cls, PDeque deque, Object index,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            PDequeIter iter = factory().createDequeIter(deque);
+            if (index != PNone.NO_VALUE) {
+                iter.advance(castToIndexNode.execute(frame, index));
+            }
+            return iter;
+        }
+
+        @Fallback
+        @SuppressWarnings("unused")
+        Object doError(Object cls, Object deque, Object index) {
+            throw raise(TypeError, "expected a deque, got '%p'", deque);
+        }
+    }
+
+    // _collections._deque_reverse_iterator(deque[, index])
+    @Builtin(name = "_deque_reverse_iterator", minNumOfPositionalArgs = 2, parameterNames = {"cls", "deque", "index"}, constructsClass = PythonBuiltinClassType.PDequeRevIter, isPublic = false)
+    @GenerateNodeFactory
+    abstract static class DequeRevIterNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PDequeIter doGeneric(VirtualFrame frame, @SuppressWarnings("unused") LazyPythonClass cls, PDeque deque, Object index,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            PDequeIter iter = factory().createDequeRevIter(deque);
+            if (index != PNone.NO_VALUE) {
+                iter.advance(castToIndexNode.execute(frame, index));
+            }
+            return iter;
+        }
+
+        @Fallback
+        @SuppressWarnings("unused")
+        Object doError(Object cls, Object deque, Object index) {
+            throw raise(TypeError, "expected a deque, got '%p'", deque);
+        }
     }
 }
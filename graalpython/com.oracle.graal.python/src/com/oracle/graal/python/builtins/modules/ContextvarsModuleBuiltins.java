@@ -40,20 +40,84 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.util.Collections;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.RuntimeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+
 import java.util.List;
 
+import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.contextvars.Hamt;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVar;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVarsContext;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.builtins.objects.str.PString;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.truffle.api.dsl.Fallback;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
 
 @CoreFunctions(defineModule = "_contextvars")
 public class ContextvarsModuleBuiltins extends PythonBuiltins {
 
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return Collections.emptyList();
+        return ContextvarsModuleBuiltinsFactory.getFactories();
+    }
+
+    // ContextVar(name, *, default)
+    @Builtin(name = "ContextVar", minNumOfPositionalArgs = 2, parameterNames = {"cls", "name"}, varArgsMarker = true, keywordOnlyNames = {"default"}, constructsClass = PythonBuiltinClassType.PContextVar)
+    @GenerateNodeFactory
+    abstract static class ContextVarNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PContextVar create(LazyPythonClass cls, String name, Object defaultValue) {
+            return factory().createContextVar(cls, name, defaultValue == PNone.NO_VALUE ? null : defaultValue);
+        }
+
+        @Specialization
+        PContextVar create(LazyPythonClass cls, PString name, Object defaultValue) {
+            return create(cls, name.getValue(), defaultValue);
+        }
+
+        @Fallback
+        Object create(@SuppressWarnings("unused") Object cls, @SuppressWarnings("unused") Object name, @SuppressWarnings("unused") Object defaultValue) {
+            throw raise(TypeError, "context variable name must be a str");
+        }
     }
 
+    @Builtin(name = "Context", minNumOfPositionalArgs = 1, constructsClass = PythonBuiltinClassType.PContextVarsContext)
+    @GenerateNodeFactory
+    abstract static class ContextNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PContextVarsContext create(LazyPythonClass cls) {
+            return factory().createContextVarsContext(cls, Hamt.EMPTY);
+        }
+    }
+
+    @Builtin(name = "Token", minNumOfPositionalArgs = 1, takesVarArgs = true, takesVarKeywordArgs = true, constructsClass = PythonBuiltinClassType.PContextVarsToken)
+    @GenerateNodeFactory
+    abstract static class TokenNode extends PythonBuiltinNode {
+        @Specialization
+        Object create(@SuppressWarnings("unused") Object cls, @SuppressWarnings("unused") Object[] args, @SuppressWarnings("unused") PKeyword[] kwargs) {
+            throw raise(RuntimeError, "Tokens can only be created by ContextVars");
+        }
+    }
+
+    // copy_context() is O(1): the mapping is persistent, so the copy just shares it
+    @Builtin(name = "copy_context")
+    @GenerateNodeFactory
+    abstract static class CopyContextNode extends PythonBuiltinNode {
+        @Specialization
+        PContextVarsContext copy() {
+            return factory().createContextVarsContext(getContext().getContextVarsContext().getVars());
+        }
+    }
 }
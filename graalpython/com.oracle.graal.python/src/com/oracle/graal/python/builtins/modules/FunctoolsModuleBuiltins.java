@@ -40,18 +40,99 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.util.ArrayList;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+
 import java.util.List;
 
+import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.common.PHashingCollection;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.builtins.objects.object.PythonDataModelLibrary;
+import com.oracle.graal.python.builtins.objects.object.PythonObjectLibrary;
+import com.oracle.graal.python.builtins.objects.partial.PPartial;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+import com.oracle.graal.python.nodes.argument.keywords.ExecuteKeywordStarargsNode.ExpandKeywordStarargsNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.runtime.ExecutionContext.IndirectCallContext;
+import com.oracle.graal.python.runtime.PythonContext;
+import com.oracle.graal.python.runtime.exception.PException;
+import com.oracle.truffle.api.CompilerDirectives;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+import com.oracle.truffle.api.interop.UnsupportedMessageException;
+import com.oracle.truffle.api.library.CachedLibrary;
 
 @CoreFunctions(defineModule = "_functools")
 public class FunctoolsModuleBuiltins extends PythonBuiltins {
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return new ArrayList<>();
+        return FunctoolsModuleBuiltinsFactory.getFactories();
+    }
+
+    // partial(func, *args, **keywords)
+    @Builtin(name = "partial", minNumOfPositionalArgs = 2, takesVarArgs = true, takesVarKeywordArgs = true, constructsClass = PythonBuiltinClassType.PPartial)
+    @GenerateNodeFactory
+    abstract static class PartialNode extends PythonBuiltinNode {
+
+        protected static boolean isExactPartial(LazyPythonClass cls, Object function) {
+            return cls == PythonBuiltinClassType.PPartial && function instanceof PPartial && ((PPartial) function).getLazyPythonClass() == PythonBuiltinClassType.PPartial;
+        }
+
+        // partial(partial(f, 1), 2) is flattened into partial(f, 1, 2) unless the inner partial has
+        // attributes of its own
+        @Specialization(guards = "isExactPartial(cls, function)", limit = "1")
+        PPartial createFlat(LazyPythonClass cls, PPartial function, Object[] args, PKeyword[] keywords,
+                        @Cached ExpandKeywordStarargsNode expandKeywordsNode,
+                        @CachedLibrary("function") PythonObjectLibrary functionLib,
+                        @CachedLibrary(limit = "1") PythonObjectLibrary lib) {
+            PHashingCollection dict = functionLib.getDict(function);
+            if (dict != null && dict.size() > 0) {
+                return createPartial(cls, function, args, keywords, lib);
+            }
+            Object[] innerArgs = function.getArgsArray();
+            Object[] flatArgs = new Object[innerArgs.length + args.length];
+            System.arraycopy(innerArgs, 0, flatArgs, 0, innerArgs.length);
+            System.arraycopy(args, 0, flatArgs, innerArgs.length, args.length);
+            PKeyword[] flatKeywords = PPartial.mergeKeywords(expandKeywordsNode.executeWith(function.getKeywords()), keywords);
+            return createPartial(cls, function.getFunction(), flatArgs, flatKeywords, lib);
+        }
+
+        @Specialization(guards = "!isExactPartial(cls, function)")
+        PPartial create(VirtualFrame frame, LazyPythonClass cls, Object function, Object[] args, PKeyword[] keywords,
+                        @CachedLibrary(limit = "3") PythonDataModelLibrary dataModelLibrary,
+                        @CachedLibrary(limit = "1") PythonObjectLibrary lib) {
+            PythonContext context = getContextRef().get();
+            PException caughtException = IndirectCallContext.enter(frame, context, this);
+            try {
+                if (!dataModelLibrary.isCallable(function)) {
+                    throw raise(TypeError, "the first argument must be callable");
+                }
+            } finally {
+                IndirectCallContext.exit(frame, context, caughtException);
+            }
+            return createPartial(cls, function, args, keywords, lib);
+        }
+
+        /**
+         * Creates the partial together with its {@code __dict__}, so that attributes are written to
+         * the dict like for any other object that has one.
+         */
+        private PPartial createPartial(LazyPythonClass cls, Object function, Object[] args, PKeyword[] keywords, PythonObjectLibrary lib) {
+            PPartial partial = factory().createPartial(cls, function, args, keywords);
+            try {
+                lib.setDict(partial, factory().createDictFixedStorage(partial));
+            } catch (UnsupportedMessageException e) {
+                CompilerDirectives.transferToInterpreter();
+                throw new IllegalStateException(e);
+            }
+            return partial;
+        }
     }
 }
@@ -25,19 +25,43 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__INDEX__;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.NotImplementedError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
 
 import java.util.List;
 
 import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.ints.PInt;
+import com.oracle.graal.python.builtins.objects.itertools.PAccumulate;
+import com.oracle.graal.python.builtins.objects.itertools.PChain;
+import com.oracle.graal.python.builtins.objects.itertools.PGroupBy;
+import com.oracle.graal.python.builtins.objects.itertools.PIslice;
+import com.oracle.graal.python.builtins.objects.itertools.PZipLongest;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+import com.oracle.graal.python.nodes.PGuards;
+import com.oracle.graal.python.nodes.PNodeWithContext;
+import com.oracle.graal.python.nodes.PRaiseNode;
+import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
+import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
+import com.oracle.truffle.api.CompilerDirectives;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.Fallback;
 import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.ImportStatic;
 import com.oracle.truffle.api.dsl.NodeFactory;
 import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.dsl.TypeSystemReference;
+import com.oracle.truffle.api.frame.VirtualFrame;
 
 @CoreFunctions(defineModule = "itertools")
 public final class ItertoolsModuleBuiltins extends PythonBuiltins {
@@ -58,4 +82,153 @@ public final class ItertoolsModuleBuiltins extends PythonBuiltins {
         }
     }
 
+    // chain(*iterables)
+    @Builtin(name = "chain", minNumOfPositionalArgs = 1, takesVarArgs = true, constructsClass = PythonBuiltinClassType.PChain)
+    @GenerateNodeFactory
+    public abstract static class ChainNode extends PythonBuiltinNode {
+        @Specialization
+        PChain chain(VirtualFrame frame, LazyPythonClass cls, Object[] iterables,
+                        @Cached("create()") GetIteratorNode getIterator) {
+            return factory().createChain(cls, getIterator.executeWith(frame, factory().createTuple(iterables)));
+        }
+    }
+
+    // islice(iterable, stop), islice(iterable, start, stop[, step])
+    @Builtin(name = "islice", minNumOfPositionalArgs = 3, maxNumOfPositionalArgs = 5, constructsClass = PythonBuiltinClassType.PIslice)
+    @GenerateNodeFactory
+    public abstract static class IsliceNode extends PythonBuiltinNode {
+        private static final String STOP_MESSAGE = "Stop argument for islice() must be None or an integer: 0 <= x <= sys.maxsize.";
+        private static final String INDICES_MESSAGE = "Indices for islice() must be None or an integer: 0 <= x <= sys.maxsize.";
+        private static final String STEP_MESSAGE = "Step for islice() must be a positive integer or None.";
+
+        @Specialization(guards = {"isNoValue(noStop)", "isNoValue(noStep)"})
+        PIslice islice(VirtualFrame frame, LazyPythonClass cls, Object iterable, Object stop, @SuppressWarnings("unused") PNone noStop, @SuppressWarnings("unused") PNone noStep,
+                        @Cached("create()") GetIteratorNode getIterator,
+                        @Cached("create()") IsliceIndexNode stopNode) {
+            long stopValue = stopNode.execute(frame, stop, STOP_MESSAGE);
+            return factory().createIslice(cls, getIterator.executeWith(frame, iterable), 0, stopValue, 1);
+        }
+
+        @Specialization(guards = "!isNoValue(stop)")
+        PIslice islice(VirtualFrame frame, LazyPythonClass cls, Object iterable, Object start, Object stop, Object step,
+                        @Cached("create()") GetIteratorNode getIterator,
+                        @Cached("create()") IsliceIndexNode startNode,
+                        @Cached("create()") IsliceIndexNode stopNode,
+                        @Cached("create()") IsliceIndexNode stepNode) {
+            long startValue = startNode.execute(frame, start, INDICES_MESSAGE);
+            long stopValue = stopNode.execute(frame, stop, INDICES_MESSAGE);
+            long stepValue = PGuards.isNoValue(step) ? 1 : stepNode.execute(frame, step, STEP_MESSAGE);
+            if (startValue == PIslice.UNBOUNDED) {
+                startValue = 0;
+            }
+            if (stepValue == PIslice.UNBOUNDED) {
+                stepValue = 1;
+            } else if (stepValue == 0) {
+                throw raise(ValueError, STEP_MESSAGE);
+            }
+            return factory().createIslice(cls, getIterator.executeWith(frame, iterable), startValue, stopValue, stepValue);
+        }
+    }
+
+    /**
+     * Converts an {@code islice} argument to a non-negative index, or {@link PIslice#UNBOUNDED}
+     * for {@code None}. Other objects are converted through {@code __index__}.
+     */
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    @ImportStatic(PGuards.class)
+    abstract static class IsliceIndexNode extends PNodeWithContext {
+        @Child private PRaiseNode raiseNode;
+        @Child private LookupAndCallUnaryNode callIndexNode;
+
+        abstract long execute(VirtualFrame frame, Object value, String message);
+
+        @Specialization(guards = "isNone(value)")
+        long doNone(@SuppressWarnings("unused") PNone value, @SuppressWarnings("unused") String message) {
+            return PIslice.UNBOUNDED;
+        }
+
+        @Specialization
+        long doLong(long value, String message) {
+            if (value < 0) {
+                throw getRaiseNode().raise(ValueError, message);
+            }
+            return value;
+        }
+
+        @Specialization
+        long doPInt(PInt value, String message) {
+            try {
+                return doLong(value.longValueExact(), message);
+            } catch (ArithmeticException e) {
+                throw getRaiseNode().raise(ValueError, message);
+            }
+        }
+
+        @Fallback
+        long doOther(VirtualFrame frame, Object value, String message) {
+            if (callIndexNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                callIndexNode = insert(LookupAndCallUnaryNode.create(__INDEX__));
+            }
+            Object result = callIndexNode.executeObject(frame, value);
+            if (result == PNone.NO_VALUE) {
+                throw getRaiseNode().raise(ValueError, message);
+            }
+            if (result instanceof Boolean || PGuards.isInteger(result) || result instanceof PInt) {
+                return execute(frame, result, message);
+            }
+            throw getRaiseNode().raise(TypeError, "__index__ returned non-int (type %p)", result);
+        }
+
+        private PRaiseNode getRaiseNode() {
+            if (raiseNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                raiseNode = insert(PRaiseNode.create());
+            }
+            return raiseNode;
+        }
+
+        static IsliceIndexNode create() {
+            return ItertoolsModuleBuiltinsFactory.IsliceIndexNodeGen.create();
+        }
+    }
+
+    // groupby(iterable, key=None)
+    @Builtin(name = "groupby", minNumOfPositionalArgs = 2, parameterNames = {"cls", "iterable", "key"}, constructsClass = PythonBuiltinClassType.PGroupBy)
+    @GenerateNodeFactory
+    public abstract static class GroupByNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PGroupBy groupBy(VirtualFrame frame, LazyPythonClass cls, Object iterable, Object key,
+                        @Cached("create()") GetIteratorNode getIterator) {
+            Object keyFunc = PGuards.isPNone(key) ? null : key;
+            return factory().createGroupBy(cls, getIterator.executeWith(frame, iterable), keyFunc);
+        }
+    }
+
+    // accumulate(iterable, func=None)
+    @Builtin(name = "accumulate", minNumOfPositionalArgs = 2, parameterNames = {"cls", "iterable", "func"}, constructsClass = PythonBuiltinClassType.PAccumulate)
+    @GenerateNodeFactory
+    public abstract static class AccumulateNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PAccumulate accumulate(VirtualFrame frame, LazyPythonClass cls, Object iterable, Object func,
+                        @Cached("create()") GetIteratorNode getIterator) {
+            Object binaryFunc = PGuards.isPNone(func) ? null : func;
+            return factory().createAccumulate(cls, getIterator.executeWith(frame, iterable), binaryFunc);
+        }
+    }
+
+    // zip_longest(*iterables, fillvalue=None)
+    @Builtin(name = "zip_longest", minNumOfPositionalArgs = 1, takesVarArgs = true, keywordOnlyNames = {"fillvalue"}, constructsClass = PythonBuiltinClassType.PZipLongest)
+    @GenerateNodeFactory
+    public abstract static class ZipLongestNode extends PythonBuiltinNode {
+        @Specialization
+        PZipLongest zipLongest(VirtualFrame frame, LazyPythonClass cls, Object[] iterables, Object fillValue,
+                        @Cached("create()") GetIteratorNode getIterator) {
+            Object[] iterators = new Object[iterables.length];
+            for (int i = 0; i < iterables.length; i++) {
+                iterators[i] = getIterator.executeWith(frame, iterables[i]);
+            }
+            return factory().createZipLongest(cls, iterators, PGuards.isNoValue(fillValue) ? PNone.NONE : fillValue);
+        }
+    }
 }
@@ -45,7 +45,13 @@ import static com.oracle.graal.python.builtins.PythonBuiltinClassType.ValueError
 
 import java.io.IOException;
 import java.nio.ByteBuffer;
+import java.nio.channels.Channel;
+import java.nio.channels.FileChannel;
+import java.nio.channels.FileChannel.MapMode;
+import java.nio.channels.NonWritableChannelException;
 import java.nio.channels.SeekableByteChannel;
+import java.nio.file.AccessDeniedException;
+import java.nio.file.NoSuchFileException;
 import java.nio.file.StandardOpenOption;
 import java.util.HashSet;
 import java.util.List;
@@ -56,7 +62,11 @@ import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.exception.OSErrorEnum;
 import com.oracle.graal.python.builtins.objects.ints.PInt;
+import com.oracle.graal.python.builtins.objects.mmap.MMapChannel;
+import com.oracle.graal.python.builtins.objects.mmap.MMapChannel.HeapChannel;
+import com.oracle.graal.python.builtins.objects.mmap.MMapChannel.MappedChannel;
 import com.oracle.graal.python.builtins.objects.mmap.PMMap;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
@@ -100,7 +110,7 @@ public class MMapModuleBuiltins extends PythonBuiltins {
         PMMap doAnonymous(LazyPythonClass clazz, @SuppressWarnings("unused") long fd, int length, @SuppressWarnings("unused") Object tagname, @SuppressWarnings("unused") PNone access,
                         @SuppressWarnings("unused") PNone offset) {
             checkLength(length);
-            return factory().createMMap(clazz, new AnonymousMap(length), length, 0);
+            return factory().createMMap(clazz, new HeapChannel(length), length, 0);
         }
 
         @Specialization(guards = {"fd >= 0", "isNoValue(access)", "isNoValue(offset)"})
@@ -115,8 +125,15 @@ public class MMapModuleBuiltins extends PythonBuiltins {
 
         // mmap(fileno, length, tagname=None, access=ACCESS_DEFAULT[, offset])
         @Specialization(guards = "fd >= 0")
-        PMMap doFile(LazyPythonClass clazz, long fd, int length, @SuppressWarnings("unused") Object tagname, @SuppressWarnings("unused") int access, long offset) {
+        PMMap doFile(LazyPythonClass clazz, long fd, int length, @SuppressWarnings("unused") Object tagname, int access, long offset) {
             checkLength(length);
+            if (offset < 0) {
+                invalidLengthProfile.enter();
+                throw raise(PythonBuiltinClassType.OverflowError, "memory mapped offset must be positive");
+            }
+            if (access < ACCESS_DEFAULT || access > ACCESS_COPY) {
+                throw raise(ValueError, "mmap invalid access parameter.");
+            }
             int ifd;
             try {
                 ifd = PInt.intValueExact(fd);
@@ -125,20 +142,128 @@ public class MMapModuleBuiltins extends PythonBuiltins {
             }
 
             String path = getContext().getResources().getFilePath(ifd);
+            if (path == null) {
+                throw raiseOSError(null, OSErrorEnum.EBADF);
+            }
             TruffleFile truffleFile = getContext().getEnv().getPublicTruffleFile(path);
+            if ((access == ACCESS_DEFAULT || access == ACCESS_WRITE) && isReadOnly(getContext().getResources().getFileChannel(ifd))) {
+                // like mmap(2), a shared writable mapping needs a descriptor opened for writing
+                throw raiseOSError(null, OSErrorEnum.EACCES);
+            }
 
-            // TODO(fa) correctly honor access flags
-            Set<StandardOpenOption> options = set(StandardOpenOption.READ, StandardOpenOption.WRITE);
-
-            // we create a new channel otherwise we cannot guarantee that the cursor is exclusive
+            // we create a new channel, the mapping stays valid even if the fd is closed
             SeekableByteChannel fileChannel;
             try {
-                fileChannel = truffleFile.newByteChannel(options);
-                position(fileChannel, offset);
-                return factory().createMMap(clazz, fileChannel, length, offset);
+                fileChannel = open(truffleFile, access);
+            } catch (AccessDeniedException e) {
+                throw raiseOSError(null, OSErrorEnum.EACCES, e);
+            } catch (NoSuchFileException e) {
+                throw raiseOSError(null, OSErrorEnum.ENOENT, e);
             } catch (IOException e) {
                 throw raise(ValueError, "cannot mmap file");
             }
+            try {
+                long fileSize = size(fileChannel);
+                long mapSize = length;
+                String error = null;
+                if (mapSize == 0) {
+                    if (fileSize == 0) {
+                        error = "cannot mmap an empty file";
+                    } else if (offset >= fileSize) {
+                        error = "mmap offset is greater than file size";
+                    }
+                    mapSize = fileSize - offset;
+                } else if (offset > fileSize || fileSize - offset < mapSize) {
+                    error = "mmap length is greater than file size";
+                }
+                if (error != null) {
+                    close(fileChannel);
+                    throw raise(ValueError, error);
+                }
+                return factory().createMMap(clazz, createChannel(fileChannel, access, offset, mapSize), mapSize, offset);
+            } catch (IOException e) {
+                throw raise(ValueError, "cannot mmap file");
+            }
+        }
+
+        @TruffleBoundary
+        private static SeekableByteChannel open(TruffleFile file, int access) throws IOException {
+            if (access == ACCESS_READ) {
+                return file.newByteChannel(set(StandardOpenOption.READ));
+            } else if (access == ACCESS_COPY) {
+                // a private mapping needs a writable channel, but copy-on-write must also work
+                // for files we may only read
+                try {
+                    return file.newByteChannel(set(StandardOpenOption.READ, StandardOpenOption.WRITE));
+                } catch (IOException | SecurityException e) {
+                    return file.newByteChannel(set(StandardOpenOption.READ));
+                }
+            }
+            return file.newByteChannel(set(StandardOpenOption.READ, StandardOpenOption.WRITE));
+        }
+
+        /**
+         * Checks if the channel behind a file descriptor was opened without write access. Java
+         * channels do not expose their open mode, but an empty write fails on read-only channels.
+         */
+        @TruffleBoundary
+        private static boolean isReadOnly(Channel channel) {
+            if (channel instanceof FileChannel) {
+                try {
+                    ((FileChannel) channel).write(ByteBuffer.allocate(0), 0);
+                } catch (NonWritableChannelException e) {
+                    return true;
+                } catch (IOException e) {
+                    // not a question of access, opening the file will tell
+                }
+            }
+            return false;
+        }
+
+        @TruffleBoundary
+        private static void close(SeekableByteChannel ch) throws IOException {
+            ch.close();
+        }
+
+        @TruffleBoundary
+        private static MMapChannel createChannel(SeekableByteChannel fileChannel, int access, long offset, long size) throws IOException {
+            if (fileChannel instanceof FileChannel) {
+                MapMode mode;
+                if (access == ACCESS_READ) {
+                    mode = MapMode.READ_ONLY;
+                } else if (access == ACCESS_COPY) {
+                    mode = MapMode.PRIVATE;
+                } else {
+                    mode = MapMode.READ_WRITE;
+                }
+                try {
+                    MMapChannel mapped = new MappedChannel((FileChannel) fileChannel, mode, offset, size);
+                    fileChannel.close();
+                    return mapped;
+                } catch (NonWritableChannelException e) {
+                    // copy-on-write over a read-only channel: keep a private copy on the heap
+                    assert access == ACCESS_COPY;
+                } catch (IOException | RuntimeException e) {
+                    fileChannel.close();
+                    throw e;
+                }
+            }
+            // the file system does not support mapping, so we copy the contents to the heap
+            if (size > Integer.MAX_VALUE) {
+                fileChannel.close();
+                throw new IOException("mapping too large");
+            }
+            byte[] data = new byte[(int) size];
+            ByteBuffer buf = ByteBuffer.wrap(data);
+            fileChannel.position(offset);
+            while (buf.hasRemaining() && fileChannel.read(buf) > 0) {
+                // keep reading
+            }
+            if (access == ACCESS_READ || access == ACCESS_COPY) {
+                fileChannel.close();
+                return new HeapChannel(data, access == ACCESS_READ, null, 0);
+            }
+            return new HeapChannel(data, false, fileChannel, offset);
         }
 
         @TruffleBoundary
@@ -172,62 +297,8 @@ public class MMapModuleBuiltins extends PythonBuiltins {
         }
 
         @TruffleBoundary
-        private static void position(SeekableByteChannel ch, long offset) throws IOException {
-            ch.position(offset);
-        }
-    }
-
-    private static class AnonymousMap implements SeekableByteChannel {
-        private final byte[] data;
-
-        private boolean open = true;
-        private int cur;
-
-        public AnonymousMap(int cap) {
-            this.data = new byte[cap];
-        }
-
-        public boolean isOpen() {
-            return open;
-        }
-
-        public void close() throws IOException {
-            open = false;
-        }
-
-        public int read(ByteBuffer dst) throws IOException {
-            int nread = Math.min(dst.remaining(), data.length - cur);
-            dst.put(data, cur, nread);
-            return nread;
-        }
-
-        public int write(ByteBuffer src) throws IOException {
-            int nwrite = Math.min(src.remaining(), data.length - cur);
-            src.get(data, cur, nwrite);
-            return nwrite;
-        }
-
-        public long position() throws IOException {
-            return cur;
-        }
-
-        public SeekableByteChannel position(long newPosition) throws IOException {
-            if (newPosition < 0) {
-                throw new IllegalArgumentException();
-            }
-            cur = (int) newPosition;
-            return this;
-        }
-
-        public long size() throws IOException {
-            return data.length;
-        }
-
-        public SeekableByteChannel truncate(long size) throws IOException {
-            for (int i = 0; i < size; i++) {
-                data[i] = 0;
-            }
-            return this;
+        private static long size(SeekableByteChannel ch) throws IOException {
+            return ch.size();
         }
     }
 }
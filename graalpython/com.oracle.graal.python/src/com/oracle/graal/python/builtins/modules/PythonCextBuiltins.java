@@ -77,6 +77,7 @@ import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.PythonAbstractObject;
 import com.oracle.graal.python.builtins.objects.bytes.BytesBuiltins;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodes;
+import com.oracle.graal.python.builtins.objects.bytes.PByteArray;
 import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.bytes.PIBytesLike;
 import com.oracle.graal.python.builtins.objects.cext.CArrayWrappers.CByteArrayWrapper;
@@ -111,6 +112,8 @@ import com.oracle.graal.python.builtins.objects.cext.PythonNativeWrapperLibrary;
 import com.oracle.graal.python.builtins.objects.cext.UnicodeObjectNodes.UnicodeAsWideCharNode;
 import com.oracle.graal.python.builtins.objects.code.PCode;
 import com.oracle.graal.python.builtins.objects.common.HashingCollectionNodes;
+import com.oracle.graal.python.builtins.objects.common.HashingStorage;
+import com.oracle.graal.python.builtins.objects.common.HashingStorage.DictEntry;
 import com.oracle.graal.python.builtins.objects.common.IndexNodes.NormalizeIndexNode;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.complex.PComplex;
@@ -1937,6 +1940,17 @@ public class PythonCextBuiltins extends PythonBuiltins {
         }
     }
 
+    @Builtin(name = "PyTruffle_ByteArray_AddExports", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class PyTruffle_ByteArray_AddExports extends PythonBinaryBuiltinNode {
+
+        @Specialization
+        PNone doInt(PByteArray byteArray, int delta) {
+            byteArray.setExports(byteArray.getExports() + delta);
+            return PNone.NONE;
+        }
+    }
+
     private abstract static class UpcallLandingNode extends PythonVarargsBuiltinNode {
         @Override
         public Object varArgExecute(VirtualFrame frame, Object self, Object[] arguments, PKeyword[] keywords) throws VarargsBuiltinDirectInvocationNotSupported {
@@ -2490,6 +2504,35 @@ public class PythonCextBuiltins extends PythonBuiltins {
         }
     }
 
+    @Builtin(name = "PyTruffle_Dict_Next", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class PyTruffle_Dict_Next extends PythonBinaryBuiltinNode {
+
+        /**
+         * Returns a tuple {@code (key, value, next_pos)} for the first entry at or after
+         * {@code pos} or {@code None} if there is no such entry. The position is the storage's own
+         * cursor, so each step is constant time for the common storages.
+         */
+        @Specialization
+        Object next(PDict dict, long pos) {
+            HashingStorage storage = dict.getDictStorage();
+            if (pos < 0 || pos >= Integer.MAX_VALUE) {
+                return PNone.NONE;
+            }
+            int position = storage.nextPosition((int) pos);
+            if (position < 0) {
+                return PNone.NONE;
+            }
+            DictEntry entry = storage.entryAt(position);
+            return factory().createTuple(new Object[]{entry.getKey(), entry.getValue(), position + 1});
+        }
+
+        @Fallback
+        Object next(@SuppressWarnings("unused") Object dict, @SuppressWarnings("unused") Object pos) {
+            return PNone.NONE;
+        }
+    }
+
     @Builtin(name = "PySet_Add", minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
     public abstract static class PySet_Add extends PythonBinaryBuiltinNode {
@@ -40,18 +40,34 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.util.ArrayList;
 import java.util.List;
 
+import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.queue.PSimpleQueue;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
 
 @CoreFunctions(defineModule = "_queue")
 public class QueueModuleBuiltins extends PythonBuiltins {
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return new ArrayList<>();
+        return QueueModuleBuiltinsFactory.getFactories();
+    }
+
+    // _queue.SimpleQueue()
+    @Builtin(name = "SimpleQueue", minNumOfPositionalArgs = 1, constructsClass = PythonBuiltinClassType.PSimpleQueue)
+    @GenerateNodeFactory
+    abstract static class SimpleQueueNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PSimpleQueue construct(LazyPythonClass cls) {
+            return factory().createSimpleQueue(cls);
+        }
     }
 }
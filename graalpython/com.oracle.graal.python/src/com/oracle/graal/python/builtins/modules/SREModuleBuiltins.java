@@ -44,6 +44,7 @@ import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeErro
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
 
 import java.io.UnsupportedEncodingException;
+import java.util.Arrays;
 import java.util.List;
 
 import com.oracle.graal.python.PythonLanguage;
@@ -51,21 +52,27 @@ import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.PythonAbstractObject;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodes;
 import com.oracle.graal.python.builtins.objects.bytes.BytesUtils;
+import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.bytes.PIBytesLike;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodesFactory.ToByteArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.builtins.objects.str.PString;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
 import com.oracle.graal.python.runtime.ExecutionContext.IndirectCallContext;
 import com.oracle.graal.python.runtime.PythonContext;
+import com.oracle.graal.python.runtime.RegexCache;
 import com.oracle.graal.python.runtime.exception.PException;
 import com.oracle.graal.python.runtime.exception.PythonErrorType;
+import com.oracle.graal.python.runtime.sequence.storage.IntSequenceStorage;
 import com.oracle.truffle.api.CompilerAsserts;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -79,10 +86,15 @@ import com.oracle.truffle.api.dsl.Specialization;
 import com.oracle.truffle.api.dsl.TypeSystemReference;
 import com.oracle.truffle.api.frame.VirtualFrame;
 import com.oracle.truffle.api.interop.ArityException;
+import com.oracle.truffle.api.interop.InteropException;
 import com.oracle.truffle.api.interop.InteropLibrary;
+import com.oracle.truffle.api.interop.InvalidArrayIndexException;
+import com.oracle.truffle.api.interop.TruffleObject;
 import com.oracle.truffle.api.interop.UnsupportedMessageException;
 import com.oracle.truffle.api.interop.UnsupportedTypeException;
 import com.oracle.truffle.api.library.CachedLibrary;
+import com.oracle.truffle.api.library.ExportLibrary;
+import com.oracle.truffle.api.library.ExportMessage;
 import com.oracle.truffle.api.profiles.BranchProfile;
 import com.oracle.truffle.api.source.Source;
 
@@ -201,15 +213,55 @@ public class SREModuleBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     abstract static class TRegexCallCompile extends PythonTernaryBuiltinNode {
 
+        static SequenceStorageNodes.ToByteArrayNode createToByteArray() {
+            return ToByteArrayNodeGen.create();
+        }
+
+        @TruffleBoundary
+        private static RegexCache.Key createKey(Object pattern, Object flags) {
+            String flagsStr = flags instanceof PString ? ((PString) flags).getValue() : flags instanceof String ? (String) flags : null;
+            if (flagsStr == null) {
+                return null;
+            }
+            if (pattern instanceof byte[]) {
+                byte[] bytes = (byte[]) pattern;
+                StringBuilder sb = new StringBuilder(bytes.length);
+                for (byte b : bytes) {
+                    sb.append((char) (b & 0xFF));
+                }
+                return new RegexCache.Key(sb.toString(), flagsStr, true);
+            }
+            return new RegexCache.Key(pattern instanceof PString ? ((PString) pattern).getValue() : (String) pattern, flagsStr, false);
+        }
+
         @Specialization(limit = "1")
         Object call(VirtualFrame frame, Object callable, Object arg1, Object arg2,
                         @Cached("create()") BranchProfile syntaxError,
                         @Cached("create()") BranchProfile typeError,
+                        @Cached("createToByteArray()") SequenceStorageNodes.ToByteArrayNode toByteArrayNode,
                         @CachedLibrary("callable") InteropLibrary interop,
                         @CachedContext(PythonLanguage.class) PythonContext context) {
+            RegexCache cache = context.getRegexCache();
+            RegexCache.Key key = null;
+            if (arg1 instanceof PBytes) {
+                key = createKey(toByteArrayNode.execute(((PBytes) arg1).getSequenceStorage()), arg2);
+            } else if (arg1 instanceof String || arg1 instanceof PString) {
+                key = createKey(arg1, arg2);
+            }
+            if (key != null) {
+                Object cached = cache.get(key);
+                if (cached != null) {
+                    return cached;
+                }
+            }
             PException savedExceptionState = IndirectCallContext.enter(frame, context, this);
             try {
-                return interop.execute(callable, arg1, arg2);
+                Object compiled = interop.execute(callable, arg1, arg2);
+                // regexes compiled by the Python fallback compiler belong to this context
+                if (key != null && !(compiled instanceof PythonAbstractObject)) {
+                    cache.put(key, compiled);
+                }
+                return compiled;
             } catch (ArityException | UnsupportedTypeException | UnsupportedMessageException e) {
                 typeError.enter();
                 throw raise(TypeError, "%s", e);
@@ -226,6 +278,21 @@ public class SREModuleBuiltins extends PythonBuiltins {
         }
     }
 
+    @Builtin(name = "tregex_cache_info", minNumOfPositionalArgs = 0)
+    @GenerateNodeFactory
+    abstract static class TRegexCacheInfo extends PythonBuiltinNode {
+
+        /**
+         * Returns the statistics of the compiled regex cache of this context as a tuple
+         * {@code (hits, misses, currsize, maxsize)}.
+         */
+        @Specialization
+        Object info(@CachedContext(PythonLanguage.class) PythonContext context) {
+            RegexCache cache = context.getRegexCache();
+            return factory().createTuple(new Object[]{cache.getHits(), cache.getMisses(), cache.size(), RegexCache.MAX_SIZE});
+        }
+    }
+
     @Builtin(name = "tregex_call_exec", minNumOfPositionalArgs = 3)
     @TypeSystemReference(PythonArithmeticTypes.class)
     @GenerateNodeFactory
@@ -247,4 +314,118 @@ public class SREModuleBuiltins extends PythonBuiltins {
             }
         }
     }
+
+    /**
+     * A read-only view on the first {@code length} elements of a regex subject. Passing this view
+     * to TRegex limits matching to {@code [0, length)} without copying the subject. Java strings
+     * are read char by char. All other subjects, like bytes, bytearray, memoryview or mmap, are
+     * read through their own array elements.
+     */
+    @ExportLibrary(InteropLibrary.class)
+    static final class BoundedInput implements TruffleObject {
+
+        final Object input;
+        private final int length;
+
+        BoundedInput(Object input, int length) {
+            this.input = input;
+            this.length = length;
+        }
+
+        @ExportMessage
+        @SuppressWarnings("static-method")
+        boolean hasArrayElements() {
+            return true;
+        }
+
+        @ExportMessage
+        long getArraySize() {
+            return length;
+        }
+
+        @ExportMessage
+        boolean isArrayElementReadable(long index) {
+            return index >= 0 && index < length;
+        }
+
+        @ExportMessage
+        Object readArrayElement(long index,
+                        @CachedLibrary("this.input") InteropLibrary lib) throws UnsupportedMessageException, InvalidArrayIndexException {
+            if (!isArrayElementReadable(index)) {
+                CompilerDirectives.transferToInterpreter();
+                throw InvalidArrayIndexException.create(index);
+            }
+            if (input instanceof String) {
+                return ((String) input).charAt((int) index);
+            }
+            return lib.readArrayElement(input, index);
+        }
+    }
+
+    @Builtin(name = "tregex_bounded_input", minNumOfPositionalArgs = 2)
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    @GenerateNodeFactory
+    abstract static class TRegexBoundedInput extends PythonBinaryBuiltinNode {
+
+        @Specialization
+        Object bound(PString input, int length) {
+            return new BoundedInput(input.getValue(), length);
+        }
+
+        @Specialization(guards = "!isPString(input)")
+        Object bound(Object input, int length) {
+            return new BoundedInput(input, length);
+        }
+    }
+
+    /**
+     * Runs a compiled regex repeatedly over {@code input}, starting at {@code pos}, until it no
+     * longer matches, a search would start after {@code lastpos}, or {@code maxcount} matches
+     * were found ({@code maxcount <= 0} means no limit). Empty matches advance the search position
+     * by one. The result is a flat int list holding {@code (start, end)} of all {@code ngroups}
+     * groups for each match.
+     */
+    @Builtin(name = "tregex_search_all", minNumOfPositionalArgs = 6)
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    @GenerateNodeFactory
+    abstract static class TRegexSearchAll extends PythonBuiltinNode {
+
+        @Specialization(limit = "1")
+        Object call(VirtualFrame frame, Object callable, Object input, int pos, int lastpos, int ngroups, int maxcount,
+                        @Cached("create()") BranchProfile typeError,
+                        @CachedLibrary("callable") InteropLibrary interop,
+                        @CachedLibrary(limit = "2") InteropLibrary resultLib,
+                        @CachedContext(PythonLanguage.class) PythonContext context) {
+            int[] bounds = new int[ngroups * 2 * 8];
+            int length = 0;
+            int count = 0;
+            int searchPos = pos;
+            PException savedExceptionState = IndirectCallContext.enter(frame, context, this);
+            try {
+                while ((maxcount <= 0 || count < maxcount) && searchPos <= lastpos) {
+                    Object result = interop.execute(callable, input, searchPos);
+                    if (!resultLib.asBoolean(resultLib.readMember(result, "isMatch"))) {
+                        break;
+                    }
+                    if (length + ngroups * 2 > bounds.length) {
+                        bounds = Arrays.copyOf(bounds, bounds.length * 2);
+                    }
+                    for (int i = 0; i < ngroups; i++) {
+                        bounds[length++] = resultLib.asInt(resultLib.invokeMember(result, "getStart", i));
+                        bounds[length++] = resultLib.asInt(resultLib.invokeMember(result, "getEnd", i));
+                    }
+                    count++;
+                    int start = bounds[length - ngroups * 2];
+                    int end = bounds[length - ngroups * 2 + 1];
+                    searchPos = start == end ? end + 1 : end;
+                }
+            } catch (InteropException e) {
+                typeError.enter();
+                throw raise(TypeError, "%s", e);
+            } finally {
+                IndirectCallContext.exit(frame, context, savedExceptionState);
+            }
+            return factory().createList(new IntSequenceStorage(bounds, length));
+        }
+    }
 }
@@ -40,38 +40,452 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.io.PrintStream;
+import java.io.IOException;
+import java.nio.channels.Channel;
+import java.nio.channels.ClosedSelectorException;
+import java.nio.channels.SelectableChannel;
+import java.nio.channels.SelectionKey;
+import java.nio.channels.Selector;
+import java.nio.channels.SocketChannel;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
 import java.util.List;
 
 import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltins;
-import com.oracle.graal.python.builtins.objects.tuple.PTuple;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.common.SequenceNodes.GetObjectArrayNode;
+import com.oracle.graal.python.builtins.objects.exception.OSErrorEnum;
+import com.oracle.graal.python.builtins.objects.list.PList;
+import com.oracle.graal.python.builtins.objects.socket.PSocket;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
-import com.oracle.graal.python.runtime.PythonOptions;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.util.CastToJavaIntNode;
+import com.oracle.graal.python.nodes.util.CastToJavaLongNode;
+import com.oracle.graal.python.runtime.PosixResources;
+import com.oracle.graal.python.runtime.object.PythonObjectFactory;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+import com.oracle.truffle.api.dsl.Cached;
 import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
 import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
 
 @CoreFunctions(defineModule = "select")
 public class SelectModuleBuiltins extends PythonBuiltins {
+    // must match the constants in lib-graalpython/select.py
+    static final int POLLIN = 0x001;
+    static final int POLLOUT = 0x004;
+    static final int POLLERR = 0x008;
+    static final int POLLNVAL = 0x020;
+
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
         return SelectModuleBuiltinsFactory.getFactories();
     }
 
-    @Builtin(name = "select", minNumOfPositionalArgs = 3, parameterNames = {"rlist", "wlist", "xlist", "timeout"})
+    /**
+     * A selector together with the file descriptors registered with it. It backs the {@code poll}
+     * and {@code epoll} objects of {@code select.py} and lives in the file descriptor table, so
+     * the selector and its registrations are kept between waits and closing the file descriptor
+     * releases them. Registered channels stay in non-blocking mode until they are unregistered.
+     */
+    static final class Poller implements Channel {
+        private final PosixResources resources;
+        private final Selector selector;
+        private final LinkedHashMap<Integer, Registration> registrations = new LinkedHashMap<>();
+
+        private static final class Registration {
+            final int fd;
+            final Channel channel;
+            /** The channel to register with the selector, {@code null} if not known yet. */
+            SelectableChannel selectable;
+            int events;
+            /** The {@code (fd, revents)} pair reported by the current wait, if any. */
+            int[] ready;
+
+            Registration(int fd, Channel channel) {
+                this.fd = fd;
+                this.channel = channel;
+            }
+        }
+
+        @TruffleBoundary
+        Poller(PosixResources resources) throws IOException {
+            this.resources = resources;
+            this.selector = Selector.open();
+        }
+
+        @TruffleBoundary
+        synchronized void register(int fd, int events) throws IOException {
+            Registration registration = registrations.get(fd);
+            if (registration == null) {
+                registration = new Registration(fd, resources.getFileChannel(fd));
+                registrations.put(fd, registration);
+            }
+            registration.events = events;
+            update(registration);
+        }
+
+        @TruffleBoundary
+        synchronized void unregister(int fd) throws IOException {
+            Registration registration = registrations.remove(fd);
+            if (registration != null) {
+                update(registration);
+            }
+        }
+
+        /**
+         * Brings the selection key of the registration's channel in line with the events of all
+         * file descriptors that currently refer to it.
+         */
+        @SuppressWarnings("unchecked")
+        private void update(Registration registration) throws IOException {
+            if (registration.selectable == null) {
+                registration.selectable = getSelectableChannel(registration.channel);
+                if (registration.selectable == null) {
+                    return;
+                }
+            }
+            SelectableChannel selectable = registration.selectable;
+            if (!selectable.isOpen()) {
+                return;
+            }
+            SelectionKey key = selectable.keyFor(selector);
+            if (key != null && !key.isValid()) {
+                flush();
+                key = null;
+            }
+            List<Registration> attached = key == null ? new ArrayList<>() : (List<Registration>) key.attachment();
+            attached.remove(registration);
+            if (registrations.get(registration.fd) == registration) {
+                attached.add(registration);
+            }
+            int ops = 0;
+            for (Registration r : attached) {
+                ops |= getInterestOps(selectable, r.events);
+            }
+            if (key == null) {
+                if (ops != 0) {
+                    // a waiting thread has to leave the selector before the channel can be added
+                    selector.wakeup();
+                    resources.registerSelectable(selectable, selector, ops, attached);
+                }
+            } else if (attached.isEmpty()) {
+                key.cancel();
+                flush();
+                resources.releaseSelectable(selectable);
+            } else {
+                key.interestOps(ops);
+                selector.wakeup();
+            }
+        }
+
+        /**
+         * Lets the selector drop cancelled keys, the readiness it sees on the way is discarded.
+         */
+        private void flush() throws IOException {
+            selector.wakeup();
+            selector.selectNow();
+            selector.selectedKeys().clear();
+        }
+
+        /**
+         * Waits until one of the registered file descriptors is ready or until the timeout (in
+         * milliseconds, negative means forever) expires. Returns {@code (fd, revents)} pairs.
+         */
+        @TruffleBoundary
+        List<int[]> poll(long timeout) throws IOException {
+            long deadline = System.nanoTime() + timeout * 1000000L;
+            ArrayList<int[]> result = new ArrayList<>();
+            try {
+                while (true) {
+                    pollImmediate(result);
+                    long remaining = timeout < 0 ? 0 : (deadline - System.nanoTime() + 999999L) / 1000000L;
+                    if (!result.isEmpty() || timeout == 0 || (timeout > 0 && remaining <= 0)) {
+                        selector.selectNow();
+                    } else if (timeout < 0) {
+                        selector.select();
+                    } else {
+                        selector.select(remaining);
+                    }
+                    pollSelected(result);
+                    if (!result.isEmpty() || timeout == 0 || (timeout > 0 && remaining <= 0) || Thread.currentThread().isInterrupted()) {
+                        return result;
+                    }
+                    // woken up by a registration change, or a spurious wakeup, keep waiting
+                }
+            } catch (ClosedSelectorException e) {
+                // closed by another thread while waiting
+                return result;
+            }
+        }
+
+        /**
+         * Reports the file descriptors that do not need the selector: closed ones and regular
+         * files, which are always ready like with {@code select(2)}. Sockets that got connected or
+         * started listening since they were registered are added to the selector.
+         */
+        private synchronized void pollImmediate(List<int[]> result) throws IOException {
+            for (Registration registration : registrations.values()) {
+                registration.ready = null;
+                Channel channel = registration.channel;
+                // sockets only report being open once connected, but closing them frees the fd
+                if (channel == null || resources.getFileChannel(registration.fd) != channel || (!(channel instanceof PSocket) && !channel.isOpen())) {
+                    addReady(result, registration, POLLNVAL);
+                } else if (channel instanceof PSocket && ((PSocket) channel).hasPeeked()) {
+                    // data received with MSG_PEEK is still queued in the socket
+                    addReady(result, registration, registration.events & POLLIN);
+                } else if (registration.selectable == null) {
+                    if (channel instanceof PSocket) {
+                        // neither connected nor listening yet
+                        update(registration);
+                    } else {
+                        addReady(result, registration, registration.events & (POLLIN | POLLOUT));
+                    }
+                }
+            }
+        }
+
+        private static void addReady(List<int[]> result, Registration registration, int revents) {
+            if (registration.ready != null) {
+                registration.ready[1] |= revents;
+            } else if (revents != 0) {
+                registration.ready = new int[]{registration.fd, revents};
+                result.add(registration.ready);
+            }
+        }
+
+        @SuppressWarnings("unchecked")
+        private synchronized void pollSelected(List<int[]> result) {
+            for (SelectionKey key : selector.selectedKeys()) {
+                if (!key.isValid()) {
+                    continue;
+                }
+                int ready = getReadyEvents(key);
+                for (Registration registration : (List<Registration>) key.attachment()) {
+                    addReady(result, registration, ready & (registration.events | POLLERR));
+                }
+            }
+            selector.selectedKeys().clear();
+        }
+
+        @Override
+        @TruffleBoundary
+        public boolean isOpen() {
+            return selector.isOpen();
+        }
+
+        @Override
+        @TruffleBoundary
+        public synchronized void close() throws IOException {
+            if (!selector.isOpen()) {
+                return;
+            }
+            // closing the selector deregisters all channels
+            selector.close();
+            for (Registration registration : registrations.values()) {
+                if (registration.selectable != null) {
+                    resources.releaseSelectable(registration.selectable);
+                }
+            }
+            registrations.clear();
+        }
+
+        private static SelectableChannel getSelectableChannel(Channel channel) {
+            if (channel instanceof PSocket) {
+                PSocket socket = (PSocket) channel;
+                if (socket.getServerSocket() != null) {
+                    return socket.getServerSocket();
+                } else if (socket.getDatagramSocket() != null) {
+                    return socket.getDatagramSocket();
+                }
+                return socket.getSocket();
+            } else if (channel instanceof SelectableChannel) {
+                return (SelectableChannel) channel;
+            }
+            return null;
+        }
+
+        private static int getInterestOps(SelectableChannel channel, int events) {
+            int validOps = channel.validOps();
+            int ops = 0;
+            if ((events & POLLIN) != 0) {
+                ops |= validOps & (SelectionKey.OP_READ | SelectionKey.OP_ACCEPT);
+            }
+            if ((events & POLLOUT) != 0) {
+                if (channel instanceof SocketChannel && ((SocketChannel) channel).isConnectionPending()) {
+                    ops |= SelectionKey.OP_CONNECT;
+                } else {
+                    ops |= validOps & SelectionKey.OP_WRITE;
+                }
+            }
+            return ops;
+        }
+
+        private static int getReadyEvents(SelectionKey key) {
+            int readyOps = key.readyOps();
+            int revents = 0;
+            if ((readyOps & (SelectionKey.OP_READ | SelectionKey.OP_ACCEPT)) != 0) {
+                revents |= POLLIN;
+            }
+            if ((readyOps & SelectionKey.OP_WRITE) != 0) {
+                revents |= POLLOUT;
+            }
+            if ((readyOps & SelectionKey.OP_CONNECT) != 0) {
+                try {
+                    ((SocketChannel) key.channel()).finishConnect();
+                    // from now on the channel reports that it is writable
+                    key.interestOps((key.interestOps() & ~SelectionKey.OP_CONNECT) | SelectionKey.OP_WRITE);
+                    revents |= POLLOUT;
+                } catch (IOException e) {
+                    revents |= POLLERR;
+                }
+            }
+            return revents;
+        }
+    }
+
+    static Poller getPoller(VirtualFrame frame, PythonBuiltinBaseNode node, PosixResources resources, int fd) {
+        Channel channel = resources.getFileChannel(fd);
+        if (!(channel instanceof Poller) || !channel.isOpen()) {
+            throw node.raiseOSError(frame, OSErrorEnum.EBADF.getNumber());
+        }
+        return (Poller) channel;
+    }
+
+    @TruffleBoundary
+    static PList createResult(PythonObjectFactory factory, List<int[]> ready) {
+        Object[] result = new Object[ready.size()];
+        for (int i = 0; i < result.length; i++) {
+            int[] entry = ready.get(i);
+            result[i] = factory.createTuple(new Object[]{entry[0], entry[1]});
+        }
+        return factory.createList(result);
+    }
+
+    /**
+     * Waits until one of the given file descriptors is ready for the requested {@code POLLIN} /
+     * {@code POLLOUT} events or until the timeout (in milliseconds, negative means forever)
+     * expires. Returns a list of {@code (fd, revents)} tuples. This is the one-shot primitive
+     * behind {@code select}, the channels are registered only for the duration of the call.
+     */
+    @Builtin(name = "_poll", minNumOfPositionalArgs = 3, parameterNames = {"fds", "events", "timeout"})
     @GenerateNodeFactory
-    abstract static class SelectNode extends PythonBuiltinNode {
+    abstract static class PollNode extends PythonTernaryBuiltinNode {
+
         @Specialization
+        PList poll(VirtualFrame frame, Object fdList, Object eventList, Object timeoutObj,
+                        @Cached GetObjectArrayNode getFds,
+                        @Cached GetObjectArrayNode getEvents,
+                        @Cached CastToJavaIntNode castToInt,
+                        @Cached CastToJavaLongNode castToLong) {
+            Object[] fdObjs = getFds.execute(fdList);
+            Object[] eventObjs = getEvents.execute(eventList);
+            int[] fds = new int[fdObjs.length];
+            int[] events = new int[fdObjs.length];
+            for (int i = 0; i < fds.length; i++) {
+                fds[i] = castToInt.execute(fdObjs[i]);
+                events[i] = castToInt.execute(eventObjs[i]);
+            }
+            long timeout = castToLong.execute(timeoutObj);
+            try {
+                return createResult(factory(), doPoll(getContext().getResources(), fds, events, timeout));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+            }
+        }
+
         @TruffleBoundary
-        PTuple select(Object rlist, Object wlist, Object xlist, @SuppressWarnings("unused") Object timeout) {
-            if (PythonOptions.getFlag(getContext(), PythonOptions.VerboseFlag)) {
-                new PrintStream(getContext().getEnv().err()).println("select() will always return immediately, we only support blocking I/O for now");
+        private static List<int[]> doPoll(PosixResources resources, int[] fds, int[] events, long timeout) throws IOException {
+            Poller poller = new Poller(resources);
+            try {
+                for (int i = 0; i < fds.length; i++) {
+                    poller.register(fds[i], events[i]);
+                }
+                return poller.poll(timeout);
+            } finally {
+                poller.close();
+            }
+        }
+    }
+
+    /**
+     * Creates a {@link Poller} and returns its file descriptor.
+     */
+    @Builtin(name = "_poller", minNumOfPositionalArgs = 0)
+    @GenerateNodeFactory
+    abstract static class PollerNode extends PythonBuiltinNode {
+        @Specialization
+        int create(VirtualFrame frame) {
+            PosixResources resources = getContext().getResources();
+            try {
+                return resources.openChannel(new Poller(resources));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+            }
+        }
+    }
+
+    /**
+     * Registers a file descriptor with a {@link Poller} for the given {@code POLLIN} /
+     * {@code POLLOUT} events, or changes the events of an already registered one.
+     */
+    @Builtin(name = "_poller_register", minNumOfPositionalArgs = 3, parameterNames = {"poller", "fd", "events"})
+    @GenerateNodeFactory
+    abstract static class PollerRegisterNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PNone register(VirtualFrame frame, Object pollerFd, Object fd, Object events,
+                        @Cached CastToJavaIntNode castToInt) {
+            PosixResources resources = getContext().getResources();
+            Poller poller = getPoller(frame, this, resources, castToInt.execute(pollerFd));
+            try {
+                poller.register(castToInt.execute(fd), castToInt.execute(events));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+            }
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "_poller_unregister", minNumOfPositionalArgs = 2, parameterNames = {"poller", "fd"})
+    @GenerateNodeFactory
+    abstract static class PollerUnregisterNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone unregister(VirtualFrame frame, Object pollerFd, Object fd,
+                        @Cached CastToJavaIntNode castToInt) {
+            PosixResources resources = getContext().getResources();
+            Poller poller = getPoller(frame, this, resources, castToInt.execute(pollerFd));
+            try {
+                poller.unregister(castToInt.execute(fd));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+            }
+            return PNone.NONE;
+        }
+    }
+
+    /**
+     * Waits on a {@link Poller}, the timeout is in milliseconds and negative values mean forever.
+     * Returns a list of {@code (fd, revents)} tuples.
+     */
+    @Builtin(name = "_poller_wait", minNumOfPositionalArgs = 2, parameterNames = {"poller", "timeout"})
+    @GenerateNodeFactory
+    abstract static class PollerWaitNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PList poll(VirtualFrame frame, Object pollerFd, Object timeout,
+                        @Cached CastToJavaIntNode castToInt,
+                        @Cached CastToJavaLongNode castToLong) {
+            PosixResources resources = getContext().getResources();
+            Poller poller = getPoller(frame, this, resources, castToInt.execute(pollerFd));
+            try {
+                return createResult(factory(), poller.poll(castToLong.execute(timeout)));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
             }
-            return factory().createTuple(new Object[]{rlist, wlist, xlist});
         }
     }
 }
@@ -45,7 +45,9 @@ import java.io.IOException;
 import java.net.Inet4Address;
 import java.net.Inet6Address;
 import java.net.InetAddress;
+import java.net.StandardProtocolFamily;
 import java.net.UnknownHostException;
+import java.nio.channels.DatagramChannel;
 import java.nio.charset.StandardCharsets;
 import java.util.ArrayList;
 import java.util.HashMap;
@@ -258,9 +260,24 @@ public class SocketModuleBuiltins extends PythonBuiltins {
             return createSocketInternal(frame, cls, cast.execute(family), cast.execute(type), cast.execute(proto), cast.execute(fileno));
         }
 
+        @TruffleBoundary
+        private static DatagramChannel openDatagramChannel(int family) throws IOException {
+            DatagramChannel channel = DatagramChannel.open(family == PSocket.AF_INET6 ? StandardProtocolFamily.INET6 : StandardProtocolFamily.INET);
+            channel.configureBlocking(false);
+            return channel;
+        }
+
         private Object createSocketInternal(LazyPythonClass cls, int family, int type, int proto) {
             if (getContext().getEnv().isNativeAccessAllowed()) {
                 PSocket newSocket = factory().createSocket(cls, family, type, proto);
+                if (newSocket.isDatagram()) {
+                    try {
+                        newSocket.setDatagramSocket(openDatagramChannel(family));
+                    } catch (IOException e) {
+                        throw raise(PythonBuiltinClassType.OSError, e);
+                    }
+                    newSocket.setBlocking(true);
+                }
                 int fd = getContext().getResources().openSocket(newSocket);
                 newSocket.setFileno(fd);
                 return newSocket;
@@ -281,7 +298,11 @@ public class SocketModuleBuiltins extends PythonBuiltins {
                     newSocket.setSocket(oldSocket.getSocket());
                 } else if (oldSocket.getServerSocket() != null) {
                     newSocket.setServerSocket(oldSocket.getServerSocket());
+                } else if (oldSocket.getDatagramSocket() != null) {
+                    newSocket.setDatagramSocket(oldSocket.getDatagramSocket());
                 }
+                newSocket.setBlocking(oldSocket.isBlocking());
+                newSocket.setTimeout(oldSocket.getTimeout());
                 getContext().getResources().reopenSocket(newSocket, fileno);
                 return newSocket;
             } else {
@@ -40,18 +40,72 @@
  */
 package com.oracle.graal.python.builtins.modules;
 
-import java.util.ArrayList;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
+
 import java.util.List;
 
+import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
+import com.oracle.graal.python.runtime.formatting.FormatTemplate;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.dsl.TypeSystemReference;
 
 @CoreFunctions(defineModule = "_string")
 public class StringModuleBuiltins extends PythonBuiltins {
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return new ArrayList<>();
+        return StringModuleBuiltinsFactory.getFactories();
+    }
+
+    @Builtin(name = "formatter_parser", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    abstract static class FormatterParserNode extends PythonUnaryBuiltinNode {
+
+        @Specialization
+        @TruffleBoundary
+        Object parse(String string) {
+            FormatTemplate template = FormatTemplate.parseMarkup(getCore(), string);
+            Object[] entries = new Object[template.size()];
+            for (int i = 0; i < entries.length; i++) {
+                FormatTemplate.Field field = template.getField(i);
+                if (field == null) {
+                    entries[i] = factory().createTuple(new Object[]{template.getLiteral(i), PNone.NONE, PNone.NONE, PNone.NONE});
+                } else {
+                    int conversion = field.getConversion();
+                    Object conversionStr = conversion == FormatTemplate.NO_CONVERSION ? PNone.NONE : new String(Character.toChars(conversion));
+                    entries[i] = factory().createTuple(new Object[]{template.getLiteral(i), field.getName(), field.getSpec(), conversionStr});
+                }
+            }
+            return factory().createSequenceIterator(factory().createList(entries));
+        }
+    }
+
+    @Builtin(name = "formatter_field_name_split", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    abstract static class FormatterFieldNameSplitNode extends PythonUnaryBuiltinNode {
+
+        @Specialization
+        @TruffleBoundary
+        Object split(String string) {
+            FormatTemplate.FieldName name = FormatTemplate.splitFieldName(string);
+            if (name.getError() != null) {
+                throw raise(ValueError, "%s", name.getError());
+            }
+            Object[] lookups = new Object[name.getLookupCount()];
+            for (int i = 0; i < lookups.length; i++) {
+                lookups[i] = factory().createTuple(new Object[]{name.isAttributeLookup(i), name.getLookupKey(i)});
+            }
+            return factory().createTuple(new Object[]{name.getFirst(), factory().createSequenceIterator(factory().createList(lookups))});
+        }
     }
 }
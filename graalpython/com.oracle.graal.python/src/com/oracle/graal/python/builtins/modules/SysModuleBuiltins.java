@@ -129,6 +129,7 @@ public class SysModuleBuiltins extends PythonBuiltins {
         builtinConstants.put("abiflags", "");
         builtinConstants.put("byteorder", ByteOrder.nativeOrder() == ByteOrder.LITTLE_ENDIAN ? "little" : "big");
         builtinConstants.put("copyright", LICENSE);
+        // keeps importlib from writing .pyc files, the parser cache follows the -B flag instead
         builtinConstants.put("dont_write_bytecode", true);
         builtinConstants.put("modules", core.factory().createDict());
         builtinConstants.put("path", core.factory().createList());
@@ -200,7 +201,7 @@ public class SysModuleBuiltins extends PythonBuiltins {
         sys.setAttribute("__flags__", core.factory().createTuple(new Object[]{
                         false, // bytes_warning
                         !PythonOptions.getFlag(context, PythonOptions.PythonOptimizeFlag), // debug
-                        true,  // dont_write_bytecode
+                        PythonOptions.getFlag(context, PythonOptions.DontWriteBytecodeFlag), // dont_write_bytecode
                         false, // hash_randomization
                         PythonOptions.getFlag(context, PythonOptions.IgnoreEnvironmentFlag), // ignore_environment
                         PythonOptions.getFlag(context, PythonOptions.InspectFlag), // inspect
@@ -41,6 +41,8 @@ import static com.oracle.graal.python.nodes.SpecialMethodNames.__REPR__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__RMUL__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__STR__;
 
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 import java.util.Arrays;
 import java.util.List;
 
@@ -50,6 +52,8 @@ import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.array.ArrayBuiltinsFactory.ArrayNoGeneralizationNodeGen;
+import com.oracle.graal.python.builtins.objects.bytes.BytesNodes;
+import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.common.IndexNodes.NormalizeIndexNode;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes.GenNodeSupplier;
@@ -63,10 +67,12 @@ import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.runtime.exception.PythonErrorType;
 import com.oracle.graal.python.runtime.sequence.storage.BasicSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.ByteSequenceStorage;
+import com.oracle.graal.python.runtime.sequence.storage.CharSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.DoubleSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.IntSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.LongSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.SequenceStorage;
+import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
 import com.oracle.truffle.api.dsl.Cached;
 import com.oracle.truffle.api.dsl.Fallback;
@@ -264,16 +270,145 @@ public class ArrayBuiltins extends PythonBuiltins {
         }
     }
 
-    @Builtin(name = "itemsize", minNumOfPositionalArgs = 1)
+    @Builtin(name = "itemsize", minNumOfPositionalArgs = 1, isGetter = true)
     @GenerateNodeFactory
     abstract static class ItemSizeNode extends PythonUnaryBuiltinNode {
 
         @Specialization
-        Object getItemSize(PArray self) {
-            if (self.getSequenceStorage().getElementType() == SequenceStorage.ListStorageType.Int) {
-                return factory().createInt(4);
+        int getItemSize(PArray self) {
+            return itemSize(self.getSequenceStorage());
+        }
+    }
+
+    @Builtin(name = "frombytes", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class ArrayFromBytesNode extends PythonBinaryBuiltinNode {
+
+        @Specialization
+        PNone frombytes(VirtualFrame frame, PArray self, Object buffer,
+                        @Cached("create()") BytesNodes.ToBytesNode toBytesNode) {
+            SequenceStorage store = self.getSequenceStorage();
+            byte[] bytes = toBytesNode.execute(frame, buffer);
+            if (bytes.length % itemSize(store) != 0) {
+                throw raise(PythonErrorType.ValueError, "bytes length not a multiple of item size");
             }
-            return factory().createInt(2);
+            appendBytes(store, bytes);
+            return PNone.NONE;
+        }
+
+        @TruffleBoundary
+        private void appendBytes(SequenceStorage store, byte[] bytes) {
+            int length = store.length();
+            int n = bytes.length / itemSize(store);
+            ByteBuffer buffer = ByteBuffer.wrap(bytes).order(ByteOrder.nativeOrder());
+            store.ensureCapacity(length + n);
+            if (store instanceof ByteSequenceStorage) {
+                buffer.get(((ByteSequenceStorage) store).getInternalByteArray(), length, n);
+            } else if (store instanceof CharSequenceStorage) {
+                buffer.asCharBuffer().get((char[]) store.getInternalArrayObject(), length, n);
+            } else if (store instanceof IntSequenceStorage) {
+                buffer.asIntBuffer().get(((IntSequenceStorage) store).getInternalIntArray(), length, n);
+            } else if (store instanceof LongSequenceStorage) {
+                buffer.asLongBuffer().get(((LongSequenceStorage) store).getInternalLongArray(), length, n);
+            } else if (store instanceof DoubleSequenceStorage) {
+                buffer.asDoubleBuffer().get(((DoubleSequenceStorage) store).getInternalDoubleArray(), length, n);
+            } else {
+                throw raise(PythonErrorType.TypeError, "unsupported array storage");
+            }
+            store.setNewLength(length + n);
+        }
+    }
+
+    @Builtin(name = "tobytes", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ArrayToBytesNode extends PythonUnaryBuiltinNode {
+
+        @Specialization
+        PBytes tobytes(PArray self) {
+            return factory().createBytes(toByteArray(self.getSequenceStorage()));
+        }
+
+        @TruffleBoundary
+        private byte[] toByteArray(SequenceStorage store) {
+            int length = store.length();
+            ByteBuffer buffer = ByteBuffer.allocate(length * itemSize(store)).order(ByteOrder.nativeOrder());
+            if (store instanceof ByteSequenceStorage) {
+                buffer.put(((ByteSequenceStorage) store).getInternalByteArray(), 0, length);
+            } else if (store instanceof CharSequenceStorage) {
+                buffer.asCharBuffer().put((char[]) store.getInternalArrayObject(), 0, length);
+            } else if (store instanceof IntSequenceStorage) {
+                buffer.asIntBuffer().put(((IntSequenceStorage) store).getInternalIntArray(), 0, length);
+            } else if (store instanceof LongSequenceStorage) {
+                buffer.asLongBuffer().put(((LongSequenceStorage) store).getInternalLongArray(), 0, length);
+            } else if (store instanceof DoubleSequenceStorage) {
+                buffer.asDoubleBuffer().put(((DoubleSequenceStorage) store).getInternalDoubleArray(), 0, length);
+            } else {
+                throw raise(PythonErrorType.TypeError, "unsupported array storage");
+            }
+            return buffer.array();
+        }
+    }
+
+    @Builtin(name = "byteswap", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ArrayByteSwapNode extends PythonUnaryBuiltinNode {
+
+        @Specialization
+        PNone byteswap(PArray self) {
+            swap(self.getSequenceStorage());
+            return PNone.NONE;
+        }
+
+        @TruffleBoundary
+        private void swap(SequenceStorage store) {
+            int length = store.length();
+            if (store instanceof ByteSequenceStorage) {
+                return;
+            } else if (store instanceof CharSequenceStorage) {
+                char[] values = (char[]) store.getInternalArrayObject();
+                for (int i = 0; i < length; i++) {
+                    values[i] = Character.reverseBytes(values[i]);
+                }
+            } else if (store instanceof IntSequenceStorage) {
+                int[] values = ((IntSequenceStorage) store).getInternalIntArray();
+                for (int i = 0; i < length; i++) {
+                    values[i] = Integer.reverseBytes(values[i]);
+                }
+            } else if (store instanceof LongSequenceStorage) {
+                long[] values = ((LongSequenceStorage) store).getInternalLongArray();
+                for (int i = 0; i < length; i++) {
+                    values[i] = Long.reverseBytes(values[i]);
+                }
+            } else if (store instanceof DoubleSequenceStorage) {
+                double[] values = ((DoubleSequenceStorage) store).getInternalDoubleArray();
+                for (int i = 0; i < length; i++) {
+                    values[i] = Double.longBitsToDouble(Long.reverseBytes(Double.doubleToRawLongBits(values[i])));
+                }
+            } else {
+                throw raise(PythonErrorType.TypeError, "unsupported array storage");
+            }
+        }
+    }
+
+    /**
+     * The size in bytes of one item, as determined by the storage the array's type code maps to.
+     */
+    static int itemSize(SequenceStorage store) {
+        switch (store.getElementType()) {
+            case Byte:
+                return 1;
+            case Char:
+                return Character.BYTES;
+            case Int:
+                return Integer.BYTES;
+            case Long:
+                return Long.BYTES;
+            case Double:
+                return Double.BYTES;
+            default:
+                // arrays are only created with the storages above
+                CompilerDirectives.transferToInterpreter();
+                throw new IllegalStateException("should not reach");
         }
     }
 
@@ -55,6 +55,7 @@ import com.oracle.graal.python.builtins.objects.bytes.AbstractBytesBuiltinsFacto
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes.GenNodeSupplier;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes.GeneralizationNode;
+import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodesFactory.GetInternalByteArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.ints.PInt;
 import com.oracle.graal.python.builtins.objects.list.PList;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
@@ -63,11 +64,14 @@ import com.oracle.graal.python.nodes.builtins.ListNodes.AppendNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonQuaternaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
 import com.oracle.graal.python.nodes.util.CastToByteNode;
+import com.oracle.graal.python.nodes.util.CastToIndexNode;
 import com.oracle.graal.python.nodes.util.CastToIntegerFromIndexNode;
 import com.oracle.graal.python.runtime.exception.PythonErrorType;
+import com.oracle.graal.python.runtime.sequence.storage.SequenceStorage;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.CompilationFinal;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -79,6 +83,7 @@ import com.oracle.truffle.api.dsl.Specialization;
 import com.oracle.truffle.api.dsl.TypeSystemReference;
 import com.oracle.truffle.api.frame.VirtualFrame;
 import com.oracle.truffle.api.nodes.Node;
+import com.oracle.truffle.api.profiles.BranchProfile;
 import com.oracle.truffle.api.profiles.ConditionProfile;
 
 @CoreFunctions(extendClasses = {PythonBuiltinClassType.PByteArray, PythonBuiltinClassType.PBytes})
@@ -646,29 +651,15 @@ public class AbstractBytesBuiltins extends PythonBuiltins {
             }
             int countSplit = maxsplit;
             int begin = 0;
-
-            outer: for (int offset = 0; offset < size - sep.length + 1; offset++) {
-                for (int sepOffset = 0; sepOffset < sep.length; sepOffset++) {
-                    if (bytes[offset + sepOffset] != sep[sepOffset]) {
-                        continue outer;
-                    }
-                }
-
-                if (begin < offset) {
-                    result.add(copyOfRange(bytes, begin, offset));
-                } else {
-                    result.add(new byte[0]);
-                }
+            int offset;
+            while ((offset = BytesUtils.indexOf(bytes, begin, size, sep, sep.length)) != -1) {
+                result.add(copyOfRange(bytes, begin, offset));
                 begin = offset + sep.length;
-                offset = begin - 1;
                 if (--countSplit == 0) {
                     break;
                 }
             }
-
-            if (begin != size) {
-                result.add(copyOfRange(bytes, begin, size));
-            }
+            result.add(copyOfRange(bytes, begin, size));
             return result;
         }
 
@@ -754,28 +745,15 @@ public class AbstractBytesBuiltins extends PythonBuiltins {
 
             int countSplit = maxsplit;
             int end = size;
-
-            outer: for (int offset = size - 1; offset >= 0; offset--) {
-                for (int sepOffset = 0; sepOffset < sep.length; sepOffset++) {
-                    if (bytes[offset - sepOffset] != sep[sep.length - sepOffset - 1]) {
-                        continue outer;
-                    }
-                }
-
-                if (end > offset) {
-                    result.add(0, copyOfRange(bytes, offset + 1, end));
-                } else {
-                    result.add(0, new byte[0]);
-                }
+            int offset;
+            while ((offset = BytesUtils.lastIndexOf(bytes, 0, end, sep, sep.length)) != -1) {
+                result.add(0, copyOfRange(bytes, offset + sep.length, end));
                 end = offset;
                 if (--countSplit == 0) {
                     break;
                 }
             }
-
-            if (end != 0) {
-                result.add(0, copyOfRange(bytes, 0, end));
-            }
+            result.add(0, copyOfRange(bytes, 0, end));
             return result;
         }
 
@@ -785,6 +763,120 @@ public class AbstractBytesBuiltins extends PythonBuiltins {
         }
     }
 
+    // bytes.find(sub[, start[, end]])
+    // bytearray.find(sub[, start[, end]])
+    @Builtin(name = "find", minNumOfPositionalArgs = 2, parameterNames = {"self", "sub", "start", "end"})
+    @GenerateNodeFactory
+    abstract static class FindNode extends PythonQuaternaryBuiltinNode {
+
+        @Specialization
+        int find(VirtualFrame frame, PIBytesLike self, Object sub, Object start, Object end,
+                        @Cached("create()") BytesNodes.FindNode findNode) {
+            return findNode.execute(frame, self, sub, start, end);
+        }
+    }
+
+    // bytes.rfind(sub[, start[, end]])
+    // bytearray.rfind(sub[, start[, end]])
+    @Builtin(name = "rfind", minNumOfPositionalArgs = 2, parameterNames = {"self", "sub", "start", "end"})
+    @GenerateNodeFactory
+    abstract static class RFindNode extends PythonQuaternaryBuiltinNode {
+
+        @Specialization
+        int rfind(VirtualFrame frame, PIBytesLike self, Object sub, Object start, Object end,
+                        @Cached("create()") BytesNodes.RFindNode rfindNode) {
+            return rfindNode.execute(frame, self, sub, start, end);
+        }
+    }
+
+    // bytes.index(sub[, start[, end]])
+    // bytearray.index(sub[, start[, end]])
+    @Builtin(name = "index", minNumOfPositionalArgs = 2, parameterNames = {"self", "sub", "start", "end"})
+    @GenerateNodeFactory
+    abstract static class IndexNode extends PythonQuaternaryBuiltinNode {
+
+        @Specialization
+        int index(VirtualFrame frame, PIBytesLike self, Object sub, Object start, Object end,
+                        @Cached("create()") BytesNodes.FindNode findNode,
+                        @Cached("create()") BranchProfile notFoundProfile) {
+            int idx = findNode.execute(frame, self, sub, start, end);
+            if (idx == -1) {
+                notFoundProfile.enter();
+                throw raise(PythonErrorType.ValueError, "subsection not found");
+            }
+            return idx;
+        }
+    }
+
+    // bytes.rindex(sub[, start[, end]])
+    // bytearray.rindex(sub[, start[, end]])
+    @Builtin(name = "rindex", minNumOfPositionalArgs = 2, parameterNames = {"self", "sub", "start", "end"})
+    @GenerateNodeFactory
+    abstract static class RIndexNode extends PythonQuaternaryBuiltinNode {
+
+        @Specialization
+        int rindex(VirtualFrame frame, PIBytesLike self, Object sub, Object start, Object end,
+                        @Cached("create()") BytesNodes.RFindNode rfindNode,
+                        @Cached("create()") BranchProfile notFoundProfile) {
+            int idx = rfindNode.execute(frame, self, sub, start, end);
+            if (idx == -1) {
+                notFoundProfile.enter();
+                throw raise(PythonErrorType.ValueError, "subsection not found");
+            }
+            return idx;
+        }
+    }
+
+    // bytes.count(sub[, start[, end]])
+    // bytearray.count(sub[, start[, end]])
+    @Builtin(name = "count", minNumOfPositionalArgs = 2, parameterNames = {"self", "sub", "start", "end"})
+    @GenerateNodeFactory
+    abstract static class CountNode extends PythonQuaternaryBuiltinNode {
+
+        @Specialization
+        int count(VirtualFrame frame, PIBytesLike self, Object sub, Object start, Object end,
+                        @Cached("create()") BytesNodes.CountNode countNode) {
+            return countNode.execute(frame, self, sub, start, end);
+        }
+    }
+
+    // bytes.replace(old, new[, count])
+    // bytearray.replace(old, new[, count])
+    @Builtin(name = "replace", minNumOfPositionalArgs = 3, parameterNames = {"self", "old", "new", "count"})
+    @GenerateNodeFactory
+    abstract static class ReplaceNode extends PythonQuaternaryBuiltinNode {
+        @Child private BytesNodes.ToBytesNode toBytesNode = BytesNodes.ToBytesNode.create();
+        @Child private SequenceStorageNodes.GetInternalByteArrayNode getInternalByteArrayNode = GetInternalByteArrayNodeGen.create();
+        @Child private CastToIndexNode castToIndexNode;
+
+        @Specialization
+        PBytes replace(VirtualFrame frame, PBytes self, Object old, Object replacement, Object count) {
+            return factory().createBytes(doReplace(frame, self, old, replacement, count));
+        }
+
+        @Specialization
+        PByteArray replace(VirtualFrame frame, PByteArray self, Object old, Object replacement, Object count) {
+            return factory().createByteArray(doReplace(frame, self, old, replacement, count));
+        }
+
+        private byte[] doReplace(VirtualFrame frame, PIBytesLike self, Object old, Object replacement, Object count) {
+            int maxCount = count == PNone.NO_VALUE ? -1 : getCastToIndexNode().execute(frame, count);
+            byte[] oldBytes = toBytesNode.execute(frame, old);
+            byte[] replacementBytes = toBytesNode.execute(frame, replacement);
+            SequenceStorage storage = self.getSequenceStorage();
+            byte[] selfBytes = getInternalByteArrayNode.execute(storage);
+            return BytesUtils.replace(selfBytes, storage.length(), oldBytes, replacementBytes, maxCount < 0 ? Integer.MAX_VALUE : maxCount);
+        }
+
+        private CastToIndexNode getCastToIndexNode() {
+            if (castToIndexNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToIndexNode = insert(CastToIndexNode.createOverflow());
+            }
+            return castToIndexNode;
+        }
+    }
+
     // static bytes.maketrans()
     // static bytearray.maketrans()
     @Builtin(name = "maketrans", minNumOfPositionalArgs = 3, isClassmethod = true)
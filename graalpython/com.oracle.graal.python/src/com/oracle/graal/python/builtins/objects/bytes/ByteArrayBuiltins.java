@@ -45,6 +45,7 @@ import static com.oracle.graal.python.nodes.SpecialMethodNames.__REPR__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__RMUL__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__SETITEM__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__STR__;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.BufferError;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.SystemError;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
@@ -64,12 +65,12 @@ import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes.GetI
 import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.builtins.objects.range.PRange;
 import com.oracle.graal.python.builtins.objects.slice.PSlice;
+import com.oracle.graal.python.builtins.objects.slice.PSlice.SliceInfo;
 import com.oracle.graal.python.builtins.objects.tuple.PTuple;
 import com.oracle.graal.python.nodes.SpecialMethodNames;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
 import com.oracle.graal.python.nodes.control.GetNextNode;
-import com.oracle.graal.python.nodes.expression.BinaryComparisonNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
@@ -94,11 +95,12 @@ import com.oracle.truffle.api.dsl.TypeSystemReference;
 import com.oracle.truffle.api.frame.VirtualFrame;
 import com.oracle.truffle.api.profiles.BranchProfile;
 import com.oracle.truffle.api.profiles.ConditionProfile;
-import com.oracle.truffle.api.profiles.ValueProfile;
 
 @CoreFunctions(extendClasses = PythonBuiltinClassType.PByteArray)
 public class ByteArrayBuiltins extends PythonBuiltins {
 
+    private static final String EXPORTS_ERROR = "Existing exports of data: object cannot be re-sized";
+
     @Override
     protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
         return ByteArrayBuiltinsFactory.getFactories();
@@ -122,7 +124,11 @@ public class ByteArrayBuiltins extends PythonBuiltins {
     public abstract static class DelItemNode extends PythonBinaryBuiltinNode {
         @Specialization
         protected PNone doGeneric(VirtualFrame frame, PByteArray self, Object key,
-                        @Cached("create()") SequenceStorageNodes.DeleteNode deleteNode) {
+                        @Cached("create()") SequenceStorageNodes.DeleteNode deleteNode,
+                        @Cached("create()") SequenceStorageNodes.LenNode lenNode) {
+            if (self.getExports() > 0 && !(key instanceof PSlice && ((PSlice) key).computeIndices(lenNode.execute(self.getSequenceStorage())).length == 0)) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
             deleteNode.execute(frame, self.getSequenceStorage(), key);
             return PNone.NONE;
         }
@@ -276,7 +282,11 @@ public class ByteArrayBuiltins extends PythonBuiltins {
     public abstract static class IAddNode extends PythonBinaryBuiltinNode {
         @Specialization
         public PByteArray add(PByteArray self, PIBytesLike other,
-                        @Cached("create()") SequenceStorageNodes.ConcatNode concatNode) {
+                        @Cached("create()") SequenceStorageNodes.ConcatNode concatNode,
+                        @Cached("create()") SequenceStorageNodes.LenNode lenNode) {
+            if (self.getExports() > 0 && lenNode.execute(other.getSequenceStorage()) != 0) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
             SequenceStorage res = concatNode.execute(self.getSequenceStorage(), other.getSequenceStorage());
             updateSequenceStorage(self, res);
             return self;
@@ -286,10 +296,14 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         public PByteArray add(VirtualFrame frame, PByteArray self, PMemoryView other,
                         @Cached("create(TOBYTES)") LookupAndCallUnaryNode toBytesNode,
                         @Cached("createBinaryProfile()") ConditionProfile isBytesProfile,
-                        @Cached("create()") SequenceStorageNodes.ConcatNode concatNode) {
+                        @Cached("create()") SequenceStorageNodes.ConcatNode concatNode,
+                        @Cached("create()") SequenceStorageNodes.LenNode lenNode) {
 
             Object bytesObj = toBytesNode.executeObject(frame, other);
             if (isBytesProfile.profile(bytesObj instanceof PBytes)) {
+                if (self.getExports() > 0 && lenNode.execute(((PBytes) bytesObj).getSequenceStorage()) != 0) {
+                    throw raise(BufferError, EXPORTS_ERROR);
+                }
                 SequenceStorage res = concatNode.execute(self.getSequenceStorage(), ((PBytes) bytesObj).getSequenceStorage());
                 updateSequenceStorage(self, res);
                 return self;
@@ -358,6 +372,9 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         @Specialization
         public PByteArray append(PByteArray byteArray, Object arg,
                         @Cached SequenceStorageNodes.AppendNode appendNode) {
+            if (byteArray.getExports() > 0) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
             appendNode.execute(byteArray.getSequenceStorage(), arg, BytesLikeNoGeneralizationNode.SUPPLIER);
             return byteArray;
         }
@@ -371,6 +388,9 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         @Specialization
         PNone doGeneric(VirtualFrame frame, PByteArray byteArray, Object source,
                         @Cached("createExtend()") SequenceStorageNodes.ExtendNode extendNode) {
+            if (byteArray.getExports() > 0) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
             SequenceStorage execute = extendNode.execute(frame, byteArray.getSequenceStorage(), source);
             assert byteArray.getSequenceStorage() == execute;
             return PNone.NONE;
@@ -398,50 +418,6 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         }
     }
 
-    // bytearray.index(x)
-    @Builtin(name = "index", minNumOfPositionalArgs = 2)
-    @GenerateNodeFactory
-    public abstract static class ByteArrayIndexNode extends PythonBuiltinNode {
-        @Child private SequenceStorageNodes.LenNode lenNode;
-
-        @Specialization
-        public int index(VirtualFrame frame, PByteArray byteArray, Object arg,
-                        @Cached("create()") BytesNodes.FindNode findNode) {
-            return findNode.execute(frame, byteArray, arg, 0, getLength(byteArray.getSequenceStorage()));
-        }
-
-        private int getLength(SequenceStorage s) {
-            if (lenNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                lenNode = insert(SequenceStorageNodes.LenNode.create());
-            }
-            return lenNode.execute(s);
-        }
-    }
-
-    // bytearray.count(x)
-    @Builtin(name = "count", minNumOfPositionalArgs = 2)
-    @GenerateNodeFactory
-    @ImportStatic(SpecialMethodNames.class)
-    public abstract static class ByteArrayCountNode extends PythonBinaryBuiltinNode {
-
-        @Specialization
-        int count(VirtualFrame frame, PByteArray byteArray, Object arg,
-                        @Cached("createClassProfile()") ValueProfile storeProfile,
-                        @Cached("createNotNormalized()") SequenceStorageNodes.GetItemNode getItemNode,
-                        @Cached("create(__EQ__, __EQ__, __EQ__)") BinaryComparisonNode eqNode) {
-
-            SequenceStorage profiled = storeProfile.profile(byteArray.getSequenceStorage());
-            int cnt = 0;
-            for (int i = 0; i < profiled.length(); i++) {
-                if (eqNode.executeBool(frame, arg, getItemNode.execute(frame, profiled, i))) {
-                    cnt++;
-                }
-            }
-            return cnt;
-        }
-    }
-
     // bytearray.reverse()
     @Builtin(name = "reverse", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
@@ -461,7 +437,11 @@ public class ByteArrayBuiltins extends PythonBuiltins {
 
         @Specialization
         public PNone clear(VirtualFrame frame, PByteArray byteArray,
-                        @Cached("create()") SequenceStorageNodes.DeleteNode deleteNode) {
+                        @Cached("create()") SequenceStorageNodes.DeleteNode deleteNode,
+                        @Cached("create()") SequenceStorageNodes.LenNode lenNode) {
+            if (byteArray.getExports() > 0 && lenNode.execute(byteArray.getSequenceStorage()) != 0) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
             deleteNode.execute(frame, byteArray.getSequenceStorage(), factory().createSlice(MISSING_INDEX, MISSING_INDEX, 1));
             return PNone.NONE;
         }
@@ -619,50 +599,6 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         }
     }
 
-    @Builtin(name = "find", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
-    @GenerateNodeFactory
-    abstract static class FindNode extends PythonBuiltinNode {
-        @Child private BytesNodes.FindNode findNode;
-        @Child private SequenceStorageNodes.LenNode lenNode;
-
-        @Specialization
-        int find(VirtualFrame frame, PByteArray self, Object sub, @SuppressWarnings("unused") PNone start, @SuppressWarnings("unused") PNone end) {
-            return find(frame, self, sub, 0, getLength(self.getSequenceStorage()));
-        }
-
-        @Specialization
-        int find(VirtualFrame frame, PByteArray self, Object sub, int start, @SuppressWarnings("unused") PNone end) {
-            return find(frame, self, sub, start, getLength(self.getSequenceStorage()));
-        }
-
-        @Specialization
-        int find(VirtualFrame frame, PByteArray self, Object sub, int start, int ending) {
-            return getFindNode().execute(frame, self, sub, start, ending);
-        }
-
-        @Fallback
-        @SuppressWarnings("unused")
-        Object doGeneric(Object self, Object sub, Object start, Object ending) {
-            throw raise(TypeError, "argument should be integer or bytes-like object, not '%p'", sub);
-        }
-
-        private BytesNodes.FindNode getFindNode() {
-            if (findNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                findNode = insert(BytesNodes.FindNode.create());
-            }
-            return findNode;
-        }
-
-        private int getLength(SequenceStorage s) {
-            if (lenNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                lenNode = insert(SequenceStorageNodes.LenNode.create());
-            }
-            return lenNode.execute(s);
-        }
-    }
-
     @Builtin(name = __GETITEM__, minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
     abstract static class GetitemNode extends PythonBinaryBuiltinNode {
@@ -681,6 +617,9 @@ public class ByteArrayBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     @ImportStatic(SpecialMethodNames.class)
     abstract static class SetItemNode extends PythonTernaryBuiltinNode {
+        @Child private SequenceStorageNodes.ExtendNode extendNode;
+        @Child private SequenceStorageNodes.LenNode lenNode;
+
         @Specialization(guards = {"!isPSlice(idx)", "!isMemoryView(value)"})
         PNone doItem(VirtualFrame frame, PByteArray self, Object idx, Object value,
                         @Cached("createSetItem()") SequenceStorageNodes.SetItemNode setItemNode) {
@@ -705,10 +644,48 @@ public class ByteArrayBuiltins extends PythonBuiltins {
         PNone doSlice(VirtualFrame frame, PByteArray self, PSlice idx, Object value,
                         @Cached("createSetSlice()") SequenceStorageNodes.SetItemNode setItemNode) {
             // this is really just a separate specialization due to the different error message
-            setItemNode.execute(frame, self.getSequenceStorage(), idx, value);
+            Object newValue = value;
+            if (self.getExports() > 0) {
+                newValue = checkExportedSliceAssignment(frame, self, idx, value);
+            }
+            setItemNode.execute(frame, self.getSequenceStorage(), idx, newValue);
             return PNone.NONE;
         }
 
+        /**
+         * Like CPython, converts the value to bytes and only allows the assignment if it does not
+         * resize the exported bytearray.
+         */
+        private Object checkExportedSliceAssignment(VirtualFrame frame, PByteArray self, PSlice slice, Object value) {
+            PIBytesLike bytes;
+            if (value instanceof PIBytesLike) {
+                bytes = (PIBytesLike) value;
+            } else {
+                bytes = factory().createByteArray(getExtendNode().execute(frame, new ByteSequenceStorage(0), value));
+            }
+            SliceInfo info = slice.computeIndices(getLenNode().execute(self.getSequenceStorage()));
+            if (info.step == 1 && getLenNode().execute(bytes.getSequenceStorage()) != info.length) {
+                throw raise(BufferError, EXPORTS_ERROR);
+            }
+            return bytes;
+        }
+
+        private SequenceStorageNodes.ExtendNode getExtendNode() {
+            if (extendNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                extendNode = insert(SequenceStorageNodes.ExtendNode.create(BytesLikeNoGeneralizationNode.SUPPLIER));
+            }
+            return extendNode;
+        }
+
+        private SequenceStorageNodes.LenNode getLenNode() {
+            if (lenNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                lenNode = insert(SequenceStorageNodes.LenNode.create());
+            }
+            return lenNode;
+        }
+
         @Fallback
         @SuppressWarnings("unused")
         Object doGeneric(Object self, Object idx, Object value) {
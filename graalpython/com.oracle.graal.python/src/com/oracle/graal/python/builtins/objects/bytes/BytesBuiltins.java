@@ -45,7 +45,6 @@ import static com.oracle.graal.python.nodes.SpecialMethodNames.__SETITEM__;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.SystemError;
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
 
-import java.io.UnsupportedEncodingException;
 import java.nio.charset.CodingErrorAction;
 import java.util.List;
 
@@ -472,45 +471,6 @@ public class BytesBuiltins extends PythonBuiltins {
         }
     }
 
-    // bytes.find(bytes[, start[, end]])
-    @Builtin(name = "find", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
-    @GenerateNodeFactory
-    abstract static class FindNode extends PythonBuiltinNode {
-        @Child private BytesNodes.FindNode findNode;
-        @Child private SequenceStorageNodes.LenNode lenNode;
-
-        @Specialization
-        int find(VirtualFrame frame, PBytes self, Object sub, @SuppressWarnings("unused") PNone start, @SuppressWarnings("unused") PNone end) {
-            return find(frame, self, sub, 0, getLength(self.getSequenceStorage()));
-        }
-
-        @Specialization
-        int find(VirtualFrame frame, PBytes self, Object sub, int start, @SuppressWarnings("unused") PNone end) {
-            return find(frame, self, sub, start, getLength(self.getSequenceStorage()));
-        }
-
-        @Specialization
-        int find(VirtualFrame frame, PBytes self, Object sub, int start, int ending) {
-            return getFindNode().execute(frame, self, sub, start, ending);
-        }
-
-        private BytesNodes.FindNode getFindNode() {
-            if (findNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                findNode = insert(BytesNodes.FindNode.create());
-            }
-            return findNode;
-        }
-
-        private int getLength(SequenceStorage s) {
-            if (lenNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                lenNode = insert(SequenceStorageNodes.LenNode.create());
-            }
-            return lenNode.execute(s);
-        }
-    }
-
     @Builtin(name = __GETITEM__, minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
     abstract static class GetitemNode extends PythonBinaryBuiltinNode {
@@ -534,32 +494,4 @@ public class BytesBuiltins extends PythonBuiltins {
             throw raise(TypeError, "'bytes' object does not support item assignment");
         }
     }
-
-    @Builtin(name = "replace", minNumOfPositionalArgs = 3)
-    @GenerateNodeFactory
-    abstract static class ReplaceNode extends PythonTernaryBuiltinNode {
-        @Child private BytesNodes.ToBytesNode toBytes = BytesNodes.ToBytesNode.create();
-
-        @Specialization
-        PBytes replace(VirtualFrame frame, PBytes self, PBytes substr, PBytes replacement) {
-            byte[] bytes = toBytes.execute(frame, self);
-            byte[] subBytes = toBytes.execute(frame, substr);
-            byte[] replacementBytes = toBytes.execute(frame, replacement);
-            try {
-                byte[] newBytes = doReplace(bytes, subBytes, replacementBytes);
-                return factory().createBytes(newBytes);
-            } catch (UnsupportedEncodingException e) {
-                CompilerDirectives.transferToInterpreter();
-                throw new IllegalStateException();
-            }
-        }
-
-        @TruffleBoundary
-        private static byte[] doReplace(byte[] bytes, byte[] subBytes, byte[] replacementBytes) throws UnsupportedEncodingException {
-            String string = new String(bytes, "ASCII");
-            String subString = new String(subBytes, "ASCII");
-            String replacementString = new String(replacementBytes, "ASCII");
-            return string.replace(subString, replacementString).getBytes("ASCII");
-        }
-    }
 }
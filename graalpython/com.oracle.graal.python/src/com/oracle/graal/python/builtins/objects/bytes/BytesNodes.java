@@ -41,16 +41,20 @@
 package com.oracle.graal.python.builtins.objects.bytes;
 
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
 
 import java.util.ArrayList;
 
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.objects.bytes.AbstractBytesBuiltins.BytesLikeNoGeneralizationNode;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodesFactory.BytesJoinNodeGen;
+import com.oracle.graal.python.builtins.objects.bytes.BytesNodesFactory.CountNodeGen;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodesFactory.FindNodeGen;
+import com.oracle.graal.python.builtins.objects.bytes.BytesNodesFactory.RFindNodeGen;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodesFactory.ToBytesNodeGen;
 import com.oracle.graal.python.builtins.objects.common.IndexNodes.NormalizeIndexNode;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
+import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodesFactory.GetInternalByteArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodesFactory.ToByteArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.nodes.PGuards;
@@ -61,6 +65,7 @@ import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
 import com.oracle.graal.python.nodes.control.GetNextNode;
 import com.oracle.graal.python.nodes.object.IsBuiltinClassProfile;
+import com.oracle.graal.python.nodes.subscript.SliceLiteralNode.CastToSliceComponentNode;
 import com.oracle.graal.python.nodes.util.CastToByteNode;
 import com.oracle.graal.python.runtime.exception.PException;
 import com.oracle.graal.python.runtime.sequence.PSequence;
@@ -74,6 +79,7 @@ import com.oracle.truffle.api.dsl.ImportStatic;
 import com.oracle.truffle.api.dsl.Specialization;
 import com.oracle.truffle.api.frame.VirtualFrame;
 import com.oracle.truffle.api.nodes.Node;
+import com.oracle.truffle.api.profiles.ConditionProfile;
 import com.oracle.truffle.api.profiles.ValueProfile;
 
 public abstract class BytesNodes {
@@ -208,96 +214,101 @@ public abstract class BytesNodes {
         }
     }
 
-    public abstract static class FindNode extends PNodeWithContext {
+    /**
+     * Base class of the substring searches on bytes-like objects. The haystack is searched in its
+     * storage, {@code start} and {@code end} only bound the search and never copy a slice.
+     */
+    abstract static class AbstractSearchNode extends PNodeWithContext {
         @Child private PRaiseNode raise = PRaiseNode.create();
-        @Child private NormalizeIndexNode normalizeIndexNode;
-        @Child private SequenceStorageNodes.GetItemNode getLeftItemNode;
-        @Child private SequenceStorageNodes.GetItemNode getRightItemNode;
+        @Child private CastToSliceComponentNode castStartNode;
+        @Child private CastToSliceComponentNode castEndNode;
+        @Child private SequenceStorageNodes.GetInternalByteArrayNode getInternalByteArrayNode;
+
+        private final ConditionProfile byteStorageProfile = ConditionProfile.createBinaryProfile();
 
         public abstract int execute(VirtualFrame frame, PIBytesLike bytes, Object sub, Object starting, Object ending);
 
-        @Specialization
-        int find(VirtualFrame frame, PIBytesLike primary, PIBytesLike sub, Object starting, Object ending) {
-            SequenceStorage haystack = primary.getSequenceStorage();
-            int len1 = haystack.length();
+        /**
+         * Searches {@code needle[0:needleLen]} in {@code haystack[start:end]}. Both bounds are
+         * already adjusted to the length of the haystack.
+         */
+        protected abstract int search(byte[] haystack, int start, int end, byte[] needle, int needleLen);
 
+        @Specialization
+        int doBytes(VirtualFrame frame, PIBytesLike primary, PIBytesLike sub, Object starting, Object ending) {
             SequenceStorage needle = sub.getSequenceStorage();
-            int len2 = needle.length();
-
-            int start = getNormalizeIndexNode().execute(starting, len1);
-            int end = getNormalizeIndexNode().execute(ending, len1);
-
-            if (start >= len1 || len1 < len2) {
-                return -1;
-            } else if (end > len1) {
-                end = len1;
-            }
-
-            // TODO implement a more efficient algorithm
-            outer: for (int i = start; i < end; i++) {
-                for (int j = 0; j < len2; j++) {
-                    if (i + j >= end) {
-                        continue outer;
-                    }
-
-                    int hb = getGetLeftItemNode().executeInt(frame, haystack, i + j);
-                    int nb = getGetRightItemNode().executeInt(frame, needle, j);
-
-                    if (nb != hb) {
-                        continue outer;
-                    }
-                }
-                return i;
-            }
-            return -1;
+            return doSearch(frame, primary, getBytes(needle), needle.length(), starting, ending);
         }
 
         @Specialization
-        int find(VirtualFrame frame, PIBytesLike primary, int sub, Object starting, @SuppressWarnings("unused") Object ending) {
-            SequenceStorage haystack = primary.getSequenceStorage();
-            int len1 = haystack.length();
-
-            int start = getNormalizeIndexNode().execute(starting, len1);
-            if (start >= len1) {
-                return -1;
+        int doByte(VirtualFrame frame, PIBytesLike primary, int sub, Object starting, Object ending) {
+            if (sub < 0 || sub > 255) {
+                throw raise.raise(ValueError, "byte must be in range(0, 256)");
             }
+            return doSearch(frame, primary, new byte[]{(byte) sub}, 1, starting, ending);
+        }
 
-            for (int i = start; i < len1; i++) {
-                int hb = getGetLeftItemNode().executeInt(frame, haystack, i);
-                if (hb == sub) {
-                    return i;
-                }
-            }
-            return -1;
+        @Specialization
+        int doMemoryView(VirtualFrame frame, PIBytesLike primary, PMemoryView sub, Object starting, Object ending,
+                        @Cached("create()") ToBytesNode toBytesNode) {
+            byte[] needle = toBytesNode.execute(frame, sub);
+            return doSearch(frame, primary, needle, needle.length, starting, ending);
         }
 
         @Fallback
         int doError(@SuppressWarnings("unused") PIBytesLike bytes, Object sub, @SuppressWarnings("unused") Object starting, @SuppressWarnings("unused") Object ending) {
-            throw raise.raise(TypeError, "expected a bytes-like object, %p found", sub);
+            throw raise.raise(TypeError, "argument should be integer or bytes-like object, not '%p'", sub);
+        }
+
+        private int doSearch(VirtualFrame frame, PIBytesLike primary, byte[] needle, int needleLen, Object starting, Object ending) {
+            SequenceStorage haystack = primary.getSequenceStorage();
+            int len = haystack.length();
+            int start = adjustIndex(getCastStartNode().execute(frame, starting), len);
+            int end = Math.min(adjustIndex(getCastEndNode().execute(frame, ending), len), len);
+            return search(getBytes(haystack), start, end, needle, needleLen);
+        }
+
+        private static int adjustIndex(int idx, int len) {
+            if (idx < 0) {
+                return Math.max(idx + len, 0);
+            }
+            return idx;
         }
 
-        private NormalizeIndexNode getNormalizeIndexNode() {
-            if (normalizeIndexNode == null) {
+        private byte[] getBytes(SequenceStorage storage) {
+            if (byteStorageProfile.profile(storage instanceof ByteSequenceStorage)) {
+                // the array may be longer than the storage; searches never read past its length
+                return (byte[]) ((ByteSequenceStorage) storage).getInternalArrayObject();
+            }
+            if (getInternalByteArrayNode == null) {
                 CompilerDirectives.transferToInterpreterAndInvalidate();
-                normalizeIndexNode = insert(NormalizeIndexNode.create(false));
+                getInternalByteArrayNode = insert(GetInternalByteArrayNodeGen.create());
             }
-            return normalizeIndexNode;
+            return getInternalByteArrayNode.execute(storage);
         }
 
-        private SequenceStorageNodes.GetItemNode getGetLeftItemNode() {
-            if (getLeftItemNode == null) {
+        private CastToSliceComponentNode getCastStartNode() {
+            if (castStartNode == null) {
                 CompilerDirectives.transferToInterpreterAndInvalidate();
-                getLeftItemNode = insert(SequenceStorageNodes.GetItemNode.create());
+                castStartNode = insert(CastToSliceComponentNode.create(0, Integer.MAX_VALUE));
             }
-            return getLeftItemNode;
+            return castStartNode;
         }
 
-        private SequenceStorageNodes.GetItemNode getGetRightItemNode() {
-            if (getRightItemNode == null) {
+        private CastToSliceComponentNode getCastEndNode() {
+            if (castEndNode == null) {
                 CompilerDirectives.transferToInterpreterAndInvalidate();
-                getRightItemNode = insert(SequenceStorageNodes.GetItemNode.create());
+                castEndNode = insert(CastToSliceComponentNode.create(Integer.MAX_VALUE, Integer.MAX_VALUE));
             }
-            return getRightItemNode;
+            return castEndNode;
+        }
+    }
+
+    public abstract static class FindNode extends AbstractSearchNode {
+
+        @Override
+        protected int search(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+            return BytesUtils.indexOf(haystack, start, end, needle, needleLen);
         }
 
         public static FindNode create() {
@@ -305,6 +316,30 @@ public abstract class BytesNodes {
         }
     }
 
+    public abstract static class RFindNode extends AbstractSearchNode {
+
+        @Override
+        protected int search(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+            return BytesUtils.lastIndexOf(haystack, start, end, needle, needleLen);
+        }
+
+        public static RFindNode create() {
+            return RFindNodeGen.create();
+        }
+    }
+
+    public abstract static class CountNode extends AbstractSearchNode {
+
+        @Override
+        protected int search(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+            return BytesUtils.count(haystack, start, end, needle, needleLen, Integer.MAX_VALUE);
+        }
+
+        public static CountNode create() {
+            return CountNodeGen.create();
+        }
+    }
+
     public static class FromSequenceStorageNode extends Node {
 
         @Node.Child private SequenceStorageNodes.GetItemNode getItemNode;
@@ -30,6 +30,7 @@ import static com.oracle.graal.python.runtime.exception.PythonErrorType.Overflow
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
 
 import java.io.UnsupportedEncodingException;
+import java.util.Arrays;
 
 import com.oracle.graal.python.runtime.PythonCore;
 import com.oracle.graal.python.runtime.PythonParser.ParserErrorCallback;
@@ -218,6 +219,196 @@ public final class BytesUtils {
         return charList;
     }
 
+    /**
+     * Haystacks shorter than this are searched without building a Horspool shift table.
+     */
+    private static final int HORSPOOL_MIN_HAYSTACK = 64;
+
+    /**
+     * Returns the index of the first occurrence of {@code b} in {@code haystack[start:end]}, or
+     * {@code -1}.
+     */
+    public static int indexOf(byte[] haystack, int start, int end, byte b) {
+        for (int i = start; i < end; i++) {
+            if (haystack[i] == b) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * Returns the index of the last occurrence of {@code b} in {@code haystack[start:end]}, or
+     * {@code -1}.
+     */
+    public static int lastIndexOf(byte[] haystack, int start, int end, byte b) {
+        for (int i = end - 1; i >= start; i--) {
+            if (haystack[i] == b) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * Returns the index of the first occurrence of {@code needle[0:needleLen]} that lies completely
+     * within {@code haystack[start:end]}, or {@code -1}. Single bytes are found by a plain scan,
+     * longer needles in long haystacks with the Boyer-Moore-Horspool algorithm.
+     */
+    @TruffleBoundary(allowInlining = true)
+    public static int indexOf(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+        if (needleLen == 0) {
+            return start <= end ? start : -1;
+        } else if (needleLen == 1) {
+            return indexOf(haystack, start, end, needle[0]);
+        } else if (end - start < HORSPOOL_MIN_HAYSTACK) {
+            return naiveIndexOf(haystack, start, end, needle, needleLen);
+        }
+        return horspoolIndexOf(haystack, start, end, needle, needleLen, horspoolTable(needle, needleLen));
+    }
+
+    /**
+     * Returns the index of the last occurrence of {@code needle[0:needleLen]} that lies completely
+     * within {@code haystack[start:end]}, or {@code -1}.
+     */
+    @TruffleBoundary(allowInlining = true)
+    public static int lastIndexOf(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+        if (needleLen == 0) {
+            return start <= end ? end : -1;
+        } else if (needleLen == 1) {
+            return lastIndexOf(haystack, start, end, needle[0]);
+        }
+        int[] shift = new int[256];
+        Arrays.fill(shift, needleLen);
+        for (int i = needleLen - 1; i > 0; i--) {
+            shift[needle[i] & 0xFF] = i;
+        }
+        int pos = end - needleLen;
+        while (pos >= start) {
+            byte first = haystack[pos];
+            if (first == needle[0] && regionMatches(haystack, pos + 1, needle, 1, needleLen - 1)) {
+                return pos;
+            }
+            pos -= shift[first & 0xFF];
+        }
+        return -1;
+    }
+
+    /**
+     * Counts the non-overlapping occurrences of {@code needle[0:needleLen]} in
+     * {@code haystack[start:end]}, stopping at {@code maxCount}. The empty needle occurs between
+     * every two bytes.
+     */
+    @TruffleBoundary
+    public static int count(byte[] haystack, int start, int end, byte[] needle, int needleLen, int maxCount) {
+        if (end - start < needleLen) {
+            return 0;
+        } else if (needleLen == 0) {
+            return Math.min(end - start + 1, maxCount);
+        }
+        int[] shift = needleLen > 1 && end - start >= HORSPOOL_MIN_HAYSTACK ? horspoolTable(needle, needleLen) : null;
+        int result = 0;
+        int pos = start;
+        while (result < maxCount) {
+            int idx;
+            if (needleLen == 1) {
+                idx = indexOf(haystack, pos, end, needle[0]);
+            } else if (shift == null) {
+                idx = naiveIndexOf(haystack, pos, end, needle, needleLen);
+            } else {
+                idx = horspoolIndexOf(haystack, pos, end, needle, needleLen, shift);
+            }
+            if (idx < 0) {
+                break;
+            }
+            result++;
+            pos = idx + needleLen;
+        }
+        return result;
+    }
+
+    /**
+     * Returns a copy of {@code self[0:len]} in which the first {@code maxCount} non-overlapping
+     * occurrences of {@code old} are replaced by {@code replacement}.
+     */
+    @TruffleBoundary
+    public static byte[] replace(byte[] self, int len, byte[] old, byte[] replacement, int maxCount) {
+        int n = count(self, 0, len, old, old.length, maxCount);
+        if (n == 0) {
+            return Arrays.copyOf(self, len);
+        }
+        byte[] result = new byte[len + n * (replacement.length - old.length)];
+        int src = 0;
+        int dst = 0;
+        for (int i = 0; i < n; i++) {
+            int idx;
+            if (old.length == 0) {
+                idx = src;
+            } else {
+                idx = indexOf(self, src, len, old, old.length);
+            }
+            System.arraycopy(self, src, result, dst, idx - src);
+            dst += idx - src;
+            System.arraycopy(replacement, 0, result, dst, replacement.length);
+            dst += replacement.length;
+            src = idx + old.length;
+            if (old.length == 0 && src < len) {
+                // the empty pattern matches between bytes, so always move past one
+                result[dst++] = self[src++];
+            }
+        }
+        System.arraycopy(self, src, result, dst, len - src);
+        return result;
+    }
+
+    private static int[] horspoolTable(byte[] needle, int needleLen) {
+        int[] shift = new int[256];
+        Arrays.fill(shift, needleLen);
+        for (int i = 0; i < needleLen - 1; i++) {
+            shift[needle[i] & 0xFF] = needleLen - 1 - i;
+        }
+        return shift;
+    }
+
+    private static int horspoolIndexOf(byte[] haystack, int start, int end, byte[] needle, int needleLen, int[] shift) {
+        byte lastByte = needle[needleLen - 1];
+        int pos = start;
+        int last = end - needleLen;
+        while (pos <= last) {
+            byte b = haystack[pos + needleLen - 1];
+            if (b == lastByte && regionMatches(haystack, pos, needle, 0, needleLen - 1)) {
+                return pos;
+            }
+            pos += shift[b & 0xFF];
+        }
+        return -1;
+    }
+
+    private static int naiveIndexOf(byte[] haystack, int start, int end, byte[] needle, int needleLen) {
+        int last = end - needleLen;
+        int pos = start;
+        while (pos <= last) {
+            pos = indexOf(haystack, pos, last + 1, needle[0]);
+            if (pos < 0) {
+                return -1;
+            }
+            if (regionMatches(haystack, pos + 1, needle, 1, needleLen - 1)) {
+                return pos;
+            }
+            pos++;
+        }
+        return -1;
+    }
+
+    private static boolean regionMatches(byte[] haystack, int offset, byte[] needle, int needleOffset, int len) {
+        for (int i = 0; i < len; i++) {
+            if (haystack[offset + i] != needle[needleOffset + i]) {
+                return false;
+            }
+        }
+        return true;
+    }
+
     private static byte[] decodeEscapeToBytes(ParserErrorCallback errors, String string) {
         CompilerAsserts.neverPartOfCompilation();
         StringBuilder sb = decodeEscapes(errors, string, false);
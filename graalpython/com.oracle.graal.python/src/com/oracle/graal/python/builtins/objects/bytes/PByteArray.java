@@ -44,6 +44,9 @@ public final class PByteArray extends PSequence implements PIBytesLike {
 
     private SequenceStorage store;
 
+    /** The number of live memoryviews of this bytearray, which cannot be resized while any exist. */
+    private int exports;
+
     public PByteArray(LazyPythonClass cls, byte[] bytes) {
         super(cls);
         store = new ByteSequenceStorage(bytes);
@@ -93,6 +96,14 @@ public final class PByteArray extends PSequence implements PIBytesLike {
         return Arrays.hashCode(store.getInternalArray());
     }
 
+    public int getExports() {
+        return exports;
+    }
+
+    public void setExports(int exports) {
+        this.exports = exports;
+    }
+
     public final void reverse() {
         store.reverse();
     }
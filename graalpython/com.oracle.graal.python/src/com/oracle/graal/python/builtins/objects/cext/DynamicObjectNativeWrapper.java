@@ -121,7 +121,6 @@ import com.oracle.graal.python.nodes.PRaiseNode;
 import com.oracle.graal.python.nodes.SpecialAttributeNames;
 import com.oracle.graal.python.nodes.SpecialMethodNames;
 import com.oracle.graal.python.nodes.attributes.LookupAttributeInMRONode;
-import com.oracle.graal.python.nodes.attributes.ReadAttributeFromObjectNode;
 import com.oracle.graal.python.nodes.attributes.WriteAttributeToObjectNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode.LookupAndCallUnaryDynamicNode;
 import com.oracle.graal.python.nodes.classes.IsSubtypeNode.IsSubtypeWithoutFrameNode;
@@ -823,10 +822,11 @@ public abstract class DynamicObjectNativeWrapper extends PythonNativeWrapper {
         @Specialization
         Object doMemoryview(PMemoryView object, String key,
                         @Cached PRaiseNode raise,
-                        @Cached ReadAttributeFromObjectNode readAttrNode,
+                        @Exclusive @Cached PythonAbstractObject.PInteropGetAttributeNode getAttrNode,
                         @CachedLibrary(limit = "1") InteropLibrary read,
                         @Cached("createBinaryProfile()") ConditionProfile isNativeObject) {
-            Object delegateObj = readAttrNode.execute(object, "__c_memoryview");
+            // managed memoryviews create their native delegate on demand
+            Object delegateObj = getAttrNode.execute(object, "__c_memoryview");
             if (isNativeObject.profile(PythonNativeObject.isInstance(delegateObj))) {
                 try {
                     return read.readMember(PythonNativeObject.cast(delegateObj).getPtr(), key);
@@ -996,12 +996,13 @@ public abstract class DynamicObjectNativeWrapper extends PythonNativeWrapper {
 
         @Specialization
         Object doMemoryview(PMemoryView object, String key, Object value,
-                        @Cached ReadAttributeFromObjectNode readAttrNode,
+                        @Exclusive @Cached PythonAbstractObject.PInteropGetAttributeNode getAttrNode,
                         @Cached("createBinaryProfile()") ConditionProfile isNativeObject,
                         @CachedLibrary(limit = "1") InteropLibrary interopLib) throws UnsupportedMessageException, UnknownIdentifierException, UnsupportedTypeException {
-            Object delegateObj = readAttrNode.execute(object, "__c_memoryview");
+            Object delegateObj = getAttrNode.execute(object, "__c_memoryview");
             if (isNativeObject.profile(PythonNativeObject.isInstance(delegateObj))) {
                 interopLib.writeMember(PythonNativeObject.cast(delegateObj).getPtr(), key, value);
+                return value;
             }
             throw new IllegalStateException("delegate of memoryview object is not native");
         }
@@ -64,6 +64,10 @@ public abstract class DynamicObjectStorage extends HashingStorage {
 
     private final DynamicObject store;
 
+    /* The keys of 'positionShape', cached for positional access. */
+    private Shape positionShape;
+    private Object[] positionKeys;
+
     private DynamicObjectStorage() {
         store = LAYOUT.newInstance(EMPTY_SHAPE);
     }
@@ -140,6 +144,34 @@ public abstract class DynamicObjectStorage extends HashingStorage {
         return wrapJavaIterable(entries);
     }
 
+    protected final Object[] getPositionKeys() {
+        Shape shape = store.getShape();
+        if (positionShape != shape) {
+            positionKeys = shape.getKeyList().toArray();
+            positionShape = shape;
+        }
+        return positionKeys;
+    }
+
+    @Override
+    @TruffleBoundary
+    public int nextPosition(int position) {
+        Object[] keys = getPositionKeys();
+        for (int i = position; i >= 0 && i < keys.length; i++) {
+            if (store.get(keys[i], PNone.NO_VALUE) != PNone.NO_VALUE) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    @Override
+    @TruffleBoundary
+    public DictEntry entryAt(int position) {
+        Object key = getPositionKeys()[position];
+        return new DictEntry(key, store.get(key));
+    }
+
     @Override
     @TruffleBoundary
     public void clear() {
@@ -424,6 +456,36 @@ public abstract class DynamicObjectStorage extends HashingStorage {
             }
         }
 
+        /*
+         * Positions past the attribute keys address the entries of the non-attributes storage.
+         */
+        @Override
+        @TruffleBoundary
+        public int nextPosition(int position) {
+            if (position < 0) {
+                return -1;
+            }
+            int attributeCount = getPositionKeys().length;
+            if (position < attributeCount) {
+                int next = super.nextPosition(position);
+                if (next >= 0) {
+                    return next;
+                }
+            }
+            int next = nonAttributesStorage.nextPosition(Math.max(position - attributeCount, 0));
+            return next < 0 ? -1 : next + attributeCount;
+        }
+
+        @Override
+        @TruffleBoundary
+        public DictEntry entryAt(int position) {
+            int attributeCount = getPositionKeys().length;
+            if (position < attributeCount) {
+                return super.entryAt(position);
+            }
+            return nonAttributesStorage.entryAt(position - attributeCount);
+        }
+
         @Override
         public void clear() {
             super.clear();
@@ -396,13 +396,28 @@ public class EconomicMapStorage extends HashingStorage implements Iterable<Objec
     }
 
     /**
-     * Copies all of the mappings from {@code other} to this map.
+     * Copies all of the mappings from {@code other} to this map. The keys keep the hashes that were
+     * computed when they were inserted into {@code other}, so no {@code __hash__} is called.
      *
      * @since 1.0
      */
+    @TruffleBoundary
     public void putAll(EconomicMapStorage other, Equivalence eq) {
-        for (DictEntry entry : other.entries()) {
-            setItem(entry.getKey(), entry.getValue(), eq);
+        for (int i = 0; i < other.totalEntries; i++) {
+            DictKey key = other.getKey(i);
+            if (key != null) {
+                putItem(key, other.getValue(i), eq);
+            }
+        }
+    }
+
+    @Override
+    @TruffleBoundary
+    public void addAll(HashingStorage other, Equivalence eq) {
+        if (other instanceof EconomicMapStorage) {
+            putAll((EconomicMapStorage) other, eq);
+        } else {
+            super.addAll(other, eq);
         }
     }
 
@@ -411,7 +426,10 @@ public class EconomicMapStorage extends HashingStorage implements Iterable<Objec
         if (key == null) {
             throw new UnsupportedOperationException("null not supported as key!");
         }
-        DictKey newKey = new DictKey(key, eq.hashCode(key));
+        putItem(new DictKey(key, eq.hashCode(key)), value, eq);
+    }
+
+    private void putItem(DictKey newKey, Object value, Equivalence eq) {
         int index = find(newKey, eq);
         if (index != -1) {
             setValue(index, value);
@@ -815,6 +833,21 @@ public class EconomicMapStorage extends HashingStorage implements Iterable<Objec
         };
     }
 
+    @Override
+    public int nextPosition(int position) {
+        for (int i = position; i >= 0 && i < totalEntries; i++) {
+            if (getKey(i) != null) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    @Override
+    public DictEntry entryAt(int position) {
+        return new DictEntry(getKey(position).value, getValue(position));
+    }
+
     @Override
     public Iterable<DictEntry> entries() {
         return new Iterable<HashingStorage.DictEntry>() {
@@ -93,6 +93,11 @@ public class EmptyStorage extends HashingStorage {
         return Collections.emptyList();
     }
 
+    @Override
+    public DictEntry entryAt(int position) {
+        throw new IndexOutOfBoundsException();
+    }
+
     @Override
     public void clear() {
     }
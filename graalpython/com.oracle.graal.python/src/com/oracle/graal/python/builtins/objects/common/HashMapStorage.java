@@ -54,6 +54,12 @@ public class HashMapStorage extends HashingStorage {
 
     private final HashMap<Object, Object> map;
 
+    /**
+     * A {@link HashMap} has no positional access, so {@link #entryAt(int)} works on a snapshot of
+     * the entries that is dropped whenever the map is modified.
+     */
+    private DictEntry[] positionEntries;
+
     @TruffleBoundary
     public HashMapStorage(Map<? extends Object, ? extends Object> map) {
         this.map = new HashMap<>(map);
@@ -70,6 +76,7 @@ public class HashMapStorage extends HashingStorage {
         for (DictEntry e : other.entries()) {
             map.put(wrap(e.getKey(), eq), e.getValue());
         }
+        positionEntries = null;
     }
 
     @Override
@@ -96,6 +103,7 @@ public class HashMapStorage extends HashingStorage {
     @TruffleBoundary
     public void setItem(Object key, Object value, Equivalence eq) {
         map.put(wrap(key, eq), value);
+        positionEntries = null;
     }
 
     @TruffleBoundary
@@ -146,6 +154,7 @@ public class HashMapStorage extends HashingStorage {
     @Override
     @TruffleBoundary
     public boolean remove(Object key, Equivalence eq) {
+        positionEntries = null;
         return map.remove(wrap(key, eq)) != null;
     }
 
@@ -165,6 +174,19 @@ public class HashMapStorage extends HashingStorage {
         return entries;
     }
 
+    @Override
+    @TruffleBoundary
+    public DictEntry entryAt(int position) {
+        if (positionEntries == null) {
+            positionEntries = new DictEntry[map.size()];
+            int i = 0;
+            for (Map.Entry<Object, Object> entry : map.entrySet()) {
+                positionEntries[i++] = new DictEntry(unwrap(entry.getKey()), entry.getValue());
+            }
+        }
+        return positionEntries[position];
+    }
+
     private static class KeyWrapper {
         private final Equivalence eq;
         private final Object key;
@@ -196,6 +218,7 @@ public class HashMapStorage extends HashingStorage {
     @TruffleBoundary
     public void clear() {
         map.clear();
+        positionEntries = null;
     }
 
     @Override
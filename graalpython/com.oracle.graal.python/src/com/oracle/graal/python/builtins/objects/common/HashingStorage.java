@@ -269,6 +269,22 @@ public abstract class HashingStorage {
 
     public abstract Iterable<DictEntry> entries();
 
+    /**
+     * Returns the position of the first entry at or after {@code position} or {@code -1} if there
+     * is no such entry. Positions are only valid as long as the storage is not modified. Together
+     * with {@link #entryAt(int)}, this allows to iterate a storage using a plain integer cursor
+     * (e.g. for {@code PyDict_Next}).
+     */
+    public int nextPosition(int position) {
+        return position >= 0 && position < length() ? position : -1;
+    }
+
+    /**
+     * Returns the entry at a position previously obtained from {@link #nextPosition(int)}. This
+     * must not be linear in the position, otherwise iterating with a cursor becomes quadratic.
+     */
+    public abstract DictEntry entryAt(int position);
+
     public abstract void clear();
 
     public abstract HashingStorage copy(Equivalence eq);
@@ -56,6 +56,7 @@ import com.oracle.graal.python.builtins.objects.common.DynamicObjectStorage.Fast
 import com.oracle.graal.python.builtins.objects.common.DynamicObjectStorage.PythonNativeObjectDictStorage;
 import com.oracle.graal.python.builtins.objects.common.DynamicObjectStorage.PythonObjectDictStorage;
 import com.oracle.graal.python.builtins.objects.common.DynamicObjectStorage.PythonObjectHybridDictStorage;
+import com.oracle.graal.python.builtins.objects.common.HashingStorage.DictEntry;
 import com.oracle.graal.python.builtins.objects.common.HashingStorage.Equivalence;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.ContainsKeyNodeGen;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.ContainsValueNodeGen;
@@ -70,6 +71,7 @@ import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactor
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.KeysEqualsNodeGen;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.KeysIsSubsetNodeGen;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.LenNodeGen;
+import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.MergeNodeGen;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.SetItemNodeGen;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodesFactory.UnionNodeGen;
 import com.oracle.graal.python.builtins.objects.dict.PDict;
@@ -1651,6 +1653,54 @@ public abstract class HashingStorageNodes {
         }
     }
 
+    /**
+     * Adds all entries of {@code other} to {@code self}, overwriting existing keys, and returns the
+     * resulting storage. Two {@link EconomicMapStorage}s are merged in bulk, keeping the hashes
+     * already computed for the keys of {@code other}.
+     */
+    public abstract static class MergeNode extends DictStorageBaseNode {
+
+        public abstract HashingStorage execute(VirtualFrame frame, HashingStorage self, HashingStorage other);
+
+        @Specialization(guards = "other.length() == 0")
+        static HashingStorage doOtherEmpty(HashingStorage self, @SuppressWarnings("unused") HashingStorage other) {
+            return self;
+        }
+
+        @Specialization(guards = "other.length() != 0")
+        static HashingStorage doSelfEmpty(VirtualFrame frame, @SuppressWarnings("unused") EmptyStorage self, HashingStorage other,
+                        @Cached("create()") CopyNode copyNode) {
+            return copyNode.execute(frame, other);
+        }
+
+        @Specialization
+        @SuppressWarnings("try")
+        HashingStorage doEconomicMap(VirtualFrame frame, EconomicMapStorage self, EconomicMapStorage other) {
+            PythonContext context = getContextRef().get();
+            PException caughtException = IndirectCallContext.enter(frame, context, this);
+            try {
+                self.putAll(other, getEquivalence());
+            } finally {
+                IndirectCallContext.exit(frame, context, caughtException);
+            }
+            return self;
+        }
+
+        @Specialization(replaces = {"doOtherEmpty", "doSelfEmpty", "doEconomicMap"})
+        static HashingStorage doGeneric(VirtualFrame frame, HashingStorage self, HashingStorage other,
+                        @Cached("create()") SetItemNode setItemNode) {
+            HashingStorage result = self;
+            for (DictEntry entry : other.entries()) {
+                result = setItemNode.execute(frame, result, entry.getKey(), entry.getValue());
+            }
+            return result;
+        }
+
+        public static MergeNode create() {
+            return MergeNodeGen.create();
+        }
+    }
+
     public static class IntersectNode extends Node {
 
         @Child private ContainsKeyNode containsKeyNode;
@@ -1668,9 +1718,16 @@ public abstract class HashingStorageNodes {
                     setItemNode = insert(SetItemNode.create());
                 }
 
-                for (Object leftKey : left.keys()) {
-                    if (containsKeyNode.execute(frame, right, leftKey)) {
-                        newStorage = setItemNode.execute(frame, newStorage, leftKey, PNone.NO_VALUE);
+                // iterate the smaller side and probe the larger one
+                HashingStorage smaller = left;
+                HashingStorage larger = right;
+                if (left.length() > right.length()) {
+                    smaller = right;
+                    larger = left;
+                }
+                for (Object key : smaller.keys()) {
+                    if (containsKeyNode.execute(frame, larger, key)) {
+                        newStorage = setItemNode.execute(frame, newStorage, key, PNone.NO_VALUE);
                     }
                 }
             }
@@ -120,6 +120,12 @@ public class KeywordsStorage extends HashingStorage {
         };
     }
 
+    @Override
+    public DictEntry entryAt(int position) {
+        PKeyword kwd = keywords[position];
+        return new DictEntry(kwd.getName(), kwd.getValue());
+    }
+
     @Override
     public void clear() {
         throw UnmodifiableStorageException.INSTANCE;
@@ -56,6 +56,8 @@ public class LocalsStorage extends HashingStorage {
     /* This won't be the real (materialized) frame but a clone of it. */
     private final MaterializedFrame frame;
     private int len = -1;
+    /* The frame slots, cached for positional access. */
+    private FrameSlot[] slots;
 
     public LocalsStorage(FrameDescriptor fd) {
         this.frame = Truffle.getRuntime().createMaterializedFrame(new Object[0], fd);
@@ -165,6 +167,33 @@ public class LocalsStorage extends HashingStorage {
         };
     }
 
+    private FrameSlot[] getSlots() {
+        if (slots == null) {
+            slots = frame.getFrameDescriptor().getSlots().toArray(new FrameSlot[0]);
+        }
+        return slots;
+    }
+
+    @Override
+    @TruffleBoundary
+    public int nextPosition(int position) {
+        FrameSlot[] frameSlots = getSlots();
+        for (int i = position; i >= 0 && i < frameSlots.length; i++) {
+            FrameSlot slot = frameSlots[i];
+            if (FrameSlotIDs.isUserFrameSlot(slot.getIdentifier()) && frame.getValue(slot) != null) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    @Override
+    @TruffleBoundary
+    public DictEntry entryAt(int position) {
+        FrameSlot slot = getSlots()[position];
+        return new DictEntry(slot.getIdentifier(), getValue(slot));
+    }
+
     @Override
     @TruffleBoundary
     public void clear() {
@@ -0,0 +1,212 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.contextvars;
+
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__CONTAINS__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__GETITEM__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__ITER__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__LEN__;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.KeyError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.RuntimeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.nodes.call.CallNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.runtime.PythonContext;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.Fallback;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PContextVarsContext)
+public class ContextBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return ContextBuiltinsFactory.getFactories();
+    }
+
+    // Context.run(callable, *args, **kwargs)
+    @Builtin(name = "run", minNumOfPositionalArgs = 2, takesVarArgs = true, takesVarKeywordArgs = true)
+    @GenerateNodeFactory
+    abstract static class RunNode extends PythonBuiltinNode {
+        @Specialization
+        Object run(VirtualFrame frame, PContextVarsContext self, Object callable, Object[] args, PKeyword[] kwargs,
+                        @Cached("create()") CallNode callNode) {
+            if (self.isEntered()) {
+                throw raise(RuntimeError, "cannot enter context: %s is already entered", self);
+            }
+            PythonContext context = getContext();
+            self.enter(context.getContextVarsContext());
+            context.setContextVarsContext(self);
+            try {
+                return callNode.execute(frame, callable, args, kwargs);
+            } finally {
+                context.setContextVarsContext(self.exit());
+            }
+        }
+    }
+
+    @Builtin(name = "copy", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class CopyNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PContextVarsContext copy(PContextVarsContext self) {
+            return factory().createContextVarsContext(self.getVars());
+        }
+    }
+
+    @Builtin(name = __GETITEM__, minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class GetItemNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        Object getItem(PContextVarsContext self, PContextVar key) {
+            Object value = key.lookup(self.getVars());
+            if (value == null) {
+                throw raise(KeyError, "%s", key);
+            }
+            return value;
+        }
+
+        @Fallback
+        Object getItem(@SuppressWarnings("unused") Object self, Object key) {
+            throw raise(TypeError, "a ContextVar key was expected, got %s", key);
+        }
+    }
+
+    // Context.get(var, default=None)
+    @Builtin(name = "get", minNumOfPositionalArgs = 2, parameterNames = {"self", "key", "default"})
+    @GenerateNodeFactory
+    abstract static class GetNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        Object get(PContextVarsContext self, PContextVar key, Object defaultValue) {
+            Object value = key.lookup(self.getVars());
+            if (value != null) {
+                return value;
+            }
+            return defaultValue == PNone.NO_VALUE ? PNone.NONE : defaultValue;
+        }
+
+        @Fallback
+        Object get(@SuppressWarnings("unused") Object self, Object key, @SuppressWarnings("unused") Object defaultValue) {
+            throw raise(TypeError, "a ContextVar key was expected, got %s", key);
+        }
+    }
+
+    @Builtin(name = __CONTAINS__, minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class ContainsNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        boolean contains(PContextVarsContext self, PContextVar key) {
+            return key.lookup(self.getVars()) != null;
+        }
+
+        @Fallback
+        Object contains(@SuppressWarnings("unused") Object self, Object key) {
+            throw raise(TypeError, "a ContextVar key was expected, got %s", key);
+        }
+    }
+
+    @Builtin(name = __LEN__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class LenNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        int len(PContextVarsContext self) {
+            return self.getVars().size();
+        }
+    }
+
+    @Builtin(name = __ITER__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class IterNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object iter(PContextVarsContext self) {
+            return factory().createSequenceIterator(factory().createList(self.getVars().toArray(true)));
+        }
+    }
+
+    @Builtin(name = "keys", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class KeysNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object keys(PContextVarsContext self) {
+            return factory().createList(self.getVars().toArray(true));
+        }
+    }
+
+    @Builtin(name = "values", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ValuesNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object values(PContextVarsContext self) {
+            return factory().createList(self.getVars().toArray(false));
+        }
+    }
+
+    @Builtin(name = "items", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ItemsNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object items(PContextVarsContext self) {
+            Object[] keys = self.getVars().toArray(true);
+            Object[] values = self.getVars().toArray(false);
+            Object[] items = new Object[keys.length];
+            for (int i = 0; i < keys.length; i++) {
+                items[i] = factory().createTuple(new Object[]{keys[i], values[i]});
+            }
+            return factory().createList(items);
+        }
+    }
+}
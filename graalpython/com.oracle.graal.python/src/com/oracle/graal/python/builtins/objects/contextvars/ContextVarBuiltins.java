@@ -0,0 +1,142 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.contextvars;
+
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.LookupError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.RuntimeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.truffle.api.dsl.Fallback;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PContextVar)
+public class ContextVarBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return ContextVarBuiltinsFactory.getFactories();
+    }
+
+    @Builtin(name = "name", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class NameNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        String name(PContextVar self) {
+            return self.getName();
+        }
+    }
+
+    // ContextVar.get([default])
+    @Builtin(name = "get", minNumOfPositionalArgs = 1, maxNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class GetNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        Object get(PContextVar self, Object defaultValue) {
+            Object value = self.lookup(getContext().getContextVarsContext().getVars());
+            if (value != null) {
+                return value;
+            } else if (defaultValue != PNone.NO_VALUE) {
+                return defaultValue;
+            } else if (self.getDefault() != null) {
+                return self.getDefault();
+            }
+            throw raise(LookupError, "%s", self);
+        }
+    }
+
+    // ContextVar.set(value)
+    @Builtin(name = "set", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class SetNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PContextVarsToken set(PContextVar self, Object value) {
+            PContextVarsContext context = getContext().getContextVarsContext();
+            Hamt vars = context.getVars();
+            Object oldValue = self.lookup(vars);
+            context.setVars(self.set(vars, value));
+            return factory().createContextVarsToken(context, self, oldValue);
+        }
+    }
+
+    // ContextVar.reset(token)
+    @Builtin(name = "reset", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class ResetNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone reset(PContextVar self, PContextVarsToken token) {
+            if (token.isUsed()) {
+                throw raise(RuntimeError, "%s has already been used once", token);
+            } else if (token.getVar() != self) {
+                throw raise(ValueError, "%s was created by a different ContextVar", token);
+            }
+            PContextVarsContext context = getContext().getContextVarsContext();
+            if (token.getContext() != context) {
+                throw raise(ValueError, "%s was created in a different Context", token);
+            }
+            token.markUsed();
+            Object oldValue = token.getOldValue();
+            if (oldValue == null) {
+                context.setVars(self.delete(context.getVars()));
+            } else {
+                context.setVars(self.set(context.getVars(), oldValue));
+            }
+            return PNone.NONE;
+        }
+
+        @Fallback
+        Object reset(@SuppressWarnings("unused") Object self, Object token) {
+            throw raise(TypeError, "expected an instance of Token, got %p", token);
+        }
+    }
+}
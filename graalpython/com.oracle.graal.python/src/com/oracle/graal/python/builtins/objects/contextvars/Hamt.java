@@ -0,0 +1,326 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.contextvars;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
+/**
+ * A persistent hash array mapped trie. Keys are compared by identity, which is how
+ * {@code contextvars} compares {@link PContextVar context variables}. Updates copy only the path
+ * from the root to the changed entry, so a snapshot of the map is taken by just keeping a
+ * reference to it.
+ */
+public final class Hamt {
+
+    public static final Hamt EMPTY = new Hamt(null, 0);
+
+    private static final int BITS = 5;
+    private static final int MASK = (1 << BITS) - 1;
+
+    private static final class Entry {
+        final Object key;
+        final int hash;
+        final Object value;
+
+        Entry(Object key, int hash, Object value) {
+            this.key = key;
+            this.hash = hash;
+            this.value = value;
+        }
+    }
+
+    /**
+     * A trie node. Each child is either an {@link Entry} or another node.
+     */
+    private static final class BitmapNode {
+        final int bitmap;
+        final Object[] children;
+
+        BitmapNode(int bitmap, Object[] children) {
+            this.bitmap = bitmap;
+            this.children = children;
+        }
+    }
+
+    /**
+     * Entries whose keys have the same hash.
+     */
+    private static final class CollisionNode {
+        final int hash;
+        final Entry[] entries;
+
+        CollisionNode(int hash, Entry[] entries) {
+            this.hash = hash;
+            this.entries = entries;
+        }
+    }
+
+    private final BitmapNode root;
+    private final int size;
+
+    private Hamt(BitmapNode root, int size) {
+        this.root = root;
+        this.size = size;
+    }
+
+    public int size() {
+        return size;
+    }
+
+    /**
+     * Returns the value for {@code key} or {@code null} if there is none.
+     */
+    @TruffleBoundary
+    public Object lookup(Object key, int hash) {
+        Object node = root;
+        int shift = 0;
+        while (node != null) {
+            if (node instanceof BitmapNode) {
+                BitmapNode bitmapNode = (BitmapNode) node;
+                int bit = bit(hash, shift);
+                if ((bitmapNode.bitmap & bit) == 0) {
+                    return null;
+                }
+                node = bitmapNode.children[index(bitmapNode.bitmap, bit)];
+                shift += BITS;
+            } else if (node instanceof Entry) {
+                Entry entry = (Entry) node;
+                return entry.key == key ? entry.value : null;
+            } else {
+                for (Entry entry : ((CollisionNode) node).entries) {
+                    if (entry.key == key) {
+                        return entry.value;
+                    }
+                }
+                return null;
+            }
+        }
+        return null;
+    }
+
+    /**
+     * Returns a map that also maps {@code key} to {@code value}.
+     */
+    @TruffleBoundary
+    public Hamt with(Object key, int hash, Object value) {
+        boolean[] added = new boolean[1];
+        BitmapNode newRoot = (BitmapNode) assoc(root == null ? new BitmapNode(0, new Object[0]) : root, 0, new Entry(key, hash, value), added);
+        return new Hamt(newRoot, added[0] ? size + 1 : size);
+    }
+
+    /**
+     * Returns a map without {@code key}, or this map if it does not contain the key.
+     */
+    @TruffleBoundary
+    public Hamt without(Object key, int hash) {
+        if (root == null) {
+            return this;
+        }
+        Object newRoot = dissoc(root, 0, key, hash);
+        if (newRoot == root) {
+            return this;
+        } else if (size == 1) {
+            return EMPTY;
+        } else if (newRoot instanceof BitmapNode) {
+            return new Hamt((BitmapNode) newRoot, size - 1);
+        } else {
+            // a single entry or collision node bubbled up to the root
+            Object child = newRoot;
+            int childHash = child instanceof Entry ? ((Entry) child).hash : ((CollisionNode) child).hash;
+            return new Hamt(new BitmapNode(bit(childHash, 0), new Object[]{child}), size - 1);
+        }
+    }
+
+    /**
+     * Returns the keys, or the values, in iteration order.
+     */
+    @TruffleBoundary
+    public Object[] toArray(boolean keys) {
+        List<Object> result = new ArrayList<>(size);
+        collect(root, keys, result);
+        return result.toArray();
+    }
+
+    private static void collect(Object node, boolean keys, List<Object> result) {
+        if (node instanceof BitmapNode) {
+            for (Object child : ((BitmapNode) node).children) {
+                collect(child, keys, result);
+            }
+        } else if (node instanceof Entry) {
+            Entry entry = (Entry) node;
+            result.add(keys ? entry.key : entry.value);
+        } else if (node instanceof CollisionNode) {
+            for (Entry entry : ((CollisionNode) node).entries) {
+                result.add(keys ? entry.key : entry.value);
+            }
+        }
+    }
+
+    private static int bit(int hash, int shift) {
+        return 1 << ((hash >>> shift) & MASK);
+    }
+
+    private static int index(int bitmap, int bit) {
+        return Integer.bitCount(bitmap & (bit - 1));
+    }
+
+    private static Object assoc(Object node, int shift, Entry entry, boolean[] added) {
+        if (node instanceof BitmapNode) {
+            BitmapNode bitmapNode = (BitmapNode) node;
+            int bit = bit(entry.hash, shift);
+            int idx = index(bitmapNode.bitmap, bit);
+            Object[] children = bitmapNode.children;
+            if ((bitmapNode.bitmap & bit) == 0) {
+                Object[] newChildren = new Object[children.length + 1];
+                System.arraycopy(children, 0, newChildren, 0, idx);
+                newChildren[idx] = entry;
+                System.arraycopy(children, idx, newChildren, idx + 1, children.length - idx);
+                added[0] = true;
+                return new BitmapNode(bitmapNode.bitmap | bit, newChildren);
+            }
+            Object[] newChildren = children.clone();
+            newChildren[idx] = assoc(children[idx], shift + BITS, entry, added);
+            return new BitmapNode(bitmapNode.bitmap, newChildren);
+        } else if (node instanceof Entry) {
+            Entry existing = (Entry) node;
+            if (existing.key == entry.key) {
+                return entry;
+            }
+            added[0] = true;
+            return merge(existing, entry, shift);
+        } else {
+            CollisionNode collisionNode = (CollisionNode) node;
+            if (collisionNode.hash != entry.hash) {
+                // the new key only shares a prefix with the colliding ones
+                BitmapNode wrapper = new BitmapNode(bit(collisionNode.hash, shift), new Object[]{collisionNode});
+                return assoc(wrapper, shift, entry, added);
+            }
+            Entry[] entries = collisionNode.entries;
+            for (int i = 0; i < entries.length; i++) {
+                if (entries[i].key == entry.key) {
+                    Entry[] newEntries = entries.clone();
+                    newEntries[i] = entry;
+                    return new CollisionNode(collisionNode.hash, newEntries);
+                }
+            }
+            Entry[] newEntries = new Entry[entries.length + 1];
+            System.arraycopy(entries, 0, newEntries, 0, entries.length);
+            newEntries[entries.length] = entry;
+            added[0] = true;
+            return new CollisionNode(collisionNode.hash, newEntries);
+        }
+    }
+
+    private static Object merge(Entry first, Entry second, int shift) {
+        if (first.hash == second.hash) {
+            return new CollisionNode(first.hash, new Entry[]{first, second});
+        }
+        int firstBit = bit(first.hash, shift);
+        int secondBit = bit(second.hash, shift);
+        if (firstBit == secondBit) {
+            return new BitmapNode(firstBit, new Object[]{merge(first, second, shift + BITS)});
+        } else if (Integer.compareUnsigned(firstBit, secondBit) < 0) {
+            return new BitmapNode(firstBit | secondBit, new Object[]{first, second});
+        } else {
+            return new BitmapNode(firstBit | secondBit, new Object[]{second, first});
+        }
+    }
+
+    /**
+     * Removes {@code key} below {@code node}. Returns the node itself if the key is not present,
+     * {@code null} if nothing remains, and a lone entry or collision node so that the parent can
+     * inline it.
+     */
+    private static Object dissoc(Object node, int shift, Object key, int hash) {
+        if (node instanceof BitmapNode) {
+            BitmapNode bitmapNode = (BitmapNode) node;
+            int bit = bit(hash, shift);
+            if ((bitmapNode.bitmap & bit) == 0) {
+                return node;
+            }
+            int idx = index(bitmapNode.bitmap, bit);
+            Object child = bitmapNode.children[idx];
+            Object newChild = dissoc(child, shift + BITS, key, hash);
+            if (newChild == child) {
+                return node;
+            }
+            Object[] children = bitmapNode.children;
+            if (newChild == null) {
+                if (children.length == 1) {
+                    return null;
+                }
+                Object[] newChildren = new Object[children.length - 1];
+                System.arraycopy(children, 0, newChildren, 0, idx);
+                System.arraycopy(children, idx + 1, newChildren, idx, children.length - idx - 1);
+                if (newChildren.length == 1 && !(newChildren[0] instanceof BitmapNode)) {
+                    return newChildren[0];
+                }
+                return new BitmapNode(bitmapNode.bitmap & ~bit, newChildren);
+            }
+            if (children.length == 1 && !(newChild instanceof BitmapNode)) {
+                return newChild;
+            }
+            Object[] newChildren = children.clone();
+            newChildren[idx] = newChild;
+            return new BitmapNode(bitmapNode.bitmap, newChildren);
+        } else if (node instanceof Entry) {
+            return ((Entry) node).key == key ? null : node;
+        } else {
+            CollisionNode collisionNode = (CollisionNode) node;
+            Entry[] entries = collisionNode.entries;
+            for (int i = 0; i < entries.length; i++) {
+                if (entries[i].key == key) {
+                    if (entries.length == 2) {
+                        return entries[1 - i];
+                    }
+                    Entry[] newEntries = new Entry[entries.length - 1];
+                    System.arraycopy(entries, 0, newEntries, 0, i);
+                    System.arraycopy(entries, i + 1, newEntries, i, entries.length - i - 1);
+                    return new CollisionNode(collisionNode.hash, newEntries);
+                }
+            }
+            return node;
+        }
+    }
+}
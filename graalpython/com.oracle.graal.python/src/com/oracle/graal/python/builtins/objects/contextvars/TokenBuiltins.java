@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2018, 2019, Oracle and/or its affiliates. All rights reserved.
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
  * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
  *
  * The Universal Permissive License (UPL), Version 1.0
@@ -38,7 +38,7 @@
  * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
  * SOFTWARE.
  */
-package com.oracle.graal.python.builtins.objects.memoryview;
+package com.oracle.graal.python.builtins.objects.contextvars;
 
 import java.util.List;
 
@@ -46,42 +46,43 @@ import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
-import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.nodes.attributes.ReadAttributeFromObjectNode;
-import com.oracle.graal.python.nodes.attributes.WriteAttributeToObjectNode;
-import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.truffle.api.dsl.Cached;
 import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
 import com.oracle.truffle.api.dsl.Specialization;
 
-@CoreFunctions(extendClasses = PythonBuiltinClassType.PMemoryView)
-public class MemoryviewBuiltins extends PythonBuiltins {
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PContextVarsToken)
+public class TokenBuiltins extends PythonBuiltins {
 
     @Override
-    protected List<NodeFactory<SetCMemoryviewNode>> getNodeFactories() {
-        return MemoryviewBuiltinsFactory.getFactories();
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return TokenBuiltinsFactory.getFactories();
     }
 
-    @Builtin(name = PMemoryView.C_MEMORYVIEW, minNumOfPositionalArgs = 1, maxNumOfPositionalArgs = 2, isGetter = true, isSetter = true)
+    @Builtin(name = "var", minNumOfPositionalArgs = 1, isGetter = true)
     @GenerateNodeFactory
-    abstract static class SetCMemoryviewNode extends PythonBinaryBuiltinNode {
-
-        /*
-         * NOTE: DO NOT CHANGE THE NAME OF PROPERTY '__c_memoryview' it is also referenced in native
-         * code and Java code
-         */
-        @Specialization(guards = "isNoValue(value)")
-        Object set(Object self, @SuppressWarnings("unused") PNone value,
-                        @Cached("create()") ReadAttributeFromObjectNode readNode) {
-            return readNode.execute(self, PMemoryView.C_MEMORYVIEW);
+    abstract static class VarNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PContextVar var(PContextVarsToken self) {
+            return self.getVar();
         }
+    }
 
-        @Specialization(guards = "!isNoValue(cmemoryview)")
-        PNone set(Object self, Object cmemoryview,
-                        @Cached("create()") WriteAttributeToObjectNode writeNode) {
-            writeNode.execute(self, PMemoryView.C_MEMORYVIEW, cmemoryview);
-            return PNone.NONE;
+    @Builtin(name = "old_value", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class OldValueNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object oldValue(PContextVarsToken self,
+                        @Cached("create()") ReadAttributeFromObjectNode readMissingNode) {
+            Object oldValue = self.getOldValue();
+            if (oldValue == null) {
+                // the marker is set up in _contextvars.py
+                return readMissingNode.execute(getCore().lookupType(PythonBuiltinClassType.PContextVarsToken), "MISSING");
+            }
+            return oldValue;
         }
     }
 }
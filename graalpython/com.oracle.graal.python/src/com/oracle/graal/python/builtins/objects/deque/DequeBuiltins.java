@@ -0,0 +1,351 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.deque;
+
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__BOOL__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__DELITEM__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__GETITEM__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__INIT__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__ITER__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__LEN__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__REVERSED__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__SETITEM__;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.IndexError;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.nodes.PGuards;
+import com.oracle.graal.python.nodes.PNodeWithContext;
+import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
+import com.oracle.graal.python.nodes.control.GetNextNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.nodes.object.IsBuiltinClassProfile;
+import com.oracle.graal.python.nodes.util.CastToIndexNode;
+import com.oracle.graal.python.runtime.exception.PException;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PDeque)
+public class DequeBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return DequeBuiltinsFactory.getFactories();
+    }
+
+    /**
+     * Appends all elements of {@code iterable} to the right or, if {@code left} is set, to the
+     * left end of a deque. Extending a deque with itself uses a snapshot of its elements.
+     */
+    abstract static class ExtendHelperNode extends PNodeWithContext {
+
+        @Child private GetIteratorNode getIteratorNode = GetIteratorNode.create();
+        @Child private GetNextNode getNextNode = GetNextNode.create();
+        @Child private IsBuiltinClassProfile errorProfile = IsBuiltinClassProfile.create();
+
+        abstract void execute(VirtualFrame frame, PDeque self, Object iterable, boolean left);
+
+        @Specialization
+        void doDeque(PDeque self, PDeque other, boolean left) {
+            for (Object value : other.toArray()) {
+                add(self, value, left);
+            }
+        }
+
+        @Specialization(guards = "!isPDeque(iterable)")
+        void doIterable(VirtualFrame frame, PDeque self, Object iterable, boolean left) {
+            Object it = getIteratorNode.executeWith(frame, iterable);
+            while (true) {
+                Object value;
+                try {
+                    value = getNextNode.execute(frame, it);
+                } catch (PException e) {
+                    e.expectStopIteration(errorProfile);
+                    return;
+                }
+                add(self, value, left);
+            }
+        }
+
+        private static void add(PDeque self, Object value, boolean left) {
+            if (left) {
+                self.addFirst(value);
+            } else {
+                self.addLast(value);
+            }
+        }
+
+        boolean isPDeque(Object obj) {
+            return obj instanceof PDeque;
+        }
+
+        static ExtendHelperNode create() {
+            return DequeBuiltinsFactory.ExtendHelperNodeGen.create();
+        }
+    }
+
+    @Builtin(name = __INIT__, minNumOfPositionalArgs = 1, parameterNames = {"self", "iterable", "maxlen"})
+    @GenerateNodeFactory
+    abstract static class InitNode extends PythonTernaryBuiltinNode {
+
+        @Specialization
+        PNone init(VirtualFrame frame, PDeque self, Object iterable, Object maxlen,
+                        @Cached("create()") CastToIndexNode castToIndexNode,
+                        @Cached("create()") ExtendHelperNode extendNode) {
+            int maxLength = PDeque.UNBOUNDED;
+            if (!PGuards.isPNone(maxlen)) {
+                maxLength = castToIndexNode.execute(frame, maxlen);
+                if (maxLength < 0) {
+                    throw raise(ValueError, "maxlen must be non-negative");
+                }
+            }
+            if (self.getSize() > 0) {
+                self.clear();
+            }
+            self.setMaxLength(maxLength);
+            if (!PGuards.isNoValue(iterable)) {
+                extendNode.execute(frame, self, iterable, false);
+            }
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "append", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class AppendNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone append(PDeque self, Object value) {
+            self.addLast(value);
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "appendleft", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class AppendLeftNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone appendLeft(PDeque self, Object value) {
+            self.addFirst(value);
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "extend", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class ExtendNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone extend(VirtualFrame frame, PDeque self, Object iterable,
+                        @Cached("create()") ExtendHelperNode extendNode) {
+            extendNode.execute(frame, self, iterable, false);
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "extendleft", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class ExtendLeftNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone extendLeft(VirtualFrame frame, PDeque self, Object iterable,
+                        @Cached("create()") ExtendHelperNode extendNode) {
+            extendNode.execute(frame, self, iterable, true);
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "pop", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class PopNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object pop(PDeque self) {
+            Object value = self.pollLast();
+            if (value == null) {
+                throw raise(IndexError, "pop from an empty deque");
+            }
+            return value;
+        }
+    }
+
+    @Builtin(name = "popleft", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class PopLeftNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object popLeft(PDeque self) {
+            Object value = self.pollFirst();
+            if (value == null) {
+                throw raise(IndexError, "pop from an empty deque");
+            }
+            return value;
+        }
+    }
+
+    @Builtin(name = "clear", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ClearNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PNone clear(PDeque self) {
+            self.clear();
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "rotate", minNumOfPositionalArgs = 1, parameterNames = {"self", "n"})
+    @GenerateNodeFactory
+    abstract static class RotateNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone rotate(VirtualFrame frame, PDeque self, Object n,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            self.rotate(PGuards.isNoValue(n) ? 1 : castToIndexNode.execute(frame, n));
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "reverse", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ReverseNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PNone reverse(PDeque self) {
+            self.reverse();
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "maxlen", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class MaxLenNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object maxLen(PDeque self) {
+            int maxLength = self.getMaxLength();
+            return maxLength == PDeque.UNBOUNDED ? PNone.NONE : maxLength;
+        }
+    }
+
+    @Builtin(name = __LEN__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class LenNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        int len(PDeque self) {
+            return self.getSize();
+        }
+    }
+
+    @Builtin(name = __BOOL__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class BoolNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        boolean bool(PDeque self) {
+            return self.getSize() > 0;
+        }
+    }
+
+    @Builtin(name = __ITER__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class IterNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PDequeIter iter(PDeque self) {
+            return factory().createDequeIter(self);
+        }
+    }
+
+    @Builtin(name = __REVERSED__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ReversedNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PDequeIter reversed(PDeque self) {
+            return factory().createDequeRevIter(self);
+        }
+    }
+
+    @Builtin(name = __GETITEM__, minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class GetItemNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        Object getItem(VirtualFrame frame, PDeque self, Object idx,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            Object value = self.get(normalize(self, castToIndexNode.execute(frame, idx)));
+            if (value == null) {
+                throw raise(IndexError, "deque index out of range");
+            }
+            return value;
+        }
+    }
+
+    @Builtin(name = __SETITEM__, minNumOfPositionalArgs = 3)
+    @GenerateNodeFactory
+    abstract static class SetItemNode extends PythonTernaryBuiltinNode {
+        @Specialization
+        PNone setItem(VirtualFrame frame, PDeque self, Object idx, Object value,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            if (!self.set(normalize(self, castToIndexNode.execute(frame, idx)), value)) {
+                throw raise(IndexError, "deque index out of range");
+            }
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = __DELITEM__, minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class DelItemNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone delItem(VirtualFrame frame, PDeque self, Object idx,
+                        @Cached("create()") CastToIndexNode castToIndexNode) {
+            if (!self.delete(normalize(self, castToIndexNode.execute(frame, idx)))) {
+                throw raise(IndexError, "deque index out of range");
+            }
+            return PNone.NONE;
+        }
+    }
+
+    static int normalize(PDeque self, int index) {
+        return index < 0 ? index + self.getSize() : index;
+    }
+}
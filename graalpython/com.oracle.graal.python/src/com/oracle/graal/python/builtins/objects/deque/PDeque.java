@@ -0,0 +1,298 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.deque;
+
+import java.util.Arrays;
+
+import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
+/**
+ * A double-ended queue backed by a growable ring buffer. The capacity is always a power of two so
+ * that indices can be wrapped with a mask. All operations on the elements synchronize on the
+ * deque, which makes single operations like {@code append} and {@code popleft} atomic for
+ * concurrent Python threads without an explicit lock on the Python side.
+ *
+ * Every structural modification increments {@link #getState() the state}, which lets iterators
+ * detect that the deque was mutated during iteration. The size, state and maximum length are read
+ * without synchronization and are thus only a snapshot if other threads modify the deque.
+ */
+public final class PDeque extends PythonBuiltinObject {
+
+    private static final int INITIAL_CAPACITY = 8;
+
+    /** Marker for deques without a maximum length. */
+    public static final int UNBOUNDED = -1;
+
+    private Object[] items = new Object[INITIAL_CAPACITY];
+    private int head;
+    private int size;
+    private int maxLength = UNBOUNDED;
+    private int state;
+
+    public PDeque(LazyPythonClass cls) {
+        super(cls);
+    }
+
+    public int getSize() {
+        return size;
+    }
+
+    public int getState() {
+        return state;
+    }
+
+    public int getMaxLength() {
+        return maxLength;
+    }
+
+    public void setMaxLength(int maxLength) {
+        this.maxLength = maxLength;
+    }
+
+    private int mask() {
+        return items.length - 1;
+    }
+
+    private void ensureCapacity() {
+        if (size == items.length) {
+            Object[] newItems = new Object[items.length << 1];
+            int firstPart = items.length - head;
+            System.arraycopy(items, head, newItems, 0, firstPart);
+            System.arraycopy(items, 0, newItems, firstPart, head);
+            items = newItems;
+            head = 0;
+        }
+    }
+
+    @TruffleBoundary
+    public synchronized void addLast(Object value) {
+        if (maxLength == 0) {
+            return;
+        }
+        if (size == maxLength) {
+            removeFirstUnsynchronized();
+        }
+        ensureCapacity();
+        items[(head + size) & mask()] = value;
+        size++;
+        state++;
+    }
+
+    @TruffleBoundary
+    public synchronized void addFirst(Object value) {
+        if (maxLength == 0) {
+            return;
+        }
+        if (size == maxLength) {
+            removeLastUnsynchronized();
+        }
+        ensureCapacity();
+        head = (head - 1) & mask();
+        items[head] = value;
+        size++;
+        state++;
+    }
+
+    /**
+     * Removes and returns the leftmost element or returns {@code null} if the deque is empty.
+     */
+    @TruffleBoundary
+    public synchronized Object pollFirst() {
+        return size == 0 ? null : removeFirstUnsynchronized();
+    }
+
+    /**
+     * Removes and returns the rightmost element or returns {@code null} if the deque is empty.
+     */
+    @TruffleBoundary
+    public synchronized Object pollLast() {
+        return size == 0 ? null : removeLastUnsynchronized();
+    }
+
+    private Object removeFirstUnsynchronized() {
+        Object value = items[head];
+        items[head] = null;
+        head = (head + 1) & mask();
+        size--;
+        state++;
+        return value;
+    }
+
+    private Object removeLastUnsynchronized() {
+        int last = (head + size - 1) & mask();
+        Object value = items[last];
+        items[last] = null;
+        size--;
+        state++;
+        return value;
+    }
+
+    /**
+     * Returns the element at {@code index}, or {@code null} if the index is out of bounds.
+     */
+    @TruffleBoundary
+    public synchronized Object get(int index) {
+        if (index < 0 || index >= size) {
+            return null;
+        }
+        return items[(head + index) & mask()];
+    }
+
+    /**
+     * Returns the element at {@code index} if the deque is still in the given state, or
+     * {@code null} otherwise. Used by iterators to detect concurrent mutation.
+     */
+    @TruffleBoundary
+    public synchronized Object getIfUnmodified(int index, int expectedState) {
+        if (state != expectedState || index < 0 || index >= size) {
+            return null;
+        }
+        return items[(head + index) & mask()];
+    }
+
+    /**
+     * Replaces the element at {@code index}. Returns {@code false} if the index is out of bounds.
+     */
+    @TruffleBoundary
+    public synchronized boolean set(int index, Object value) {
+        if (index < 0 || index >= size) {
+            return false;
+        }
+        items[(head + index) & mask()] = value;
+        return true;
+    }
+
+    /**
+     * Removes the element at {@code index} by shifting the shorter side of the deque. Returns
+     * {@code false} if the index is out of bounds.
+     */
+    @TruffleBoundary
+    public synchronized boolean delete(int index) {
+        if (index < 0 || index >= size) {
+            return false;
+        }
+        int m = mask();
+        if (index < size >> 1) {
+            for (int i = index; i > 0; i--) {
+                items[(head + i) & m] = items[(head + i - 1) & m];
+            }
+            removeFirstUnsynchronized();
+        } else {
+            for (int i = index; i < size - 1; i++) {
+                items[(head + i) & m] = items[(head + i + 1) & m];
+            }
+            removeLastUnsynchronized();
+        }
+        return true;
+    }
+
+    @TruffleBoundary
+    public synchronized void clear() {
+        Arrays.fill(items, null);
+        head = 0;
+        size = 0;
+        state++;
+    }
+
+    /**
+     * Rotates the deque {@code n} steps to the right, or to the left if {@code n} is negative.
+     */
+    @TruffleBoundary
+    public synchronized void rotate(int n) {
+        if (size <= 1) {
+            return;
+        }
+        // normalize to a right rotation in [0, size)
+        int steps = n % size;
+        if (steps < 0) {
+            steps += size;
+        }
+        if (steps == 0) {
+            return;
+        }
+        int m = mask();
+        if (size == items.length) {
+            head = (head - steps) & m;
+        } else if (steps <= size >> 1) {
+            for (int i = 0; i < steps; i++) {
+                int last = (head + size - 1) & m;
+                head = (head - 1) & m;
+                items[head] = items[last];
+                items[last] = null;
+            }
+        } else {
+            for (int i = 0; i < size - steps; i++) {
+                int tail = (head + size) & m;
+                items[tail] = items[head];
+                items[head] = null;
+                head = (head + 1) & m;
+            }
+        }
+        state++;
+    }
+
+    @TruffleBoundary
+    public synchronized void reverse() {
+        int m = mask();
+        for (int i = 0, j = size - 1; i < j; i++, j--) {
+            int a = (head + i) & m;
+            int b = (head + j) & m;
+            Object tmp = items[a];
+            items[a] = items[b];
+            items[b] = tmp;
+        }
+        state++;
+    }
+
+    /**
+     * Returns a snapshot of the elements from left to right.
+     */
+    @TruffleBoundary
+    public synchronized Object[] toArray() {
+        Object[] result = new Object[size];
+        int firstPart = Math.min(size, items.length - head);
+        System.arraycopy(items, head, result, 0, firstPart);
+        System.arraycopy(items, 0, result, firstPart, size - firstPart);
+        return result;
+    }
+}
@@ -52,23 +52,34 @@ import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.PNotImplemented;
+import com.oracle.graal.python.builtins.objects.common.EconomicMapStorage;
+import com.oracle.graal.python.builtins.objects.common.EmptyStorage;
 import com.oracle.graal.python.builtins.objects.common.HashingCollectionNodes;
 import com.oracle.graal.python.builtins.objects.common.HashingStorage;
 import com.oracle.graal.python.builtins.objects.common.HashingStorage.DictEntry;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodes;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodes.ContainsKeyNode;
+import com.oracle.graal.python.builtins.objects.common.KeywordsStorage;
+import com.oracle.graal.python.builtins.objects.common.PHashingCollection;
 import com.oracle.graal.python.builtins.objects.function.PKeyword;
 import com.oracle.graal.python.builtins.objects.mappingproxy.PMappingproxy;
 import com.oracle.graal.python.builtins.objects.str.PString;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.PGuards;
+import com.oracle.graal.python.nodes.call.CallNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallBinaryNode;
+import com.oracle.graal.python.nodes.call.special.LookupAndCallTernaryNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
+import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
+import com.oracle.graal.python.nodes.control.GetNextNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.nodes.object.IsBuiltinClassProfile;
 import com.oracle.graal.python.runtime.PythonCore;
+import com.oracle.graal.python.runtime.exception.PException;
 import com.oracle.graal.python.runtime.exception.PythonErrorType;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -410,6 +421,106 @@ public final class DictBuiltins extends PythonBuiltins {
         }
     }
 
+    // update([other], **kwargs)
+    @Builtin(name = "update", minNumOfPositionalArgs = 1, takesVarArgs = true, takesVarKeywordArgs = true)
+    @GenerateNodeFactory
+    public abstract static class UpdateNode extends PythonBuiltinNode {
+
+        @Child private HashingStorageNodes.MergeNode mergeNode = HashingStorageNodes.MergeNode.create();
+
+        protected static boolean isDictArg(Object[] args) {
+            return args[0] instanceof PDict;
+        }
+
+        @Specialization(guards = "args.length == 0")
+        Object doKeywords(VirtualFrame frame, PDict self, @SuppressWarnings("unused") Object[] args, PKeyword[] kwargs) {
+            mergeKeywords(frame, self, kwargs);
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = {"args.length == 1", "isDictArg(args)"})
+        Object doDict(VirtualFrame frame, PDict self, Object[] args, PKeyword[] kwargs) {
+            PDict other = (PDict) args[0];
+            if (other != self) {
+                self.setDictStorage(mergeNode.execute(frame, self.getDictStorage(), other.getDictStorage()));
+            }
+            mergeKeywords(frame, self, kwargs);
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = {"args.length == 1", "!isDictArg(args)"})
+        Object doIterable(VirtualFrame frame, PDict self, Object[] args, PKeyword[] kwargs,
+                        @Cached("create()") HashingStorageNodes.InitNode initNode) {
+            HashingStorage other = initNode.execute(frame, args[0], PKeyword.EMPTY_KEYWORDS);
+            self.setDictStorage(mergeNode.execute(frame, self.getDictStorage(), other));
+            mergeKeywords(frame, self, kwargs);
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = "args.length > 1")
+        Object doGeneric(@SuppressWarnings("unused") PDict self, Object[] args, @SuppressWarnings("unused") PKeyword[] kwargs) {
+            throw raise(TypeError, "update expected at most 1 arguments, got %d", args.length);
+        }
+
+        private void mergeKeywords(VirtualFrame frame, PDict self, PKeyword[] kwargs) {
+            if (kwargs.length != 0) {
+                self.setDictStorage(mergeNode.execute(frame, self.getDictStorage(), KeywordsStorage.create(kwargs)));
+            }
+        }
+    }
+
+    // fromkeys(iterable[, value])
+    @Builtin(name = "fromkeys", minNumOfPositionalArgs = 2, parameterNames = {"cls", "iterable", "value"}, isClassmethod = true)
+    @GenerateNodeFactory
+    public abstract static class FromKeysNode extends PythonTernaryBuiltinNode {
+
+        @Specialization
+        Object fromKeys(VirtualFrame frame, LazyPythonClass cls, Object iterable, Object value,
+                        @Cached("create()") IsBuiltinClassProfile isDictProfile,
+                        @Cached("create()") IsBuiltinClassProfile isBuiltinIterableProfile,
+                        @Cached("create()") IsBuiltinClassProfile errorProfile,
+                        @Cached("create()") GetIteratorNode getIteratorNode,
+                        @Cached("create()") GetNextNode nextNode,
+                        @Cached("create()") HashingStorageNodes.SetItemNode setItemNode,
+                        @Cached("create()") CallNode callNode,
+                        @Cached("create(__SETITEM__)") LookupAndCallTernaryNode callSetItemNode) {
+            Object val = value == PNone.NO_VALUE ? PNone.NONE : value;
+            if (isDictProfile.profileClass(cls, PythonBuiltinClassType.PDict)) {
+                if (iterable instanceof PHashingCollection && isBuiltinIterableProfile.profileIsAnyBuiltinObject((PHashingCollection) iterable)) {
+                    // the number of keys is known, so the storage is allocated only once
+                    HashingStorage keys = ((PHashingCollection) iterable).getDictStorage();
+                    HashingStorage storage = EconomicMapStorage.create(keys.length(), false);
+                    for (Object key : keys.keys()) {
+                        storage = setItemNode.execute(frame, storage, key, val);
+                    }
+                    return factory().createDict(storage);
+                }
+                HashingStorage storage = new EmptyStorage();
+                Object it = getIteratorNode.executeWith(frame, iterable);
+                while (true) {
+                    try {
+                        storage = setItemNode.execute(frame, storage, nextNode.execute(frame, it), val);
+                    } catch (PException e) {
+                        e.expectStopIteration(errorProfile);
+                        return factory().createDict(storage);
+                    }
+                }
+            }
+            Object dict = callNode.execute(frame, cls, new Object[0], PKeyword.EMPTY_KEYWORDS);
+            Object it = getIteratorNode.executeWith(frame, iterable);
+            while (true) {
+                Object key;
+                try {
+                    key = nextNode.execute(frame, it);
+                } catch (PException e) {
+                    e.expectStopIteration(errorProfile);
+                    return dict;
+                }
+                callSetItemNode.execute(frame, dict, key, val);
+            }
+        }
+    }
+
     // clear()
     @Builtin(name = "clear", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
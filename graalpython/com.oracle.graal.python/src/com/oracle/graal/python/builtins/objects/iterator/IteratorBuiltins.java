@@ -41,6 +41,7 @@ import com.oracle.graal.python.builtins.objects.common.SequenceNodes;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.iterator.PRangeIterator.PRangeReverseIterator;
 import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
+import com.oracle.graal.python.builtins.objects.str.StringUtils;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallBinaryNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
@@ -171,7 +172,7 @@ public class IteratorBuiltins extends PythonBuiltins {
         @Specialization
         public Object next(PStringIterator self) {
             if (self.index < self.value.length()) {
-                return Character.toString(self.value.charAt(self.index++));
+                return StringUtils.charToString(self.nextChar());
             }
             throw raise(StopIteration);
         }
@@ -25,15 +25,51 @@
  */
 package com.oracle.graal.python.builtins.objects.iterator;
 
+import com.oracle.graal.python.builtins.objects.str.LazyString;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
 
+/**
+ * Iterates the characters of a string in place. Flat strings are indexed directly; lazy strings are
+ * walked piece by piece so they are never flattened or copied.
+ */
 public final class PStringIterator extends PBuiltinIterator {
 
-    final String value;
+    final CharSequence value;
     int index;
 
-    public PStringIterator(LazyPythonClass clazz, String value) {
+    /** The flat piece containing {@code index}; the whole value for flat strings. */
+    private String leaf;
+    /** Offset of {@link #leaf} within {@link #value}. */
+    private int leafStart;
+    private LazyString.LeafIterator leaves;
+
+    public PStringIterator(LazyPythonClass clazz, CharSequence value) {
         super(clazz);
         this.value = value;
+        this.leaf = value instanceof String ? (String) value : "";
+    }
+
+    /**
+     * Returns the character at {@code index} and advances. The caller must ensure that
+     * {@code index < value.length()}.
+     */
+    char nextChar() {
+        int offset = index - leafStart;
+        if (offset >= leaf.length()) {
+            nextLeaf();
+            offset = 0;
+        }
+        index++;
+        return leaf.charAt(offset);
+    }
+
+    @TruffleBoundary
+    private void nextLeaf() {
+        if (leaves == null) {
+            leaves = new LazyString.LeafIterator(value);
+        }
+        leafStart += leaf.length();
+        leaf = leaves.next();
     }
 }
@@ -0,0 +1,159 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.itertools;
+
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__EQ__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__ITER__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__NEXT__;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.StopIteration;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.nodes.call.CallNode;
+import com.oracle.graal.python.nodes.control.GetNextNode;
+import com.oracle.graal.python.nodes.expression.BinaryComparisonNode;
+import com.oracle.graal.python.nodes.expression.CastToBooleanNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.truffle.api.CompilerDirectives;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+
+@CoreFunctions(extendClasses = {PythonBuiltinClassType.PGroupBy, PythonBuiltinClassType.PGrouper})
+public class GroupByBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return GroupByBuiltinsFactory.getFactories();
+    }
+
+    @Builtin(name = __ITER__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    public abstract static class IterNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PGroupBy iterGroupBy(PGroupBy self) {
+            return self;
+        }
+
+        @Specialization
+        PGrouper iterGrouper(PGrouper self) {
+            return self;
+        }
+    }
+
+    @Builtin(name = __NEXT__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    public abstract static class NextNode extends PythonUnaryBuiltinNode {
+        @Child private GetNextNode nextNode = GetNextNode.create();
+        @Child private CallNode callKeyFuncNode;
+        @Child private BinaryComparisonNode eqNode;
+        @Child private CastToBooleanNode castToBooleanNode;
+
+        @Specialization
+        Object nextGroup(VirtualFrame frame, PGroupBy self) {
+            self.setCurrentGrouper(null);
+            // skip to the next group
+            while (true) {
+                if (self.getCurrentKey() == null) {
+                    // nothing read yet
+                } else if (self.getTargetKey() == null) {
+                    break;
+                } else if (!keysEqual(frame, self.getTargetKey(), self.getCurrentKey())) {
+                    break;
+                }
+                step(frame, self);
+            }
+            Object key = self.getCurrentKey();
+            self.setTargetKey(key);
+            PGrouper grouper = factory().createGrouper(self, key);
+            self.setCurrentGrouper(grouper);
+            return factory().createTuple(new Object[]{key, grouper});
+        }
+
+        @Specialization
+        Object nextItem(VirtualFrame frame, PGrouper self) {
+            PGroupBy parent = self.getParent();
+            if (parent.getCurrentGrouper() != self) {
+                throw raise(StopIteration);
+            }
+            if (parent.getCurrentValue() == null) {
+                step(frame, parent);
+            }
+            if (!keysEqual(frame, self.getTargetKey(), parent.getCurrentKey())) {
+                throw raise(StopIteration);
+            }
+            Object value = parent.getCurrentValue();
+            parent.setCurrent(null, null);
+            return value;
+        }
+
+        private void step(VirtualFrame frame, PGroupBy self) {
+            Object value = nextNode.execute(frame, self.getIterator());
+            Object key;
+            Object keyFunc = self.getKeyFunc();
+            if (keyFunc == null) {
+                key = value;
+            } else {
+                if (callKeyFuncNode == null) {
+                    CompilerDirectives.transferToInterpreterAndInvalidate();
+                    callKeyFuncNode = insert(CallNode.create());
+                }
+                key = callKeyFuncNode.execute(frame, keyFunc, value);
+            }
+            self.setCurrent(key, value);
+        }
+
+        private boolean keysEqual(VirtualFrame frame, Object left, Object right) {
+            if (eqNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                eqNode = insert(BinaryComparisonNode.create(__EQ__, __EQ__, "=="));
+                castToBooleanNode = insert(CastToBooleanNode.createIfTrueNode());
+            }
+            return castToBooleanNode.executeBoolean(frame, eqNode.executeWith(frame, left, right));
+        }
+    }
+}
@@ -0,0 +1,105 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.itertools;
+
+import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+
+/**
+ * An {@code itertools.groupby} object. The keys and the current value are {@code null} while
+ * they are unset; the groups share the underlying iterator with this object and only the most
+ * recently created group can still be advanced.
+ */
+public final class PGroupBy extends PythonBuiltinObject {
+
+    private final Object iterator;
+    private final Object keyFunc;
+    private Object targetKey;
+    private Object currentKey;
+    private Object currentValue;
+    private PGrouper currentGrouper;
+
+    public PGroupBy(LazyPythonClass cls, Object iterator, Object keyFunc) {
+        super(cls);
+        this.iterator = iterator;
+        this.keyFunc = keyFunc;
+    }
+
+    public Object getIterator() {
+        return iterator;
+    }
+
+    /**
+     * The key function or {@code null} for the identity.
+     */
+    public Object getKeyFunc() {
+        return keyFunc;
+    }
+
+    public Object getTargetKey() {
+        return targetKey;
+    }
+
+    public void setTargetKey(Object targetKey) {
+        this.targetKey = targetKey;
+    }
+
+    public Object getCurrentKey() {
+        return currentKey;
+    }
+
+    public Object getCurrentValue() {
+        return currentValue;
+    }
+
+    public void setCurrent(Object key, Object value) {
+        this.currentKey = key;
+        this.currentValue = value;
+    }
+
+    public PGrouper getCurrentGrouper() {
+        return currentGrouper;
+    }
+
+    public void setCurrentGrouper(PGrouper currentGrouper) {
+        this.currentGrouper = currentGrouper;
+    }
+}
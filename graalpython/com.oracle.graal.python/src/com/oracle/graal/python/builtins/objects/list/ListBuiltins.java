@@ -50,6 +50,7 @@ import static com.oracle.graal.python.runtime.exception.PythonErrorType.MemoryEr
 import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
 
 import java.math.BigInteger;
+import java.util.Arrays;
 import java.util.List;
 
 import com.oracle.graal.python.builtins.Builtin;
@@ -77,6 +78,7 @@ import com.oracle.graal.python.nodes.builtins.ListNodes;
 import com.oracle.graal.python.nodes.builtins.ListNodes.AppendNode;
 import com.oracle.graal.python.nodes.builtins.ListNodes.CreateStorageFromIteratorNode;
 import com.oracle.graal.python.nodes.builtins.ListNodes.IndexNode;
+import com.oracle.graal.python.nodes.call.CallNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.control.GetIteratorExpressionNode.GetIteratorNode;
 import com.oracle.graal.python.nodes.expression.BinaryComparisonNode;
@@ -96,6 +98,7 @@ import com.oracle.graal.python.runtime.sequence.storage.EmptySequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.IntSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.LongSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.SequenceStorage;
+import com.oracle.graal.python.runtime.sequence.storage.SequenceStorageFactory;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
 import com.oracle.truffle.api.dsl.Cached;
@@ -741,6 +744,186 @@ public class ListBuiltins extends PythonBuiltins {
         }
     }
 
+    // list.sort(*, key=None, reverse=False)
+    @Builtin(name = "sort", minNumOfPositionalArgs = 1, parameterNames = {"self"}, varArgsMarker = true, keywordOnlyNames = {"key", "reverse"})
+    @GenerateNodeFactory
+    public abstract static class ListSortNode extends PythonTernaryBuiltinNode {
+
+        private static final long NEGATIVE_ZERO_BITS = Double.doubleToRawLongBits(-0.0);
+
+        @Child private CastToBooleanNode castToBooleanNode;
+
+        @Specialization(guards = {"isIntStorage(list)", "isPNone(key)"})
+        PNone sortInt(VirtualFrame frame, PList list, @SuppressWarnings("unused") Object key, Object reverse) {
+            boolean rev = isReverse(frame, reverse);
+            IntSequenceStorage storage = (IntSequenceStorage) list.getSequenceStorage();
+            sortInts(storage.getInternalIntArray(), storage.length());
+            if (rev) {
+                // equal ints are indistinguishable, so stability does not matter
+                storage.reverse();
+            }
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = {"isLongStorage(list)", "isPNone(key)"})
+        PNone sortLong(VirtualFrame frame, PList list, @SuppressWarnings("unused") Object key, Object reverse) {
+            boolean rev = isReverse(frame, reverse);
+            LongSequenceStorage storage = (LongSequenceStorage) list.getSequenceStorage();
+            sortLongs(storage.getInternalLongArray(), storage.length());
+            if (rev) {
+                storage.reverse();
+            }
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = {"isDoubleStorage(list)", "isPNone(key)"})
+        PNone sortDouble(VirtualFrame frame, PList list, Object key, Object reverse,
+                        @Cached("createBinaryProfile()") ConditionProfile totalOrderProfile,
+                        @Cached SequenceStorageNodes.ToArrayNode toArrayNode,
+                        @Cached CallNode keyCallNode,
+                        @Cached TimSortNode timSortNode) {
+            boolean rev = isReverse(frame, reverse);
+            DoubleSequenceStorage storage = (DoubleSequenceStorage) list.getSequenceStorage();
+            double[] values = storage.getInternalDoubleArray();
+            int length = storage.length();
+            // Java's total order on doubles differs from Python's '<' for NaN and signed zeros
+            if (totalOrderProfile.profile(isTotallyOrdered(values, length))) {
+                sortDoubles(values, length);
+                if (rev) {
+                    storage.reverse();
+                }
+                return PNone.NONE;
+            }
+            return sortObjects(frame, list, key, rev, toArrayNode, keyCallNode, timSortNode);
+        }
+
+        @Specialization
+        PNone sortGeneric(VirtualFrame frame, PList list, Object key, Object reverse,
+                        @Cached SequenceStorageNodes.ToArrayNode toArrayNode,
+                        @Cached CallNode keyCallNode,
+                        @Cached TimSortNode timSortNode) {
+            return sortObjects(frame, list, key, isReverse(frame, reverse), toArrayNode, keyCallNode, timSortNode);
+        }
+
+        @Fallback
+        Object doGeneric(Object self, @SuppressWarnings("unused") Object key, @SuppressWarnings("unused") Object reverse) {
+            throw raise(TypeError, "descriptor 'sort' requires a 'list' object but received a '%p'", self);
+        }
+
+        private PNone sortObjects(VirtualFrame frame, PList list, Object key, boolean reverse, SequenceStorageNodes.ToArrayNode toArrayNode, CallNode keyCallNode, TimSortNode timSortNode) {
+            SequenceStorage original = list.getSequenceStorage();
+            // sort a private copy, so that the original order can be restored if sorting fails
+            Object[] values = copyValues(toArrayNode.execute(original));
+            int length = values.length;
+            // Like CPython, we empty the list while sorting, so that we can detect modifications
+            // done by the key function or by comparisons.
+            list.setSequenceStorage(EmptySequenceStorage.INSTANCE);
+            boolean modified;
+            boolean sorted = false;
+            try {
+                Object[] keys = values;
+                if (!PGuards.isPNone(key)) {
+                    // every key is computed exactly once and then carries its value along
+                    keys = new Object[length];
+                    for (int i = 0; i < length; i++) {
+                        keys[i] = keyCallNode.execute(frame, key, values[i]);
+                    }
+                }
+                // Reverse sort stability is achieved by initially reversing the list, applying a
+                // stable forward sort, then reversing the final result.
+                if (reverse) {
+                    reverse(keys, values, length);
+                }
+                if (keys == values && isStrings(values)) {
+                    sortStrings(values, length);
+                } else {
+                    timSortNode.execute(frame, keys, keys != values ? values : null, length);
+                }
+                if (reverse) {
+                    reverse(keys, values, length);
+                }
+                sorted = true;
+            } finally {
+                modified = list.getSequenceStorage() != EmptySequenceStorage.INSTANCE;
+                list.setSequenceStorage(sorted ? createStorage(values) : original);
+            }
+            if (modified) {
+                throw raise(PythonErrorType.ValueError, "list modified during sort");
+            }
+            return PNone.NONE;
+        }
+
+        private boolean isReverse(VirtualFrame frame, Object reverse) {
+            if (reverse instanceof Boolean) {
+                return (boolean) reverse;
+            } else if (reverse == PNone.NO_VALUE) {
+                return false;
+            }
+            if (castToBooleanNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToBooleanNode = insert(CastToBooleanNode.createIfTrueNode());
+            }
+            return castToBooleanNode.executeBoolean(frame, reverse);
+        }
+
+        private static void reverse(Object[] keys, Object[] values, int length) {
+            TimSortNode.reverseSlice(keys, 0, length);
+            if (keys != values) {
+                TimSortNode.reverseSlice(values, 0, length);
+            }
+        }
+
+        private static boolean isTotallyOrdered(double[] values, int length) {
+            for (int i = 0; i < length; i++) {
+                double v = values[i];
+                if (Double.isNaN(v) || Double.doubleToRawLongBits(v) == NEGATIVE_ZERO_BITS) {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        private static boolean isStrings(Object[] values) {
+            for (int i = 0; i < values.length; i++) {
+                if (!(values[i] instanceof String)) {
+                    return false;
+                }
+            }
+            return true;
+        }
+
+        @TruffleBoundary
+        private static void sortInts(int[] values, int length) {
+            Arrays.sort(values, 0, length);
+        }
+
+        @TruffleBoundary
+        private static void sortLongs(long[] values, int length) {
+            Arrays.sort(values, 0, length);
+        }
+
+        @TruffleBoundary
+        private static void sortDoubles(double[] values, int length) {
+            Arrays.sort(values, 0, length);
+        }
+
+        @TruffleBoundary
+        private static void sortStrings(Object[] values, int length) {
+            // this is a stable sort and String.compareTo is what str.__lt__ uses
+            Arrays.sort(values, 0, length);
+        }
+
+        @TruffleBoundary
+        private static Object[] copyValues(Object[] values) {
+            return Arrays.copyOf(values, values.length);
+        }
+
+        @TruffleBoundary
+        private static SequenceStorage createStorage(Object[] values) {
+            return SequenceStorageFactory.createStorage(values);
+        }
+    }
+
     @Builtin(name = __LEN__, minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
     public abstract static class LenNode extends PythonUnaryBuiltinNode {
@@ -0,0 +1,754 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.list;
+
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__GT__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__LT__;
+
+import com.oracle.graal.python.nodes.PNodeWithContext;
+import com.oracle.graal.python.nodes.expression.BinaryComparisonNode;
+import com.oracle.truffle.api.frame.VirtualFrame;
+
+/**
+ * A stable, adaptive merge sort (timsort) over an array of keys, using Python's {@code <} for
+ * comparisons. This is a port of CPython's {@code listobject.c}; read {@code listsort.txt} for an
+ * overview of the algorithm. If an array of values is given, every move of a key is mirrored in
+ * the values, so that both end up ordered by key.
+ */
+public final class TimSortNode extends PNodeWithContext {
+
+    /*
+     * When we get into galloping mode, we stay there until both runs win less often than
+     * MIN_GALLOP consecutive times.
+     */
+    private static final int MIN_GALLOP = 7;
+
+    /* The maximum number of entries in a MergeState's pending-runs stack. */
+    private static final int MAX_MERGE_PENDING = 85;
+
+    @Child private BinaryComparisonNode ltNode = BinaryComparisonNode.create(__LT__, __GT__, "<");
+
+    /**
+     * The state of one sort invocation. It is kept out of the node so that the node may be used
+     * re-entrantly, e.g., when a comparison itself sorts a list.
+     */
+    private static final class MergeState {
+        final Object[] keys;
+        final Object[] values;
+
+        int minGallop = MIN_GALLOP;
+
+        /* Temporary storage for merges. */
+        Object[] tmpKeys;
+        Object[] tmpValues;
+
+        /*
+         * A stack of n pending runs yet to be merged. Run #i starts at runBase[i] and extends for
+         * runLen[i] elements.
+         */
+        final int[] runBase = new int[MAX_MERGE_PENDING];
+        final int[] runLen = new int[MAX_MERGE_PENDING];
+        int n;
+
+        MergeState(Object[] keys, Object[] values) {
+            this.keys = keys;
+            this.values = values;
+        }
+
+        void ensureTemp(int need) {
+            if (tmpKeys == null || tmpKeys.length < need) {
+                tmpKeys = new Object[need];
+                if (values != null) {
+                    tmpValues = new Object[need];
+                }
+            }
+        }
+    }
+
+    public static TimSortNode create() {
+        return new TimSortNode();
+    }
+
+    /**
+     * Sorts {@code keys[0:length]} in-place. If {@code values} is not {@code null}, it must have
+     * at least {@code length} elements and is permuted alongside the keys.
+     */
+    public void execute(VirtualFrame frame, Object[] keys, Object[] values, int length) {
+        if (length < 2) {
+            return;
+        }
+        MergeState ms = new MergeState(keys, values);
+        int lo = 0;
+        int nremaining = length;
+        int minrun = computeMinrun(nremaining);
+        do {
+            // identify next run
+            int n = countRun(frame, keys, lo, lo + nremaining);
+            if (n < 0) {
+                n = -n;
+                reverseSlice(keys, values, lo, lo + n);
+            }
+            // if short, extend to min(minrun, nremaining)
+            if (n < minrun) {
+                int force = nremaining <= minrun ? nremaining : minrun;
+                binarySort(frame, keys, values, lo, lo + force, lo + n);
+                n = force;
+            }
+            // push run onto pending-runs stack, and maybe merge
+            assert ms.n < MAX_MERGE_PENDING;
+            ms.runBase[ms.n] = lo;
+            ms.runLen[ms.n] = n;
+            ms.n++;
+            mergeCollapse(frame, ms);
+            // advance to find next run
+            lo += n;
+            nremaining -= n;
+        } while (nremaining > 0);
+
+        mergeForceCollapse(frame, ms);
+        assert ms.n == 1;
+        assert ms.runBase[0] == 0;
+        assert ms.runLen[0] == length;
+    }
+
+    private boolean lt(VirtualFrame frame, Object a, Object b) {
+        return ltNode.executeBool(frame, a, b);
+    }
+
+    /**
+     * Compute a good value for the minimum run length; natural runs shorter than this are boosted
+     * artificially via binary insertion.
+     */
+    private static int computeMinrun(int length) {
+        int n = length;
+        int r = 0; // becomes 1 if any 1 bits are shifted off
+        while (n >= 64) {
+            r |= n & 1;
+            n >>= 1;
+        }
+        return n + r;
+    }
+
+    private static void reverseSlice(Object[] keys, Object[] values, int lo, int hi) {
+        reverseSlice(keys, lo, hi);
+        if (values != null) {
+            reverseSlice(values, lo, hi);
+        }
+    }
+
+    static void reverseSlice(Object[] a, int lo, int hi) {
+        int i = lo;
+        int j = hi - 1;
+        while (i < j) {
+            Object t = a[i];
+            a[i] = a[j];
+            a[j] = t;
+            i++;
+            j--;
+        }
+    }
+
+    /**
+     * Sort {@code [lo, hi)} via binary insertion, knowing that {@code [lo, start)} is already
+     * sorted. This is the best method for sorting small arrays and it is stable.
+     */
+    private void binarySort(VirtualFrame frame, Object[] keys, Object[] values, int lo, int hi, int initialStart) {
+        int start = initialStart;
+        if (lo == start) {
+            start++;
+        }
+        for (; start < hi; start++) {
+            // set l to where keys[start] belongs
+            int l = lo;
+            int r = start;
+            Object pivot = keys[r];
+            // Invariants: pivot >= all in [lo, l), pivot < all in [r, start).
+            do {
+                int p = l + ((r - l) >> 1);
+                if (lt(frame, pivot, keys[p])) {
+                    r = p;
+                } else {
+                    l = p + 1;
+                }
+            } while (l < r);
+            assert l == r;
+            // Elements equal to pivot are left of l, which makes this sort stable.
+            System.arraycopy(keys, l, keys, l + 1, start - l);
+            keys[l] = pivot;
+            if (values != null) {
+                Object pivotValue = values[start];
+                System.arraycopy(values, l, values, l + 1, start - l);
+                values[l] = pivotValue;
+            }
+        }
+    }
+
+    /**
+     * Return the length of the run beginning at {@code lo}, in the slice {@code [lo, hi)}. A run
+     * is either the longest non-descending or the longest strictly descending sequence. The
+     * length of a descending run is returned negated. The strictness of "descending" guarantees
+     * that the run may be reversed without violating stability.
+     */
+    private int countRun(VirtualFrame frame, Object[] keys, int lo, int hi) {
+        assert lo < hi;
+        int p = lo + 1;
+        if (p == hi) {
+            return 1;
+        }
+        int n = 2;
+        if (lt(frame, keys[p], keys[p - 1])) {
+            for (p++; p < hi; p++, n++) {
+                if (!lt(frame, keys[p], keys[p - 1])) {
+                    break;
+                }
+            }
+            return -n;
+        } else {
+            for (p++; p < hi; p++, n++) {
+                if (lt(frame, keys[p], keys[p - 1])) {
+                    break;
+                }
+            }
+            return n;
+        }
+    }
+
+    /**
+     * Locate the proper position of key in the sorted slice {@code a[base:base+n]}; if the slice
+     * contains an element equal to key, return the position immediately to the left of the
+     * leftmost equal element. {@code hint} is an index at which to begin the search,
+     * {@code 0 <= hint < n}. The closer hint is to the final result, the faster this runs.
+     *
+     * The return value is the int k in {@code 0..n} such that {@code a[k-1] < key <= a[k]}.
+     */
+    private int gallopLeft(VirtualFrame frame, Object key, Object[] a, int base, int n, int hint) {
+        assert n > 0 && hint >= 0 && hint < n;
+        int lastofs = 0;
+        int ofs = 1;
+        if (lt(frame, a[base + hint], key)) {
+            // a[hint] < key -- gallop right, until a[hint + lastofs] < key <= a[hint + ofs]
+            int maxofs = n - hint;
+            while (ofs < maxofs) {
+                if (lt(frame, a[base + hint + ofs], key)) {
+                    lastofs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) { // int overflow
+                        ofs = maxofs;
+                    }
+                } else {
+                    break;
+                }
+            }
+            if (ofs > maxofs) {
+                ofs = maxofs;
+            }
+            // translate back to offsets relative to base
+            lastofs += hint;
+            ofs += hint;
+        } else {
+            // key <= a[hint] -- gallop left, until a[hint - ofs] < key <= a[hint - lastofs]
+            int maxofs = hint + 1;
+            while (ofs < maxofs) {
+                if (lt(frame, a[base + hint - ofs], key)) {
+                    break;
+                }
+                lastofs = ofs;
+                ofs = (ofs << 1) + 1;
+                if (ofs <= 0) { // int overflow
+                    ofs = maxofs;
+                }
+            }
+            if (ofs > maxofs) {
+                ofs = maxofs;
+            }
+            // translate back to positive offsets relative to base
+            int k = lastofs;
+            lastofs = hint - ofs;
+            ofs = hint - k;
+        }
+        assert -1 <= lastofs && lastofs < ofs && ofs <= n;
+        /*
+         * Now a[lastofs] < key <= a[ofs], so key belongs somewhere to the right of lastofs but no
+         * farther right than ofs. Do a binary search, with invariant a[lastofs-1] < key <= a[ofs].
+         */
+        lastofs++;
+        while (lastofs < ofs) {
+            int m = lastofs + ((ofs - lastofs) >> 1);
+            if (lt(frame, a[base + m], key)) {
+                lastofs = m + 1; // a[m] < key
+            } else {
+                ofs = m; // key <= a[m]
+            }
+        }
+        assert lastofs == ofs;
+        return ofs;
+    }
+
+    /**
+     * Exactly like {@link #gallopLeft}, except that if any elements in the slice are equal to
+     * key, key belongs at the right of them. The return value is the int k in {@code 0..n} such
+     * that {@code a[k-1] <= key < a[k]}.
+     */
+    private int gallopRight(VirtualFrame frame, Object key, Object[] a, int base, int n, int hint) {
+        assert n > 0 && hint >= 0 && hint < n;
+        int lastofs = 0;
+        int ofs = 1;
+        if (lt(frame, key, a[base + hint])) {
+            // key < a[hint] -- gallop left, until a[hint - ofs] <= key < a[hint - lastofs]
+            int maxofs = hint + 1;
+            while (ofs < maxofs) {
+                if (lt(frame, key, a[base + hint - ofs])) {
+                    lastofs = ofs;
+                    ofs = (ofs << 1) + 1;
+                    if (ofs <= 0) { // int overflow
+                        ofs = maxofs;
+                    }
+                } else {
+                    break;
+                }
+            }
+            if (ofs > maxofs) {
+                ofs = maxofs;
+            }
+            // translate back to positive offsets relative to base
+            int k = lastofs;
+            lastofs = hint - ofs;
+            ofs = hint - k;
+        } else {
+            // a[hint] <= key -- gallop right, until a[hint + lastofs] <= key < a[hint + ofs]
+            int maxofs = n - hint;
+            while (ofs < maxofs) {
+                if (lt(frame, key, a[base + hint + ofs])) {
+                    break;
+                }
+                lastofs = ofs;
+                ofs = (ofs << 1) + 1;
+                if (ofs <= 0) { // int overflow
+                    ofs = maxofs;
+                }
+            }
+            if (ofs > maxofs) {
+                ofs = maxofs;
+            }
+            // translate back to offsets relative to base
+            lastofs += hint;
+            ofs += hint;
+        }
+        assert -1 <= lastofs && lastofs < ofs && ofs <= n;
+        /*
+         * Now a[lastofs] <= key < a[ofs], so key belongs somewhere to the right of lastofs but no
+         * farther right than ofs. Do a binary search, with invariant a[lastofs-1] <= key < a[ofs].
+         */
+        lastofs++;
+        while (lastofs < ofs) {
+            int m = lastofs + ((ofs - lastofs) >> 1);
+            if (lt(frame, key, a[base + m])) {
+                ofs = m; // key < a[m]
+            } else {
+                lastofs = m + 1; // a[m] <= key
+            }
+        }
+        assert lastofs == ofs;
+        return ofs;
+    }
+
+    /**
+     * Merge the na elements starting at pa with the nb elements starting at pb in a stable way,
+     * in-place. Must have {@code pa + na == pb}, {@code keys[pb] < keys[pa]}, that
+     * {@code keys[pa + na - 1]} belongs at the end of the merge, and should have {@code na <= nb}.
+     */
+    private void mergeLo(VirtualFrame frame, MergeState ms, int pa, int initialNa, int initialPb, int initialNb) {
+        int na = initialNa;
+        int nb = initialNb;
+        int pb = initialPb;
+        assert na > 0 && nb > 0 && pa + na == pb;
+        Object[] keys = ms.keys;
+        Object[] values = ms.values;
+        ms.ensureTemp(na);
+        Object[] tmpKeys = ms.tmpKeys;
+        Object[] tmpValues = ms.tmpValues;
+        System.arraycopy(keys, pa, tmpKeys, 0, na);
+        if (values != null) {
+            System.arraycopy(values, pa, tmpValues, 0, na);
+        }
+        int dest = pa;
+        int ta = 0;
+        boolean copyB = false;
+        // Invariant: elements in tmp[ta:ta+na] are waiting to be reinserted at dest. The finally
+        // block ensures that this also happens if a comparison raises an exception.
+        try {
+            copy(keys, values, dest++, keys, values, pb++);
+            nb--;
+            if (nb == 0) {
+                return;
+            }
+            if (na == 1) {
+                copyB = true;
+                return;
+            }
+            int minGallop = ms.minGallop;
+            while (true) {
+                int acount = 0; // number of times A won in a row
+                int bcount = 0; // number of times B won in a row
+
+                // Do the straightforward thing until (if ever) one run appears to win
+                // consistently.
+                while (true) {
+                    assert na > 1 && nb > 0;
+                    if (lt(frame, keys[pb], tmpKeys[ta])) {
+                        copy(keys, values, dest++, keys, values, pb++);
+                        bcount++;
+                        acount = 0;
+                        nb--;
+                        if (nb == 0) {
+                            return;
+                        }
+                        if (bcount >= minGallop) {
+                            break;
+                        }
+                    } else {
+                        copy(keys, values, dest++, tmpKeys, tmpValues, ta++);
+                        acount++;
+                        bcount = 0;
+                        na--;
+                        if (na == 1) {
+                            copyB = true;
+                            return;
+                        }
+                        if (acount >= minGallop) {
+                            break;
+                        }
+                    }
+                }
+
+                // One run is winning so consistently that galloping may be a huge win. So try
+                // that, and continue galloping until (if ever) neither run appears to be winning
+                // consistently anymore.
+                minGallop++;
+                do {
+                    assert na > 1 && nb > 0;
+                    minGallop -= minGallop > 1 ? 1 : 0;
+                    ms.minGallop = minGallop;
+                    int k = gallopRight(frame, keys[pb], tmpKeys, ta, na, 0);
+                    acount = k;
+                    if (k != 0) {
+                        copyRange(tmpKeys, tmpValues, ta, keys, values, dest, k);
+                        dest += k;
+                        ta += k;
+                        na -= k;
+                        if (na == 1) {
+                            copyB = true;
+                            return;
+                        }
+                        // na == 0 is impossible now if the comparison function is consistent,
+                        // but we can't assume that it is.
+                        if (na == 0) {
+                            return;
+                        }
+                    }
+                    copy(keys, values, dest++, keys, values, pb++);
+                    nb--;
+                    if (nb == 0) {
+                        return;
+                    }
+
+                    k = gallopLeft(frame, tmpKeys[ta], keys, pb, nb, 0);
+                    bcount = k;
+                    if (k != 0) {
+                        copyRange(keys, values, pb, keys, values, dest, k);
+                        dest += k;
+                        pb += k;
+                        nb -= k;
+                        if (nb == 0) {
+                            return;
+                        }
+                    }
+                    copy(keys, values, dest++, tmpKeys, tmpValues, ta++);
+                    na--;
+                    if (na == 1) {
+                        copyB = true;
+                        return;
+                    }
+                } while (acount >= MIN_GALLOP || bcount >= MIN_GALLOP);
+                minGallop++; // penalize it for leaving galloping mode
+                ms.minGallop = minGallop;
+            }
+        } finally {
+            if (copyB) {
+                assert na == 1 && nb > 0;
+                // the last element of run A belongs at the end of the merge
+                copyRange(keys, values, pb, keys, values, dest, nb);
+                copy(keys, values, dest + nb, tmpKeys, tmpValues, ta);
+            } else if (na > 0) {
+                copyRange(tmpKeys, tmpValues, ta, keys, values, dest, na);
+            }
+        }
+    }
+
+    /**
+     * Merge the na elements starting at pa with the nb elements starting at pb in a stable way,
+     * in-place. Must have {@code pa + na == pb}, {@code keys[pb] < keys[pa]}, that
+     * {@code keys[pa + na - 1]} belongs at the end of the merge, and should have {@code na >= nb}.
+     */
+    private void mergeHi(VirtualFrame frame, MergeState ms, int pa, int initialNa, int pb, int initialNb) {
+        int na = initialNa;
+        int nb = initialNb;
+        assert na > 0 && nb > 0 && pa + na == pb;
+        Object[] keys = ms.keys;
+        Object[] values = ms.values;
+        ms.ensureTemp(nb);
+        Object[] tmpKeys = ms.tmpKeys;
+        Object[] tmpValues = ms.tmpValues;
+        System.arraycopy(keys, pb, tmpKeys, 0, nb);
+        if (values != null) {
+            System.arraycopy(values, pb, tmpValues, 0, nb);
+        }
+        // dest, ia and ib point at the last element of the destination, run A and run B (in
+        // the temporary storage), respectively
+        int dest = pb + nb - 1;
+        int ia = pa + na - 1;
+        int ib = nb - 1;
+        boolean copyA = false;
+        // Invariant: elements in tmp[0:nb] are waiting to be reinserted before dest + 1. The
+        // finally block ensures that this also happens if a comparison raises an exception.
+        try {
+            copy(keys, values, dest--, keys, values, ia--);
+            na--;
+            if (na == 0) {
+                return;
+            }
+            if (nb == 1) {
+                copyA = true;
+                return;
+            }
+            int minGallop = ms.minGallop;
+            while (true) {
+                int acount = 0; // number of times A won in a row
+                int bcount = 0; // number of times B won in a row
+
+                // Do the straightforward thing until (if ever) one run appears to win
+                // consistently.
+                while (true) {
+                    assert na > 0 && nb > 1;
+                    if (lt(frame, tmpKeys[ib], keys[ia])) {
+                        copy(keys, values, dest--, keys, values, ia--);
+                        acount++;
+                        bcount = 0;
+                        na--;
+                        if (na == 0) {
+                            return;
+                        }
+                        if (acount >= minGallop) {
+                            break;
+                        }
+                    } else {
+                        copy(keys, values, dest--, tmpKeys, tmpValues, ib--);
+                        bcount++;
+                        acount = 0;
+                        nb--;
+                        if (nb == 1) {
+                            copyA = true;
+                            return;
+                        }
+                        if (bcount >= minGallop) {
+                            break;
+                        }
+                    }
+                }
+
+                // One run is winning so consistently that galloping may be a huge win. So try
+                // that, and continue galloping until (if ever) neither run appears to be winning
+                // consistently anymore.
+                minGallop++;
+                do {
+                    assert na > 0 && nb > 1;
+                    minGallop -= minGallop > 1 ? 1 : 0;
+                    ms.minGallop = minGallop;
+                    int k = na - gallopRight(frame, tmpKeys[ib], keys, pa, na, na - 1);
+                    acount = k;
+                    if (k != 0) {
+                        dest -= k;
+                        ia -= k;
+                        copyRange(keys, values, ia + 1, keys, values, dest + 1, k);
+                        na -= k;
+                        if (na == 0) {
+                            return;
+                        }
+                    }
+                    copy(keys, values, dest--, tmpKeys, tmpValues, ib--);
+                    nb--;
+                    if (nb == 1) {
+                        copyA = true;
+                        return;
+                    }
+
+                    k = nb - gallopLeft(frame, keys[ia], tmpKeys, 0, nb, nb - 1);
+                    bcount = k;
+                    if (k != 0) {
+                        dest -= k;
+                        ib -= k;
+                        copyRange(tmpKeys, tmpValues, ib + 1, keys, values, dest + 1, k);
+                        nb -= k;
+                        if (nb == 1) {
+                            copyA = true;
+                            return;
+                        }
+                        // nb == 0 is impossible now if the comparison function is consistent,
+                        // but we can't assume that it is.
+                        if (nb == 0) {
+                            return;
+                        }
+                    }
+                    copy(keys, values, dest--, keys, values, ia--);
+                    na--;
+                    if (na == 0) {
+                        return;
+                    }
+                } while (acount >= MIN_GALLOP || bcount >= MIN_GALLOP);
+                minGallop++; // penalize it for leaving galloping mode
+                ms.minGallop = minGallop;
+            }
+        } finally {
+            if (copyA) {
+                assert nb == 1 && na > 0;
+                // the first element of run B belongs at the front of the merge
+                copyRange(keys, values, ia + 1 - na, keys, values, dest + 1 - na, na);
+                copy(keys, values, dest - na, tmpKeys, tmpValues, ib);
+            } else if (nb > 0) {
+                copyRange(tmpKeys, tmpValues, 0, keys, values, dest - (nb - 1), nb);
+            }
+        }
+    }
+
+    /** Merge the two runs at stack indices i and i+1. */
+    private void mergeAt(VirtualFrame frame, MergeState ms, int i) {
+        assert ms.n >= 2 && i >= 0 && (i == ms.n - 2 || i == ms.n - 3);
+        int pa = ms.runBase[i];
+        int na = ms.runLen[i];
+        int pb = ms.runBase[i + 1];
+        int nb = ms.runLen[i + 1];
+        assert na > 0 && nb > 0 && pa + na == pb;
+
+        // Record the length of the combined runs; if i is the 3rd-last run now, also slide over
+        // the last run (which isn't involved in this merge). The current run i+1 goes away in
+        // any case.
+        ms.runLen[i] = na + nb;
+        if (i == ms.n - 3) {
+            ms.runBase[i + 1] = ms.runBase[i + 2];
+            ms.runLen[i + 1] = ms.runLen[i + 2];
+        }
+        ms.n--;
+
+        Object[] keys = ms.keys;
+        // Where does b start in a? Elements in a before that can be ignored (already in place).
+        int k = gallopRight(frame, keys[pb], keys, pa, na, 0);
+        pa += k;
+        na -= k;
+        if (na == 0) {
+            return;
+        }
+        // Where does a end in b? Elements in b after that can be ignored (already in place).
+        nb = gallopLeft(frame, keys[pa + na - 1], keys, pb, nb, nb - 1);
+        if (nb <= 0) {
+            return;
+        }
+        // Merge what remains of the runs, using a temp array with min(na, nb) elements.
+        if (na <= nb) {
+            mergeLo(frame, ms, pa, na, pb, nb);
+        } else {
+            mergeHi(frame, ms, pa, na, pb, nb);
+        }
+    }
+
+    /**
+     * Examine the stack of runs waiting to be merged, merging adjacent runs until the stack
+     * invariants are re-established:
+     *
+     * 1. len[-3] > len[-2] + len[-1]
+     *
+     * 2. len[-2] > len[-1]
+     */
+    private void mergeCollapse(VirtualFrame frame, MergeState ms) {
+        int[] p = ms.runLen;
+        while (ms.n > 1) {
+            int n = ms.n - 2;
+            if ((n > 0 && p[n - 1] <= p[n] + p[n + 1]) || (n > 1 && p[n - 2] <= p[n - 1] + p[n])) {
+                if (p[n - 1] < p[n + 1]) {
+                    n--;
+                }
+                mergeAt(frame, ms, n);
+            } else if (p[n] <= p[n + 1]) {
+                mergeAt(frame, ms, n);
+            } else {
+                break;
+            }
+        }
+    }
+
+    /**
+     * Regardless of invariants, merge all runs on the stack until only one remains. This is used
+     * at the end of the mergesort.
+     */
+    private void mergeForceCollapse(VirtualFrame frame, MergeState ms) {
+        int[] p = ms.runLen;
+        while (ms.n > 1) {
+            int n = ms.n - 2;
+            if (n > 0 && p[n - 1] < p[n + 1]) {
+                n--;
+            }
+            mergeAt(frame, ms, n);
+        }
+    }
+
+    private static void copy(Object[] dstKeys, Object[] dstValues, int dst, Object[] srcKeys, Object[] srcValues, int src) {
+        dstKeys[dst] = srcKeys[src];
+        if (dstValues != null) {
+            dstValues[dst] = srcValues[src];
+        }
+    }
+
+    private static void copyRange(Object[] srcKeys, Object[] srcValues, int src, Object[] dstKeys, Object[] dstValues, int dst, int n) {
+        System.arraycopy(srcKeys, src, dstKeys, dst, n);
+        if (dstValues != null) {
+            System.arraycopy(srcValues, src, dstValues, dst, n);
+        }
+    }
+}
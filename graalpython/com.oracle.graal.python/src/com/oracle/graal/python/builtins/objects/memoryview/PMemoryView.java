@@ -40,24 +40,27 @@
  */
 package com.oracle.graal.python.builtins.objects.memoryview;
 
+import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.bytes.PythonBufferLibrary;
+import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.SpecialMethodNames;
-import com.oracle.graal.python.nodes.attributes.ReadAttributeFromDynamicObjectNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode.LookupAndCallUnaryDynamicNode;
-import com.oracle.graal.python.nodes.util.CastToByteNode;
 import com.oracle.graal.python.nodes.util.CastToJavaIntNode;
 import com.oracle.truffle.api.dsl.Cached;
-import com.oracle.truffle.api.dsl.Cached.Shared;
+import com.oracle.truffle.api.interop.UnsupportedMessageException;
 import com.oracle.truffle.api.library.ExportLibrary;
 import com.oracle.truffle.api.library.ExportMessage;
 
+/**
+ * The memoryview object. Its state lives in the delegate installed by
+ * {@code lib-graalpython/memoryview.py}, which is either a managed view over {@code bytes},
+ * {@code bytearray} or {@code mmap} or a native memoryview for all other exporters.
+ */
 @ExportLibrary(PythonBufferLibrary.class)
 public class PMemoryView extends PythonBuiltinObject {
 
-    static final String C_MEMORYVIEW = "__c_memoryview";
-
     public PMemoryView(LazyPythonClass cls, @SuppressWarnings("unused") Object obj) {
         super(cls);
     }
@@ -69,26 +72,19 @@ public class PMemoryView extends PythonBuiltinObject {
 
     @ExportMessage
     int getBufferLength(
-                    @Shared("readNativeMemoryViewNode") @Cached ReadAttributeFromDynamicObjectNode readNativeMemoryViewNode,
-                    @Shared("lenNode") @Cached LookupAndCallUnaryDynamicNode lenNode,
-                    @Shared("castToIntNode") @Cached CastToJavaIntNode castToIntNode) {
-        Object nativeMemoryViewObject = readNativeMemoryViewNode.execute(this, C_MEMORYVIEW);
-        return castToIntNode.execute(lenNode.executeObject(nativeMemoryViewObject, SpecialMethodNames.__LEN__));
+                    @Cached LookupAndCallUnaryDynamicNode lenNode,
+                    @Cached CastToJavaIntNode castToIntNode) {
+        return castToIntNode.execute(lenNode.executeObject(this, SpecialMethodNames.__LEN__));
     }
 
     @ExportMessage
     byte[] getBufferBytes(
-                    @Shared("readNativeMemoryViewNode") @Cached ReadAttributeFromDynamicObjectNode readNativeMemoryViewNode,
-                    @Shared("lenNode") @Cached LookupAndCallUnaryDynamicNode lenNode,
-                    @Shared("castToIntNode") @Cached CastToJavaIntNode castToIntNode,
-                    @Cached PInteropSubscriptNode subscriptNode,
-                    @Cached CastToByteNode castToByteNode) {
-        Object nativeMemoryViewObject = readNativeMemoryViewNode.execute(this, C_MEMORYVIEW);
-        int len = castToIntNode.execute(lenNode.executeObject(nativeMemoryViewObject, SpecialMethodNames.__LEN__));
-        byte[] data = new byte[len];
-        for (int i = 0; i < data.length; i++) {
-            data[i] = castToByteNode.execute(null, subscriptNode.execute(nativeMemoryViewObject, i));
+                    @Cached LookupAndCallUnaryDynamicNode toBytesNode,
+                    @Cached SequenceStorageNodes.ToByteArrayNode toByteArrayNode) throws UnsupportedMessageException {
+        Object bytes = toBytesNode.executeObject(this, "tobytes");
+        if (bytes instanceof PBytes) {
+            return toByteArrayNode.execute(((PBytes) bytes).getSequenceStorage());
         }
-        return data;
+        throw UnsupportedMessageException.create();
     }
 }
@@ -58,9 +58,6 @@ import static com.oracle.graal.python.nodes.SpecialMethodNames.__RMUL__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__STR__;
 
 import java.io.IOException;
-import java.nio.ByteBuffer;
-import java.nio.channels.Channel;
-import java.nio.channels.SeekableByteChannel;
 import java.util.List;
 
 import com.oracle.graal.python.builtins.Builtin;
@@ -68,7 +65,6 @@ import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
-import com.oracle.graal.python.builtins.objects.bytes.AbstractBytesBuiltins.BytesLikeNoGeneralizationNode;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodes;
 import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.bytes.PIBytesLike;
@@ -79,26 +75,19 @@ import com.oracle.graal.python.builtins.objects.ints.PInt;
 import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.builtins.objects.mmap.MMapBuiltinsFactory.InternalLenNodeGen;
 import com.oracle.graal.python.builtins.objects.slice.PSlice;
-import com.oracle.graal.python.builtins.objects.slice.PSlice.SliceInfo;
 import com.oracle.graal.python.nodes.PNodeWithContext;
-import com.oracle.graal.python.nodes.PRaiseNode;
-import com.oracle.graal.python.nodes.PRaiseOSErrorNode;
 import com.oracle.graal.python.nodes.SpecialMethodNames;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
 import com.oracle.graal.python.nodes.util.CastToByteNode;
 import com.oracle.graal.python.nodes.util.CastToIndexNode;
 import com.oracle.graal.python.nodes.util.CastToJavaLongNode;
-import com.oracle.graal.python.nodes.util.ChannelNodes;
-import com.oracle.graal.python.nodes.util.ChannelNodes.ReadByteFromChannelNode;
 import com.oracle.graal.python.nodes.util.ChannelNodes.ReadFromChannelNode;
-import com.oracle.graal.python.nodes.util.ChannelNodes.WriteByteToChannelNode;
-import com.oracle.graal.python.nodes.util.ChannelNodes.WriteToChannelNode;
-import com.oracle.graal.python.runtime.sequence.storage.ByteSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.SequenceStorage;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -118,57 +107,67 @@ public class MMapBuiltins extends PythonBuiltins {
     protected interface MMapBaseNode {
     }
 
-    protected interface ByteReadingNode extends MMapBaseNode {
-
-        default ReadByteFromChannelNode createValueError(PRaiseNode raise) {
-            return ReadByteFromChannelNode.create(() -> new ChannelNodes.ReadByteErrorHandler() {
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return MMapBuiltinsFactory.getFactories();
+    }
 
-                @Override
-                public int execute(Channel channel) {
-                    throw raise.raise(PythonBuiltinClassType.ValueError, "read byte out of range");
-                }
-            });
+    /**
+     * Returns the channel of an mmap, raising {@code ValueError} like CPython if it was closed.
+     */
+    static MMapChannel getValidChannel(PythonBuiltinBaseNode node, PMMap self) {
+        MMapChannel channel = self.getChannel();
+        if (!channel.isOpen()) {
+            throw node.raise(PythonBuiltinClassType.ValueError, "mmap closed or invalid");
         }
+        return channel;
+    }
 
-        default ReadByteFromChannelNode createIndexError(PRaiseNode raise) {
-            return ReadByteFromChannelNode.create(() -> new ChannelNodes.ReadByteErrorHandler() {
-
-                @Override
-                public int execute(Channel channel) {
-                    throw raise.raise(PythonBuiltinClassType.IndexError, "mmap index out of range");
-                }
-            });
+    /**
+     * Slice indices over an mmap. Unlike {@code SliceInfo} they are longs, since mappings may be
+     * larger than 2 GB.
+     */
+    static final class MMapSlice {
+        final long start;
+        final long step;
+        final long length;
 
+        MMapSlice(long start, long step, long length) {
+            this.start = start;
+            this.step = step;
+            this.length = length;
         }
     }
 
-    protected interface ByteWritingNode extends MMapBaseNode {
-
-        default WriteByteToChannelNode createValueError(PRaiseNode raise) {
-            return WriteByteToChannelNode.create(() -> new ChannelNodes.WriteByteErrorHandler() {
-
-                @Override
-                public void execute(Channel channel, byte b) {
-                    throw raise.raise(PythonBuiltinClassType.ValueError, "write byte out of range");
-                }
-            });
+    static MMapSlice computeIndices(PythonBuiltinBaseNode node, PSlice slice, long length) {
+        long step = slice.getStep() == PSlice.MISSING_INDEX ? 1 : slice.getStep();
+        if (step == 0) {
+            throw node.raise(PythonBuiltinClassType.ValueError, "slice step cannot be zero");
         }
-
-        default WriteByteToChannelNode createIndexError(PRaiseNode raise) {
-            return WriteByteToChannelNode.create(() -> new ChannelNodes.WriteByteErrorHandler() {
-
-                @Override
-                public void execute(Channel channel, byte b) {
-                    throw raise.raise(PythonBuiltinClassType.IndexError, "mmap index out of range");
-                }
-            });
-
+        long start = adjustIndex(slice.getStart(), step < 0 ? length - 1 : 0, step, length);
+        long stop = adjustIndex(slice.getStop(), step < 0 ? -1 : length, step, length);
+        long sliceLength;
+        if ((step < 0 && stop >= start) || (step > 0 && start >= stop)) {
+            sliceLength = 0;
+        } else if (step < 0) {
+            sliceLength = (stop - start + 1) / step + 1;
+        } else {
+            sliceLength = (stop - start - 1) / step + 1;
         }
+        return new MMapSlice(start, step, sliceLength);
     }
 
-    @Override
-    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
-        return MMapBuiltinsFactory.getFactories();
+    private static long adjustIndex(int index, long missing, long step, long length) {
+        if (index == PSlice.MISSING_INDEX) {
+            return missing;
+        }
+        long idx = index < 0 ? index + length : index;
+        if (idx < 0) {
+            return step < 0 ? -1 : 0;
+        } else if (idx >= length) {
+            return step < 0 ? length - 1 : length;
+        }
+        return idx;
     }
 
     @Builtin(name = __ADD__, minNumOfPositionalArgs = 2)
@@ -233,7 +232,7 @@ public class MMapBuiltins extends PythonBuiltins {
 
     @Builtin(name = __GETITEM__, minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
-    public abstract static class GetItemNode extends PythonBuiltinNode implements ByteReadingNode {
+    public abstract static class GetItemNode extends PythonBuiltinNode {
 
         public abstract Object executeObject(VirtualFrame frame, PMMap self, Object idxObj);
 
@@ -242,56 +241,37 @@ public class MMapBuiltins extends PythonBuiltins {
         public abstract long executeLong(VirtualFrame frame, PMMap self, Object idxObj);
 
         @Specialization(guards = "!isPSlice(idxObj)")
-        int doSingle(VirtualFrame frame, PMMap self, Object idxObj,
-                        @SuppressWarnings("unused") @Cached PRaiseNode raise,
-                        @Cached("createIndexError(raise)") ReadByteFromChannelNode readByteNode,
+        int doSingle(PMMap self, Object idxObj,
                         @Cached("create()") CastToJavaLongNode castToLongNode,
-                        @Cached("create()") InternalLenNode lenNode) {
-
-            try {
-                long i = castToLongNode.execute(idxObj);
-                long len = lenNode.execute(self);
-                SeekableByteChannel channel = self.getChannel();
-                long idx = i < 0 ? i + len : i;
-
-                // save current position
-                long oldPos = PMMap.position(channel);
-
-                PMMap.position(channel, idx);
-                int res = readByteNode.execute(channel) & 0xFF;
-
-                // restore position
-                PMMap.position(channel, oldPos);
-
-                return res;
-
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+                        @Cached("createBinaryProfile()") ConditionProfile outOfRangeProfile) {
+            MMapChannel channel = getValidChannel(this, self);
+            long i = castToLongNode.execute(idxObj);
+            long len = self.getLength();
+            long idx = i < 0 ? i + len : i;
+            if (outOfRangeProfile.profile(idx < 0 || idx >= len)) {
+                throw raise(PythonBuiltinClassType.IndexError, "mmap index out of range");
             }
+            return channel.get(idx) & 0xFF;
         }
 
         @Specialization
-        Object doSlice(VirtualFrame frame, PMMap self, PSlice idx,
-                        @Cached("create()") ReadFromChannelNode readNode,
-                        @Cached("create()") InternalLenNode lenNode) {
-            try {
-                long len = lenNode.execute(self);
-                SliceInfo info = idx.computeIndices(PInt.intValueExact(len));
-                SeekableByteChannel channel = self.getChannel();
-
-                // save current position
-                long oldPos = PMMap.position(channel);
-
-                PMMap.position(channel, info.start);
-                ByteSequenceStorage s = readNode.execute(channel, info.length);
-
-                // restore position
-                PMMap.position(channel, oldPos);
-
-                return factory().createBytes(s);
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+        Object doSlice(PMMap self, PSlice idx,
+                        @Cached("createBinaryProfile()") ConditionProfile stepProfile) {
+            MMapChannel channel = getValidChannel(this, self);
+            MMapSlice info = computeIndices(this, idx, self.getLength());
+            if (info.length > Integer.MAX_VALUE) {
+                throw raise(PythonBuiltinClassType.OverflowError, "mmap slice is too large");
             }
+            byte[] result = new byte[(int) info.length];
+            if (stepProfile.profile(info.step == 1)) {
+                channel.get(info.start, result, 0, result.length);
+            } else {
+                long j = info.start;
+                for (int i = 0; i < result.length; i++, j += info.step) {
+                    result[i] = channel.get(j);
+                }
+            }
+            return factory().createBytes(result);
         }
 
         public static GetItemNode create() {
@@ -301,72 +281,52 @@ public class MMapBuiltins extends PythonBuiltins {
 
     @Builtin(name = SpecialMethodNames.__SETITEM__, minNumOfPositionalArgs = 3)
     @GenerateNodeFactory
-    abstract static class SetItemNode extends PythonBuiltinNode implements ByteWritingNode {
+    abstract static class SetItemNode extends PythonBuiltinNode {
 
         @Specialization(guards = "!isPSlice(idxObj)")
         PNone doSingle(VirtualFrame frame, PMMap self, Object idxObj, Object val,
-                        @SuppressWarnings("unused") @Cached PRaiseNode raise,
-                        @Cached("createIndexError(raise)") WriteByteToChannelNode writeByteNode,
                         @Cached("create()") CastToJavaLongNode castToLongNode,
                         @Cached("createCoerce()") CastToByteNode castToByteNode,
-                        @Cached("create()") InternalLenNode lenNode,
                         @Cached("createBinaryProfile()") ConditionProfile outOfRangeProfile) {
-
-            try {
-                long i = castToLongNode.execute(idxObj);
-                long len = lenNode.execute(self);
-                SeekableByteChannel channel = self.getChannel();
-                long idx = i < 0 ? i + len : i;
-
-                if (outOfRangeProfile.profile(idx < 0 || idx >= len)) {
-                    throw raise(PythonBuiltinClassType.IndexError, "mmap index out of range");
-                }
-
-                // save current position
-                long oldPos = PMMap.position(channel);
-
-                PMMap.position(channel, idx);
-                writeByteNode.execute(channel, castToByteNode.execute(frame, val));
-
-                // restore position
-                PMMap.position(channel, oldPos);
-
-                return PNone.NONE;
-
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+            MMapChannel channel = getValidChannel(this, self);
+            checkWritable(channel);
+            long i = castToLongNode.execute(idxObj);
+            long len = self.getLength();
+            long idx = i < 0 ? i + len : i;
+            if (outOfRangeProfile.profile(idx < 0 || idx >= len)) {
+                throw raise(PythonBuiltinClassType.IndexError, "mmap index out of range");
             }
+            channel.put(idx, castToByteNode.execute(frame, val));
+            return PNone.NONE;
         }
 
         @Specialization
-        PNone doSlice(VirtualFrame frame, PMMap self, PSlice idx, PIBytesLike val,
-                        @Cached("create()") WriteToChannelNode writeNode,
+        PNone doSlice(PMMap self, PSlice idx, PIBytesLike val,
                         @Cached("create()") SequenceNodes.GetSequenceStorageNode getStorageNode,
-                        @Cached("create()") InternalLenNode lenNode,
-                        @Cached("createBinaryProfile()") ConditionProfile invalidStepProfile) {
-
-            try {
-                long len = lenNode.execute(self);
-                SliceInfo info = idx.computeIndices(PInt.intValueExact(len));
-                SeekableByteChannel channel = self.getChannel();
-
-                if (invalidStepProfile.profile(info.step != 1)) {
-                    throw raise(PythonBuiltinClassType.SystemError, "step != 1 not supported");
+                        @Cached SequenceStorageNodes.ToByteArrayNode toByteArrayNode,
+                        @Cached("createBinaryProfile()") ConditionProfile stepProfile) {
+            MMapChannel channel = getValidChannel(this, self);
+            checkWritable(channel);
+            MMapSlice info = computeIndices(this, idx, self.getLength());
+            SequenceStorage storage = getStorageNode.execute(val);
+            if (storage.length() != info.length) {
+                throw raise(PythonBuiltinClassType.IndexError, "mmap slice assignment is wrong size");
+            }
+            byte[] data = toByteArrayNode.execute(storage);
+            if (stepProfile.profile(info.step == 1)) {
+                channel.put(info.start, data, 0, storage.length());
+            } else {
+                long j = info.start;
+                for (int i = 0; i < storage.length(); i++, j += info.step) {
+                    channel.put(j, data[i]);
                 }
+            }
+            return PNone.NONE;
+        }
 
-                // save current position
-                long oldPos = PMMap.position(channel);
-
-                PMMap.position(channel, info.start);
-                writeNode.execute(frame, channel, getStorageNode.execute(val), info.length);
-
-                // restore position
-                PMMap.position(channel, oldPos);
-
-                return PNone.NONE;
-
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+        private void checkWritable(MMapChannel channel) {
+            if (channel.isReadonly()) {
+                throw raise(PythonBuiltinClassType.TypeError, "mmap can't modify a readonly memory map.");
             }
         }
 
@@ -379,9 +339,9 @@ public class MMapBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     public abstract static class LenNode extends PythonBuiltinNode {
         @Specialization
-        long len(VirtualFrame frame, PMMap self,
-                        @Cached("create()") InternalLenNode lenNode) {
-            return lenNode.execute(self);
+        long len(PMMap self) {
+            getValidChannel(this, self);
+            return self.getLength();
         }
     }
 
@@ -431,7 +391,6 @@ public class MMapBuiltins extends PythonBuiltins {
     abstract static class ClosedNode extends PythonUnaryBuiltinNode {
 
         @Specialization
-        @TruffleBoundary
         boolean close(PMMap self) {
             return !self.getChannel().isOpen();
         }
@@ -442,36 +401,37 @@ public class MMapBuiltins extends PythonBuiltins {
     abstract static class SizeNode extends PythonBuiltinNode {
 
         @Specialization
-        long size(VirtualFrame frame, PMMap self,
+        long size(PMMap self,
                         @Cached("create()") InternalLenNode lenNode) {
+            getValidChannel(this, self);
             return lenNode.execute(self);
         }
     }
 
     @Builtin(name = "tell", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
-    abstract static class TellNode extends PythonBuiltinNode implements ByteReadingNode {
+    abstract static class TellNode extends PythonBuiltinNode {
         @Specialization
-        long readline(VirtualFrame frame, PMMap self) {
-            try {
-                SeekableByteChannel channel = self.getChannel();
-                return PMMap.position(channel) - self.getOffset();
-            } catch (IOException e) {
-                throw raiseOSError(frame, OSErrorEnum.EIO, e);
-            }
+        long tell(PMMap self) {
+            return getValidChannel(this, self).position();
         }
     }
 
     @Builtin(name = "read_byte", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
     @TypeSystemReference(PythonArithmeticTypes.class)
-    abstract static class ReadByteNode extends PythonUnaryBuiltinNode implements ByteReadingNode {
+    abstract static class ReadByteNode extends PythonUnaryBuiltinNode {
 
         @Specialization
         int readByte(PMMap self,
-                        @SuppressWarnings("unused") @Cached PRaiseNode raise,
-                        @Cached("createValueError(raise)") ReadByteFromChannelNode readByteNode) {
-            return readByteNode.execute(self.getChannel());
+                        @Cached("createBinaryProfile()") ConditionProfile outOfRangeProfile) {
+            MMapChannel channel = getValidChannel(this, self);
+            long pos = channel.position();
+            if (outOfRangeProfile.profile(pos >= self.getLength())) {
+                throw raise(PythonBuiltinClassType.ValueError, "read byte out of range");
+            }
+            channel.position(pos + 1);
+            return channel.get(pos) & 0xFF;
         }
     }
 
@@ -481,66 +441,55 @@ public class MMapBuiltins extends PythonBuiltins {
     abstract static class ReadNode extends PythonBuiltinNode {
 
         @Specialization
-        PBytes readUnlimited(PMMap self, @SuppressWarnings("unused") PNone n,
-                        @Cached("create()") ReadFromChannelNode readChannelNode) {
+        PBytes readUnlimited(PMMap self, @SuppressWarnings("unused") PNone n) {
             // intentionally accept NO_VALUE and NONE; both mean that we read unlimited amount of
             // bytes
-            ByteSequenceStorage res = readChannelNode.execute(self.getChannel(), ReadFromChannelNode.MAX_READ);
-            return factory().createBytes(res);
+            return doRead(self, Integer.MAX_VALUE);
         }
 
         @Specialization(guards = "!isNoValue(n)")
         PBytes read(VirtualFrame frame, PMMap self, Object n,
-                        @Cached("create()") ReadFromChannelNode readChannelNode,
                         @Cached("create()") CastToIndexNode castToIndexNode,
                         @Cached("createBinaryProfile()") ConditionProfile negativeProfile) {
             int nread = castToIndexNode.execute(frame, n);
             if (negativeProfile.profile(nread < 0)) {
-                return readUnlimited(self, PNone.NO_VALUE, readChannelNode);
+                return readUnlimited(self, PNone.NO_VALUE);
             }
-            ByteSequenceStorage res = readChannelNode.execute(self.getChannel(), nread);
-            return factory().createBytes(res);
+            return doRead(self, nread);
         }
 
+        private PBytes doRead(PMMap self, int n) {
+            MMapChannel channel = getValidChannel(this, self);
+            long pos = channel.position();
+            int nread = (int) Math.max(Math.min(n, Math.min(self.getLength() - pos, ReadFromChannelNode.MAX_READ)), 0);
+            byte[] result = new byte[nread];
+            channel.get(pos, result, 0, nread);
+            channel.position(pos + nread);
+            return factory().createBytes(result);
+        }
     }
 
     @Builtin(name = "readline", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
-    abstract static class ReadlineNode extends PythonUnaryBuiltinNode implements ByteReadingNode {
+    abstract static class ReadlineNode extends PythonUnaryBuiltinNode {
 
         @Specialization
-        Object readline(PMMap self,
-                        @Cached SequenceStorageNodes.AppendNode appendNode) {
-
-            try {
-                ByteBuffer buf = ByteBuffer.allocate(4096);
-                SeekableByteChannel channel = self.getChannel();
-                ByteSequenceStorage res = new ByteSequenceStorage(16);
-                // search for newline char
-                outer: while (readIntoBuffer(channel, buf) > 0) {
-                    buf.flip();
-                    while (buf.hasRemaining()) {
-                        byte b = buf.get();
-                        // CPython really tests for '\n' only
-                        if (b != (byte) '\n') {
-                            appendNode.execute(res, b, BytesLikeNoGeneralizationNode.SUPPLIER);
-                        } else {
-                            // recover correct position (i.e. number of remaining bytes in buffer)
-                            PMMap.position(channel, PMMap.position(channel) - buf.remaining() - 1);
-                            break outer;
-                        }
-                    }
-                    buf.clear();
-                }
-                return factory().createBytes(res);
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+        PBytes readline(PMMap self,
+                        @Cached("createBinaryProfile()") ConditionProfile noNewlineProfile) {
+            MMapChannel channel = getValidChannel(this, self);
+            long len = self.getLength();
+            long pos = Math.min(channel.position(), len);
+            // CPython really tests for '\n' only
+            long eol = channel.indexOf((byte) '\n', pos, len);
+            if (noNewlineProfile.profile(eol < 0)) {
+                eol = len;
+            } else {
+                eol++;
             }
-        }
-
-        @TruffleBoundary(allowInlining = true)
-        private static int readIntoBuffer(SeekableByteChannel ch, ByteBuffer dst) throws IOException {
-            return ch.read(dst);
+            byte[] result = new byte[(int) Math.min(eol - pos, ReadFromChannelNode.MAX_READ)];
+            channel.get(pos, result, 0, result.length);
+            channel.position(pos + result.length);
+            return factory().createBytes(result);
         }
     }
 
@@ -549,19 +498,32 @@ public class MMapBuiltins extends PythonBuiltins {
     abstract static class WriteNode extends PythonBinaryBuiltinNode {
 
         @Specialization
-        int writeBytesLike(VirtualFrame frame, PMMap self, PIBytesLike bytesLike,
-                        @Cached("create()") WriteToChannelNode writeNode,
-                        @Cached("create()") SequenceNodes.GetSequenceStorageNode getStorageNode) {
-            SeekableByteChannel channel = self.getChannel();
-            return writeNode.execute(frame, channel, getStorageNode.execute(bytesLike), Integer.MAX_VALUE);
+        int writeBytesLike(PMMap self, PIBytesLike bytesLike,
+                        @Cached("create()") SequenceNodes.GetSequenceStorageNode getStorageNode,
+                        @Cached SequenceStorageNodes.ToByteArrayNode toByteArrayNode) {
+            SequenceStorage storage = getStorageNode.execute(bytesLike);
+            return write(self, toByteArrayNode.execute(storage), storage.length());
         }
 
         @Specialization
         int writeMemoryview(VirtualFrame frame, PMMap self, PMemoryView memoryView,
-                        @Cached("create()") WriteToChannelNode writeNode,
                         @Cached("create()") BytesNodes.ToBytesNode toBytesNode) {
             byte[] data = toBytesNode.execute(frame, memoryView);
-            return writeNode.execute(frame, self.getChannel(), new ByteSequenceStorage(data), Integer.MAX_VALUE);
+            return write(self, data, data.length);
+        }
+
+        private int write(PMMap self, byte[] data, int len) {
+            MMapChannel channel = getValidChannel(this, self);
+            if (channel.isReadonly()) {
+                throw raise(PythonBuiltinClassType.TypeError, "mmap can't modify a readonly memory map.");
+            }
+            long pos = channel.position();
+            if (pos > self.getLength() || self.getLength() - pos < len) {
+                throw raise(PythonBuiltinClassType.ValueError, "data out of range");
+            }
+            channel.put(pos, data, 0, len);
+            channel.position(pos + len);
+            return len;
         }
     }
 
@@ -580,40 +542,30 @@ public class MMapBuiltins extends PythonBuiltins {
 
         @Specialization
         Object seek(VirtualFrame frame, PMMap self, long dist, Object how) {
-            try {
-                SeekableByteChannel channel = self.getChannel();
-                long size;
-                if (self.getLength() == 0) {
-                    size = PMMap.size(channel) - self.getOffset();
-                } else {
-                    size = self.getLength();
-                }
-                long where;
-                int ihow = castToInt(frame, how);
-                switch (ihow) {
-                    case 0: /* relative to start */
-                        where = dist;
-                        break;
-                    case 1: /* relative to current position */
-                        where = PMMap.position(channel) + dist;
-                        break;
-                    case 2: /* relative to end */
-                        where = size + dist;
-                        break;
-                    default:
-                        errorProfile.enter();
-                        throw raise(PythonBuiltinClassType.ValueError, "unknown seek type");
-                }
-                if (where > size || where < 0) {
+            MMapChannel channel = getValidChannel(this, self);
+            long size = self.getLength();
+            long where;
+            int ihow = castToInt(frame, how);
+            switch (ihow) {
+                case 0: /* relative to start */
+                    where = dist;
+                    break;
+                case 1: /* relative to current position */
+                    where = channel.position() + dist;
+                    break;
+                case 2: /* relative to end */
+                    where = size + dist;
+                    break;
+                default:
                     errorProfile.enter();
-                    throw raise(PythonBuiltinClassType.ValueError, "seek out of range");
-                }
-                PMMap.position(channel, where);
-                return PNone.NONE;
-            } catch (IOException e) {
+                    throw raise(PythonBuiltinClassType.ValueError, "unknown seek type");
+            }
+            if (where > size || where < 0) {
                 errorProfile.enter();
-                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+                throw raise(PythonBuiltinClassType.ValueError, "seek out of range");
             }
+            channel.position(where);
+            return PNone.NONE;
         }
 
         private int castToInt(VirtualFrame frame, Object val) {
@@ -628,84 +580,44 @@ public class MMapBuiltins extends PythonBuiltins {
     @Builtin(name = "find", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
     @GenerateNodeFactory
     @TypeSystemReference(PythonArithmeticTypes.class)
-    public abstract static class FindNode extends PythonBuiltinNode implements ByteReadingNode {
-
-        @Child private SequenceStorageNodes.GetItemNode getRightItemNode;
+    public abstract static class FindNode extends PythonBuiltinNode {
 
         public abstract long execute(VirtualFrame frame, PMMap bytes, Object sub, Object starting, Object ending);
 
         @Specialization
-        long find(VirtualFrame frame, PMMap primary, PIBytesLike sub, Object starting, Object ending,
-                        @SuppressWarnings("unused") @Cached PRaiseNode raise,
-                        @Cached("createValueError(raise)") ReadByteFromChannelNode readByteNode) {
-            try {
-                SeekableByteChannel channel = primary.getChannel();
-                long len1 = PMMap.size(channel);
-
-                SequenceStorage needle = sub.getSequenceStorage();
-                int len2 = needle.length();
-
-                long s = castToLong(starting, 0);
-                long e = castToLong(ending, len1);
-
-                long start = s < 0 ? s + len1 : s;
-                long end = e < 0 ? e + len1 : e;
-
-                if (start >= len1 || len1 < len2) {
-                    return -1;
-                } else if (end > len1) {
-                    end = len1;
-                }
-
-                // TODO implement a more efficient algorithm
-                outer: for (long i = start; i < end; i++) {
-                    // TODO(fa) don't seek but use circular buffer
-                    PMMap.position(channel, i);
-                    for (int j = 0; j < len2; j++) {
-                        int hb = readByteNode.execute(channel);
-                        int nb = getGetRightItemNode().executeInt(frame, needle, j);
-                        if (nb != hb || i + j >= end) {
-                            continue outer;
-                        }
-                    }
-                    return i;
-                }
-                return -1;
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
-            }
+        long find(PMMap primary, PIBytesLike sub, Object starting, Object ending,
+                        @Cached("create()") SequenceNodes.GetSequenceStorageNode getStorageNode,
+                        @Cached SequenceStorageNodes.ToByteArrayNode toByteArrayNode) {
+            MMapChannel channel = getValidChannel(this, primary);
+            long len = primary.getLength();
+            SequenceStorage storage = getStorageNode.execute(sub);
+            byte[] needle = toByteArrayNode.execute(storage);
+            long start = clamp(castToLong(starting, channel.position()), len);
+            long end = clamp(castToLong(ending, len), len);
+            return channel.indexOf(needle, start, end);
         }
 
         @Specialization
-        long find(PMMap primary, int sub, Object starting, @SuppressWarnings("unused") Object ending,
-                        @SuppressWarnings("unused") @Cached PRaiseNode raise,
-                        @Cached("createValueError(raise)") ReadByteFromChannelNode readByteNode) {
-            try {
-                SeekableByteChannel channel = primary.getChannel();
-                long len1 = PMMap.size(channel);
-
-                long s = castToLong(starting, 0);
-                long e = castToLong(ending, len1);
-
-                long start = s < 0 ? s + len1 : s;
-                long end = Math.max(e < 0 ? e + len1 : e, len1);
-
-                PMMap.position(channel, start);
+        long find(PMMap primary, int sub, Object starting, Object ending) {
+            if (sub < 0 || sub > 255) {
+                throw raise(PythonBuiltinClassType.ValueError, CastToByteNode.INVALID_BYTE_VALUE);
+            }
+            MMapChannel channel = getValidChannel(this, primary);
+            long len = primary.getLength();
+            long start = clamp(castToLong(starting, channel.position()), len);
+            long end = clamp(castToLong(ending, len), len);
+            return channel.indexOf((byte) sub, start, end);
+        }
 
-                for (long i = start; i < end; i++) {
-                    int hb = readByteNode.execute(channel);
-                    if (hb == sub) {
-                        return i;
-                    }
-                }
-                return -1;
-            } catch (IOException e) {
-                throw raise(PythonBuiltinClassType.OSError, e);
+        static long clamp(long idx, long len) {
+            if (idx < 0) {
+                return Math.max(idx + len, 0);
             }
+            return Math.min(idx, len);
         }
 
         // TODO(fa): use node
-        private static long castToLong(Object obj, long defaultVal) {
+        static long castToLong(Object obj, long defaultVal) {
             if (obj instanceof Integer || obj instanceof Long) {
                 return ((Number) obj).longValue();
             } else if (obj instanceof PInt) {
@@ -717,13 +629,34 @@ public class MMapBuiltins extends PythonBuiltins {
             }
             return defaultVal;
         }
+    }
 
-        private SequenceStorageNodes.GetItemNode getGetRightItemNode() {
-            if (getRightItemNode == null) {
-                CompilerDirectives.transferToInterpreterAndInvalidate();
-                getRightItemNode = insert(SequenceStorageNodes.GetItemNode.create());
+    @Builtin(name = "rfind", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
+    @GenerateNodeFactory
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    public abstract static class RFindNode extends PythonBuiltinNode {
+
+        @Specialization
+        long rfind(PMMap primary, PIBytesLike sub, Object starting, Object ending,
+                        @Cached("create()") SequenceNodes.GetSequenceStorageNode getStorageNode,
+                        @Cached SequenceStorageNodes.ToByteArrayNode toByteArrayNode) {
+            return rfind(primary, toByteArrayNode.execute(getStorageNode.execute(sub)), starting, ending);
+        }
+
+        @Specialization
+        long rfind(PMMap primary, int sub, Object starting, Object ending) {
+            if (sub < 0 || sub > 255) {
+                throw raise(PythonBuiltinClassType.ValueError, CastToByteNode.INVALID_BYTE_VALUE);
             }
-            return getRightItemNode;
+            return rfind(primary, new byte[]{(byte) sub}, starting, ending);
+        }
+
+        private long rfind(PMMap primary, byte[] needle, Object starting, Object ending) {
+            MMapChannel channel = getValidChannel(this, primary);
+            long len = primary.getLength();
+            long start = FindNode.clamp(FindNode.castToLong(starting, channel.position()), len);
+            long end = FindNode.clamp(FindNode.castToLong(ending, len), len);
+            return channel.lastIndexOf(needle, start, end);
         }
     }
 
@@ -732,33 +665,8 @@ public class MMapBuiltins extends PythonBuiltins {
 
         public abstract long execute(PMMap self);
 
-        @Specialization(guards = "self.getLength() == 0")
-        long doFull(PMMap self,
-                        @Cached PRaiseOSErrorNode raise,
-                        @Cached("create()") BranchProfile profile) {
-            try {
-                return PMMap.size(self.getChannel()) - self.getOffset();
-            } catch (IOException e) {
-                profile.enter();
-                throw raise.raiseOSError(null, OSErrorEnum.EIO, e);
-            }
-        }
-
-        @Specialization(guards = "self.getLength() > 0")
-        long doWindow(PMMap self) {
-            return self.getLength();
-        }
-
         @Specialization
-        long doGeneric(PMMap self,
-                        @Cached PRaiseOSErrorNode raise) {
-            if (self.getLength() == 0) {
-                try {
-                    return PMMap.size(self.getChannel()) - self.getOffset();
-                } catch (IOException e) {
-                    throw raise.raiseOSError(null, OSErrorEnum.EIO, e);
-                }
-            }
+        static long doLen(PMMap self) {
             return self.getLength();
         }
 
@@ -767,15 +675,24 @@ public class MMapBuiltins extends PythonBuiltins {
         }
     }
 
-    @Builtin(name = "flush", minNumOfPositionalArgs = 1)
+    @Builtin(name = "flush", minNumOfPositionalArgs = 1, maxNumOfPositionalArgs = 3)
     @GenerateNodeFactory
-    abstract static class FlushNode extends PythonUnaryBuiltinNode {
+    abstract static class FlushNode extends PythonTernaryBuiltinNode {
 
         @Specialization
-        Object seek(@SuppressWarnings("unused") PMMap self) {
+        Object flush(VirtualFrame frame, PMMap self, @SuppressWarnings("unused") Object offset, @SuppressWarnings("unused") Object size) {
+            try {
+                force(getValidChannel(this, self));
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EIO, e);
+            }
             return PNone.NONE;
         }
 
+        @TruffleBoundary
+        private static void force(MMapChannel channel) throws IOException {
+            channel.force();
+        }
     }
 
 }
@@ -0,0 +1,421 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.mmap;
+
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.MappedByteBuffer;
+import java.nio.channels.ClosedChannelException;
+import java.nio.channels.FileChannel;
+import java.nio.channels.FileChannel.MapMode;
+import java.nio.channels.NonWritableChannelException;
+import java.nio.channels.SeekableByteChannel;
+
+import com.oracle.graal.python.builtins.objects.bytes.BytesUtils;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
+/**
+ * The memory behind an {@code mmap} object. The {@link SeekableByteChannel} view maintains the
+ * position used by {@code read}, {@code write}, {@code seek} etc. Positions are relative to the
+ * start of the mapping. In addition, the memory can be accessed at absolute indices without
+ * touching the position.
+ */
+public abstract class MMapChannel implements SeekableByteChannel {
+    private static final int SEARCH_CHUNK_SIZE = 64 * 1024;
+
+    private final boolean readonly;
+    private boolean open = true;
+    private long position;
+
+    protected MMapChannel(boolean readonly) {
+        this.readonly = readonly;
+    }
+
+    public final boolean isReadonly() {
+        return readonly;
+    }
+
+    @Override
+    public abstract long size();
+
+    public abstract byte get(long index);
+
+    public abstract void put(long index, byte b);
+
+    public abstract void get(long index, byte[] dst, int dstOffset, int len);
+
+    public abstract void put(long index, byte[] src, int srcOffset, int len);
+
+    /**
+     * Makes sure that all changes are written to the underlying file (if any).
+     */
+    public void force() throws IOException {
+    }
+
+    /**
+     * Returns the index of the first occurrence of {@code b} in {@code [start, end)} or {@code -1}.
+     */
+    @TruffleBoundary
+    public long indexOf(byte b, long start, long end) {
+        for (long i = start; i < end; i++) {
+            if (get(i) == b) {
+                return i;
+            }
+        }
+        return -1;
+    }
+
+    /**
+     * Returns the index of the first occurrence of {@code needle} that lies completely within
+     * {@code [start, end)} or {@code -1}. The memory is copied out and searched in chunks that
+     * overlap by {@code needle.length - 1} bytes.
+     */
+    @TruffleBoundary
+    public long indexOf(byte[] needle, long start, long end) {
+        if (needle.length == 0) {
+            return start <= end ? start : -1;
+        } else if (needle.length == 1) {
+            return indexOf(needle[0], start, end);
+        } else if (end - start < needle.length) {
+            return -1;
+        }
+        byte[] chunk = new byte[(int) Math.min(end - start, SEARCH_CHUNK_SIZE + needle.length - 1)];
+        long pos = start;
+        while (end - pos >= needle.length) {
+            int n = (int) Math.min(chunk.length, end - pos);
+            get(pos, chunk, 0, n);
+            int idx = BytesUtils.indexOf(chunk, 0, n, needle, needle.length);
+            if (idx >= 0) {
+                return pos + idx;
+            }
+            pos += n - needle.length + 1;
+        }
+        return -1;
+    }
+
+    /**
+     * Returns the index of the last occurrence of {@code needle} that lies completely within
+     * {@code [start, end)} or {@code -1}.
+     */
+    @TruffleBoundary
+    public long lastIndexOf(byte[] needle, long start, long end) {
+        if (needle.length == 0) {
+            return start <= end ? end : -1;
+        } else if (end - start < needle.length) {
+            return -1;
+        }
+        byte[] chunk = new byte[(int) Math.min(end - start, SEARCH_CHUNK_SIZE + needle.length - 1)];
+        long limit = end;
+        while (limit - start >= needle.length) {
+            int n = (int) Math.min(chunk.length, limit - start);
+            long pos = limit - n;
+            get(pos, chunk, 0, n);
+            int idx = BytesUtils.lastIndexOf(chunk, 0, n, needle, needle.length);
+            if (idx >= 0) {
+                return pos + idx;
+            }
+            limit = pos + needle.length - 1;
+        }
+        return -1;
+    }
+
+    @Override
+    public boolean isOpen() {
+        return open;
+    }
+
+    @Override
+    public void close() throws IOException {
+        open = false;
+    }
+
+    @Override
+    public long position() {
+        return position;
+    }
+
+    @Override
+    public SeekableByteChannel position(long newPosition) {
+        if (newPosition < 0) {
+            throw new IllegalArgumentException();
+        }
+        position = newPosition;
+        return this;
+    }
+
+    @Override
+    public int read(ByteBuffer dst) throws IOException {
+        checkOpen();
+        long remaining = size() - position;
+        if (remaining <= 0) {
+            return -1;
+        }
+        int n = (int) Math.min(dst.remaining(), remaining);
+        if (dst.hasArray()) {
+            get(position, dst.array(), dst.arrayOffset() + dst.position(), n);
+            dst.position(dst.position() + n);
+        } else {
+            for (int i = 0; i < n; i++) {
+                dst.put(get(position + i));
+            }
+        }
+        position += n;
+        return n;
+    }
+
+    @Override
+    public int write(ByteBuffer src) throws IOException {
+        checkOpen();
+        if (readonly) {
+            throw new NonWritableChannelException();
+        }
+        int n = (int) Math.max(Math.min(src.remaining(), size() - position), 0);
+        if (src.hasArray()) {
+            put(position, src.array(), src.arrayOffset() + src.position(), n);
+            src.position(src.position() + n);
+        } else {
+            for (int i = 0; i < n; i++) {
+                put(position + i, src.get());
+            }
+        }
+        position += n;
+        return n;
+    }
+
+    @Override
+    public SeekableByteChannel truncate(long size) {
+        throw new UnsupportedOperationException("cannot truncate a memory map");
+    }
+
+    private void checkOpen() throws ClosedChannelException {
+        if (!open) {
+            throw new ClosedChannelException();
+        }
+    }
+
+    /**
+     * Memory that lives on the Java heap. This is used for anonymous maps and as a fallback if the
+     * file system does not support mapping files. In the latter case, the data is written back to
+     * the file on {@link #force()} and {@link #close()}.
+     */
+    public static final class HeapChannel extends MMapChannel {
+        private final byte[] data;
+        private final SeekableByteChannel backingChannel;
+        private final long backingOffset;
+
+        public HeapChannel(int size) {
+            this(new byte[size], false, null, 0);
+        }
+
+        public HeapChannel(byte[] data, boolean readonly, SeekableByteChannel backingChannel, long backingOffset) {
+            super(readonly);
+            this.data = data;
+            this.backingChannel = backingChannel;
+            this.backingOffset = backingOffset;
+        }
+
+        @Override
+        public long size() {
+            return data.length;
+        }
+
+        @Override
+        public byte get(long index) {
+            return data[(int) index];
+        }
+
+        @Override
+        public void put(long index, byte b) {
+            data[(int) index] = b;
+        }
+
+        @Override
+        public void get(long index, byte[] dst, int dstOffset, int len) {
+            System.arraycopy(data, (int) index, dst, dstOffset, len);
+        }
+
+        @Override
+        public void put(long index, byte[] src, int srcOffset, int len) {
+            System.arraycopy(src, srcOffset, data, (int) index, len);
+        }
+
+        @Override
+        @TruffleBoundary
+        public long indexOf(byte[] needle, long start, long end) {
+            return BytesUtils.indexOf(data, (int) start, (int) end, needle, needle.length);
+        }
+
+        @Override
+        @TruffleBoundary
+        public long lastIndexOf(byte[] needle, long start, long end) {
+            return BytesUtils.lastIndexOf(data, (int) start, (int) end, needle, needle.length);
+        }
+
+        @Override
+        @TruffleBoundary
+        public void force() throws IOException {
+            if (backingChannel != null && backingChannel.isOpen()) {
+                backingChannel.position(backingOffset);
+                ByteBuffer buf = ByteBuffer.wrap(data);
+                while (buf.hasRemaining()) {
+                    backingChannel.write(buf);
+                }
+            }
+        }
+
+        @Override
+        @TruffleBoundary
+        public void close() throws IOException {
+            if (isOpen() && backingChannel != null) {
+                force();
+                backingChannel.close();
+            }
+            super.close();
+        }
+    }
+
+    /**
+     * A file mapped into memory. Since a single {@link MappedByteBuffer} cannot be larger than
+     * 2 GB, larger mappings are split into multiple windows.
+     */
+    public static final class MappedChannel extends MMapChannel {
+        private static final int WINDOW_SHIFT = 30;
+        private static final long WINDOW_SIZE = 1L << WINDOW_SHIFT;
+        private static final long WINDOW_MASK = WINDOW_SIZE - 1;
+
+        private final MappedByteBuffer[] windows;
+        private final long size;
+        private final boolean shared;
+
+        @TruffleBoundary
+        public MappedChannel(FileChannel channel, MapMode mode, long offset, long size) throws IOException {
+            super(mode == MapMode.READ_ONLY);
+            this.size = size;
+            this.shared = mode == MapMode.READ_WRITE;
+            this.windows = new MappedByteBuffer[(int) ((size + WINDOW_SIZE - 1) >>> WINDOW_SHIFT)];
+            for (int i = 0; i < windows.length; i++) {
+                long start = (long) i << WINDOW_SHIFT;
+                windows[i] = channel.map(mode, offset + start, Math.min(WINDOW_SIZE, size - start));
+            }
+        }
+
+        @Override
+        public long size() {
+            return size;
+        }
+
+        @Override
+        @TruffleBoundary(allowInlining = true)
+        public byte get(long index) {
+            return windows[(int) (index >>> WINDOW_SHIFT)].get((int) (index & WINDOW_MASK));
+        }
+
+        @Override
+        @TruffleBoundary(allowInlining = true)
+        public void put(long index, byte b) {
+            windows[(int) (index >>> WINDOW_SHIFT)].put((int) (index & WINDOW_MASK), b);
+        }
+
+        @Override
+        @TruffleBoundary
+        public void get(long index, byte[] dst, int dstOffset, int len) {
+            long cur = index;
+            int off = dstOffset;
+            int remaining = len;
+            while (remaining > 0) {
+                ByteBuffer window = windows[(int) (cur >>> WINDOW_SHIFT)].duplicate();
+                int inWindow = (int) (cur & WINDOW_MASK);
+                int n = Math.min(remaining, window.limit() - inWindow);
+                window.position(inWindow);
+                window.get(dst, off, n);
+                cur += n;
+                off += n;
+                remaining -= n;
+            }
+        }
+
+        @Override
+        @TruffleBoundary
+        public void put(long index, byte[] src, int srcOffset, int len) {
+            long cur = index;
+            int off = srcOffset;
+            int remaining = len;
+            while (remaining > 0) {
+                ByteBuffer window = windows[(int) (cur >>> WINDOW_SHIFT)].duplicate();
+                int inWindow = (int) (cur & WINDOW_MASK);
+                int n = Math.min(remaining, window.limit() - inWindow);
+                window.position(inWindow);
+                window.put(src, off, n);
+                cur += n;
+                off += n;
+                remaining -= n;
+            }
+        }
+
+        @Override
+        @TruffleBoundary
+        public long indexOf(byte b, long start, long end) {
+            long i = start;
+            while (i < end) {
+                MappedByteBuffer window = windows[(int) (i >>> WINDOW_SHIFT)];
+                int from = (int) (i & WINDOW_MASK);
+                int to = (int) Math.min(window.limit(), from + (end - i));
+                for (int j = from; j < to; j++) {
+                    if (window.get(j) == b) {
+                        return i + (j - from);
+                    }
+                }
+                i += to - from;
+            }
+            return -1;
+        }
+
+        @Override
+        @TruffleBoundary
+        public void force() {
+            if (shared) {
+                for (MappedByteBuffer window : windows) {
+                    window.force();
+                }
+            }
+        }
+    }
+}
@@ -40,38 +40,28 @@
  */
 package com.oracle.graal.python.builtins.objects.mmap;
 
-import java.io.IOException;
-import java.nio.channels.SeekableByteChannel;
-
 import com.oracle.graal.python.builtins.objects.bytes.PythonBufferLibrary;
-import com.oracle.graal.python.builtins.objects.mmap.MMapBuiltins.InternalLenNode;
 import com.oracle.graal.python.builtins.objects.object.PythonObject;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
-import com.oracle.graal.python.nodes.util.CastToJavaIntNode;
-import com.oracle.graal.python.nodes.util.ChannelNodes.ReadFromChannelNode;
-import com.oracle.graal.python.runtime.sequence.storage.ByteSequenceStorage;
-import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
-import com.oracle.truffle.api.dsl.Cached;
-import com.oracle.truffle.api.dsl.Cached.Shared;
 import com.oracle.truffle.api.library.ExportLibrary;
 import com.oracle.truffle.api.library.ExportMessage;
 
 @ExportLibrary(PythonBufferLibrary.class)
 public final class PMMap extends PythonObject {
 
-    private final SeekableByteChannel mappedByteBuffer;
+    private final MMapChannel channel;
     private final long length;
     private final long offset;
 
-    public PMMap(LazyPythonClass pythonClass, SeekableByteChannel mappedByteBuffer, long length, long offset) {
+    public PMMap(LazyPythonClass pythonClass, MMapChannel channel, long length, long offset) {
         super(pythonClass);
-        this.mappedByteBuffer = mappedByteBuffer;
+        this.channel = channel;
         this.length = length;
         this.offset = offset;
     }
 
-    public SeekableByteChannel getChannel() {
-        return mappedByteBuffer;
+    public MMapChannel getChannel() {
+        return channel;
     }
 
     public long getLength() {
@@ -88,46 +78,14 @@ public final class PMMap extends PythonObject {
     }
 
     @ExportMessage
-    int getBufferLength(
-                    @Shared("lenNode") @Cached InternalLenNode lenNode,
-                    @Shared("castToIntNode") @Cached CastToJavaIntNode castToIntNode) {
-        return castToIntNode.execute(lenNode.execute(this));
+    int getBufferLength() {
+        return (int) Math.min(length, Integer.MAX_VALUE);
     }
 
     @ExportMessage
-    byte[] getBufferBytes(
-                    @Shared("lenNode") @Cached InternalLenNode lenNode,
-                    @Shared("castToIntNode") @Cached CastToJavaIntNode castToIntNode,
-                    @Cached ReadFromChannelNode readNode) {
-
-        try {
-            int len = getBufferLength(lenNode, castToIntNode);
-
-            // save current position
-            long oldPos = PMMap.position(mappedByteBuffer);
-
-            PMMap.position(mappedByteBuffer, 0);
-            ByteSequenceStorage s = readNode.execute(mappedByteBuffer, len);
-            return s.getInternalByteArray();
-        } catch (IOException e) {
-            // TODO(fa) how to handle?
-            return null;
-        }
-    }
-
-    @TruffleBoundary
-    static long position(SeekableByteChannel ch) throws IOException {
-        return ch.position();
+    byte[] getBufferBytes() {
+        byte[] bytes = new byte[getBufferLength()];
+        channel.get(0, bytes, 0, bytes.length);
+        return bytes;
     }
-
-    @TruffleBoundary
-    static void position(SeekableByteChannel ch, long offset) throws IOException {
-        ch.position(offset);
-    }
-
-    @TruffleBoundary
-    static long size(SeekableByteChannel ch) throws IOException {
-        return ch.size();
-    }
-
 }
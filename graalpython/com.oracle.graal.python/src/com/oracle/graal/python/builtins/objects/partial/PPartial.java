@@ -0,0 +1,117 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.partial;
+
+import java.util.Arrays;
+
+import com.oracle.graal.python.builtins.objects.dict.PDict;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
+import com.oracle.graal.python.builtins.objects.tuple.PTuple;
+import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
+
+/**
+ * A {@code functools.partial} object. The bound positional arguments are kept as a plain array next
+ * to the {@code args} tuple so that calls can pass them on without unpacking the tuple.
+ */
+public final class PPartial extends PythonBuiltinObject {
+
+    private Object function;
+    private PTuple args;
+    private Object[] argsArray;
+    private PDict keywords;
+
+    public PPartial(LazyPythonClass cls, Object function, PTuple args, Object[] argsArray, PDict keywords) {
+        super(cls);
+        this.function = function;
+        this.args = args;
+        this.argsArray = argsArray;
+        this.keywords = keywords;
+    }
+
+    public Object getFunction() {
+        return function;
+    }
+
+    public PTuple getArgs() {
+        return args;
+    }
+
+    public Object[] getArgsArray() {
+        return argsArray;
+    }
+
+    public PDict getKeywords() {
+        return keywords;
+    }
+
+    public void setState(Object newFunction, PTuple newArgs, Object[] newArgsArray, PDict newKeywords) {
+        this.function = newFunction;
+        this.args = newArgs;
+        this.argsArray = newArgsArray;
+        this.keywords = newKeywords;
+    }
+
+    /**
+     * Combines stored and call-site keywords. Keywords in {@code overrides} replace entries of
+     * {@code base} with the same name, so the result is what {@code {**base, **overrides}} would be.
+     */
+    public static PKeyword[] mergeKeywords(PKeyword[] base, PKeyword[] overrides) {
+        if (base.length == 0) {
+            return overrides;
+        } else if (overrides.length == 0) {
+            return base;
+        }
+        PKeyword[] merged = new PKeyword[base.length + overrides.length];
+        int n = 0;
+        outer: for (PKeyword keyword : base) {
+            for (PKeyword override : overrides) {
+                if (keyword.getName().equals(override.getName())) {
+                    continue outer;
+                }
+            }
+            merged[n++] = keyword;
+        }
+        System.arraycopy(overrides, 0, merged, n, overrides.length);
+        n += overrides.length;
+        return n == merged.length ? merged : Arrays.copyOf(merged, n);
+    }
+}
@@ -0,0 +1,233 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.partial;
+
+import static com.oracle.graal.python.nodes.SpecialAttributeNames.__DICT__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__CALL__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__REDUCE__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__SETSTATE__;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeError;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.common.PHashingCollection;
+import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
+import com.oracle.graal.python.builtins.objects.dict.PDict;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
+import com.oracle.graal.python.builtins.objects.object.PythonDataModelLibrary;
+import com.oracle.graal.python.builtins.objects.object.PythonObjectLibrary;
+import com.oracle.graal.python.builtins.objects.tuple.PTuple;
+import com.oracle.graal.python.nodes.argument.keywords.ExecuteKeywordStarargsNode.ExpandKeywordStarargsNode;
+import com.oracle.graal.python.nodes.call.CallNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.runtime.ExecutionContext.IndirectCallContext;
+import com.oracle.graal.python.runtime.PythonContext;
+import com.oracle.graal.python.runtime.exception.PException;
+import com.oracle.truffle.api.CompilerDirectives;
+import com.oracle.truffle.api.dsl.Cached;
+import com.oracle.truffle.api.dsl.Fallback;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+import com.oracle.truffle.api.interop.UnsupportedMessageException;
+import com.oracle.truffle.api.library.CachedLibrary;
+import com.oracle.truffle.api.profiles.ConditionProfile;
+
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PPartial)
+public class PartialBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return PartialBuiltinsFactory.getFactories();
+    }
+
+    @Builtin(name = "func", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class FuncNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object func(PPartial self) {
+            return self.getFunction();
+        }
+    }
+
+    @Builtin(name = "args", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class ArgsNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PTuple args(PPartial self) {
+            return self.getArgs();
+        }
+    }
+
+    @Builtin(name = "keywords", minNumOfPositionalArgs = 1, isGetter = true)
+    @GenerateNodeFactory
+    abstract static class KeywordsNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        PDict keywords(PPartial self) {
+            return self.getKeywords();
+        }
+    }
+
+    @Builtin(name = __CALL__, minNumOfPositionalArgs = 1, takesVarArgs = true, takesVarKeywordArgs = true)
+    @GenerateNodeFactory
+    abstract static class CallPartialNode extends PythonBuiltinNode {
+        @Specialization
+        Object call(VirtualFrame frame, PPartial self, Object[] args, PKeyword[] keywords,
+                        @Cached CallNode callNode,
+                        @Cached ExpandKeywordStarargsNode expandKeywordsNode,
+                        @Cached("createBinaryProfile()") ConditionProfile hasArgsProfile,
+                        @Cached("createBinaryProfile()") ConditionProfile hasKeywordsProfile) {
+            Object[] boundArgs = self.getArgsArray();
+            Object[] callArgs = boundArgs;
+            if (hasArgsProfile.profile(args.length > 0)) {
+                callArgs = new Object[boundArgs.length + args.length];
+                System.arraycopy(boundArgs, 0, callArgs, 0, boundArgs.length);
+                System.arraycopy(args, 0, callArgs, boundArgs.length, args.length);
+            }
+            // the stored keywords are passed on as they are unless the call site adds any
+            PKeyword[] callKeywords = expandKeywordsNode.executeWith(self.getKeywords());
+            if (hasKeywordsProfile.profile(keywords.length > 0)) {
+                callKeywords = PPartial.mergeKeywords(callKeywords, keywords);
+            }
+            return callNode.execute(frame, self.getFunction(), callArgs, callKeywords);
+        }
+    }
+
+    @Builtin(name = __REDUCE__, minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class ReduceNode extends PythonUnaryBuiltinNode {
+        @Specialization(limit = "1")
+        PTuple reduce(PPartial self,
+                        @CachedLibrary("self") PythonObjectLibrary lib) {
+            PDict keywords = self.getKeywords();
+            PHashingCollection dict = lib.getDict(self);
+            Object[] state = new Object[]{self.getFunction(), self.getArgs(), keywords.size() > 0 ? keywords : PNone.NONE, dict != null && dict.size() > 0 ? dict : PNone.NONE};
+            return factory().createTuple(new Object[]{self.getLazyPythonClass(), factory().createTuple(new Object[]{self.getFunction()}), factory().createTuple(state)});
+        }
+    }
+
+    @Builtin(name = __SETSTATE__, minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    abstract static class SetStateNode extends PythonBinaryBuiltinNode {
+        @Specialization(limit = "1")
+        PNone setState(VirtualFrame frame, PPartial self, PTuple state,
+                        @Cached SequenceStorageNodes.ToArrayNode toArrayNode,
+                        @CachedLibrary(limit = "3") PythonDataModelLibrary dataModelLibrary,
+                        @CachedLibrary("self") PythonObjectLibrary lib) {
+            Object[] items = toArrayNode.execute(state.getSequenceStorage());
+            if (items.length != 4 || !(items[1] instanceof PTuple) || !(items[2] instanceof PDict || items[2] == PNone.NONE) || !(items[3] instanceof PDict || items[3] == PNone.NONE)) {
+                throw raise(TypeError, "invalid partial state");
+            }
+            Object function = items[0];
+            PythonContext context = getContextRef().get();
+            PException caughtException = IndirectCallContext.enter(frame, context, this);
+            try {
+                if (!dataModelLibrary.isCallable(function)) {
+                    throw raise(TypeError, "invalid partial state");
+                }
+            } finally {
+                IndirectCallContext.exit(frame, context, caughtException);
+            }
+            PTuple args = (PTuple) items[1];
+            Object[] argsArray = toArrayNode.execute(args.getSequenceStorage());
+            if (args.getLazyPythonClass() != PythonBuiltinClassType.PTuple) {
+                args = factory().createTuple(argsArray);
+            }
+            PDict keywords = items[2] == PNone.NONE ? factory().createDict() : (PDict) items[2];
+            self.setState(function, args, argsArray, keywords);
+            if (items[3] instanceof PDict) {
+                try {
+                    lib.setDict(self, (PDict) items[3]);
+                } catch (UnsupportedMessageException e) {
+                    CompilerDirectives.transferToInterpreter();
+                    throw new IllegalStateException(e);
+                }
+            }
+            return PNone.NONE;
+        }
+
+        @Fallback
+        Object setState(@SuppressWarnings("unused") Object self, @SuppressWarnings("unused") Object state) {
+            throw raise(TypeError, "argument to __setstate__ must be a tuple");
+        }
+    }
+
+    @Builtin(name = __DICT__, minNumOfPositionalArgs = 1, maxNumOfPositionalArgs = 2, isGetter = true, isSetter = true)
+    @GenerateNodeFactory
+    abstract static class DictNode extends PythonBinaryBuiltinNode {
+        @Specialization(limit = "1")
+        PNone dict(PPartial self, PDict mapping,
+                        @CachedLibrary("self") PythonObjectLibrary lib) {
+            try {
+                lib.setDict(self, mapping);
+            } catch (UnsupportedMessageException e) {
+                CompilerDirectives.transferToInterpreter();
+                throw new IllegalStateException(e);
+            }
+            return PNone.NONE;
+        }
+
+        @Specialization(guards = "isNoValue(mapping)", limit = "1")
+        Object dict(PPartial self, @SuppressWarnings("unused") PNone mapping,
+                        @CachedLibrary("self") PythonObjectLibrary lib) {
+            PHashingCollection dict = lib.getDict(self);
+            if (dict == null) {
+                dict = factory().createDictFixedStorage(self);
+                try {
+                    lib.setDict(self, dict);
+                } catch (UnsupportedMessageException e) {
+                    CompilerDirectives.transferToInterpreter();
+                    throw new IllegalStateException(e);
+                }
+            }
+            return dict;
+        }
+    }
+}
@@ -0,0 +1,200 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.builtins.objects.queue;
+
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.KeyboardInterrupt;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.QueueEmpty;
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
+
+import java.util.List;
+
+import com.oracle.graal.python.builtins.Builtin;
+import com.oracle.graal.python.builtins.CoreFunctions;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.nodes.expression.CastToBooleanNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
+import com.oracle.graal.python.nodes.util.CastToDoubleNode;
+import com.oracle.truffle.api.CompilerDirectives;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+import com.oracle.truffle.api.dsl.GenerateNodeFactory;
+import com.oracle.truffle.api.dsl.NodeFactory;
+import com.oracle.truffle.api.dsl.Specialization;
+import com.oracle.truffle.api.frame.VirtualFrame;
+import com.oracle.truffle.api.profiles.ConditionProfile;
+
+@CoreFunctions(extendClasses = PythonBuiltinClassType.PSimpleQueue)
+public class SimpleQueueBuiltins extends PythonBuiltins {
+
+    @Override
+    protected List<? extends NodeFactory<? extends PythonBuiltinBaseNode>> getNodeFactories() {
+        return SimpleQueueBuiltinsFactory.getFactories();
+    }
+
+    // SimpleQueue.put(item, block=True, timeout=None)
+    @Builtin(name = "put", minNumOfPositionalArgs = 2, parameterNames = {"self", "item", "block", "timeout"})
+    @GenerateNodeFactory
+    abstract static class PutNode extends PythonBuiltinNode {
+        @Specialization
+        PNone put(PSimpleQueue self, Object item, @SuppressWarnings("unused") Object block, @SuppressWarnings("unused") Object timeout) {
+            // the queue is unbounded, so 'block' and 'timeout' are ignored
+            self.put(item);
+            return PNone.NONE;
+        }
+    }
+
+    // SimpleQueue.put_nowait(item)
+    @Builtin(name = "put_nowait", minNumOfPositionalArgs = 2, parameterNames = {"self", "item"})
+    @GenerateNodeFactory
+    abstract static class PutNoWaitNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        PNone putNoWait(PSimpleQueue self, Object item) {
+            self.put(item);
+            return PNone.NONE;
+        }
+    }
+
+    // SimpleQueue.get(block=True, timeout=None)
+    @Builtin(name = "get", minNumOfPositionalArgs = 1, parameterNames = {"self", "block", "timeout"})
+    @GenerateNodeFactory
+    abstract static class GetNode extends PythonTernaryBuiltinNode {
+        @Child private CastToBooleanNode castToBooleanNode;
+        @Child private CastToDoubleNode castToDoubleNode;
+
+        private static final long NO_TIMEOUT = -1;
+
+        private final ConditionProfile fastPathProfile = ConditionProfile.createBinaryProfile();
+
+        @Specialization
+        Object get(VirtualFrame frame, PSimpleQueue self, Object block, Object timeout) {
+            boolean isBlocking = block == PNone.NO_VALUE || getCastToBooleanNode().executeBoolean(frame, block);
+            long timeoutNanos = NO_TIMEOUT;
+            if (isBlocking && !(timeout instanceof PNone)) {
+                double timeoutSeconds = getCastToDoubleNode().execute(frame, timeout);
+                if (timeoutSeconds < 0) {
+                    throw raise(ValueError, "'timeout' must be a non-negative number");
+                }
+                timeoutNanos = (long) Math.min(timeoutSeconds * 1e9, Long.MAX_VALUE);
+            }
+            // an available item is returned without waiting
+            Object item = self.poll();
+            if (fastPathProfile.profile(item == null)) {
+                if (!isBlocking) {
+                    throw raise(QueueEmpty);
+                }
+                try {
+                    if (timeoutNanos == NO_TIMEOUT) {
+                        item = self.take();
+                    } else {
+                        item = self.poll(timeoutNanos);
+                    }
+                } catch (InterruptedException e) {
+                    interrupt();
+                    throw raise(KeyboardInterrupt);
+                }
+                if (item == null) {
+                    throw raise(QueueEmpty);
+                }
+            }
+            return item;
+        }
+
+        @TruffleBoundary
+        private static void interrupt() {
+            Thread.currentThread().interrupt();
+        }
+
+        private CastToBooleanNode getCastToBooleanNode() {
+            if (castToBooleanNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToBooleanNode = insert(CastToBooleanNode.createIfTrueNode());
+            }
+            return castToBooleanNode;
+        }
+
+        private CastToDoubleNode getCastToDoubleNode() {
+            if (castToDoubleNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToDoubleNode = insert(CastToDoubleNode.create());
+            }
+            return castToDoubleNode;
+        }
+    }
+
+    // SimpleQueue.get_nowait()
+    @Builtin(name = "get_nowait", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class GetNoWaitNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        Object getNoWait(PSimpleQueue self) {
+            Object item = self.poll();
+            if (item == null) {
+                throw raise(QueueEmpty);
+            }
+            return item;
+        }
+    }
+
+    // SimpleQueue.empty()
+    @Builtin(name = "empty", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class EmptyNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        boolean empty(PSimpleQueue self) {
+            return self.isEmpty();
+        }
+    }
+
+    // SimpleQueue.qsize()
+    @Builtin(name = "qsize", minNumOfPositionalArgs = 1)
+    @GenerateNodeFactory
+    abstract static class QSizeNode extends PythonUnaryBuiltinNode {
+        @Specialization
+        int qsize(PSimpleQueue self) {
+            return self.size();
+        }
+    }
+}
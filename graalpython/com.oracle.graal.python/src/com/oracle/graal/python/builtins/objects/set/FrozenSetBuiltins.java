@@ -75,6 +75,7 @@ import com.oracle.graal.python.runtime.ExecutionContext.IndirectCallContext;
 import com.oracle.graal.python.runtime.PythonContext;
 import com.oracle.graal.python.runtime.exception.PException;
 import com.oracle.graal.python.runtime.exception.PythonErrorType;
+import com.oracle.graal.python.runtime.object.PythonObjectFactory;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.CompilationFinal;
 import com.oracle.truffle.api.dsl.Cached;
@@ -387,6 +388,59 @@ public final class FrozenSetBuiltins extends PythonBuiltins {
         }
     }
 
+    @Builtin(name = "intersection", minNumOfPositionalArgs = 1, takesVarArgs = true)
+    @GenerateNodeFactory
+    abstract static class IntersectionNode extends PythonBuiltinNode {
+
+        @Specialization
+        PBaseSet intersection(VirtualFrame frame, PBaseSet self, Object[] args,
+                        @Cached("create()") SetNodes.GetSetStorageNode getSetStorageNode,
+                        @Cached("create()") HashingStorageNodes.IntersectNode intersectNode,
+                        @Cached("create()") HashingStorageNodes.CopyNode copyNode,
+                        @Cached("createClassProfile()") ValueProfile setTypeProfile) {
+            HashingStorage result;
+            if (args.length == 0) {
+                result = copyNode.execute(frame, self.getDictStorage());
+            } else {
+                result = self.getDictStorage();
+                for (int i = 0; i < args.length; i++) {
+                    result = intersectNode.execute(frame, result, getSetStorageNode.execute(frame, args[i]));
+                }
+            }
+            return createSetLike(factory(), setTypeProfile.profile(self), result);
+        }
+    }
+
+    @Builtin(name = "difference", minNumOfPositionalArgs = 1, takesVarArgs = true)
+    @GenerateNodeFactory
+    abstract static class DifferenceNode extends PythonBuiltinNode {
+
+        @Specialization
+        PBaseSet difference(VirtualFrame frame, PBaseSet self, Object[] args,
+                        @Cached("create()") SetNodes.GetSetStorageNode getSetStorageNode,
+                        @Cached("create()") HashingStorageNodes.DiffNode diffNode,
+                        @Cached("create()") HashingStorageNodes.CopyNode copyNode,
+                        @Cached("createClassProfile()") ValueProfile setTypeProfile) {
+            HashingStorage result;
+            if (args.length == 0) {
+                result = copyNode.execute(frame, self.getDictStorage());
+            } else {
+                result = self.getDictStorage();
+                for (int i = 0; i < args.length; i++) {
+                    result = diffNode.execute(frame, result, getSetStorageNode.execute(frame, args[i]));
+                }
+            }
+            return createSetLike(factory(), setTypeProfile.profile(self), result);
+        }
+    }
+
+    private static PBaseSet createSetLike(PythonObjectFactory factory, PBaseSet self, HashingStorage storage) {
+        if (self instanceof PFrozenSet) {
+            return factory.createFrozenSet(storage);
+        }
+        return factory.createSet(storage);
+    }
+
     abstract static class BinaryUnionNode extends PNodeWithContext {
         @Child private Equivalence equivalenceNode;
 
@@ -36,10 +36,13 @@ import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
 import com.oracle.graal.python.builtins.objects.PNone;
+import com.oracle.graal.python.builtins.objects.common.EconomicMapStorage;
 import com.oracle.graal.python.builtins.objects.common.HashingCollectionNodes;
+import com.oracle.graal.python.builtins.objects.common.HashingStorage;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodes;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallBinaryNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
+import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.runtime.PythonCore;
@@ -49,6 +52,7 @@ import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
 import com.oracle.truffle.api.dsl.Specialization;
 import com.oracle.truffle.api.frame.VirtualFrame;
+import com.oracle.truffle.api.profiles.ConditionProfile;
 import com.oracle.truffle.api.profiles.ValueProfile;
 
 @CoreFunctions(extendClasses = PythonBuiltinClassType.PSet)
@@ -105,6 +109,63 @@ public final class SetBuiltins extends PythonBuiltins {
         }
     }
 
+    @Builtin(name = "update", minNumOfPositionalArgs = 1, takesVarArgs = true)
+    @GenerateNodeFactory
+    abstract static class UpdateNode extends PythonBuiltinNode {
+
+        @Specialization
+        PNone update(VirtualFrame frame, PSet self, Object[] args,
+                        @Cached("create()") FrozenSetBuiltins.BinaryUnionNode binaryUnionNode) {
+            for (int i = 0; i < args.length; i++) {
+                binaryUnionNode.execute(frame, self, self.getDictStorage(), args[i]);
+            }
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "intersection_update", minNumOfPositionalArgs = 1, takesVarArgs = true)
+    @GenerateNodeFactory
+    abstract static class IntersectionUpdateNode extends PythonBuiltinNode {
+
+        @Specialization
+        PNone intersectionUpdate(VirtualFrame frame, PSet self, Object[] args,
+                        @Cached("create()") SetNodes.GetSetStorageNode getSetStorageNode,
+                        @Cached("create()") HashingStorageNodes.IntersectNode intersectNode) {
+            for (int i = 0; i < args.length; i++) {
+                self.setDictStorage(intersectNode.execute(frame, self.getDictStorage(), getSetStorageNode.execute(frame, args[i])));
+            }
+            return PNone.NONE;
+        }
+    }
+
+    @Builtin(name = "difference_update", minNumOfPositionalArgs = 1, takesVarArgs = true)
+    @GenerateNodeFactory
+    abstract static class DifferenceUpdateNode extends PythonBuiltinNode {
+
+        @Specialization
+        PNone differenceUpdate(VirtualFrame frame, PSet self, Object[] args,
+                        @Cached("create()") SetNodes.GetSetStorageNode getSetStorageNode,
+                        @Cached("create()") HashingStorageNodes.DiffNode diffNode,
+                        @Cached("create()") HashingStorageNodes.DelItemNode delItemNode,
+                        @Cached("createBinaryProfile()") ConditionProfile removeInPlaceProfile) {
+            for (int i = 0; i < args.length; i++) {
+                HashingStorage selfStorage = self.getDictStorage();
+                HashingStorage otherStorage = getSetStorageNode.execute(frame, args[i]);
+                if (otherStorage == selfStorage) {
+                    self.setDictStorage(EconomicMapStorage.create(false));
+                } else if (removeInPlaceProfile.profile(otherStorage.length() < selfStorage.length())) {
+                    // the other side is smaller, so remove its keys instead of rebuilding this set
+                    for (Object key : otherStorage.keys()) {
+                        delItemNode.execute(frame, self, self.getDictStorage(), key);
+                    }
+                } else {
+                    self.setDictStorage(diffNode.execute(frame, selfStorage, otherStorage));
+                }
+            }
+            return PNone.NONE;
+        }
+    }
+
     @Builtin(name = "remove", minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
     abstract static class RemoveNode extends PythonBinaryBuiltinNode {
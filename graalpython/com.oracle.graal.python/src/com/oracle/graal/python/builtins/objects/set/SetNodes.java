@@ -45,6 +45,7 @@ import static com.oracle.graal.python.runtime.exception.PythonErrorType.TypeErro
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.common.HashingCollectionNodes.SetItemNode;
+import com.oracle.graal.python.builtins.objects.common.HashingStorage;
 import com.oracle.graal.python.builtins.objects.str.PString;
 import com.oracle.graal.python.builtins.objects.type.LazyPythonClass;
 import com.oracle.graal.python.nodes.PGuards;
@@ -136,4 +137,29 @@ public abstract class SetNodes {
             return SetNodesFactory.ConstructSetNodeGen.create();
         }
     }
+
+    /**
+     * Provides the hashing storage of a set operand. Sets are used as they are, any other iterable
+     * is hashed into a new storage exactly once.
+     */
+    @ImportStatic(PGuards.class)
+    public abstract static class GetSetStorageNode extends PNodeWithContext {
+
+        public abstract HashingStorage execute(VirtualFrame frame, Object iterable);
+
+        @Specialization
+        static HashingStorage doSet(PBaseSet set) {
+            return set.getDictStorage();
+        }
+
+        @Specialization(guards = "!isAnySet(iterable)")
+        static HashingStorage doIterable(VirtualFrame frame, Object iterable,
+                        @Cached("create()") ConstructSetNode constructSetNode) {
+            return constructSetNode.executeWith(frame, iterable).getDictStorage();
+        }
+
+        public static GetSetStorageNode create() {
+            return SetNodesFactory.GetSetStorageNodeGen.create();
+        }
+    }
 }
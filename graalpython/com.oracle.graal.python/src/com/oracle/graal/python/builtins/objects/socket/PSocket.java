@@ -42,10 +42,17 @@ package com.oracle.graal.python.builtins.objects.socket;
 
 import java.io.IOException;
 import java.net.InetSocketAddress;
+import java.net.SocketAddress;
+import java.nio.ByteBuffer;
 import java.nio.channels.Channel;
+import java.nio.channels.DatagramChannel;
+import java.nio.channels.SelectionKey;
+import java.nio.channels.Selector;
 import java.nio.channels.ServerSocketChannel;
 import java.nio.channels.SocketChannel;
+import java.util.Arrays;
 import java.util.HashMap;
+import java.util.concurrent.atomic.AtomicReference;
 
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.object.PythonBuiltinObject;
@@ -59,8 +66,8 @@ public class PSocket extends PythonBuiltinObject implements Channel {
     public static final int AF_INET = 2;
     public static final int AF_INET6 = 23;
 
-    public static final int SOCK_DGRAM = 1;
-    public static final int SOCK_STREAM = 2;
+    public static final int SOCK_STREAM = 1;
+    public static final int SOCK_DGRAM = 2;
 
     public static final int AI_PASSIVE = 1;
     public static final int AI_CANONNAME = 2;
@@ -83,6 +90,14 @@ public class PSocket extends PythonBuiltinObject implements Channel {
 
     public static final int IPPROTO_TCP = 6;
 
+    public static final int MSG_PEEK = 2;
+
+    /** The largest datagram payload that can be received. */
+    public static final int MAX_DATAGRAM_SIZE = 65535;
+
+    private static final int DEFAULT_RECV_BUFFER = 8192;
+    private static final int MAX_CACHED_RECV_BUFFER = 65536;
+
     @CompilationFinal private static InetSocketAddress EPHEMERAL_ADDRESS;
 
     private static InetSocketAddress getEphemeralAddress() {
@@ -102,17 +117,36 @@ public class PSocket extends PythonBuiltinObject implements Channel {
     public int serverPort;
     public String serverHost;
 
-    private double timeout;
+    /** The timeout in seconds, negative values mean no timeout. */
+    private double timeout = -1.0;
 
     private InetSocketAddress address = getEphemeralAddress();
 
     private SocketChannel socket;
 
     private ServerSocketChannel serverSocket;
+
+    /**
+     * The channel of a {@link #SOCK_DGRAM} socket. It is always in non-blocking mode, blocking
+     * operations wait on {@link #datagramSelector} instead so that the socket timeout is honoured.
+     */
+    private DatagramChannel datagramSocket;
+    private Selector datagramSelector;
+
     private boolean blocking;
 
     private HashMap<Object, Object> options;
 
+    /** The receive buffer that is not in use right now, see {@link #acquireRecvBuffer}. */
+    private final AtomicReference<ByteBuffer> recvBuffer = new AtomicReference<>();
+
+    /**
+     * Data that was received with {@link #MSG_PEEK} and is returned again by the next receive. For
+     * a datagram socket it is one whole datagram sent by {@link #peekedSender}.
+     */
+    private byte[] peeked;
+    private SocketAddress peekedSender;
+
     public PSocket(LazyPythonClass cls, int family, int type, int proto) {
         super(cls);
         this.family = family;
@@ -176,6 +210,57 @@ public class PSocket extends PythonBuiltinObject implements Channel {
         this.serverSocket = serverSocket;
     }
 
+    public boolean isDatagram() {
+        return type == SOCK_DGRAM;
+    }
+
+    public DatagramChannel getDatagramSocket() {
+        return datagramSocket;
+    }
+
+    public void setDatagramSocket(DatagramChannel datagramSocket) {
+        this.datagramSocket = datagramSocket;
+    }
+
+    /**
+     * Waits until the datagram channel is ready for the given {@link SelectionKey} operation.
+     * Returns {@code false} if the socket timeout expired first. Non-blocking sockets do not wait,
+     * the following channel operation reports whether it would have blocked.
+     */
+    @TruffleBoundary
+    public boolean awaitDatagram(int op) throws IOException {
+        if (timeout == 0) {
+            return true;
+        }
+        if (datagramSelector == null) {
+            datagramSelector = Selector.open();
+            datagramSocket.register(datagramSelector, op);
+        } else {
+            datagramSocket.keyFor(datagramSelector).interestOps(op);
+        }
+        try {
+            if (timeout < 0) {
+                while (datagramSelector.select() == 0) {
+                    if (Thread.currentThread().isInterrupted()) {
+                        return false;
+                    }
+                }
+                return true;
+            }
+            long deadline = System.nanoTime() + (long) (timeout * 1000000000L);
+            long remaining = Math.max((long) (timeout * 1000), 1);
+            while (datagramSelector.select(remaining) == 0) {
+                remaining = (deadline - System.nanoTime()) / 1000000L;
+                if (remaining <= 0) {
+                    return false;
+                }
+            }
+            return true;
+        } finally {
+            datagramSelector.selectedKeys().clear();
+        }
+    }
+
     public void setSocket(SocketChannel socket) {
         if (this.getServerSocket() != null) {
             throw new Error();
@@ -183,6 +268,81 @@ public class PSocket extends PythonBuiltinObject implements Channel {
         this.socket = socket;
     }
 
+    /**
+     * Returns a cleared buffer with room for exactly {@code size} bytes. The caller owns it until
+     * it hands it back with {@link #releaseRecvBuffer}, so the data must be copied out before.
+     * Buffers of up to {@link #MAX_CACHED_RECV_BUFFER} bytes are reused by subsequent calls, a
+     * receive running concurrently in another thread gets a buffer of its own.
+     */
+    @TruffleBoundary
+    public ByteBuffer acquireRecvBuffer(int size) {
+        if (size > MAX_CACHED_RECV_BUFFER) {
+            return ByteBuffer.allocate(size);
+        }
+        ByteBuffer buffer = recvBuffer.getAndSet(null);
+        if (buffer == null || buffer.capacity() < size) {
+            buffer = ByteBuffer.allocate(Math.max(size, DEFAULT_RECV_BUFFER));
+        }
+        buffer.clear();
+        buffer.limit(size);
+        return buffer;
+    }
+
+    @TruffleBoundary
+    public void releaseRecvBuffer(ByteBuffer buffer) {
+        if (buffer.capacity() <= MAX_CACHED_RECV_BUFFER) {
+            recvBuffer.set(buffer);
+        }
+    }
+
+    @TruffleBoundary
+    public synchronized boolean hasPeeked() {
+        return peeked != null;
+    }
+
+    @TruffleBoundary
+    public synchronized void setPeeked(byte[] data, SocketAddress sender) {
+        this.peeked = data;
+        this.peekedSender = sender;
+    }
+
+    /**
+     * Copies previously peeked stream data into {@code target} and returns the number of bytes
+     * copied, or {@code -1} if there is none. Unless {@code keep} is set, the copied bytes are
+     * consumed.
+     */
+    @TruffleBoundary
+    public synchronized int takePeeked(ByteBuffer target, boolean keep) {
+        if (peeked == null) {
+            return -1;
+        }
+        int n = Math.min(peeked.length, target.remaining());
+        target.put(peeked, 0, n);
+        if (!keep) {
+            peeked = n == peeked.length ? null : Arrays.copyOfRange(peeked, n, peeked.length);
+        }
+        return n;
+    }
+
+    /**
+     * Copies a previously peeked datagram into {@code target} and returns its sender, or
+     * {@code null} if there is none. Unless {@code keep} is set, the datagram is consumed, and like
+     * with recvfrom(2), the part that did not fit is lost.
+     */
+    @TruffleBoundary
+    public synchronized SocketAddress takePeekedDatagram(ByteBuffer target, boolean keep) {
+        if (peeked == null) {
+            return null;
+        }
+        SocketAddress sender = peekedSender;
+        target.put(peeked, 0, Math.min(peeked.length, target.remaining()));
+        if (!keep) {
+            peeked = null;
+            peekedSender = null;
+        }
+        return sender;
+    }
+
     public boolean isBlocking() {
         return blocking;
     }
@@ -193,7 +353,8 @@ public class PSocket extends PythonBuiltinObject implements Channel {
 
     @TruffleBoundary
     public boolean isOpen() {
-        return (getSocket() != null && getSocket().isOpen()) || (getServerSocket() != null && getServerSocket().isOpen());
+        return (getSocket() != null && getSocket().isOpen()) || (getServerSocket() != null && getServerSocket().isOpen()) ||
+                        (getDatagramSocket() != null && getDatagramSocket().isOpen());
     }
 
     @TruffleBoundary
@@ -202,7 +363,17 @@ public class PSocket extends PythonBuiltinObject implements Channel {
             getSocket().close();
         } else if (getServerSocket() != null) {
             getServerSocket().close();
+        } else if (getDatagramSocket() != null) {
+            closeDatagram();
+        }
+    }
+
+    @TruffleBoundary
+    public void closeDatagram() throws IOException {
+        if (datagramSelector != null) {
+            datagramSelector.close();
         }
+        getDatagramSocket().close();
     }
 
     @TruffleBoundary
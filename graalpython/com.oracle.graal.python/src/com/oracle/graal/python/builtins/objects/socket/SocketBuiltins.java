@@ -41,12 +41,18 @@
 package com.oracle.graal.python.builtins.objects.socket;
 
 import java.io.IOException;
+import java.net.Inet6Address;
 import java.net.InetAddress;
 import java.net.InetSocketAddress;
+import java.net.PortUnreachableException;
 import java.net.SocketAddress;
 import java.net.SocketException;
+import java.net.SocketTimeoutException;
+import java.net.UnknownHostException;
 import java.nio.ByteBuffer;
+import java.nio.channels.DatagramChannel;
 import java.nio.channels.NotYetConnectedException;
+import java.nio.channels.SelectionKey;
 import java.nio.channels.ServerSocketChannel;
 import java.nio.channels.SocketChannel;
 import java.util.Arrays;
@@ -61,27 +67,38 @@ import com.oracle.graal.python.builtins.objects.PNotImplemented;
 import com.oracle.graal.python.builtins.objects.bytes.PByteArray;
 import com.oracle.graal.python.builtins.objects.bytes.PBytes;
 import com.oracle.graal.python.builtins.objects.bytes.PIBytesLike;
+import com.oracle.graal.python.builtins.objects.bytes.PythonBufferLibrary;
 import com.oracle.graal.python.builtins.objects.common.SequenceNodes.GetObjectArrayNode;
+import com.oracle.graal.python.builtins.objects.common.SequenceNodesFactory.GetObjectArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.common.SequenceStorageNodes;
 import com.oracle.graal.python.builtins.objects.exception.OSErrorEnum;
 import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.builtins.objects.tuple.PTuple;
+import com.oracle.graal.python.nodes.PGuards;
+import com.oracle.graal.python.nodes.SpecialMethodNames;
+import com.oracle.graal.python.nodes.attributes.GetAttributeNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallTernaryNode;
 import com.oracle.graal.python.nodes.call.special.LookupAndCallUnaryNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinBaseNode;
 import com.oracle.graal.python.nodes.function.PythonBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonBinaryBuiltinNode;
+import com.oracle.graal.python.nodes.function.builtins.PythonQuaternaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonTernaryBuiltinNode;
 import com.oracle.graal.python.nodes.function.builtins.PythonUnaryBuiltinNode;
 import com.oracle.graal.python.nodes.util.CastToIndexNode;
+import com.oracle.graal.python.nodes.util.CastToJavaIntNode;
+import com.oracle.graal.python.runtime.PosixResources;
 import com.oracle.graal.python.runtime.sequence.storage.ByteSequenceStorage;
 import com.oracle.graal.python.runtime.sequence.storage.SequenceStorage;
+import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
 import com.oracle.truffle.api.dsl.Cached;
 import com.oracle.truffle.api.dsl.GenerateNodeFactory;
 import com.oracle.truffle.api.dsl.NodeFactory;
 import com.oracle.truffle.api.dsl.Specialization;
 import com.oracle.truffle.api.frame.VirtualFrame;
+import com.oracle.truffle.api.interop.UnsupportedMessageException;
+import com.oracle.truffle.api.library.CachedLibrary;
 import com.oracle.truffle.api.profiles.ConditionProfile;
 
 @CoreFunctions(extendClasses = PythonBuiltinClassType.PSocket)
@@ -93,6 +110,151 @@ public class SocketBuiltins extends PythonBuiltins {
         return SocketBuiltinsFactory.getFactories();
     }
 
+    /**
+     * Converts the items of a Python {@code (host, port)} address tuple to a resolved socket
+     * address.
+     */
+    @TruffleBoundary
+    static InetSocketAddress toSocketAddress(PythonBuiltinBaseNode node, Object[] hostAndPort) {
+        if (hostAndPort.length < 2 || !(hostAndPort[0] instanceof String) || !(hostAndPort[1] instanceof Integer)) {
+            throw node.raise(PythonBuiltinClassType.TypeError, "getsockaddrarg: address must be a pair (host, port)");
+        }
+        String host = (String) hostAndPort[0];
+        int port = (int) hostAndPort[1];
+        if (port < 0 || port >= 65536) {
+            throw node.raise(PythonBuiltinClassType.OverflowError, "getsockaddrarg: port must be 0-65535.");
+        }
+        if (host.isEmpty()) {
+            return new InetSocketAddress(port);
+        } else if (host.equals("<broadcast>")) {
+            host = "255.255.255.255";
+        }
+        try {
+            return new InetSocketAddress(InetAddress.getByName(host), port);
+        } catch (UnknownHostException e) {
+            throw node.raise(PythonBuiltinClassType.OSError, "[Errno -2] Name or service not known");
+        }
+    }
+
+    /**
+     * Converts a socket address to the items of the corresponding Python address tuple.
+     */
+    @TruffleBoundary
+    static Object[] fromSocketAddress(SocketAddress address) {
+        InetSocketAddress inetAddress = (InetSocketAddress) address;
+        InetAddress host = inetAddress.getAddress();
+        if (host instanceof Inet6Address) {
+            return new Object[]{host.getHostAddress(), inetAddress.getPort(), 0, ((Inet6Address) host).getScopeId()};
+        }
+        return new Object[]{host.getHostAddress(), inetAddress.getPort()};
+    }
+
+    /**
+     * Receives one datagram into {@code buffer} and returns the address of its sender. Like
+     * recvfrom(2), a datagram that does not fit is truncated.
+     */
+    static SocketAddress receiveDatagram(PythonBuiltinBaseNode node, VirtualFrame frame, PSocket socket, ByteBuffer buffer, boolean peek) {
+        SocketAddress sender;
+        try {
+            sender = doReceiveDatagram(socket, buffer, peek);
+        } catch (SocketTimeoutException e) {
+            throw node.raise(PythonBuiltinClassType.SocketTimeout, "timed out");
+        } catch (PortUnreachableException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.ECONNREFUSED, e);
+        } catch (IOException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.EBADF, e);
+        }
+        if (sender == null) {
+            throw node.raiseOSError(frame, OSErrorEnum.EAGAIN);
+        }
+        return sender;
+    }
+
+    @TruffleBoundary
+    private static SocketAddress doReceiveDatagram(PSocket socket, ByteBuffer buffer, boolean peek) throws IOException {
+        SocketAddress sender = socket.takePeekedDatagram(buffer, peek);
+        if (sender != null) {
+            return sender;
+        }
+        if (!socket.awaitDatagram(SelectionKey.OP_READ)) {
+            throw new SocketTimeoutException();
+        }
+        if (!peek) {
+            return socket.getDatagramSocket().receive(buffer);
+        }
+        // keep the whole datagram, the next receive may ask for more than this one
+        ByteBuffer datagram = ByteBuffer.allocate(PSocket.MAX_DATAGRAM_SIZE);
+        sender = socket.getDatagramSocket().receive(datagram);
+        if (sender != null) {
+            socket.setPeeked(Arrays.copyOf(datagram.array(), datagram.position()), sender);
+            socket.takePeekedDatagram(buffer, true);
+        }
+        return sender;
+    }
+
+    /**
+     * Sends {@code data} as one datagram to {@code target}, or to the connected peer if
+     * {@code target} is {@code null}, and returns the number of bytes sent.
+     */
+    static int sendDatagram(PythonBuiltinBaseNode node, VirtualFrame frame, PSocket socket, byte[] data, SocketAddress target) {
+        if (target == null && !isConnected(socket.getDatagramSocket())) {
+            throw node.raiseOSError(frame, OSErrorEnum.EDESTADDRREQ);
+        }
+        int sent;
+        try {
+            sent = doSendDatagram(socket, data, target);
+        } catch (SocketTimeoutException e) {
+            throw node.raise(PythonBuiltinClassType.SocketTimeout, "timed out");
+        } catch (PortUnreachableException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.ECONNREFUSED, e);
+        } catch (IOException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.EBADF, e);
+        }
+        if (sent == 0 && data.length > 0) {
+            throw node.raiseOSError(frame, OSErrorEnum.EAGAIN);
+        }
+        return sent;
+    }
+
+    @TruffleBoundary
+    private static int doSendDatagram(PSocket socket, byte[] data, SocketAddress target) throws IOException {
+        if (!socket.awaitDatagram(SelectionKey.OP_WRITE)) {
+            throw new SocketTimeoutException();
+        }
+        DatagramChannel channel = socket.getDatagramSocket();
+        ByteBuffer buffer = ByteBuffer.wrap(data);
+        return target == null ? channel.write(buffer) : channel.send(buffer, target);
+    }
+
+    @TruffleBoundary
+    private static boolean isConnected(DatagramChannel channel) {
+        return channel.isConnected();
+    }
+
+    /**
+     * Converts the optional {@code flags} argument of the send and receive methods. Only the flags
+     * in {@code supported} can be emulated on Java channels, any other flag is rejected.
+     */
+    static int getFlags(PythonBuiltinBaseNode node, VirtualFrame frame, Object flags, int supported, CastToJavaIntNode castToInt) {
+        if (PGuards.isNoValue(flags)) {
+            return 0;
+        }
+        int value = castToInt.execute(flags);
+        if ((value & ~supported) != 0) {
+            throw node.raiseOSError(frame, OSErrorEnum.EOPNOTSUPP);
+        }
+        return value;
+    }
+
+    static boolean isPeek(int flags) {
+        return (flags & PSocket.MSG_PEEK) != 0;
+    }
+
+    @TruffleBoundary
+    static int position(ByteBuffer buffer) {
+        return buffer.position();
+    }
+
     // accept()
     @Builtin(name = "_accept", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
@@ -126,10 +288,20 @@ public class SocketBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     abstract static class BindNode extends PythonBinaryBuiltinNode {
         @Specialization
-        Object bind(PSocket socket, PTuple address,
+        Object bind(VirtualFrame frame, PSocket socket, PTuple address,
                         @Cached GetObjectArrayNode getObjectArrayNode) {
             Object[] hostAndPort = getObjectArrayNode.execute(address);
 
+            if (socket.isDatagram()) {
+                InetSocketAddress socketAddress = toSocketAddress(this, hostAndPort);
+                try {
+                    bindDatagram(socket, socketAddress);
+                } catch (IOException e) {
+                    throw raiseOSError(frame, OSErrorEnum.EADDRINUSE, e);
+                }
+                return PNone.NONE;
+            }
+
             int port = (int) hostAndPort[1];
 
             if (port >= 65536 || port < 0) {
@@ -140,6 +312,11 @@ public class SocketBuiltins extends PythonBuiltins {
             socket.serverPort = port;
             return PNone.NONE;
         }
+
+        @TruffleBoundary
+        private static void bindDatagram(PSocket socket, InetSocketAddress address) throws IOException {
+            socket.getDatagramSocket().bind(address);
+        }
     }
 
     // close()
@@ -169,6 +346,16 @@ public class SocketBuiltins extends PythonBuiltins {
                 } catch (IOException e) {
                     throw raise(PythonBuiltinClassType.OSError, "Bad file descriptor");
                 }
+            } else if (socket.getDatagramSocket() != null) {
+                if (!socket.getDatagramSocket().isOpen()) {
+                    throw raise(PythonBuiltinClassType.OSError, "Bad file descriptor");
+                }
+
+                try {
+                    socket.closeDatagram();
+                } catch (IOException e) {
+                    throw raise(PythonBuiltinClassType.OSError, "Bad file descriptor");
+                }
             }
             getContext().getResources().close(socket.getFileno());
             return PNone.NONE;
@@ -180,9 +367,18 @@ public class SocketBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     abstract static class ConnectNode extends PythonBinaryBuiltinNode {
         @Specialization
-        Object connect(PSocket socket, PTuple address,
+        Object connect(VirtualFrame frame, PSocket socket, PTuple address,
                         @Cached GetObjectArrayNode getObjectArrayNode) {
             Object[] hostAndPort = getObjectArrayNode.execute(address);
+            if (socket.isDatagram()) {
+                InetSocketAddress socketAddress = toSocketAddress(this, hostAndPort);
+                try {
+                    connectDatagram(socket, socketAddress);
+                } catch (IOException e) {
+                    throw raiseOSError(frame, OSErrorEnum.EINVAL, e);
+                }
+                return PNone.NONE;
+            }
             try {
                 doConnect(socket, hostAndPort);
                 return PNone.NONE;
@@ -198,6 +394,15 @@ public class SocketBuiltins extends PythonBuiltins {
             channel.connect(socketAddress);
             socket.setSocket(channel);
         }
+
+        @TruffleBoundary
+        private static void connectDatagram(PSocket socket, InetSocketAddress address) throws IOException {
+            DatagramChannel channel = socket.getDatagramSocket();
+            if (channel.isConnected()) {
+                channel.disconnect();
+            }
+            channel.connect(address);
+        }
     }
 
     // getpeername()
@@ -207,6 +412,16 @@ public class SocketBuiltins extends PythonBuiltins {
         @Specialization
         @TruffleBoundary
         Object get(PSocket socket) {
+            if (socket.getDatagramSocket() != null) {
+                try {
+                    SocketAddress addr = socket.getDatagramSocket().getRemoteAddress();
+                    if (addr != null) {
+                        return factory().createTuple(fromSocketAddress(addr));
+                    }
+                } catch (IOException e) {
+                    throw raise(PythonBuiltinClassType.OSError);
+                }
+            }
             if (socket.getSocket() == null) {
                 throw raise(PythonBuiltinClassType.OSError, "[Errno 57] Socket is not connected");
             }
@@ -245,6 +460,17 @@ public class SocketBuiltins extends PythonBuiltins {
                 }
             }
 
+            if (socket.getDatagramSocket() != null) {
+                try {
+                    SocketAddress addr = socket.getDatagramSocket().getLocalAddress();
+                    if (addr != null) {
+                        return factory().createTuple(fromSocketAddress(addr));
+                    }
+                } catch (IOException e) {
+                    throw raise(PythonBuiltinClassType.OSError);
+                }
+            }
+
             if (socket.serverHost != null) {
                 return factory().createTuple(new Object[]{socket.serverHost, socket.serverPort});
             }
@@ -279,6 +505,9 @@ public class SocketBuiltins extends PythonBuiltins {
 
         @Specialization
         Object get(PSocket socket) {
+            if (socket.isDatagram()) {
+                return socket.getTimeout() < 0 ? PNone.NONE : socket.getTimeout();
+            }
             try {
                 if (socket.getSocket() != null) {
                     return getSoTimeout(socket.getSocket());
@@ -331,22 +560,77 @@ public class SocketBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     abstract static class RecvNode extends PythonTernaryBuiltinNode {
         @Specialization
-        Object recv(PSocket socket, int bufsize, int flags) {
-            return recv(socket, bufsize, PNone.NONE);
+        PBytes recv(VirtualFrame frame, PSocket socket, int bufsize, Object flags,
+                        @Cached CastToJavaIntNode castToInt) {
+            if (bufsize < 0) {
+                throw raise(PythonBuiltinClassType.ValueError, "negative buffersize in recv");
+            }
+            boolean peek = isPeek(getFlags(this, frame, flags, PSocket.MSG_PEEK, castToInt));
+            if (socket.isDatagram()) {
+                ByteBuffer buffer = socket.acquireRecvBuffer(bufsize);
+                try {
+                    receiveDatagram(this, frame, socket, buffer, peek);
+                    return factory().createBytes(copyReceived(buffer));
+                } finally {
+                    socket.releaseRecvBuffer(buffer);
+                }
+            }
+            return factory().createBytes(recvStream(this, frame, socket, bufsize, peek));
         }
+    }
 
-        @Specialization
-        @TruffleBoundary
-        PBytes recv(PSocket socket, int bufsize, PNone flags) {
-            SocketChannel nativeSocket = socket.getSocket();
-            ByteBuffer readBytes = ByteBuffer.allocate(bufsize);
-            try {
-                int length = nativeSocket.read(readBytes);
-                return factory().createBytes(Arrays.copyOfRange(readBytes.array(), 0, length));
-            } catch (IOException | NullPointerException e) {
-                throw raise(PythonBuiltinClassType.OSError);
+    static byte[] recvStream(PythonBuiltinBaseNode node, VirtualFrame frame, PSocket socket, int bufsize, boolean peek) {
+        if (socket.getSocket() == null) {
+            throw node.raiseOSError(frame, OSErrorEnum.ENOTCONN);
+        }
+        try {
+            return doRecvStream(socket, bufsize, peek);
+        } catch (NotYetConnectedException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.ENOTCONN, e);
+        } catch (IOException e) {
+            throw node.raiseOSError(frame, OSErrorEnum.EBADF, e);
+        }
+    }
+
+    @TruffleBoundary
+    private static byte[] doRecvStream(PSocket socket, int bufsize, boolean peek) throws IOException {
+        ByteBuffer buffer = socket.acquireRecvBuffer(bufsize);
+        try {
+            if (readStream(socket, buffer, peek) <= 0) {
+                return new byte[0];
             }
+            return copyReceived(buffer);
+        } finally {
+            socket.releaseRecvBuffer(buffer);
+        }
+    }
+
+    /**
+     * Reads from a connected stream socket into {@code target} and returns the number of bytes
+     * read, or a negative number at the end of the stream. Data read with {@code peek} is kept by
+     * the socket and returned again by the next read.
+     */
+    @TruffleBoundary
+    static int readStream(PSocket socket, ByteBuffer target, boolean peek) throws IOException {
+        int n = socket.takePeeked(target, peek);
+        if (n >= 0) {
+            return n;
         }
+        int start = target.arrayOffset() + target.position();
+        n = socket.getSocket().read(target);
+        if (n > 0 && peek) {
+            socket.setPeeked(Arrays.copyOfRange(target.array(), start, start + n), null);
+        }
+        return n;
+    }
+
+    /**
+     * Copies the received bytes out of a buffer obtained from {@link PSocket#acquireRecvBuffer},
+     * which may be reused by the next receive.
+     */
+    @TruffleBoundary
+    static byte[] copyReceived(ByteBuffer buffer) {
+        return Arrays.copyOf(buffer.array(), buffer.position());
     }
 
     // recvfrom(bufsize[, flags])
@@ -354,90 +638,212 @@ public class SocketBuiltins extends PythonBuiltins {
     @GenerateNodeFactory
     abstract static class RecvFromNode extends PythonTernaryBuiltinNode {
         @Specialization
-        Object recvFrom(PSocket socket, int bufsize, int flags) {
-            return PNotImplemented.NOT_IMPLEMENTED;
+        PTuple recvFrom(VirtualFrame frame, PSocket socket, int bufsize, Object flags,
+                        @Cached CastToJavaIntNode castToInt) {
+            if (bufsize < 0) {
+                throw raise(PythonBuiltinClassType.ValueError, "negative buffersize in recvfrom");
+            }
+            boolean peek = isPeek(getFlags(this, frame, flags, PSocket.MSG_PEEK, castToInt));
+            if (socket.isDatagram()) {
+                ByteBuffer buffer = socket.acquireRecvBuffer(bufsize);
+                try {
+                    SocketAddress sender = receiveDatagram(this, frame, socket, buffer, peek);
+                    return factory().createTuple(new Object[]{factory().createBytes(copyReceived(buffer)), factory().createTuple(fromSocketAddress(sender))});
+                } finally {
+                    socket.releaseRecvBuffer(buffer);
+                }
+            }
+            // like on Linux, a connected stream socket does not report the sender's address
+            return factory().createTuple(new Object[]{factory().createBytes(recvStream(this, frame, socket, bufsize, peek)), PNone.NONE});
         }
+    }
 
-        @Specialization
-        Object recvFrom(PSocket socket, int bufsize, PNone flags) {
-            return PNotImplemented.NOT_IMPLEMENTED;
+    /**
+     * Common base for {@code recv_into} and {@code recvfrom_into}. Data is read directly into the
+     * storage of a {@code bytearray} or of a memoryview over a {@code bytearray}. For any other
+     * writable buffer, the received bytes are stored with a single slice assignment.
+     */
+    abstract static class RecvIntoBaseNode extends PythonQuaternaryBuiltinNode {
+        @Child private GetAttributeNode getBytearrayWindowNode;
+        @Child private GetObjectArrayNode getObjectArrayNode;
+        @Child private CastToJavaIntNode castToJavaIntNode;
+        @Child private CastToIndexNode castToIndexNode;
+        @Child private LookupAndCallUnaryNode callLenNode;
+        @Child private LookupAndCallTernaryNode callSetItemNode;
+
+        private final ConditionProfile directProfile = ConditionProfile.createBinaryProfile();
+
+        /**
+         * Receives into {@code buffer} and returns the number of bytes received, or a tuple of
+         * that number and the sender's address if {@code withAddress} is set.
+         */
+        protected Object recvInto(VirtualFrame frame, PSocket socket, Object buffer, Object nbytes, Object flags, boolean withAddress) {
+            ByteBuffer target = getDirectBuffer(frame, buffer);
+            byte[] data = null;
+            if (directProfile.profile(target != null)) {
+                target = limit(target, getRequested(frame, nbytes, remaining(target)));
+            } else {
+                data = new byte[getRequested(frame, nbytes, getCastToIndexNode().execute(frame, getCallLenNode().executeObject(frame, buffer)))];
+                target = ByteBuffer.wrap(data);
+            }
+            boolean peek = isPeek(getFlags(this, frame, flags, PSocket.MSG_PEEK, getCastToJavaIntNode()));
+            int length;
+            Object sender = PNone.NONE;
+            if (socket.isDatagram()) {
+                int start = position(target);
+                sender = factory().createTuple(fromSocketAddress(receiveDatagram(this, frame, socket, target, peek)));
+                length = position(target) - start;
+            } else {
+                length = fillBuffer(frame, socket, target, peek);
+            }
+            if (data != null && length > 0) {
+                PBytes received = factory().createBytes(new ByteSequenceStorage(data, length));
+                getCallSetItemNode().execute(frame, buffer, factory().createSlice(0, length, 1), received);
+            }
+            if (withAddress) {
+                // like on Linux, a connected stream socket does not report the sender's address
+                return factory().createTuple(new Object[]{length, sender});
+            }
+            return length;
         }
-    }
 
-    // recv_into(bufsize[, flags])
-    @Builtin(name = "recv_into", minNumOfPositionalArgs = 1, maxNumOfPositionalArgs = 3)
-    @GenerateNodeFactory
-    abstract static class RecvIntoNode extends PythonTernaryBuiltinNode {
-        protected static SequenceStorageNodes.SetItemNode createSetItem() {
-            return SequenceStorageNodes.SetItemNode.create("cannot happen: non-byte store in socket.recv_into");
+        /**
+         * Returns a view of the buffer's backing array, or {@code null} if the buffer cannot be
+         * written to directly.
+         */
+        private ByteBuffer getDirectBuffer(VirtualFrame frame, Object buffer) {
+            if (buffer instanceof PByteArray) {
+                SequenceStorage storage = ((PByteArray) buffer).getSequenceStorage();
+                if (storage instanceof ByteSequenceStorage) {
+                    return wrap((ByteSequenceStorage) storage, 0, storage.length());
+                }
+            } else if (buffer instanceof PMemoryView) {
+                // '(bytearray, start, length)' for writable contiguous views of a bytearray
+                Object window = getBytearrayWindowNode().executeObject(frame, buffer);
+                if (window instanceof PTuple) {
+                    Object[] items = getObjectArrayNode().execute(window);
+                    if (items.length == 3 && items[0] instanceof PByteArray) {
+                        SequenceStorage storage = ((PByteArray) items[0]).getSequenceStorage();
+                        int start = getCastToJavaIntNode().execute(items[1]);
+                        int length = getCastToJavaIntNode().execute(items[2]);
+                        if (storage instanceof ByteSequenceStorage && start + length <= storage.length()) {
+                            return wrap((ByteSequenceStorage) storage, start, length);
+                        }
+                    }
+                }
+            }
+            return null;
         }
 
-        @Specialization
-        Object recvInto(VirtualFrame frame, PSocket socket, PMemoryView buffer, Object flags,
-                        @Cached("createBinaryProfile()") ConditionProfile byteStorage,
-                        @Cached CastToIndexNode cast,
-                        @Cached("create(__LEN__)") LookupAndCallUnaryNode callLen,
-                        @Cached("create(__SETITEM__)") LookupAndCallTernaryNode setItem) {
-            int bufferLen = cast.execute(frame, callLen.executeObject(frame, buffer));
-            byte[] targetBuffer = new byte[bufferLen];
-            ByteBuffer byteBuffer = ByteBuffer.wrap(targetBuffer);
-            int length;
+        private int getRequested(VirtualFrame frame, Object nbytes, int bufferLength) {
+            if (PGuards.isPNone(nbytes)) {
+                return bufferLength;
+            }
+            int requested = getCastToIndexNode().execute(frame, nbytes);
+            if (requested < 0) {
+                throw raise(PythonBuiltinClassType.ValueError, "negative buffersize in recv_into");
+            } else if (requested > bufferLength) {
+                throw raise(PythonBuiltinClassType.ValueError, "buffer too small for requested bytes");
+            }
+            return requested == 0 ? bufferLength : requested;
+        }
+
+        private int fillBuffer(VirtualFrame frame, PSocket socket, ByteBuffer byteBuffer, boolean peek) {
+            if (socket.getSocket() == null) {
+                throw raiseOSError(frame, OSErrorEnum.ENOTCONN);
+            }
             try {
-                length = fillBuffer(socket, byteBuffer);
+                return Math.max(readStream(socket, byteBuffer, peek), 0);
             } catch (NotYetConnectedException e) {
                 throw raiseOSError(frame, OSErrorEnum.ENOTCONN, e);
             } catch (IOException e) {
                 throw raiseOSError(frame, OSErrorEnum.EBADF, e);
             }
-            for (int i = 0; i < length; i++) {
-                int b = targetBuffer[i];
-                if (b < 0) {
-                    b += 256;
-                }
-                setItem.execute(frame, buffer, i, (Object) b);
+        }
+
+        @TruffleBoundary
+        private static ByteBuffer wrap(ByteSequenceStorage storage, int start, int length) {
+            return ByteBuffer.wrap(storage.getInternalByteArray(), start, length);
+        }
+
+        @TruffleBoundary
+        private static int remaining(ByteBuffer buffer) {
+            return buffer.remaining();
+        }
+
+        @TruffleBoundary
+        private static ByteBuffer limit(ByteBuffer buffer, int requested) {
+            buffer.limit(buffer.position() + requested);
+            return buffer;
+        }
+
+        private GetAttributeNode getBytearrayWindowNode() {
+            if (getBytearrayWindowNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                // see '__memoryview_bytearray_window' in 'memoryview.py'
+                getBytearrayWindowNode = insert(GetAttributeNode.create("__bytearray_window"));
             }
-            return length;
+            return getBytearrayWindowNode;
         }
 
-        @Specialization
-        Object recvInto(VirtualFrame frame, PSocket socket, PByteArray buffer, Object flags,
-                        @Cached("createBinaryProfile()") ConditionProfile byteStorage,
-                        @Cached SequenceStorageNodes.LenNode lenNode,
-                        @Cached("createSetItem()") SequenceStorageNodes.SetItemNode setItem) {
-            SequenceStorage storage = buffer.getSequenceStorage();
-            int bufferLen = lenNode.execute(storage);
-            if (byteStorage.profile(storage instanceof ByteSequenceStorage)) {
-                ByteBuffer byteBuffer = ((ByteSequenceStorage) storage).getBufferView();
-                try {
-                    return fillBuffer(socket, byteBuffer);
-                } catch (NotYetConnectedException e) {
-                    throw raiseOSError(frame, OSErrorEnum.ENOTCONN, e);
-                } catch (IOException e) {
-                    throw raiseOSError(frame, OSErrorEnum.EBADF, e);
-                }
-            } else {
-                byte[] targetBuffer = new byte[bufferLen];
-                ByteBuffer byteBuffer = ByteBuffer.wrap(targetBuffer);
-                int length;
-                try {
-                    length = fillBuffer(socket, byteBuffer);
-                } catch (NotYetConnectedException e) {
-                    throw raiseOSError(frame, OSErrorEnum.ENOTCONN, e);
-                } catch (IOException e) {
-                    throw raiseOSError(frame, OSErrorEnum.EBADF, e);
-                }
-                for (int i = 0; i < length; i++) {
-                    // we don't allow generalization
-                    setItem.execute(frame, storage, i, targetBuffer[i]);
-                }
-                return length;
+        private GetObjectArrayNode getObjectArrayNode() {
+            if (getObjectArrayNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                getObjectArrayNode = insert(GetObjectArrayNodeGen.create());
             }
+            return getObjectArrayNode;
         }
 
-        @TruffleBoundary
-        private static int fillBuffer(PSocket socket, ByteBuffer byteBuffer) throws IOException {
-            SocketChannel nativeSocket = socket.getSocket();
-            return nativeSocket.read(byteBuffer);
+        private CastToJavaIntNode getCastToJavaIntNode() {
+            if (castToJavaIntNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToJavaIntNode = insert(CastToJavaIntNode.create());
+            }
+            return castToJavaIntNode;
+        }
+
+        private CastToIndexNode getCastToIndexNode() {
+            if (castToIndexNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                castToIndexNode = insert(CastToIndexNode.create());
+            }
+            return castToIndexNode;
+        }
+
+        private LookupAndCallUnaryNode getCallLenNode() {
+            if (callLenNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                callLenNode = insert(LookupAndCallUnaryNode.create(SpecialMethodNames.__LEN__));
+            }
+            return callLenNode;
+        }
+
+        private LookupAndCallTernaryNode getCallSetItemNode() {
+            if (callSetItemNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                callSetItemNode = insert(LookupAndCallTernaryNode.create(SpecialMethodNames.__SETITEM__));
+            }
+            return callSetItemNode;
+        }
+    }
+
+    // recv_into(buffer[, nbytes[, flags]])
+    @Builtin(name = "recv_into", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
+    @GenerateNodeFactory
+    abstract static class RecvIntoNode extends RecvIntoBaseNode {
+        @Specialization
+        Object recvInto(VirtualFrame frame, PSocket socket, Object buffer, Object nbytes, Object flags) {
+            return recvInto(frame, socket, buffer, nbytes, flags, false);
+        }
+    }
+
+    // recvfrom_into(buffer[, nbytes[, flags]])
+    @Builtin(name = "recvfrom_into", minNumOfPositionalArgs = 2, maxNumOfPositionalArgs = 4)
+    @GenerateNodeFactory
+    abstract static class RecvFromIntoNode extends RecvIntoBaseNode {
+        @Specialization
+        Object recvFromInto(VirtualFrame frame, PSocket socket, Object buffer, Object nbytes, Object flags) {
+            return recvInto(frame, socket, buffer, nbytes, flags, true);
         }
     }
 
@@ -467,8 +873,13 @@ public class SocketBuiltins extends PythonBuiltins {
     abstract static class SendNode extends PythonTernaryBuiltinNode {
         @Specialization
         Object send(VirtualFrame frame, PSocket socket, PBytes bytes, Object flags,
-                        @Cached SequenceStorageNodes.ToByteArrayNode toBytes) {
-            // TODO: do not ignore flags
+                        @Cached SequenceStorageNodes.ToByteArrayNode toBytes,
+                        @Cached CastToJavaIntNode castToInt) {
+            getFlags(this, frame, flags, 0, castToInt);
+            if (socket.isDatagram()) {
+                return sendDatagram(this, frame, socket, toBytes.execute(bytes.getSequenceStorage()), null);
+            }
+
             if (socket.getSocket() == null) {
                 throw raise(PythonBuiltinClassType.OSError);
             }
@@ -499,8 +910,13 @@ public class SocketBuiltins extends PythonBuiltins {
     abstract static class SendAllNode extends PythonTernaryBuiltinNode {
         @Specialization
         Object sendAll(VirtualFrame frame, PSocket socket, PIBytesLike bytes, Object flags,
-                        @Cached SequenceStorageNodes.ToByteArrayNode toBytes) {
-            // TODO: do not ignore flags
+                        @Cached SequenceStorageNodes.ToByteArrayNode toBytes,
+                        @Cached CastToJavaIntNode castToInt) {
+            getFlags(this, frame, flags, 0, castToInt);
+            if (socket.isDatagram()) {
+                sendDatagram(this, frame, socket, toBytes.execute(bytes.getSequenceStorage()), null);
+                return PNone.NONE;
+            }
             try {
                 ByteBuffer buffer = ByteBuffer.wrap(toBytes.execute(bytes.getSequenceStorage()));
                 doWrite(socket, buffer);
@@ -515,15 +931,43 @@ public class SocketBuiltins extends PythonBuiltins {
     // sendto(bytes, flags, address)
     @Builtin(name = "sendto", minNumOfPositionalArgs = 3, maxNumOfPositionalArgs = 4)
     @GenerateNodeFactory
-    abstract static class SendToNode extends PythonBuiltinNode {
-        @Specialization
-        Object sendTo(PSocket socket, Object bytes, int flags, Object address) {
-            return PNotImplemented.NOT_IMPLEMENTED;
-        }
-
-        @Specialization
-        Object sendTo(PSocket socket, Object bytes, PNone flags, Object address) {
-            return PNotImplemented.NOT_IMPLEMENTED;
+    abstract static class SendToNode extends PythonQuaternaryBuiltinNode {
+        @Specialization(limit = "3")
+        Object sendTo(VirtualFrame frame, PSocket socket, Object data, Object flagsOrAddress, Object maybeAddress,
+                        @CachedLibrary("data") PythonBufferLibrary bufferLib,
+                        @Cached GetObjectArrayNode getObjectArrayNode,
+                        @Cached CastToJavaIntNode castToInt) {
+            Object address = flagsOrAddress;
+            if (!PGuards.isNoValue(maybeAddress)) {
+                getFlags(this, frame, flagsOrAddress, 0, castToInt);
+                address = maybeAddress;
+            }
+            if (!(address instanceof PTuple)) {
+                throw raise(PythonBuiltinClassType.TypeError, "getsockaddrarg: AF_INET address must be tuple, not %p", address);
+            }
+            byte[] bytes;
+            try {
+                if (!bufferLib.isBuffer(data)) {
+                    throw raise(PythonBuiltinClassType.TypeError, "a bytes-like object is required, not '%p'", data);
+                }
+                bytes = bufferLib.getBufferBytes(data);
+            } catch (UnsupportedMessageException e) {
+                throw raise(PythonBuiltinClassType.TypeError, "a bytes-like object is required, not '%p'", data);
+            }
+            InetSocketAddress target = toSocketAddress(this, getObjectArrayNode.execute(address));
+            if (socket.isDatagram()) {
+                return sendDatagram(this, frame, socket, bytes, target);
+            }
+            // the address is ignored for connected stream sockets
+            if (socket.getSocket() == null) {
+                throw raiseOSError(frame, OSErrorEnum.ENOTCONN);
+            }
+            try {
+                doWrite(socket, ByteBuffer.wrap(bytes));
+                return bytes.length;
+            } catch (IOException e) {
+                throw raiseOSError(frame, OSErrorEnum.EBADF, e);
+            }
         }
     }
 
@@ -544,14 +988,17 @@ public class SocketBuiltins extends PythonBuiltins {
         @TruffleBoundary
         Object setBlocking(PSocket socket, boolean blocking) {
             socket.setBlocking(blocking);
+            socket.setTimeout(blocking ? -1.0 : 0.0);
 
             try {
+                // registered channels must stay non-blocking, the resources defer the change
+                PosixResources resources = getContext().getResources();
                 if (socket.getSocket() != null) {
-                    socket.getSocket().configureBlocking(socket.isBlocking());
+                    resources.configureBlocking(socket.getSocket(), socket.isBlocking());
                 }
 
                 if (socket.getServerSocket() != null) {
-                    socket.getServerSocket().configureBlocking(socket.isBlocking());
+                    resources.configureBlocking(socket.getServerSocket(), socket.isBlocking());
                 }
             } catch (IOException e) {
                 throw raise(PythonBuiltinClassType.OSError);
@@ -565,9 +1012,21 @@ public class SocketBuiltins extends PythonBuiltins {
     @Builtin(name = "settimeout", minNumOfPositionalArgs = 2)
     @GenerateNodeFactory
     abstract static class SetTimeoutNode extends PythonBinaryBuiltinNode {
+        @Specialization
+        Object setTimeout(PSocket socket, @SuppressWarnings("unused") PNone none) {
+            socket.setTimeout(-1.0);
+            socket.setBlocking(true);
+            return PNone.NONE;
+        }
+
         @Specialization
         @TruffleBoundary
         Object setTimeout(PSocket socket, Integer value) {
+            if (value < 0) {
+                throw raise(PythonBuiltinClassType.ValueError, "Timeout value out of range");
+            }
+            socket.setTimeout(value);
+            socket.setBlocking(value != 0);
             try {
                 if (socket.getSocket() != null) {
                     socket.getSocket().socket().setSoTimeout(value);
@@ -585,8 +1044,15 @@ public class SocketBuiltins extends PythonBuiltins {
 
         @Specialization
         Object setTimeout(PSocket socket, double value) {
+            if (value < 0) {
+                throw raise(PythonBuiltinClassType.ValueError, "Timeout value out of range");
+            }
             Integer intValue = (int) value;
-            return setTimeout(socket, intValue);
+            setTimeout(socket, intValue);
+            // keep the fractional part for datagram sockets
+            socket.setTimeout(value);
+            socket.setBlocking(value != 0);
+            return PNone.NONE;
         }
     }
 
@@ -40,6 +40,8 @@
  */
 package com.oracle.graal.python.builtins.objects.str;
 
+import java.util.ArrayDeque;
+
 import org.graalvm.nativeimage.ImageInfo;
 
 import com.oracle.graal.python.nodes.PGuards;
@@ -258,4 +260,43 @@ public class LazyString implements PCharSequence {
     public byte[] getBytes() {
         return toString().getBytes();
     }
+
+    /**
+     * Walks the flat pieces of a character sequence from left to right. Unmaterialized lazy strings
+     * are split into their parts instead of being flattened, so no characters are copied.
+     */
+    public static final class LeafIterator {
+        private final ArrayDeque<CharSequence> pending = new ArrayDeque<>();
+
+        @TruffleBoundary
+        public LeafIterator(CharSequence root) {
+            pending.push(root);
+        }
+
+        /**
+         * Returns the next non-empty piece, or {@code null} if the sequence is exhausted.
+         */
+        @TruffleBoundary
+        public String next() {
+            while (!pending.isEmpty()) {
+                CharSequence cs = pending.pop();
+                if (cs instanceof LazyString) {
+                    // another thread may materialize the string concurrently, so the fields are
+                    // read only once and a left part that already spans the whole string is the
+                    // materialized result
+                    LazyString lazyString = (LazyString) cs;
+                    CharSequence left = lazyString.left;
+                    CharSequence right = lazyString.right;
+                    if (right == null || left.length() == lazyString.len) {
+                        return cs.toString();
+                    }
+                    pending.push(right);
+                    pending.push(left);
+                } else if (cs.length() > 0) {
+                    return cs.toString();
+                }
+            }
+            return null;
+        }
+    }
 }
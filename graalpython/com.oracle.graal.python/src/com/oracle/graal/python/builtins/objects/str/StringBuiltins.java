@@ -28,6 +28,7 @@ package com.oracle.graal.python.builtins.objects.str;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__ADD__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__CONTAINS__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__EQ__;
+import static com.oracle.graal.python.nodes.SpecialMethodNames.__FORMAT__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__GETITEM__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__GE__;
 import static com.oracle.graal.python.nodes.SpecialMethodNames.__GT__;
@@ -67,6 +68,8 @@ import com.oracle.graal.python.builtins.Builtin;
 import com.oracle.graal.python.builtins.CoreFunctions;
 import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.PythonBuiltins;
+import com.oracle.graal.python.builtins.modules.BuiltinFunctions;
+import com.oracle.graal.python.builtins.modules.BuiltinFunctionsFactory;
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.PNotImplemented;
 import com.oracle.graal.python.builtins.objects.bytes.BytesNodes;
@@ -75,6 +78,7 @@ import com.oracle.graal.python.builtins.objects.common.HashingStorageNodes.SetIt
 import com.oracle.graal.python.builtins.objects.common.SequenceNodes.GetObjectArrayNode;
 import com.oracle.graal.python.builtins.objects.common.SequenceNodesFactory.GetObjectArrayNodeGen;
 import com.oracle.graal.python.builtins.objects.dict.PDict;
+import com.oracle.graal.python.builtins.objects.function.PKeyword;
 import com.oracle.graal.python.builtins.objects.ints.PInt;
 import com.oracle.graal.python.builtins.objects.iterator.PStringIterator;
 import com.oracle.graal.python.builtins.objects.list.ListBuiltins.ListReverseNode;
@@ -87,6 +91,7 @@ import com.oracle.graal.python.builtins.objects.tuple.PTuple;
 import com.oracle.graal.python.nodes.PNodeWithContext;
 import com.oracle.graal.python.nodes.PRaiseNode;
 import com.oracle.graal.python.nodes.SpecialMethodNames;
+import com.oracle.graal.python.nodes.attributes.GetAttributeNode.GetAnyAttributeNode;
 import com.oracle.graal.python.nodes.attributes.LookupAttributeInMRONode;
 import com.oracle.graal.python.nodes.builtins.JoinInternalNode;
 import com.oracle.graal.python.nodes.builtins.ListNodes.AppendNode;
@@ -104,9 +109,11 @@ import com.oracle.graal.python.nodes.string.StringLenNode;
 import com.oracle.graal.python.nodes.truffle.PythonArithmeticTypes;
 import com.oracle.graal.python.nodes.util.CastToIndexNode;
 import com.oracle.graal.python.nodes.util.CastToIntegerFromIndexNode;
+import com.oracle.graal.python.nodes.util.CastToStringNode;
 import com.oracle.graal.python.runtime.ExecutionContext.IndirectCallContext;
 import com.oracle.graal.python.runtime.PythonContext;
 import com.oracle.graal.python.runtime.exception.PException;
+import com.oracle.graal.python.runtime.formatting.FormatTemplate;
 import com.oracle.graal.python.runtime.formatting.StringFormatter;
 import com.oracle.truffle.api.CompilerDirectives;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -1636,6 +1643,283 @@ public final class StringBuiltins extends PythonBuiltins {
         }
     }
 
+    /**
+     * Common implementation of {@code str.format} and {@code str.format_map}. Format strings are
+     * parsed once into a {@link FormatTemplate}, which is cached per call site for constant
+     * templates, so a call only resolves and formats the replacement fields.
+     */
+    abstract static class FormatBaseNode extends PythonBuiltinNode {
+        static final int TEMPLATE_CACHE_SIZE = 4;
+
+        @Child private GetAnyAttributeNode getAttributeNode;
+        @Child private LookupAndCallBinaryNode getItemNode;
+        @Child private LookupAndCallBinaryNode getMappingItemNode;
+        @Child private LookupAndCallBinaryNode formatNode;
+        @Child private BuiltinFunctions.ReprNode reprNode;
+        @Child private CastToStringNode strNode;
+
+        /**
+         * State of the automatic field numbering, shared by a template and its nested specs.
+         */
+        private static final class AutoNumbering {
+            private static final int INIT = 0;
+            private static final int AUTO = 1;
+            private static final int MANUAL = 2;
+
+            private int state = INIT;
+            private int next;
+        }
+
+        protected static boolean isSameTemplate(String template, String cachedTemplate) {
+            return cachedTemplate.equals(template);
+        }
+
+        protected final FormatTemplate parse(String template) {
+            return FormatTemplate.parse(getCore(), template);
+        }
+
+        protected final String render(VirtualFrame frame, FormatTemplate template, Object[] args, PKeyword[] kwargs, Object mapping) {
+            AutoNumbering numbering = new AutoNumbering();
+            StringBuilder sb = newStringBuilder();
+            for (int i = 0; i < template.size(); i++) {
+                append(sb, template.getLiteral(i));
+                FormatTemplate.Field field = template.getField(i);
+                if (field != null) {
+                    Object value = resolveField(frame, field, numbering, args, kwargs, mapping);
+                    String spec = field.getSpec();
+                    FormatTemplate expandedSpec = field.getExpandedSpec();
+                    if (expandedSpec != null) {
+                        spec = renderSpec(frame, expandedSpec, numbering, args, kwargs, mapping);
+                    }
+                    append(sb, formatValue(frame, value, spec));
+                }
+            }
+            return toString(sb);
+        }
+
+        private String renderSpec(VirtualFrame frame, FormatTemplate spec, AutoNumbering numbering, Object[] args, PKeyword[] kwargs, Object mapping) {
+            StringBuilder sb = newStringBuilder();
+            for (int i = 0; i < spec.size(); i++) {
+                append(sb, spec.getLiteral(i));
+                FormatTemplate.Field field = spec.getField(i);
+                if (field != null) {
+                    Object value = resolveField(frame, field, numbering, args, kwargs, mapping);
+                    if (field.specNeedsExpanding()) {
+                        throw raise(ValueError, "Max string recursion exceeded");
+                    }
+                    append(sb, formatValue(frame, value, field.getSpec()));
+                }
+            }
+            return toString(sb);
+        }
+
+        private Object resolveField(VirtualFrame frame, FormatTemplate.Field field, AutoNumbering numbering, Object[] args, PKeyword[] kwargs, Object mapping) {
+            FormatTemplate.FieldName name = field.getFieldName();
+            if (name.hasFirstPartError()) {
+                throw raise(ValueError, "%s", name.getError());
+            }
+            Object value = getArgument(frame, name, numbering, args, kwargs, mapping);
+            for (int i = 0; i < name.getLookupCount(); i++) {
+                if (name.isAttributeLookup(i)) {
+                    value = getAttributeNode().executeObject(frame, value, name.getLookupKey(i));
+                } else {
+                    value = getItemNode().executeObject(frame, value, name.getLookupKey(i));
+                }
+            }
+            if (name.getError() != null) {
+                throw raise(ValueError, "%s", name.getError());
+            }
+            return convert(frame, value, field.getConversion());
+        }
+
+        private Object getArgument(VirtualFrame frame, FormatTemplate.FieldName name, AutoNumbering numbering, Object[] args, PKeyword[] kwargs, Object mapping) {
+            if (name.isAutoNumbered()) {
+                if (numbering.state == AutoNumbering.MANUAL) {
+                    throw raise(ValueError, "cannot switch from manual field specification to automatic field numbering");
+                }
+                numbering.state = AutoNumbering.AUTO;
+                return getPositional(args, numbering.next++);
+            } else if (name.getIndex() >= 0) {
+                if (numbering.state == AutoNumbering.AUTO) {
+                    throw raise(ValueError, "cannot switch from automatic field numbering to manual field specification");
+                }
+                numbering.state = AutoNumbering.MANUAL;
+                return getPositional(args, name.getIndex());
+            }
+            String keyword = name.getKeyword();
+            if (mapping != null) {
+                return getMappingItemNode().executeObject(frame, mapping, keyword);
+            }
+            for (PKeyword kwarg : kwargs) {
+                if (keyword.equals(kwarg.getName())) {
+                    return kwarg.getValue();
+                }
+            }
+            throw raise(KeyError, "%s", keyword);
+        }
+
+        private Object getPositional(Object[] args, long index) {
+            if (args == null) {
+                throw raise(ValueError, "Format string contains positional fields");
+            }
+            if (index >= args.length) {
+                throw raise(IndexError, "Replacement index %d out of range for positional args tuple", index);
+            }
+            return args[(int) index];
+        }
+
+        private Object convert(VirtualFrame frame, Object value, int conversion) {
+            switch (conversion) {
+                case FormatTemplate.NO_CONVERSION:
+                    return value;
+                case 'r':
+                    return getReprNode().execute(frame, value);
+                case 's':
+                    return getStrNode().execute(frame, value);
+                case 'a':
+                    Object repr = getReprNode().execute(frame, value);
+                    return toAscii(repr instanceof PString ? ((PString) repr).getValue() : (String) repr);
+                default:
+                    if (conversion > 32 && conversion < 127) {
+                        throw raise(ValueError, "Unknown conversion specifier %s", String.valueOf((char) conversion));
+                    }
+                    throw raise(ValueError, "Unknown conversion specifier \\x%x", conversion);
+            }
+        }
+
+        private String formatValue(VirtualFrame frame, Object value, String spec) {
+            if (spec.isEmpty() && value instanceof String) {
+                return (String) value;
+            }
+            Object result = getFormatNode().executeObject(frame, value, spec);
+            if (result instanceof String) {
+                return (String) result;
+            } else if (result instanceof PString) {
+                return ((PString) result).getValue();
+            }
+            throw raise(TypeError, "__format__ must return a str, not %p", result);
+        }
+
+        @TruffleBoundary
+        private static String toAscii(String repr) {
+            StringBuilder sb = new StringBuilder(repr.length());
+            int i = 0;
+            while (i < repr.length()) {
+                int codepoint = repr.codePointAt(i);
+                if (codepoint < 128) {
+                    sb.append((char) codepoint);
+                } else if (codepoint <= 0xff) {
+                    sb.append("\\x").append(String.format("%02x", codepoint));
+                } else if (codepoint <= 0xffff) {
+                    sb.append("\\u").append(String.format("%04x", codepoint));
+                } else {
+                    sb.append("\\U").append(String.format("%08x", codepoint));
+                }
+                i += Character.charCount(codepoint);
+            }
+            return sb.toString();
+        }
+
+        @TruffleBoundary
+        private static StringBuilder newStringBuilder() {
+            return new StringBuilder();
+        }
+
+        @TruffleBoundary
+        private static void append(StringBuilder sb, String s) {
+            sb.append(s);
+        }
+
+        @TruffleBoundary
+        private static String toString(StringBuilder sb) {
+            return sb.toString();
+        }
+
+        private GetAnyAttributeNode getAttributeNode() {
+            if (getAttributeNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                getAttributeNode = insert(GetAnyAttributeNode.create());
+            }
+            return getAttributeNode;
+        }
+
+        private LookupAndCallBinaryNode getItemNode() {
+            if (getItemNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                getItemNode = insert(LookupAndCallBinaryNode.create(__GETITEM__));
+            }
+            return getItemNode;
+        }
+
+        private LookupAndCallBinaryNode getMappingItemNode() {
+            if (getMappingItemNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                getMappingItemNode = insert(LookupAndCallBinaryNode.create(__GETITEM__));
+            }
+            return getMappingItemNode;
+        }
+
+        private LookupAndCallBinaryNode getFormatNode() {
+            if (formatNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                formatNode = insert(LookupAndCallBinaryNode.create(__FORMAT__));
+            }
+            return formatNode;
+        }
+
+        private BuiltinFunctions.ReprNode getReprNode() {
+            if (reprNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                reprNode = insert(BuiltinFunctionsFactory.ReprNodeFactory.create());
+            }
+            return reprNode;
+        }
+
+        private CastToStringNode getStrNode() {
+            if (strNode == null) {
+                CompilerDirectives.transferToInterpreterAndInvalidate();
+                strNode = insert(CastToStringNode.createCoercing());
+            }
+            return strNode;
+        }
+    }
+
+    @Builtin(name = "format", minNumOfPositionalArgs = 1, takesVarArgs = true, takesVarKeywordArgs = true)
+    @GenerateNodeFactory
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    public abstract static class FormatNode extends FormatBaseNode {
+
+        @Specialization(guards = "isSameTemplate(self, cachedSelf)", limit = "TEMPLATE_CACHE_SIZE")
+        String doCached(VirtualFrame frame, @SuppressWarnings("unused") String self, Object[] args, PKeyword[] kwargs,
+                        @SuppressWarnings("unused") @Cached("self") String cachedSelf,
+                        @Cached("parse(self)") FormatTemplate template) {
+            return render(frame, template, args, kwargs, null);
+        }
+
+        @Specialization(replaces = "doCached")
+        String doGeneric(VirtualFrame frame, String self, Object[] args, PKeyword[] kwargs) {
+            return render(frame, parse(self), args, kwargs, null);
+        }
+    }
+
+    @Builtin(name = "format_map", minNumOfPositionalArgs = 2)
+    @GenerateNodeFactory
+    @TypeSystemReference(PythonArithmeticTypes.class)
+    public abstract static class FormatMapNode extends FormatBaseNode {
+
+        @Specialization(guards = "isSameTemplate(self, cachedSelf)", limit = "TEMPLATE_CACHE_SIZE")
+        String doCached(VirtualFrame frame, @SuppressWarnings("unused") String self, Object mapping,
+                        @SuppressWarnings("unused") @Cached("self") String cachedSelf,
+                        @Cached("parse(self)") FormatTemplate template) {
+            return render(frame, template, null, null, mapping);
+        }
+
+        @Specialization(replaces = "doCached")
+        String doGeneric(VirtualFrame frame, String self, Object mapping) {
+            return render(frame, parse(self), null, null, mapping);
+        }
+    }
+
     @Builtin(name = "isascii", minNumOfPositionalArgs = 1)
     @GenerateNodeFactory
     @TypeSystemReference(PythonArithmeticTypes.class)
@@ -2169,6 +2453,11 @@ public final class StringBuiltins extends PythonBuiltins {
     @TypeSystemReference(PythonArithmeticTypes.class)
     public abstract static class IterNode extends PythonUnaryBuiltinNode {
 
+        @Specialization
+        PStringIterator doPString(PString self) {
+            return factory().createStringIterator(self.getCharSequence());
+        }
+
         @Specialization
         PStringIterator doString(String self) {
             return factory().createStringIterator(self);
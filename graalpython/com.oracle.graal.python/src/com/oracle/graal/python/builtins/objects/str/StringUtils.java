@@ -40,6 +40,9 @@
  */
 package com.oracle.graal.python.builtins.objects.str;
 
+import com.oracle.truffle.api.CompilerDirectives.CompilationFinal;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
 public final class StringUtils {
     public enum StripKind {
         LEFT,
@@ -47,6 +50,13 @@ public final class StringUtils {
         BOTH
     }
 
+    @CompilationFinal(dimensions = 1) private static final String[] LATIN1_CHARS = new String[256];
+    static {
+        for (int i = 0; i < LATIN1_CHARS.length; i++) {
+            LATIN1_CHARS[i] = String.valueOf((char) i);
+        }
+    }
+
     private static final int[] ASCII_WHITESPACE = {
                     0, 0, 0, 0, 0, 0, 0, 0,
                     /* case 0x0009: * CHARACTER TABULATION */
@@ -77,6 +87,21 @@ public final class StringUtils {
                     0, 0, 0, 0, 0, 0, 0, 0
     };
 
+    /**
+     * Returns a one-character string; strings for Latin-1 characters are shared.
+     */
+    public static String charToString(char ch) {
+        if (ch < LATIN1_CHARS.length) {
+            return LATIN1_CHARS[ch];
+        }
+        return newCharString(ch);
+    }
+
+    @TruffleBoundary
+    private static String newCharString(char ch) {
+        return String.valueOf(ch);
+    }
+
     public static boolean isUnicodeWhitespace(char ch) {
         switch (ch) {
             case 0x0009:
@@ -115,7 +115,7 @@ public abstract class SliceLiteralNode extends ExpressionNode {
         return SliceLiteralNodeGen.create(null, null, null);
     }
 
-    abstract static class CastToSliceComponentNode extends PNodeWithContext {
+    public abstract static class CastToSliceComponentNode extends PNodeWithContext {
 
         @Child private PRaiseNode raiseNode;
 
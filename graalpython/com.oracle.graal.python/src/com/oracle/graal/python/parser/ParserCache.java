@@ -0,0 +1,244 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+package com.oracle.graal.python.parser;
+
+import static com.oracle.truffle.api.TruffleFile.LAST_MODIFIED_TIME;
+import static com.oracle.truffle.api.TruffleFile.SIZE;
+
+import java.io.IOException;
+import java.io.OutputStream;
+import java.nio.file.StandardCopyOption;
+import java.util.Arrays;
+
+import com.oracle.graal.python.PythonLanguage;
+import com.oracle.graal.python.parser.sst.SSTDeserializer;
+import com.oracle.graal.python.parser.sst.SSTNode;
+import com.oracle.graal.python.parser.sst.SSTSerializer;
+import com.oracle.graal.python.runtime.PythonParser.ParserMode;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+import com.oracle.truffle.api.TruffleFile;
+import com.oracle.truffle.api.TruffleLanguage.Env;
+import com.oracle.truffle.api.source.Source;
+
+/**
+ * A persistent cache of parsed Python files. For every parsed {@code dir/name.py} the simple syntax
+ * tree and its scopes are stored in {@code dir/__pycache__/name.graalpython.sst}, similar to the
+ * {@code .pyc} files of CPython. The cache entry is only used if the modification time and size of
+ * the source file and the hash of its contents match the ones recorded in the entry.
+ *
+ * All I/O errors are ignored, the source is simply parsed again in that case. New entries are not
+ * written if the Python {@code -B} flag is set, or to directories that are not writable.
+ */
+public final class ParserCache {
+
+    private static final String CACHE_DIR = "__pycache__";
+    private static final String CACHE_SUFFIX = ".graalpython.sst";
+    private static final int MAGIC = 0x47505354;
+    /**
+     * Has to be incremented whenever the layout of the SST nodes or of {@link ScopeInfo} changes.
+     */
+    private static final int FORMAT_VERSION = 1;
+    private static final String LANGUAGE_VERSION = PythonLanguage.VERSION;
+    private static final int HEADER_SIZE = 4 + 4 + 4 + 8 + 8 + 4 + 8;
+
+    private final boolean writeEntries;
+    private long hits = 0;
+    private long misses = 0;
+    private long writes = 0;
+
+    public ParserCache(boolean writeEntries) {
+        this.writeEntries = writeEntries;
+    }
+
+    public long getHits() {
+        return hits;
+    }
+
+    public long getMisses() {
+        return misses;
+    }
+
+    public long getWrites() {
+        return writes;
+    }
+
+    public static boolean isCacheable(ParserMode mode, Source source) {
+        return mode == ParserMode.File && !source.isInteractive() && source.getPath() != null && source.getPath().endsWith(PythonLanguage.EXTENSION);
+    }
+
+    /**
+     * Looks up the cached tree for {@code source}. On success, the scopes of the tree are
+     * registered in {@code scopeEnvironment} and the tree is returned, otherwise {@code null} is
+     * returned.
+     */
+    @TruffleBoundary
+    public SSTNode load(Source source, ScopeEnvironment scopeEnvironment) {
+        SSTNode result = null;
+        try {
+            TruffleFile sourceFile = getEnv().getInternalTruffleFile(source.getPath());
+            TruffleFile cacheFile = getCacheFile(sourceFile);
+            if (cacheFile != null && cacheFile.isRegularFile()) {
+                byte[] data = cacheFile.readAllBytes();
+                if (data.length > HEADER_SIZE && Arrays.equals(createHeader(sourceFile, source), Arrays.copyOf(data, HEADER_SIZE))) {
+                    result = SSTDeserializer.deserialize(data, HEADER_SIZE, scopeEnvironment);
+                }
+            }
+        } catch (IOException | SecurityException | UnsupportedOperationException e) {
+            // fall back to parsing
+        } catch (IllegalStateException | IndexOutOfBoundsException | ClassCastException | IllegalArgumentException e) {
+            // a corrupted or outdated entry, it will be overwritten
+            result = null;
+        }
+        if (result != null) {
+            hits++;
+        } else {
+            misses++;
+        }
+        return result;
+    }
+
+    /**
+     * Stores the tree created by parsing {@code source}. This must be called before the tree is
+     * translated.
+     */
+    @TruffleBoundary
+    public void store(Source source, ScopeInfo globalScope, SSTNode root) {
+        if (!writeEntries) {
+            return;
+        }
+        TruffleFile tmpFile = null;
+        try {
+            TruffleFile sourceFile = getEnv().getInternalTruffleFile(source.getPath());
+            TruffleFile cacheFile = getCacheFile(sourceFile);
+            if (cacheFile == null || !isWritable(cacheFile.getParent())) {
+                return;
+            }
+            byte[] data = SSTSerializer.serialize(globalScope, root);
+            byte[] header = createHeader(sourceFile, source);
+            cacheFile.getParent().createDirectories();
+            // write to a temporary file first, so that concurrent readers never see a partial entry
+            tmpFile = cacheFile.resolveSibling(cacheFile.getName() + "." + Long.toHexString(System.nanoTime()) + ".tmp");
+            try (OutputStream out = tmpFile.newOutputStream()) {
+                out.write(header);
+                out.write(data);
+            }
+            tmpFile.move(cacheFile, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+            tmpFile = null;
+            writes++;
+        } catch (IOException | SecurityException | UnsupportedOperationException | IllegalStateException e) {
+            // the cache is optional
+        } finally {
+            if (tmpFile != null) {
+                try {
+                    tmpFile.delete();
+                } catch (IOException | SecurityException e) {
+                    // ignore
+                }
+            }
+        }
+    }
+
+    private static Env getEnv() {
+        return PythonLanguage.getContext().getEnv();
+    }
+
+    /**
+     * Checks if entries can be written to {@code cacheDir}, or if it can be created in a writable
+     * source directory.
+     */
+    private static boolean isWritable(TruffleFile cacheDir) {
+        if (cacheDir.exists()) {
+            return cacheDir.isDirectory() && cacheDir.isWritable();
+        }
+        TruffleFile sourceDir = cacheDir.getParent();
+        return sourceDir != null && sourceDir.isWritable();
+    }
+
+    private static TruffleFile getCacheFile(TruffleFile sourceFile) {
+        TruffleFile dir = sourceFile.getParent();
+        String name = sourceFile.getName();
+        if (dir == null || name == null) {
+            return null;
+        }
+        String moduleName = name.substring(0, name.length() - PythonLanguage.EXTENSION.length());
+        return dir.resolve(CACHE_DIR).resolve(moduleName + CACHE_SUFFIX);
+    }
+
+    private static byte[] createHeader(TruffleFile sourceFile, Source source) throws IOException {
+        TruffleFile.Attributes attributes = sourceFile.getAttributes(Arrays.asList(SIZE, LAST_MODIFIED_TIME));
+        CharSequence characters = source.getCharacters();
+        byte[] header = new byte[HEADER_SIZE];
+        int offset = putInt(header, 0, MAGIC);
+        offset = putInt(header, offset, FORMAT_VERSION);
+        offset = putInt(header, offset, LANGUAGE_VERSION.hashCode());
+        offset = putLong(header, offset, attributes.get(LAST_MODIFIED_TIME).toMillis());
+        offset = putLong(header, offset, attributes.get(SIZE));
+        offset = putInt(header, offset, characters.length());
+        putLong(header, offset, hash(characters));
+        return header;
+    }
+
+    private static int putInt(byte[] buffer, int offset, int value) {
+        buffer[offset] = (byte) (value >>> 24);
+        buffer[offset + 1] = (byte) (value >>> 16);
+        buffer[offset + 2] = (byte) (value >>> 8);
+        buffer[offset + 3] = (byte) value;
+        return offset + 4;
+    }
+
+    private static int putLong(byte[] buffer, int offset, long value) {
+        putInt(buffer, offset, (int) (value >>> 32));
+        return putInt(buffer, offset + 4, (int) value);
+    }
+
+    /**
+     * 64-bit FNV-1a hash of the source characters.
+     */
+    private static long hash(CharSequence characters) {
+        long hash = 0xcbf29ce484222325L;
+        for (int i = 0; i < characters.length(); i++) {
+            hash ^= characters.charAt(i);
+            hash *= 0x100000001b3L;
+        }
+        return hash;
+    }
+}
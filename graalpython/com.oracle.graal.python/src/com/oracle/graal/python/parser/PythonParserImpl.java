@@ -54,6 +54,7 @@ public final class PythonParserImpl implements PythonParser {
     private final boolean useExperimentalParser;
     private final boolean logFiles;
     private final int timeStatistics;
+    private final ParserCache cache;
     private long timeInParser = 0;
     private long numberOfFiles = 0;
 
@@ -61,6 +62,7 @@ public final class PythonParserImpl implements PythonParser {
         this.useExperimentalParser = env.getOptions().get(PythonOptions.UseExperimentalParser);
         this.logFiles = env.getOptions().get(PythonOptions.ParserLogFiles);
         this.timeStatistics = env.getOptions().get(PythonOptions.ParserStatistics);
+        this.cache = env.getOptions().get(PythonOptions.ParserCache) ? new ParserCache(!env.getOptions().get(PythonOptions.DontWriteBytecodeFlag)) : null;
     }
 
     private static Python3Parser getPython3Parser(String string) {
@@ -137,6 +139,11 @@ public final class PythonParserImpl implements PythonParser {
                 numberOfFiles++;
                 if (numberOfFiles % timeStatistics == 0) {
                     System.out.println("Parsed " + numberOfFiles + " in " + timeInParser + "ms.");
+                    if (cache != null) {
+                        long lookups = cache.getHits() + cache.getMisses();
+                        System.out.println("Parser cache: " + cache.getHits() + " hits, " + cache.getMisses() + " misses (" + (lookups == 0 ? 0 : cache.getHits() * 100 / lookups) +
+                                        "% hit rate), " + cache.getWrites() + " entries written.");
+                    }
                 }
             }
         }
@@ -145,6 +152,22 @@ public final class PythonParserImpl implements PythonParser {
 
     @TruffleBoundary
     public Node parseN(ParserMode mode, ParserErrorCallback errors, Source source, Frame currentFrame) {
+        boolean cacheable = cache != null && ParserCache.isCacheable(mode, source);
+        if (cacheable) {
+            PythonNodeFactory factory = new PythonNodeFactory(errors, source);
+            SSTNode cachedResult = cache.load(source, factory.getScopeEnvironment());
+            if (cachedResult != null) {
+                if (logFiles) {
+                    System.out.print(" from cache");
+                }
+                lastGlobalScope = factory.getScopeEnvironment().getGlobalScope();
+                try {
+                    return factory.createParserResult(cachedResult, mode, currentFrame);
+                } catch (Exception e) {
+                    throw handleParserError(errors, source, e, true);
+                }
+            }
+        }
         FrameDescriptor inlineLocals = mode == ParserMode.InlineEvaluation ? currentFrame.getFrameDescriptor() : null;
         // ANTLR parsing
         Python3NewParser parser = getPython3NewParser(source, errors);
@@ -185,6 +208,9 @@ public final class PythonParserImpl implements PythonParser {
         }
 
         lastGlobalScope = parser.factory.getScopeEnvironment().getGlobalScope();
+        if (cacheable) {
+            cache.store(source, lastGlobalScope, parserSSTResult);
+        }
         try {
             return parser.factory.createParserResult(parserSSTResult, mode, currentFrame);
         } catch (Exception e) {
@@ -261,6 +261,11 @@ public class ScopeEnvironment implements CellFrameSlotSupplier {
         return globalScope;
     }
 
+    public void setGlobalScope(ScopeInfo globalScope) {
+        this.globalScope = globalScope;
+        this.currentScope = globalScope;
+    }
+
     public boolean isNonlocal(String name) {
         assert name != null : "name is null!";
         return currentScope.isExplicitNonlocalVariable(name);
@@ -232,6 +232,22 @@ public final class ScopeInfo {
         }
     }
 
+    public Set<String> getExplicitGlobalVariables() {
+        return explicitGlobalVariables;
+    }
+
+    public Set<String> getExplicitNonlocalVariables() {
+        return explicitNonlocalVariables;
+    }
+
+    public Set<String> getCellVars() {
+        return cellVars;
+    }
+
+    public Set<String> getFreeVars() {
+        return freeVars;
+    }
+
     public boolean isCellVar(String identifier) {
         return cellVars != null && cellVars.contains(identifier);
     }
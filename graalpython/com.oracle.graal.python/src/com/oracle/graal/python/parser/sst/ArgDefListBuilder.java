@@ -279,4 +279,55 @@ public final class ArgDefListBuilder {
         return new Signature(kwarIndex > -1, splatMarker ? -1 : splatIndex, splatMarker, ids, kwids);
     }
 
+    void writeTo(SSTSerializer out) {
+        writeParameters(out, args, splatIndex);
+        writeParameters(out, kwargs, kwarIndex);
+    }
+
+    private static void writeParameters(SSTSerializer out, List<Parameter> params, int specialIndex) {
+        if (params == null) {
+            out.writeInt(0);
+            return;
+        }
+        out.writeInt(params.size());
+        out.writeInt(specialIndex);
+        for (Parameter param : params) {
+            out.writeString(param.name);
+            out.writeNode(param.type);
+            out.writeNode(param instanceof ParameterWithDefValue ? ((ParameterWithDefValue) param).value : null);
+        }
+    }
+
+    /**
+     * Reads the parameters written by {@link #writeTo(SSTSerializer)} and adds them in their
+     * original order, so that the builder ends up in the same state as after parsing.
+     */
+    static ArgDefListBuilder readFrom(SSTDeserializer in, ScopeEnvironment scopeEnvironment) {
+        ArgDefListBuilder builder = new ArgDefListBuilder(scopeEnvironment);
+        int argsCount = in.readInt();
+        int argsSplat = argsCount > 0 ? in.readInt() : -1;
+        for (int i = 0; i < argsCount; i++) {
+            String name = in.readString();
+            SSTNode type = in.readNode();
+            SSTNode value = in.readNode();
+            if (i == argsSplat) {
+                builder.addSplat(name, type);
+            } else {
+                builder.addParam(name, type, value);
+            }
+        }
+        int kwargsCount = in.readInt();
+        int kwargsIndex = kwargsCount > 0 ? in.readInt() : -1;
+        for (int i = 0; i < kwargsCount; i++) {
+            String name = in.readString();
+            SSTNode type = in.readNode();
+            SSTNode value = in.readNode();
+            if (i == kwargsIndex) {
+                builder.addKwargs(name, type);
+            } else {
+                builder.addParam(name, type, value);
+            }
+        }
+        return builder;
+    }
 }
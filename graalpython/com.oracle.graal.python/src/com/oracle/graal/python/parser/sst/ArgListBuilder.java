@@ -158,4 +158,21 @@ public final class ArgListBuilder {
         return result;
     }
 
+    void writeTo(SSTSerializer out) {
+        out.writeNodes(args);
+        out.writeNodes(nameArgNodes);
+        out.writeStrings(nameArgNames);
+        out.writeNodes(starArg);
+        out.writeNodes(kwArg);
+    }
+
+    static ArgListBuilder readFrom(SSTDeserializer in) {
+        ArgListBuilder builder = new ArgListBuilder();
+        builder.args = in.readNodeList();
+        builder.nameArgNodes = in.readNodeList();
+        builder.nameArgNames = in.readStringList();
+        builder.starArg = in.readNodeList();
+        builder.kwArg = in.readNodeList();
+        return builder;
+    }
 }
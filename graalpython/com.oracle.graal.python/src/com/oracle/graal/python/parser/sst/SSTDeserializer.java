@@ -0,0 +1,523 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+package com.oracle.graal.python.parser.sst;
+
+import static com.oracle.graal.python.parser.sst.SSTSerializer.NEW_STRING;
+import static com.oracle.graal.python.parser.sst.SSTSerializer.NULL_INDEX;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
+import com.oracle.graal.python.nodes.expression.BinaryArithmetic;
+import com.oracle.graal.python.nodes.expression.UnaryArithmetic;
+import com.oracle.graal.python.parser.ScopeEnvironment;
+import com.oracle.graal.python.parser.ScopeInfo;
+import com.oracle.graal.python.parser.ScopeInfo.ScopeKind;
+
+/**
+ * Reads a tree written by {@link SSTSerializer}. The scopes are recreated and registered as the
+ * global scope of the given {@link ScopeEnvironment}, so that the environment is in the same state
+ * as after parsing the source.
+ *
+ * Malformed input results in an {@link IllegalStateException} or an
+ * {@link IndexOutOfBoundsException}.
+ */
+public final class SSTDeserializer {
+
+    private final byte[] data;
+    private int position;
+    private final ScopeEnvironment scopeEnvironment;
+    private final ArrayList<String> strings = new ArrayList<>();
+    private final ArrayList<ScopeInfo> scopes = new ArrayList<>();
+
+    private SSTDeserializer(byte[] data, int offset, ScopeEnvironment scopeEnvironment) {
+        this.data = data;
+        this.position = offset;
+        this.scopeEnvironment = scopeEnvironment;
+    }
+
+    public static SSTNode deserialize(byte[] data, int offset, ScopeEnvironment scopeEnvironment) {
+        SSTDeserializer deserializer = new SSTDeserializer(data, offset, scopeEnvironment);
+        ScopeInfo globalScope = deserializer.readScope(null);
+        scopeEnvironment.setGlobalScope(globalScope);
+        SSTNode result = deserializer.readNode();
+        if (deserializer.position != data.length) {
+            throw new IllegalStateException("unexpected data after the end of the tree");
+        }
+        return result;
+    }
+
+    // primitives
+
+    int readByte() {
+        if (position >= data.length) {
+            throw new IndexOutOfBoundsException("unexpected end of data");
+        }
+        return data[position++] & 0xff;
+    }
+
+    boolean readBoolean() {
+        return readByte() != 0;
+    }
+
+    int readInt() {
+        return (readByte() << 24) | (readByte() << 16) | (readByte() << 8) | readByte();
+    }
+
+    String readString() {
+        int index = readInt();
+        if (index == NULL_INDEX) {
+            return null;
+        } else if (index == NEW_STRING) {
+            int length = readInt();
+            if (length < 0 || length > (data.length - position) / 2) {
+                throw new IllegalStateException("invalid string length " + length);
+            }
+            char[] chars = new char[length];
+            for (int i = 0; i < length; i++) {
+                chars[i] = (char) ((readByte() << 8) | readByte());
+            }
+            String value = new String(chars);
+            strings.add(value);
+            return value;
+        }
+        return strings.get(index);
+    }
+
+    String[] readStrings() {
+        int length = readInt();
+        if (length == NULL_INDEX) {
+            return null;
+        }
+        String[] result = new String[checkLength(length)];
+        for (int i = 0; i < length; i++) {
+            result[i] = readString();
+        }
+        return result;
+    }
+
+    List<String> readStringList() {
+        String[] values = readStrings();
+        if (values == null) {
+            return null;
+        }
+        ArrayList<String> result = new ArrayList<>(values.length);
+        for (String value : values) {
+            result.add(value);
+        }
+        return result;
+    }
+
+    private <E extends Enum<E>> E readEnum(Class<E> enumType) {
+        String name = readString();
+        return name == null ? null : Enum.valueOf(enumType, name);
+    }
+
+    private int checkLength(int length) {
+        // every element takes at least one byte
+        if (length < 0 || length > data.length - position) {
+            throw new IllegalStateException("invalid length " + length);
+        }
+        return length;
+    }
+
+    // scopes
+
+    private ScopeInfo readScope(ScopeInfo parent) {
+        String scopeId = readString();
+        ScopeKind kind = readEnum(ScopeKind.class);
+        ScopeInfo scope = new ScopeInfo(scopeId, kind, null, parent);
+        scopes.add(scope);
+        scope.setHasAnnotations(readBoolean());
+        String[] slots = readStrings();
+        for (String identifier : slots) {
+            scope.createSlotIfNotPresent(identifier);
+        }
+        String[] names = readStrings();
+        if (names != null) {
+            for (String name : names) {
+                scope.addExplicitGlobalVariable(name);
+            }
+        }
+        names = readStrings();
+        if (names != null) {
+            for (String name : names) {
+                scope.addExplicitNonlocalVariable(name);
+            }
+        }
+        names = readStrings();
+        if (names != null) {
+            for (String name : names) {
+                scope.addCellVar(name);
+            }
+        }
+        names = readStrings();
+        if (names != null) {
+            for (String name : names) {
+                scope.addFreeVar(name);
+            }
+        }
+        int childCount = checkLength(readInt());
+        for (int i = 0; i < childCount; i++) {
+            readScope(scope);
+        }
+        return scope;
+    }
+
+    private ScopeInfo readScopeReference() {
+        int index = readInt();
+        return index == NULL_INDEX ? null : scopes.get(index);
+    }
+
+    // nodes
+
+    SSTNode[] readNodes() {
+        int length = readInt();
+        if (length == NULL_INDEX) {
+            return null;
+        }
+        SSTNode[] result = new SSTNode[checkLength(length)];
+        for (int i = 0; i < length; i++) {
+            result[i] = readNode();
+        }
+        return result;
+    }
+
+    List<SSTNode> readNodeList() {
+        SSTNode[] nodes = readNodes();
+        if (nodes == null) {
+            return null;
+        }
+        ArrayList<SSTNode> result = new ArrayList<>(nodes.length);
+        for (SSTNode node : nodes) {
+            result.add(node);
+        }
+        return result;
+    }
+
+    private ArgListBuilder readArgList() {
+        return readBoolean() ? ArgListBuilder.readFrom(this) : null;
+    }
+
+    private ArgDefListBuilder readArgDefList() {
+        return readBoolean() ? ArgDefListBuilder.readFrom(this, scopeEnvironment) : null;
+    }
+
+    SSTNode readNode() {
+        byte tag = (byte) readByte();
+        if (tag == SSTSerializer.NULL) {
+            return null;
+        }
+        int start = readInt();
+        int end = readInt();
+        SSTNode result;
+        switch (tag) {
+            case SSTSerializer.AND:
+                result = new AndSSTNode(readNodes(), start, end);
+                break;
+            case SSTSerializer.ANN_ASSIGNMENT: {
+                SSTNode lhs = readNode();
+                SSTNode type = readNode();
+                result = new AnnAssignmentSSTNode(lhs, type, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.ASSERT: {
+                SSTNode test = readNode();
+                result = new AssertSSTNode(test, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.ASSIGNMENT: {
+                SSTNode[] lhs = readNodes();
+                result = new AssignmentSSTNode(lhs, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.AUG_ASSIGNMENT: {
+                SSTNode lhs = readNode();
+                String operation = readString();
+                result = new AugAssignmentSSTNode(lhs, operation, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.BINARY_ARITHMETIC: {
+                BinaryArithmetic operation = readEnum(BinaryArithmetic.class);
+                SSTNode left = readNode();
+                result = new BinaryArithmeticSSTNode(operation, left, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.BLOCK:
+                result = new BlockSSTNode(readNodes(), start, end);
+                break;
+            case SSTSerializer.BOOLEAN_LITERAL:
+                result = new BooleanLiteralSSTNode(readBoolean(), start, end);
+                break;
+            case SSTSerializer.CALL: {
+                SSTNode target = readNode();
+                result = new CallSSTNode(target, readArgList(), start, end);
+                break;
+            }
+            case SSTSerializer.CLASS: {
+                ScopeInfo scope = readScopeReference();
+                String name = readString();
+                ArgListBuilder baseClasses = readArgList();
+                result = new ClassSSTNode(scope, name, baseClasses, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.COLLECTION: {
+                SSTNode[] values = readNodes();
+                result = new CollectionSSTNode(values, readEnum(PythonBuiltinClassType.class), start, end);
+                break;
+            }
+            case SSTSerializer.COMPARISON: {
+                SSTNode firstValue = readNode();
+                String[] operations = readStrings();
+                result = new ComparisonSSTNode(firstValue, operations, readNodes(), start, end);
+                break;
+            }
+            case SSTSerializer.DECORATED: {
+                SSTNode[] nodes = readNodes();
+                DecoratorSSTNode[] decorators = null;
+                if (nodes != null) {
+                    decorators = new DecoratorSSTNode[nodes.length];
+                    for (int i = 0; i < nodes.length; i++) {
+                        decorators[i] = (DecoratorSSTNode) nodes[i];
+                    }
+                }
+                result = new DecoratedSSTNode(decorators, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.DECORATOR: {
+                String name = readString();
+                result = new DecoratorSSTNode(name, readArgList(), start, end);
+                break;
+            }
+            case SSTSerializer.DEL:
+                result = new DelSSTNode(readNodes(), start, end);
+                break;
+            case SSTSerializer.EXCEPT: {
+                SSTNode test = readNode();
+                String asName = readString();
+                result = new ExceptSSTNode(test, asName, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.EXPRESSION_STATEMENT:
+                result = new ExpressionStatementSSTNode(readNode());
+                break;
+            case SSTSerializer.FLOAT_LITERAL: {
+                String value = readString();
+                result = new FloatLiteralSSTNode(value, readBoolean(), start, end);
+                break;
+            }
+            case SSTSerializer.FOR_COMPREHENSION: {
+                ScopeInfo scope = readScopeReference();
+                boolean async = readBoolean();
+                SSTNode target = readNode();
+                SSTNode name = readNode();
+                SSTNode[] variables = readNodes();
+                SSTNode iterator = readNode();
+                SSTNode[] conditions = readNodes();
+                PythonBuiltinClassType resultType = readEnum(PythonBuiltinClassType.class);
+                int line = readInt();
+                int level = readInt();
+                result = new ForComprehensionSSTNode(scope, async, target, name, variables, iterator, conditions, resultType, line, level, start, end);
+                break;
+            }
+            case SSTSerializer.FOR: {
+                SSTNode[] targets = readNodes();
+                SSTNode iterator = readNode();
+                SSTNode body = readNode();
+                SSTNode elseStatement = readNode();
+                ForSSTNode forNode = new ForSSTNode(targets, iterator, body, readBoolean(), start, end);
+                forNode.setElse(elseStatement);
+                forNode.setContainsBreak(readBoolean());
+                result = forNode;
+                break;
+            }
+            case SSTSerializer.FUNCTION_DEF: {
+                ScopeInfo scope = readScopeReference();
+                String name = readString();
+                String enclosingClassName = readString();
+                ArgDefListBuilder argBuilder = readArgDefList();
+                result = new FunctionDefSSTNode(scope, name, enclosingClassName, argBuilder, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.GET_ATTRIBUTE: {
+                SSTNode receiver = readNode();
+                result = new GetAttributeSSTNode(receiver, readString(), start, end);
+                break;
+            }
+            case SSTSerializer.IF: {
+                SSTNode test = readNode();
+                SSTNode thenStatement = readNode();
+                result = new IfSSTNode(test, thenStatement, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.IMPORT_FROM: {
+                ScopeInfo scope = readScopeReference();
+                String from = readString();
+                int length = readInt();
+                String[][] asNames = null;
+                if (length != NULL_INDEX) {
+                    asNames = new String[checkLength(length)][];
+                    for (int i = 0; i < length; i++) {
+                        asNames[i] = readStrings();
+                    }
+                }
+                result = new ImportFromSSTNode(scope, from, asNames, start, end);
+                break;
+            }
+            case SSTSerializer.IMPORT: {
+                ScopeInfo scope = readScopeReference();
+                String name = readString();
+                result = new ImportSSTNode(scope, name, readString(), start, end);
+                break;
+            }
+            case SSTSerializer.LAMBDA: {
+                ScopeInfo scope = readScopeReference();
+                ArgDefListBuilder args = readArgDefList();
+                result = new LambdaSSTNode(scope, args, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.NOT:
+                result = new NotSSTNode(readNode(), start, end);
+                break;
+            case SSTSerializer.NUMBER_LITERAL: {
+                String value = readString();
+                int numberStart = readInt();
+                int base = readInt();
+                NumberLiteralSSTNode number = new NumberLiteralSSTNode(value, numberStart, base, start, end);
+                number.setIsNegative(readBoolean());
+                result = number;
+                break;
+            }
+            case SSTSerializer.OR:
+                result = new OrSSTNode(readNodes(), start, end);
+                break;
+            case SSTSerializer.RAISE: {
+                SSTNode value = readNode();
+                result = new RaiseSSTNode(value, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.RETURN:
+                result = new ReturnSSTNode(readNode(), start, end);
+                break;
+            case SSTSerializer.SIMPLE:
+                result = new SimpleSSTNode(readEnum(SimpleSSTNode.Type.class), start, end);
+                break;
+            case SSTSerializer.SLICE: {
+                SSTNode sliceStart = readNode();
+                SSTNode sliceStop = readNode();
+                result = new SliceSSTNode(sliceStart, sliceStop, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.STAR:
+                result = new StarSSTNode(readNode(), start, end);
+                break;
+            case SSTSerializer.STRING_LITERAL:
+                result = new StringLiteralSSTNode(readStrings(), start, end);
+                break;
+            case SSTSerializer.SUBSCRIPT: {
+                SSTNode receiver = readNode();
+                result = new SubscriptSSTNode(receiver, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.TERNARY_ARITHMETIC: {
+                SSTNode left = readNode();
+                result = new TernaryArithmeticSSTNode(left, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.TERNARY_IF: {
+                SSTNode test = readNode();
+                SSTNode thenStatement = readNode();
+                result = new TernaryIfSSTNode(test, thenStatement, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.TRY: {
+                SSTNode body = readNode();
+                SSTNode[] nodes = readNodes();
+                ExceptSSTNode[] exceptNodes = null;
+                if (nodes != null) {
+                    exceptNodes = new ExceptSSTNode[nodes.length];
+                    for (int i = 0; i < nodes.length; i++) {
+                        exceptNodes[i] = (ExceptSSTNode) nodes[i];
+                    }
+                }
+                SSTNode elseStatement = readNode();
+                result = new TrySSTNode(body, exceptNodes, elseStatement, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.UNARY: {
+                UnaryArithmetic arithmetic = readEnum(UnaryArithmetic.class);
+                result = new UnarySSTNode(arithmetic, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.VAR_LOOKUP:
+                result = new VarLookupSSTNode(readString(), start, end);
+                break;
+            case SSTSerializer.WHILE: {
+                SSTNode test = readNode();
+                SSTNode body = readNode();
+                SSTNode elseStatement = readNode();
+                boolean containsContinue = readBoolean();
+                WhileSSTNode whileNode = new WhileSSTNode(test, body, containsContinue, readBoolean(), start, end);
+                whileNode.setElse(elseStatement);
+                result = whileNode;
+                break;
+            }
+            case SSTSerializer.WITH: {
+                SSTNode expression = readNode();
+                SSTNode target = readNode();
+                result = new WithSSTNode(expression, target, readNode(), start, end);
+                break;
+            }
+            case SSTSerializer.YIELD_EXPRESSION: {
+                SSTNode value = readNode();
+                result = new YieldExpressionSSTNode(value, readBoolean(), start, end);
+                break;
+            }
+            default:
+                throw new IllegalStateException("unknown node tag " + tag);
+        }
+        result.setStartOffset(start);
+        result.setEndOffset(end);
+        return result;
+    }
+}
@@ -0,0 +1,673 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+
+package com.oracle.graal.python.parser.sst;
+
+import java.io.ByteArrayOutputStream;
+import java.util.ArrayList;
+import java.util.Collection;
+import java.util.HashMap;
+import java.util.List;
+
+import com.oracle.graal.python.parser.ScopeInfo;
+import com.oracle.truffle.api.frame.FrameSlot;
+
+/**
+ * Writes a simple syntax tree together with the scopes created while parsing it into a compact
+ * binary form. The result can be turned back into an equivalent tree by {@link SSTDeserializer}
+ * and then be translated to Truffle nodes as if it came directly from the parser.
+ *
+ * The tree must be serialized before it is translated, since the translation adds frame slots to
+ * the scopes.
+ */
+public final class SSTSerializer implements SSTreeVisitor<Void> {
+
+    static final byte NULL = 0;
+    static final byte AND = 1;
+    static final byte ANN_ASSIGNMENT = 2;
+    static final byte ASSERT = 3;
+    static final byte ASSIGNMENT = 4;
+    static final byte AUG_ASSIGNMENT = 5;
+    static final byte BINARY_ARITHMETIC = 6;
+    static final byte BLOCK = 7;
+    static final byte BOOLEAN_LITERAL = 8;
+    static final byte CALL = 9;
+    static final byte CLASS = 10;
+    static final byte COLLECTION = 11;
+    static final byte COMPARISON = 12;
+    static final byte DECORATED = 13;
+    static final byte DECORATOR = 14;
+    static final byte DEL = 15;
+    static final byte EXCEPT = 16;
+    static final byte EXPRESSION_STATEMENT = 17;
+    static final byte FLOAT_LITERAL = 18;
+    static final byte FOR_COMPREHENSION = 19;
+    static final byte FOR = 20;
+    static final byte FUNCTION_DEF = 21;
+    static final byte GET_ATTRIBUTE = 22;
+    static final byte IF = 23;
+    static final byte IMPORT_FROM = 24;
+    static final byte IMPORT = 25;
+    static final byte LAMBDA = 26;
+    static final byte NOT = 27;
+    static final byte NUMBER_LITERAL = 28;
+    static final byte OR = 29;
+    static final byte RAISE = 30;
+    static final byte RETURN = 31;
+    static final byte SIMPLE = 32;
+    static final byte SLICE = 33;
+    static final byte STAR = 34;
+    static final byte STRING_LITERAL = 35;
+    static final byte SUBSCRIPT = 36;
+    static final byte TERNARY_ARITHMETIC = 37;
+    static final byte TERNARY_IF = 38;
+    static final byte TRY = 39;
+    static final byte UNARY = 40;
+    static final byte VAR_LOOKUP = 41;
+    static final byte WHILE = 42;
+    static final byte WITH = 43;
+    static final byte YIELD_EXPRESSION = 44;
+
+    static final int NULL_INDEX = -1;
+    static final int NEW_STRING = -2;
+
+    private final ByteArrayOutputStream out = new ByteArrayOutputStream(4096);
+    private final HashMap<String, Integer> strings = new HashMap<>();
+    private final HashMap<ScopeInfo, Integer> scopes = new HashMap<>();
+
+    private SSTSerializer() {
+    }
+
+    /**
+     * Serializes the tree {@code root} whose scopes are all nested in {@code globalScope}.
+     *
+     * @throws IllegalStateException if the tree refers to state that cannot be serialized
+     */
+    public static byte[] serialize(ScopeInfo globalScope, SSTNode root) {
+        SSTSerializer serializer = new SSTSerializer();
+        serializer.writeScope(globalScope);
+        serializer.writeNode(root);
+        return serializer.out.toByteArray();
+    }
+
+    // primitives
+
+    void writeByte(int value) {
+        out.write(value);
+    }
+
+    void writeBoolean(boolean value) {
+        out.write(value ? 1 : 0);
+    }
+
+    void writeInt(int value) {
+        out.write(value >>> 24);
+        out.write(value >>> 16);
+        out.write(value >>> 8);
+        out.write(value);
+    }
+
+    void writeString(String value) {
+        if (value == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        Integer index = strings.get(value);
+        if (index != null) {
+            writeInt(index);
+            return;
+        }
+        strings.put(value, strings.size());
+        writeInt(NEW_STRING);
+        int length = value.length();
+        writeInt(length);
+        for (int i = 0; i < length; i++) {
+            char c = value.charAt(i);
+            out.write(c >>> 8);
+            out.write(c);
+        }
+    }
+
+    void writeStrings(Collection<String> values) {
+        if (values == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        writeInt(values.size());
+        for (String value : values) {
+            writeString(value);
+        }
+    }
+
+    void writeStrings(String[] values) {
+        if (values == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        writeInt(values.length);
+        for (String value : values) {
+            writeString(value);
+        }
+    }
+
+    void writeEnum(Enum<?> value) {
+        writeString(value == null ? null : value.name());
+    }
+
+    // scopes
+
+    private void writeScope(ScopeInfo scope) {
+        scopes.put(scope, scopes.size());
+        writeString(scope.getScopeId());
+        writeEnum(scope.getScopeKind());
+        writeBoolean(scope.hasAnnotations());
+        List<? extends FrameSlot> slots = scope.getFrameDescriptor().getSlots();
+        writeInt(slots.size());
+        for (FrameSlot slot : slots) {
+            Object identifier = slot.getIdentifier();
+            if (!(identifier instanceof String)) {
+                throw new IllegalStateException("cannot serialize frame slot " + identifier);
+            }
+            writeString((String) identifier);
+        }
+        writeStrings(scope.getExplicitGlobalVariables());
+        writeStrings(scope.getExplicitNonlocalVariables());
+        writeStrings(scope.getCellVars());
+        writeStrings(scope.getFreeVars());
+        // new scopes are prepended to their parent's list of children, so we write them in
+        // reverse to get the same order back when reading
+        List<ScopeInfo> children = new ArrayList<>();
+        for (ScopeInfo child = scope.getFirstChildScope(); child != null; child = child.getNextChildScope()) {
+            children.add(child);
+        }
+        writeInt(children.size());
+        for (int i = children.size() - 1; i >= 0; i--) {
+            writeScope(children.get(i));
+        }
+    }
+
+    private void writeScopeReference(ScopeInfo scope) {
+        if (scope == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        Integer index = scopes.get(scope);
+        if (index == null) {
+            throw new IllegalStateException("scope " + scope + " is not reachable from the global scope");
+        }
+        writeInt(index);
+    }
+
+    // nodes
+
+    void writeNode(SSTNode node) {
+        if (node == null) {
+            writeByte(NULL);
+        } else {
+            node.accept(this);
+        }
+    }
+
+    void writeNodes(SSTNode[] nodes) {
+        if (nodes == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        writeInt(nodes.length);
+        for (SSTNode node : nodes) {
+            writeNode(node);
+        }
+    }
+
+    void writeNodes(List<? extends SSTNode> nodes) {
+        if (nodes == null) {
+            writeInt(NULL_INDEX);
+            return;
+        }
+        writeInt(nodes.size());
+        for (SSTNode node : nodes) {
+            writeNode(node);
+        }
+    }
+
+    private void writeHeader(byte tag, SSTNode node) {
+        writeByte(tag);
+        writeInt(node.startOffset);
+        writeInt(node.endOffset);
+    }
+
+    private void writeArgList(ArgListBuilder builder) {
+        writeBoolean(builder != null);
+        if (builder != null) {
+            builder.writeTo(this);
+        }
+    }
+
+    private void writeArgDefList(ArgDefListBuilder builder) {
+        writeBoolean(builder != null);
+        if (builder != null) {
+            builder.writeTo(this);
+        }
+    }
+
+    @Override
+    public Void visit(AndSSTNode node) {
+        writeHeader(AND, node);
+        writeNodes(node.values);
+        return null;
+    }
+
+    @Override
+    public Void visit(AnnAssignmentSSTNode node) {
+        writeHeader(ANN_ASSIGNMENT, node);
+        writeNode(node.lhs[0]);
+        writeNode(node.type);
+        writeNode(node.rhs);
+        return null;
+    }
+
+    @Override
+    public Void visit(AssertSSTNode node) {
+        writeHeader(ASSERT, node);
+        writeNode(node.test);
+        writeNode(node.message);
+        return null;
+    }
+
+    @Override
+    public Void visit(AssignmentSSTNode node) {
+        writeHeader(ASSIGNMENT, node);
+        writeNodes(node.lhs);
+        writeNode(node.rhs);
+        return null;
+    }
+
+    @Override
+    public Void visit(AugAssignmentSSTNode node) {
+        writeHeader(AUG_ASSIGNMENT, node);
+        writeNode(node.lhs);
+        writeString(node.operation);
+        writeNode(node.rhs);
+        return null;
+    }
+
+    @Override
+    public Void visit(BinaryArithmeticSSTNode node) {
+        writeHeader(BINARY_ARITHMETIC, node);
+        writeEnum(node.operation);
+        writeNode(node.left);
+        writeNode(node.right);
+        return null;
+    }
+
+    @Override
+    public Void visit(BlockSSTNode node) {
+        writeHeader(BLOCK, node);
+        writeNodes(node.statements);
+        return null;
+    }
+
+    @Override
+    public Void visit(BooleanLiteralSSTNode node) {
+        writeHeader(BOOLEAN_LITERAL, node);
+        writeBoolean(node.value);
+        return null;
+    }
+
+    @Override
+    public Void visit(CallSSTNode node) {
+        writeHeader(CALL, node);
+        writeNode(node.target);
+        writeArgList(node.parameters);
+        return null;
+    }
+
+    @Override
+    public Void visit(ClassSSTNode node) {
+        writeHeader(CLASS, node);
+        writeScopeReference(node.classScope);
+        writeString(node.name);
+        writeArgList(node.baseClasses);
+        writeNode(node.body);
+        return null;
+    }
+
+    @Override
+    public Void visit(CollectionSSTNode node) {
+        writeHeader(COLLECTION, node);
+        writeNodes(node.values);
+        writeEnum(node.type);
+        return null;
+    }
+
+    @Override
+    public Void visit(ComparisonSSTNode node) {
+        writeHeader(COMPARISON, node);
+        writeNode(node.firstValue);
+        writeStrings(node.operations);
+        writeNodes(node.otherValues);
+        return null;
+    }
+
+    @Override
+    public Void visit(DecoratedSSTNode node) {
+        writeHeader(DECORATED, node);
+        writeNodes(node.decorators);
+        writeNode(node.decorated);
+        return null;
+    }
+
+    @Override
+    public Void visit(DecoratorSSTNode node) {
+        writeHeader(DECORATOR, node);
+        writeString(node.name);
+        writeArgList(node.arg);
+        return null;
+    }
+
+    @Override
+    public Void visit(DelSSTNode node) {
+        writeHeader(DEL, node);
+        writeNodes(node.expressions);
+        return null;
+    }
+
+    @Override
+    public Void visit(ExceptSSTNode node) {
+        writeHeader(EXCEPT, node);
+        writeNode(node.test);
+        writeString(node.asName);
+        writeNode(node.body);
+        return null;
+    }
+
+    @Override
+    public Void visit(ExpressionStatementSSTNode node) {
+        writeHeader(EXPRESSION_STATEMENT, node);
+        writeNode(node.expression);
+        return null;
+    }
+
+    @Override
+    public Void visit(FloatLiteralSSTNode node) {
+        writeHeader(FLOAT_LITERAL, node);
+        writeString(node.value);
+        writeBoolean(node.imaginary);
+        return null;
+    }
+
+    @Override
+    public Void visit(ForComprehensionSSTNode node) {
+        writeHeader(FOR_COMPREHENSION, node);
+        writeScopeReference(node.scope);
+        writeBoolean(node.async);
+        writeNode(node.target);
+        writeNode(node.name);
+        writeNodes(node.variables);
+        writeNode(node.iterator);
+        writeNodes(node.conditions);
+        writeEnum(node.resultType);
+        writeInt(node.line);
+        writeInt(node.level);
+        return null;
+    }
+
+    @Override
+    public Void visit(ForSSTNode node) {
+        writeHeader(FOR, node);
+        writeNodes(node.targets);
+        writeNode(node.iterator);
+        writeNode(node.body);
+        writeNode(node.elseStatement);
+        writeBoolean(node.containsContinue);
+        writeBoolean(node.containsBreak);
+        return null;
+    }
+
+    @Override
+    public Void visit(FunctionDefSSTNode node) {
+        writeHeader(FUNCTION_DEF, node);
+        writeScopeReference(node.functionScope);
+        writeString(node.name);
+        writeString(node.enclosingClassName);
+        writeArgDefList(node.argBuilder);
+        writeNode(node.body);
+        return null;
+    }
+
+    @Override
+    public Void visit(GetAttributeSSTNode node) {
+        writeHeader(GET_ATTRIBUTE, node);
+        writeNode(node.receiver);
+        writeString(node.name);
+        return null;
+    }
+
+    @Override
+    public Void visit(IfSSTNode node) {
+        writeHeader(IF, node);
+        writeNode(node.test);
+        writeNode(node.thenStatement);
+        writeNode(node.elseStatement);
+        return null;
+    }
+
+    @Override
+    public Void visit(ImportFromSSTNode node) {
+        writeHeader(IMPORT_FROM, node);
+        writeScopeReference(node.scope);
+        writeString(node.from);
+        if (node.asNames == null) {
+            writeInt(NULL_INDEX);
+        } else {
+            writeInt(node.asNames.length);
+            for (String[] asName : node.asNames) {
+                writeStrings(asName);
+            }
+        }
+        return null;
+    }
+
+    @Override
+    public Void visit(ImportSSTNode node) {
+        writeHeader(IMPORT, node);
+        writeScopeReference(node.scope);
+        writeString(node.name);
+        writeString(node.asName);
+        return null;
+    }
+
+    @Override
+    public Void visit(LambdaSSTNode node) {
+        writeHeader(LAMBDA, node);
+        writeScopeReference(node.functionScope);
+        writeArgDefList(node.args);
+        writeNode(node.body);
+        return null;
+    }
+
+    @Override
+    public Void visit(NotSSTNode node) {
+        writeHeader(NOT, node);
+        writeNode(node.value);
+        return null;
+    }
+
+    @Override
+    public Void visit(NumberLiteralSSTNode node) {
+        writeHeader(NUMBER_LITERAL, node);
+        writeString(node.value);
+        writeInt(node.start);
+        writeInt(node.base);
+        writeBoolean(node.negative);
+        return null;
+    }
+
+    @Override
+    public Void visit(OrSSTNode node) {
+        writeHeader(OR, node);
+        writeNodes(node.values);
+        return null;
+    }
+
+    @Override
+    public Void visit(RaiseSSTNode node) {
+        writeHeader(RAISE, node);
+        writeNode(node.value);
+        writeNode(node.from);
+        return null;
+    }
+
+    @Override
+    public Void visit(ReturnSSTNode node) {
+        writeHeader(RETURN, node);
+        writeNode(node.value);
+        return null;
+    }
+
+    @Override
+    public Void visit(SimpleSSTNode node) {
+        writeHeader(SIMPLE, node);
+        writeEnum(node.type);
+        return null;
+    }
+
+    @Override
+    public Void visit(SliceSSTNode node) {
+        writeHeader(SLICE, node);
+        writeNode(node.start);
+        writeNode(node.stop);
+        writeNode(node.step);
+        return null;
+    }
+
+    @Override
+    public Void visit(StarSSTNode node) {
+        writeHeader(STAR, node);
+        writeNode(node.value);
+        return null;
+    }
+
+    @Override
+    public Void visit(StringLiteralSSTNode node) {
+        writeHeader(STRING_LITERAL, node);
+        writeStrings(node.values);
+        return null;
+    }
+
+    @Override
+    public Void visit(SubscriptSSTNode node) {
+        writeHeader(SUBSCRIPT, node);
+        writeNode(node.receiver);
+        writeNode(node.subscript);
+        return null;
+    }
+
+    @Override
+    public Void visit(TernaryArithmeticSSTNode node) {
+        writeHeader(TERNARY_ARITHMETIC, node);
+        writeNode(node.left);
+        writeNode(node.right);
+        return null;
+    }
+
+    @Override
+    public Void visit(TernaryIfSSTNode node) {
+        writeHeader(TERNARY_IF, node);
+        writeNode(node.test);
+        writeNode(node.thenStatement);
+        writeNode(node.elseStatement);
+        return null;
+    }
+
+    @Override
+    public Void visit(TrySSTNode node) {
+        writeHeader(TRY, node);
+        writeNode(node.body);
+        writeNodes(node.exceptNodes);
+        writeNode(node.elseStatement);
+        writeNode(node.finallyStatement);
+        return null;
+    }
+
+    @Override
+    public Void visit(UnarySSTNode node) {
+        writeHeader(UNARY, node);
+        writeEnum(node.arithmetic);
+        writeNode(node.value);
+        return null;
+    }
+
+    @Override
+    public Void visit(VarLookupSSTNode node) {
+        writeHeader(VAR_LOOKUP, node);
+        writeString(node.name);
+        return null;
+    }
+
+    @Override
+    public Void visit(WhileSSTNode node) {
+        writeHeader(WHILE, node);
+        writeNode(node.test);
+        writeNode(node.body);
+        writeNode(node.elseStatement);
+        writeBoolean(node.containsContinue);
+        writeBoolean(node.containsBreak);
+        return null;
+    }
+
+    @Override
+    public Void visit(WithSSTNode node) {
+        writeHeader(WITH, node);
+        writeNode(node.expression);
+        writeNode(node.target);
+        writeNode(node.body);
+        return null;
+    }
+
+    @Override
+    public Void visit(YieldExpressionSSTNode node) {
+        writeHeader(YIELD_EXPRESSION, node);
+        writeNode(node.value);
+        writeBoolean(node.isFrom);
+        return null;
+    }
+}
@@ -47,14 +47,19 @@ import java.nio.channels.Channel;
 import java.nio.channels.Channels;
 import java.nio.channels.Pipe;
 import java.nio.channels.SeekableByteChannel;
+import java.nio.channels.SelectableChannel;
+import java.nio.channels.SelectionKey;
+import java.nio.channels.Selector;
 import java.util.ArrayList;
 import java.util.Collections;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Locale;
 import java.util.Map;
+import java.util.Set;
 import java.util.SortedMap;
 import java.util.TreeMap;
+import java.util.WeakHashMap;
 
 import com.oracle.graal.python.builtins.objects.socket.PSocket;
 import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
@@ -81,6 +86,12 @@ public class PosixResources {
     private final Map<String, Integer> inodes;
     private int inodeCnt = 0;
 
+    /**
+     * Selectable channels that are in non-blocking mode only because they are registered with a
+     * selector. They are switched back to blocking mode when they leave the last selector.
+     */
+    private final Set<SelectableChannel> selectorChannels = Collections.newSetFromMap(new WeakHashMap<>());
+
     private static class ProcessGroup extends Process {
         private final List<Process> children;
 
@@ -297,6 +308,13 @@ public class PosixResources {
         addFD(fd, socket);
     }
 
+    @TruffleBoundary
+    public int openChannel(Channel channel) {
+        int fd = nextFreeFd();
+        addFD(fd, channel);
+        return fd;
+    }
+
     @TruffleBoundary(allowInlining = true)
     public void fdopen(int fd, Channel fc) {
         files.get(fd).channel = fc;
@@ -354,6 +372,52 @@ public class PosixResources {
         return new int[]{readFD, writeFD};
     }
 
+    /**
+     * Registers a channel with a selector. Selectors only accept non-blocking channels, so a
+     * blocking channel is switched to non-blocking mode until {@link #releaseSelectable} finds it
+     * is no longer registered with any selector.
+     */
+    @TruffleBoundary
+    public SelectionKey registerSelectable(SelectableChannel channel, Selector selector, int ops, Object attachment) throws IOException {
+        synchronized (selectorChannels) {
+            if (channel.isBlocking()) {
+                channel.configureBlocking(false);
+                selectorChannels.add(channel);
+            }
+            return channel.register(selector, ops, attachment);
+        }
+    }
+
+    /**
+     * Restores the blocking mode of a channel that was registered through
+     * {@link #registerSelectable}. The selector must have flushed the cancelled key already.
+     */
+    @TruffleBoundary
+    public void releaseSelectable(SelectableChannel channel) throws IOException {
+        synchronized (selectorChannels) {
+            if (!channel.isRegistered() && selectorChannels.remove(channel) && channel.isOpen()) {
+                channel.configureBlocking(true);
+            }
+        }
+    }
+
+    /**
+     * Sets the blocking mode of a channel. If the channel is currently registered with a selector,
+     * the mode is applied when it leaves the last selector.
+     */
+    @TruffleBoundary
+    public void configureBlocking(SelectableChannel channel, boolean blocking) throws IOException {
+        synchronized (selectorChannels) {
+            if (!channel.isRegistered()) {
+                channel.configureBlocking(blocking);
+            } else if (blocking) {
+                selectorChannels.add(channel);
+            } else {
+                selectorChannels.remove(channel);
+            }
+        }
+    }
+
     @TruffleBoundary(allowInlining = true)
     private int nextFreeFd() {
         synchronized (files) {
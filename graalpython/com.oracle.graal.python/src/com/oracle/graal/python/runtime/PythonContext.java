@@ -55,6 +55,7 @@ import org.graalvm.nativeimage.ImageInfo;
 import org.graalvm.options.OptionValues;
 
 import com.oracle.graal.python.PythonLanguage;
+import com.oracle.graal.python.builtins.PythonBuiltinClassType;
 import com.oracle.graal.python.builtins.objects.PNone;
 import com.oracle.graal.python.builtins.objects.PythonAbstractObject;
 import com.oracle.graal.python.builtins.objects.cext.PThreadState;
@@ -62,6 +63,8 @@ import com.oracle.graal.python.builtins.objects.cext.PythonNativeClass;
 import com.oracle.graal.python.builtins.objects.common.HashingCollectionNodes.GetDictStorageNode;
 import com.oracle.graal.python.builtins.objects.common.HashingStorage;
 import com.oracle.graal.python.builtins.objects.common.HashingStorageNodes.GetItemInteropNode;
+import com.oracle.graal.python.builtins.objects.contextvars.Hamt;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVarsContext;
 import com.oracle.graal.python.builtins.objects.dict.PDict;
 import com.oracle.graal.python.builtins.objects.frame.PFrame;
 import com.oracle.graal.python.builtins.objects.frame.PFrame.Reference;
@@ -118,6 +121,9 @@ public final class PythonContext {
         /* corresponds to 'PyThreadState.exc_*' */
         PException caughtException;
 
+        /* corresponds to 'PyThreadState.context' */
+        PContextVarsContext contextVarsContext;
+
         PythonThreadState() {
             owners = new LinkedList<>();
         }
@@ -190,6 +196,7 @@ public final class PythonContext {
     private Map<Long, PythonThreadState> threadStateMapping;
 
     private final ReentrantLock importLock = new ReentrantLock();
+    private final RegexCache regexCache = new RegexCache();
     @CompilationFinal private boolean isInitialized = false;
 
     @CompilationFinal private PythonModule builtinsModule;
@@ -270,6 +277,10 @@ public final class PythonContext {
         return importLock;
     }
 
+    public RegexCache getRegexCache() {
+        return regexCache;
+    }
+
     public PDict getImportedModules() {
         return sysModules;
     }
@@ -896,6 +907,22 @@ public final class PythonContext {
         return threadStateMapping.get(Thread.currentThread().getId());
     }
 
+    /**
+     * The {@code contextvars} context of the current thread. A thread starts out with an empty
+     * context.
+     */
+    public PContextVarsContext getContextVarsContext() {
+        PythonThreadState ts = getThreadState();
+        if (ts.contextVarsContext == null) {
+            ts.contextVarsContext = new PContextVarsContext(PythonBuiltinClassType.PContextVarsContext, Hamt.EMPTY);
+        }
+        return ts.contextVarsContext;
+    }
+
+    public void setContextVarsContext(PContextVarsContext context) {
+        getThreadState().contextVarsContext = context;
+    }
+
     public void setSentinelLockWeakref(WeakReference<PLock> sentinelLock) {
         getThreadState().sentinelLock = sentinelLock;
     }
@@ -82,6 +82,9 @@ public final class PythonOptions {
     @Option(category = OptionCategory.USER, help = "Equivalent to the Python -u flag. Force stdout and stderr to be unbuffered.", stability = OptionStability.STABLE) //
     public static final OptionKey<Boolean> UnbufferedIO = new OptionKey<>(false);
 
+    @Option(category = OptionCategory.USER, help = "Equivalent to the Python -B flag. Don't write parser cache files to __pycache__ on import.", stability = OptionStability.STABLE) //
+    public static final OptionKey<Boolean> DontWriteBytecodeFlag = new OptionKey<>(false);
+
     @Option(category = OptionCategory.USER, help = "Equivalent to the Python -I flag. Isolate from the users environment by not adding the cwd to the path", stability = OptionStability.STABLE) //
     public static final OptionKey<Boolean> IsolateFlag = new OptionKey<>(false);
 
@@ -100,15 +103,21 @@ public final class PythonOptions {
     @Option(category = OptionCategory.INTERNAL, help = "Enable catching all Exceptions in generic try-catch statements.") //
     public static final OptionKey<Boolean> CatchAllExceptions = new OptionKey<>(false);
 
+    @Option(category = OptionCategory.EXPERT, help = "Execute core files of modules like _sre, _socket or zlib only when the module is first imported instead of at startup.") //
+    public static final OptionKey<Boolean> LazyCoreFiles = new OptionKey<>(false);
+
     @Option(category = OptionCategory.EXPERT, help = "Use new experimental parser.") //
     public static final OptionKey<Boolean> UseExperimentalParser = new OptionKey<>(true);
 
     @Option(category = OptionCategory.EXPERT, help = "Prints path to parsed files") //
     public static final OptionKey<Boolean> ParserLogFiles = new OptionKey<>(false);
 
-    @Option(category = OptionCategory.EXPERT, help = "Prints parser time statistis after number of parsed files, set by this option. 0 or <0 means no statistics are printed.") //
+    @Option(category = OptionCategory.EXPERT, help = "Prints parser time and parser cache statistics after number of parsed files, set by this option. 0 or <0 means no statistics are printed.") //
     public static final OptionKey<Integer> ParserStatistics = new OptionKey<>(0);
 
+    @Option(category = OptionCategory.EXPERT, help = "Store the parsed form of Python files in __pycache__ and reuse it while the sources do not change.") //
+    public static final OptionKey<Boolean> ParserCache = new OptionKey<>(true);
+
     @Option(category = OptionCategory.EXPERT, help = "") //
     public static final OptionKey<Boolean> IntrinsifyBuiltinCalls = new OptionKey<>(true);
 
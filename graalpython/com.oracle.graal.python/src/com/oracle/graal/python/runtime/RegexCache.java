@@ -0,0 +1,134 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.runtime;
+
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.Objects;
+
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
+/**
+ * A bounded LRU cache of compiled TRegex objects of a {@link PythonContext context}. The TRegex
+ * engines are created per context with a fallback compiler that calls back into that context, so
+ * compiled regexes must not be shared between contexts. Patterns compiled by the Python fallback
+ * compiler must not be put into this cache.
+ */
+public final class RegexCache {
+
+    public static final int MAX_SIZE = 512;
+
+    public static final class Key {
+        private final String pattern;
+        private final String flags;
+        private final boolean binary;
+
+        /**
+         * @param pattern the pattern; a bytes pattern is represented by one char per byte
+         * @param flags the TRegex flags string, including the sticky flag {@code 'y'}
+         * @param binary whether the pattern was a bytes pattern
+         */
+        public Key(String pattern, String flags, boolean binary) {
+            this.pattern = pattern;
+            this.flags = flags;
+            this.binary = binary;
+        }
+
+        @Override
+        public boolean equals(Object obj) {
+            if (!(obj instanceof Key)) {
+                return false;
+            }
+            Key other = (Key) obj;
+            return binary == other.binary && pattern.equals(other.pattern) && flags.equals(other.flags);
+        }
+
+        @Override
+        public int hashCode() {
+            return Objects.hash(pattern, flags, binary);
+        }
+    }
+
+    private final LinkedHashMap<Key, Object> entries = new LinkedHashMap<Key, Object>(16, 0.75f, true) {
+        private static final long serialVersionUID = 1L;
+
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<Key, Object> eldest) {
+            return size() > MAX_SIZE;
+        }
+    };
+
+    private long hits;
+    private long misses;
+
+    @TruffleBoundary
+    public synchronized Object get(Key key) {
+        Object compiled = entries.get(key);
+        if (compiled != null) {
+            hits++;
+        } else {
+            misses++;
+        }
+        return compiled;
+    }
+
+    @TruffleBoundary
+    public synchronized void put(Key key, Object compiled) {
+        entries.put(key, compiled);
+    }
+
+    public synchronized long getHits() {
+        return hits;
+    }
+
+    public synchronized long getMisses() {
+        return misses;
+    }
+
+    public synchronized int size() {
+        return entries.size();
+    }
+
+    @TruffleBoundary
+    public synchronized void clear() {
+        entries.clear();
+    }
+}
@@ -72,4 +72,6 @@ public abstract class PythonErrorType {
     public static final PythonBuiltinClassType ZipImportError = PythonBuiltinClassType.ZipImportError;
     public static final PythonBuiltinClassType ZLibError = PythonBuiltinClassType.ZLibError;
     public static final PythonBuiltinClassType LZMAError = PythonBuiltinClassType.LZMAError;
+    public static final PythonBuiltinClassType QueueEmpty = PythonBuiltinClassType.QueueEmpty;
+    public static final PythonBuiltinClassType SocketTimeout = PythonBuiltinClassType.SocketTimeout;
 }
@@ -0,0 +1,437 @@
+/*
+ * Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+ * DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+ *
+ * The Universal Permissive License (UPL), Version 1.0
+ *
+ * Subject to the condition set forth below, permission is hereby granted to any
+ * person obtaining a copy of this software, associated documentation and/or
+ * data (collectively the "Software"), free of charge and under any and all
+ * copyright rights in the Software, and any and all patent rights owned or
+ * freely licensable by each licensor hereunder covering either (i) the
+ * unmodified Software as contributed to or provided by such licensor, or (ii)
+ * the Larger Works (as defined below), to deal in both
+ *
+ * (a) the Software, and
+ *
+ * (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+ * one is included with the Software each a "Larger Work" to which the Software
+ * is contributed by such licensors),
+ *
+ * without restriction, including without limitation the rights to copy, create
+ * derivative works of, display, perform, and distribute the Software and make,
+ * use, sell, offer for sale, import, export, have made, and have sold the
+ * Software and the Larger Work(s), and to sublicense the foregoing rights on
+ * either these or other terms.
+ *
+ * This license is subject to the following condition:
+ *
+ * The above copyright notice and either this complete permission notice or at a
+ * minimum a reference to the UPL must be included in all copies or substantial
+ * portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+package com.oracle.graal.python.runtime.formatting;
+
+import static com.oracle.graal.python.runtime.exception.PythonErrorType.ValueError;
+
+import java.util.ArrayList;
+
+import com.oracle.graal.python.runtime.PythonCore;
+import com.oracle.truffle.api.CompilerDirectives.TruffleBoundary;
+
+/**
+ * A {@code str.format} template parsed into chunks of literal text, each optionally followed by a
+ * replacement field. Parsing follows CPython's {@code MarkupIterator}, so the same structure backs
+ * {@code str.format}, {@code str.format_map} and {@code _string.formatter_parser}. A parsed
+ * template is immutable and may be cached for a constant format string.
+ */
+public final class FormatTemplate {
+    public static final int NO_CONVERSION = -1;
+
+    private static final long TOO_MANY_DIGITS = -2;
+
+    private final String[] literals;
+    private final Field[] fields;
+
+    private FormatTemplate(String[] literals, Field[] fields) {
+        this.literals = literals;
+        this.fields = fields;
+    }
+
+    /**
+     * Number of chunks; every chunk has a literal text, and possibly a replacement field.
+     */
+    public int size() {
+        return literals.length;
+    }
+
+    public String getLiteral(int i) {
+        return literals[i];
+    }
+
+    /**
+     * Returns the replacement field following the literal of chunk {@code i}, or {@code null} if
+     * the chunk is literal text only.
+     */
+    public Field getField(int i) {
+        return fields[i];
+    }
+
+    public static final class Field {
+        private final String name;
+        private final String spec;
+        private final int conversion;
+        private final boolean specNeedsExpanding;
+        private final FieldName fieldName;
+        private final FormatTemplate expandedSpec;
+
+        Field(String name, String spec, int conversion, boolean specNeedsExpanding, FieldName fieldName, FormatTemplate expandedSpec) {
+            this.name = name;
+            this.spec = spec;
+            this.conversion = conversion;
+            this.specNeedsExpanding = specNeedsExpanding;
+            this.fieldName = fieldName;
+            this.expandedSpec = expandedSpec;
+        }
+
+        public String getName() {
+            return name;
+        }
+
+        public String getSpec() {
+            return spec;
+        }
+
+        /**
+         * The conversion code point following {@code '!'}, or {@link #NO_CONVERSION}.
+         */
+        public int getConversion() {
+            return conversion;
+        }
+
+        /**
+         * Whether the format spec contains nested replacement fields.
+         */
+        public boolean specNeedsExpanding() {
+            return specNeedsExpanding;
+        }
+
+        /**
+         * The parsed field name; only available for templates parsed for rendering.
+         */
+        public FieldName getFieldName() {
+            return fieldName;
+        }
+
+        /**
+         * The parsed format spec if it needs expanding and nesting is still allowed at this level,
+         * {@code null} otherwise.
+         */
+        public FormatTemplate getExpandedSpec() {
+            return expandedSpec;
+        }
+    }
+
+    /**
+     * A field name split into its first part and the chain of attribute and item lookups. Errors
+     * in the name are not raised while parsing but recorded with their position, since CPython
+     * only reports them once the lookups preceding them have been performed.
+     */
+    public static final class FieldName {
+        private final String keyword;
+        private final long index;
+        private final Object[] lookupKeys;
+        private final boolean[] attributeLookups;
+        private final String error;
+
+        FieldName(String keyword, long index, Object[] lookupKeys, boolean[] attributeLookups, String error) {
+            this.keyword = keyword;
+            this.index = index;
+            this.lookupKeys = lookupKeys;
+            this.attributeLookups = attributeLookups;
+            this.error = error;
+        }
+
+        /**
+         * Whether the first part is empty and the argument is chosen by automatic numbering.
+         */
+        public boolean isAutoNumbered() {
+            return index < 0 && keyword.isEmpty();
+        }
+
+        /**
+         * The positional argument index, or {@code -1} if the first part is not a number.
+         */
+        public long getIndex() {
+            return index;
+        }
+
+        public String getKeyword() {
+            return keyword;
+        }
+
+        /**
+         * The first part as exposed by {@code _string.formatter_field_name_split}.
+         */
+        public Object getFirst() {
+            return index >= 0 ? toIndexObject(index) : keyword;
+        }
+
+        public int getLookupCount() {
+            return lookupKeys.length;
+        }
+
+        public Object getLookupKey(int i) {
+            return lookupKeys[i];
+        }
+
+        public boolean isAttributeLookup(int i) {
+            return attributeLookups[i];
+        }
+
+        /**
+         * The message of the {@code ValueError} to raise after all lookups have been performed, or
+         * before the argument is fetched at all if {@link #hasFirstPartError()}.
+         */
+        public String getError() {
+            return error;
+        }
+
+        public boolean hasFirstPartError() {
+            return error != null && index == TOO_MANY_DIGITS;
+        }
+    }
+
+    /**
+     * Parses a template for rendering: field names are split and format specs containing
+     * replacement fields are parsed one level deep, mirroring CPython's recursion limit.
+     */
+    @TruffleBoundary
+    public static FormatTemplate parse(PythonCore core, String template) {
+        return parse(core, template, true, true);
+    }
+
+    /**
+     * Parses a template only into its markup, as needed by {@code _string.formatter_parser}.
+     */
+    @TruffleBoundary
+    public static FormatTemplate parseMarkup(PythonCore core, String template) {
+        return parse(core, template, false, false);
+    }
+
+    private static FormatTemplate parse(PythonCore core, String template, boolean splitNames, boolean expandSpecs) {
+        ArrayList<String> literals = new ArrayList<>();
+        ArrayList<Field> fields = new ArrayList<>();
+        int len = template.length();
+        int pos = 0;
+        while (pos < len) {
+            int start = pos;
+            char c = 0;
+            boolean markupFollows = false;
+            while (pos < len) {
+                c = template.charAt(pos++);
+                if (c == '{' || c == '}') {
+                    markupFollows = true;
+                    break;
+                }
+            }
+            int literalEnd = pos;
+            if (markupFollows) {
+                boolean atEnd = pos >= len;
+                if (c == '}' && (atEnd || template.charAt(pos) != '}')) {
+                    throw core.raise(ValueError, "Single '}' encountered in format string");
+                }
+                if (c == '{' && atEnd) {
+                    throw core.raise(ValueError, "Single '{' encountered in format string");
+                }
+                if (template.charAt(pos) == c) {
+                    // an escaped brace: the literal ends with it and no field follows
+                    pos++;
+                    markupFollows = false;
+                } else {
+                    literalEnd--;
+                }
+            }
+            literals.add(template.substring(start, literalEnd));
+            if (markupFollows) {
+                pos = parseField(core, template, pos, fields, splitNames, expandSpecs);
+            } else {
+                fields.add(null);
+            }
+        }
+        return new FormatTemplate(literals.toArray(new String[0]), fields.toArray(new Field[0]));
+    }
+
+    private static int parseField(PythonCore core, String template, int fieldStart, ArrayList<Field> fields, boolean splitNames, boolean expandSpecs) {
+        int len = template.length();
+        int pos = fieldStart;
+        char c = 0;
+        scan: while (pos < len) {
+            c = template.charAt(pos++);
+            switch (c) {
+                case '{':
+                    throw core.raise(ValueError, "unexpected '{' in field name");
+                case '[':
+                    while (pos < len && template.charAt(pos) != ']') {
+                        pos++;
+                    }
+                    break;
+                case '}':
+                case ':':
+                case '!':
+                    break scan;
+                default:
+                    break;
+            }
+        }
+        if (c != '}' && c != ':' && c != '!') {
+            throw core.raise(ValueError, "expected '}' before end of string");
+        }
+        String name = template.substring(fieldStart, pos - 1);
+        int conversion = NO_CONVERSION;
+        String spec = "";
+        boolean specNeedsExpanding = false;
+        if (c != '}') {
+            if (c == '!') {
+                if (pos >= len) {
+                    throw core.raise(ValueError, "end of string while looking for conversion specifier");
+                }
+                conversion = template.codePointAt(pos);
+                pos += Character.charCount(conversion);
+                if (pos < len) {
+                    c = template.charAt(pos++);
+                    if (c == '}') {
+                        fields.add(createField(core, name, spec, conversion, false, splitNames, expandSpecs));
+                        return pos;
+                    } else if (c != ':') {
+                        throw core.raise(ValueError, "expected ':' after conversion specifier");
+                    }
+                }
+            }
+            int specStart = pos;
+            int count = 1;
+            while (pos < len) {
+                c = template.charAt(pos++);
+                if (c == '{') {
+                    specNeedsExpanding = true;
+                    count++;
+                } else if (c == '}' && --count == 0) {
+                    spec = template.substring(specStart, pos - 1);
+                    fields.add(createField(core, name, spec, conversion, specNeedsExpanding, splitNames, expandSpecs));
+                    return pos;
+                }
+            }
+            throw core.raise(ValueError, "unmatched '{' in format spec");
+        }
+        fields.add(createField(core, name, spec, conversion, false, splitNames, expandSpecs));
+        return pos;
+    }
+
+    private static Field createField(PythonCore core, String name, String spec, int conversion, boolean specNeedsExpanding, boolean splitNames, boolean expandSpecs) {
+        FieldName fieldName = splitNames ? splitFieldName(name) : null;
+        FormatTemplate expandedSpec = specNeedsExpanding && expandSpecs ? parse(core, spec, true, false) : null;
+        return new Field(name, spec, conversion, specNeedsExpanding, fieldName, expandedSpec);
+    }
+
+    /**
+     * Splits a field name like {@code 0.attr[key]} into its first part and lookup chain.
+     */
+    @TruffleBoundary
+    public static FieldName splitFieldName(String name) {
+        int len = name.length();
+        int pos = 0;
+        while (pos < len && name.charAt(pos) != '.' && name.charAt(pos) != '[') {
+            pos++;
+        }
+        String first = name.substring(0, pos);
+        long index = parseIndex(first);
+        if (index == TOO_MANY_DIGITS) {
+            return new FieldName(first, index, new Object[0], new boolean[0], "Too many decimal digits in format string");
+        }
+        ArrayList<Object> keys = new ArrayList<>();
+        ArrayList<Boolean> attributes = new ArrayList<>();
+        String error = null;
+        while (pos < len) {
+            char c = name.charAt(pos++);
+            int start = pos;
+            String key;
+            Object lookupKey;
+            if (c == '.') {
+                while (pos < len && name.charAt(pos) != '.' && name.charAt(pos) != '[') {
+                    pos++;
+                }
+                key = name.substring(start, pos);
+                lookupKey = key;
+            } else if (c == '[') {
+                while (pos < len && name.charAt(pos) != ']') {
+                    pos++;
+                }
+                if (pos >= len) {
+                    error = "Missing ']' in format string";
+                    break;
+                }
+                key = name.substring(start, pos++);
+                long keyIndex = parseIndex(key);
+                if (keyIndex == TOO_MANY_DIGITS) {
+                    error = "Too many decimal digits in format string";
+                    break;
+                }
+                lookupKey = keyIndex >= 0 ? toIndexObject(keyIndex) : key;
+            } else {
+                error = "Only '.' or '[' may follow ']' in format field specifier";
+                break;
+            }
+            if (key.isEmpty()) {
+                error = "Empty attribute in format string";
+                break;
+            }
+            keys.add(lookupKey);
+            attributes.add(c == '.');
+        }
+        boolean[] attributeLookups = new boolean[attributes.size()];
+        for (int i = 0; i < attributeLookups.length; i++) {
+            attributeLookups[i] = attributes.get(i);
+        }
+        return new FieldName(first, index, keys.toArray(), attributeLookups, error);
+    }
+
+    /**
+     * Parses a string of decimal digits like CPython's {@code get_integer}: returns {@code -1} if
+     * the string is empty or contains a non-digit, and {@link #TOO_MANY_DIGITS} on overflow.
+     */
+    private static long parseIndex(String s) {
+        if (s.isEmpty()) {
+            return -1;
+        }
+        long value = 0;
+        int i = 0;
+        while (i < s.length()) {
+            int codePoint = s.codePointAt(i);
+            int digit = Character.digit(codePoint, 10);
+            if (digit < 0) {
+                return -1;
+            }
+            if (value > (Long.MAX_VALUE - digit) / 10) {
+                return TOO_MANY_DIGITS;
+            }
+            value = value * 10 + digit;
+            i += Character.charCount(codePoint);
+        }
+        return value;
+    }
+
+    private static Object toIndexObject(long index) {
+        if (index == (int) index) {
+            return (int) index;
+        }
+        return index;
+    }
+}
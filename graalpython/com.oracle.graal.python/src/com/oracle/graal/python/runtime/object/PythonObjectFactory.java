@@ -28,7 +28,6 @@ package com.oracle.graal.python.runtime.object;
 import java.io.ByteArrayOutputStream;
 import java.lang.ref.ReferenceQueue;
 import java.math.BigInteger;
-import java.nio.channels.SeekableByteChannel;
 import java.nio.file.DirectoryStream;
 import java.util.Map;
 
@@ -50,6 +49,12 @@ import com.oracle.graal.python.builtins.objects.common.HashingStorage;
 import com.oracle.graal.python.builtins.objects.common.LocalsStorage;
 import com.oracle.graal.python.builtins.objects.common.PHashingCollection;
 import com.oracle.graal.python.builtins.objects.complex.PComplex;
+import com.oracle.graal.python.builtins.objects.contextvars.Hamt;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVar;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVarsContext;
+import com.oracle.graal.python.builtins.objects.contextvars.PContextVarsToken;
+import com.oracle.graal.python.builtins.objects.deque.PDeque;
+import com.oracle.graal.python.builtins.objects.deque.PDequeIter;
 import com.oracle.graal.python.builtins.objects.dict.PDict;
 import com.oracle.graal.python.builtins.objects.dict.PDictView;
 import com.oracle.graal.python.builtins.objects.dict.PDictView.PDictItemsView;
@@ -81,6 +86,12 @@ import com.oracle.graal.python.builtins.objects.iterator.PSentinelIterator;
 import com.oracle.graal.python.builtins.objects.iterator.PSequenceIterator;
 import com.oracle.graal.python.builtins.objects.iterator.PStringIterator;
 import com.oracle.graal.python.builtins.objects.iterator.PZip;
+import com.oracle.graal.python.builtins.objects.itertools.PAccumulate;
+import com.oracle.graal.python.builtins.objects.itertools.PChain;
+import com.oracle.graal.python.builtins.objects.itertools.PGroupBy;
+import com.oracle.graal.python.builtins.objects.itertools.PGrouper;
+import com.oracle.graal.python.builtins.objects.itertools.PIslice;
+import com.oracle.graal.python.builtins.objects.itertools.PZipLongest;
 import com.oracle.graal.python.builtins.objects.list.PList;
 import com.oracle.graal.python.builtins.objects.lzma.PLZMACompressor;
 import com.oracle.graal.python.builtins.objects.lzma.PLZMADecompressor;
@@ -90,12 +101,15 @@ import com.oracle.graal.python.builtins.objects.memoryview.PMemoryView;
 import com.oracle.graal.python.builtins.objects.method.PBuiltinMethod;
 import com.oracle.graal.python.builtins.objects.method.PDecoratedMethod;
 import com.oracle.graal.python.builtins.objects.method.PMethod;
+import com.oracle.graal.python.builtins.objects.mmap.MMapChannel;
 import com.oracle.graal.python.builtins.objects.mmap.PMMap;
 import com.oracle.graal.python.builtins.objects.module.PythonModule;
 import com.oracle.graal.python.builtins.objects.object.PythonObject;
+import com.oracle.graal.python.builtins.objects.partial.PPartial;
 import com.oracle.graal.python.builtins.objects.posix.PDirEntry;
 import com.oracle.graal.python.builtins.objects.posix.PScandirIterator;
 import com.oracle.graal.python.builtins.objects.random.PRandom;
+import com.oracle.graal.python.builtins.objects.queue.PSimpleQueue;
 import com.oracle.graal.python.builtins.objects.range.PRange;
 import com.oracle.graal.python.builtins.objects.referencetype.PReferenceType;
 import com.oracle.graal.python.builtins.objects.reversed.PSequenceReverseIterator;
@@ -333,6 +347,10 @@ public abstract class PythonObjectFactory extends Node {
         return trace(new PRandom(cls));
     }
 
+    public PDeque createDeque(LazyPythonClass cls) {
+        return trace(new PDeque(cls));
+    }
+
     /*
      * Classes, methods and functions
      */
@@ -676,7 +694,7 @@ public abstract class PythonObjectFactory extends Node {
      * Iterators
      */
 
-    public PStringIterator createStringIterator(String str) {
+    public PStringIterator createStringIterator(CharSequence str) {
         return trace(new PStringIterator(PythonBuiltinClassType.PIterator, str));
     }
 
@@ -714,6 +732,38 @@ public abstract class PythonObjectFactory extends Node {
         return trace(object);
     }
 
+    public PDequeIter createDequeIter(PDeque deque) {
+        return trace(new PDequeIter(PythonBuiltinClassType.PDequeIter, deque, false));
+    }
+
+    public PDequeIter createDequeRevIter(PDeque deque) {
+        return trace(new PDequeIter(PythonBuiltinClassType.PDequeRevIter, deque, true));
+    }
+
+    public PChain createChain(LazyPythonClass cls, Object source) {
+        return trace(new PChain(cls, source));
+    }
+
+    public PIslice createIslice(LazyPythonClass cls, Object iterator, long start, long stop, long step) {
+        return trace(new PIslice(cls, iterator, start, stop, step));
+    }
+
+    public PGroupBy createGroupBy(LazyPythonClass cls, Object iterator, Object keyFunc) {
+        return trace(new PGroupBy(cls, iterator, keyFunc));
+    }
+
+    public PGrouper createGrouper(PGroupBy parent, Object targetKey) {
+        return trace(new PGrouper(PythonBuiltinClassType.PGrouper, parent, targetKey));
+    }
+
+    public PAccumulate createAccumulate(LazyPythonClass cls, Object iterator, Object func) {
+        return trace(new PAccumulate(cls, iterator, func));
+    }
+
+    public PZipLongest createZipLongest(LazyPythonClass cls, Object[] iterators, Object fillValue) {
+        return trace(new PZipLongest(cls, iterators, fillValue));
+    }
+
     public PArrayIterator createArrayIterator(PArray array) {
         return trace(new PArrayIterator(PythonBuiltinClassType.PArrayIterator, array));
     }
@@ -799,6 +849,30 @@ public abstract class PythonObjectFactory extends Node {
      * Threading
      */
 
+    public PSimpleQueue createSimpleQueue(LazyPythonClass cls) {
+        return trace(new PSimpleQueue(cls));
+    }
+
+    public PContextVar createContextVar(LazyPythonClass cls, String name, Object defaultValue) {
+        return trace(new PContextVar(cls, name, defaultValue));
+    }
+
+    public PContextVarsContext createContextVarsContext(Hamt vars) {
+        return trace(new PContextVarsContext(PythonBuiltinClassType.PContextVarsContext, vars));
+    }
+
+    public PContextVarsContext createContextVarsContext(LazyPythonClass cls, Hamt vars) {
+        return trace(new PContextVarsContext(cls, vars));
+    }
+
+    public PPartial createPartial(LazyPythonClass cls, Object function, Object[] args, PKeyword[] keywords) {
+        return trace(new PPartial(cls, function, createTuple(args), args, createDict(keywords)));
+    }
+
+    public PContextVarsToken createContextVarsToken(PContextVarsContext context, PContextVar var, Object oldValue) {
+        return trace(new PContextVarsToken(PythonBuiltinClassType.PContextVarsToken, context, var, oldValue));
+    }
+
     public PLock createLock() {
         return trace(new PLock(PythonBuiltinClassType.PLock));
     }
@@ -839,11 +913,11 @@ public abstract class PythonObjectFactory extends Node {
         return trace(new PDirEntry(cls, name, file));
     }
 
-    public PMMap createMMap(SeekableByteChannel channel, long length, long offset) {
+    public PMMap createMMap(MMapChannel channel, long length, long offset) {
         return trace(new PMMap(PythonBuiltinClassType.PMMap, channel, length, offset));
     }
 
-    public PMMap createMMap(LazyPythonClass clazz, SeekableByteChannel channel, long length, long offset) {
+    public PMMap createMMap(LazyPythonClass clazz, MMapChannel channel, long length, long offset) {
         return trace(new PMMap(clazz, channel, length, offset));
     }
 
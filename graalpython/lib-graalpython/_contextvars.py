@@ -37,31 +37,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-class Context:
-    pass
 
+class _TokenMissing:
+    def __repr__(self):
+        return '<Token.MISSING>'
 
-class ContextVar:
-    def __init__(self, name, default=None):
-        self._name = name
-        self._value = default
-                
-    def get(self):
-        if self._value is None:
-            raise LookupError
-        return self._value
-    
-    def set(self, value):
-        self._value = value
-        
-    def reset(self, token):
-        pass
 
+Token.MISSING = _TokenMissing()
+del _TokenMissing
 
-class Token:
-    pass
 
+def _contextvar_repr(self):
+    return "<ContextVar name=%r at 0x%x>" % (self.name, id(self))
 
-def copy_context():
-    raise NotImplementedError
 
+def _token_repr(self):
+    return "<Token var=%r at 0x%x>" % (self.var, id(self))
+
+
+ContextVar.__repr__ = _contextvar_repr
+Token.__repr__ = _token_repr
@@ -49,18 +49,15 @@ def reduce(function, iterable, initializer=None):
     return value
 
 
-class partial:
-    def __init__(self, func, *args, **keywords):
-        def newfunc(*fargs, **fkeywords):
-            newkeywords = keywords.copy()
-            newkeywords.update(fkeywords)
-            return func(*args, *fargs, **newkeywords)
-        self.func = func
-        self.args = args
-        self.keywords = keywords
-        self.newfunc = newfunc
-    
-    def __call__(self, *args, **keywords):
-        return self.newfunc(*args, **keywords)
-    
-    # TODO: correctly implement '__reduce__' and '__setstate__'
+def _partial_repr(self):
+    args = [repr(self.func)]
+    args.extend(repr(x) for x in self.args)
+    args.extend("%s=%r" % (k, v) for (k, v) in self.keywords.items())
+    if type(self) is partial:
+        name = "functools.partial"
+    else:
+        name = type(self).__qualname__
+    return "%s(%s)" % (name, ", ".join(args))
+
+
+partial.__repr__ = _partial_repr
@@ -104,14 +104,13 @@ SHUT_RD = 0
 SHUT_WR = 1
 SHUT_RDWR = 2
 
+# Flags for send and receive, must match PSocket.MSG_PEEK
+MSG_PEEK = 2
+
 has_ipv6 = False  #: TODO implement me
 error = OSError
 
 
-class timeout(OSError):
-    pass
-
-
 __default_timeout = None
 
 
@@ -41,9 +41,6 @@ from mmap import mmap
 
 _mappingpoxy = type(type.__dict__)
 
-def default(value, default):
-    return default if not value else value
-
 def maxsize():
     import sys
     return sys.maxsize
@@ -154,6 +151,12 @@ CODESIZE = 4
 MAGIC = 20171005
 MAXREPEAT = 4294967295
 MAXGROUPS = 2147483647
+# upper bound for the number of compiled replacement templates kept per pattern
+_MAXTEMPLATES = 512
+# escapes that are replaced by a single character in replacement templates
+_TEMPLATE_ESCAPES = {'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v', '\\': '\\'}
+_ASCII_LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
 FLAG_NAMES = ["re.TEMPLATE", "re.IGNORECASE", "re.LOCALE", "re.MULTILINE",
               "re.DOTALL", "re.UNICODE", "re.VERBOSE", "re.DEBUG",
               "re.ASCII"]
@@ -255,11 +258,13 @@ class SRE_Pattern():
                 flags_str.append(char)
         self.flags_str = "".join(flags_str)
         self.__compiled_regexes = dict()
+        self.__templates = dict()
         groupindex = dict()
-        if self.__tregex_compile(self.pattern).groups is not None:
-            for group_name in dir(self.__tregex_compile(self.pattern).groups):
-                groups = self.__tregex_compile(self.pattern).groups
-                self.groups = len(dir(groups))
+        groups = self.__tregex_compile(self.pattern).groups
+        if groups is not None:
+            group_names = dir(groups)
+            self.groups = len(group_names)
+            for group_name in group_names:
                 groupindex[group_name] = groups[group_name]
         self.groupindex = _mappingpoxy(groupindex)
 
@@ -310,29 +315,24 @@ class SRE_Pattern():
 
     def _search(self, pattern, string, pos, endpos, sticky=False):
         pattern = self.__tregex_compile(pattern, self.flags_str + ("y" if sticky else ""))
-        input_str = string
-        if endpos == -1 or endpos >= len(string):
-            endpos = len(string)
-            result = tregex_call_exec(pattern.exec, input_str, min(pos, len(string) + 1))
-        else:
-            input_str = string[:endpos]
-            result = tregex_call_exec(pattern.exec, input_str, min(pos, endpos % len(string) + 1))
+        subject, endpos = self.__bounded(string, endpos)
+        result = tregex_call_exec(pattern.exec, subject, min(pos, endpos + 1))
         if result.isMatch:
-            return SRE_Match(self, pos, endpos, result, input_str, pattern)
+            return SRE_Match(self, pos, endpos, result, string, pattern)
         else:
             return None
 
     def search(self, string, pos=0, endpos=None):
         self.__check_input_type(string)
-        return self._search(self.pattern, string, pos, default(endpos, -1))
+        return self._search(self.pattern, string, pos, endpos)
 
     def match(self, string, pos=0, endpos=None):
         self.__check_input_type(string)
-        return self._search(self.pattern, string, pos, default(endpos, -1), sticky=True)
+        return self._search(self.pattern, string, pos, endpos, sticky=True)
 
     def fullmatch(self, string, pos=0, endpos=None):
         self.__check_input_type(string)
-        return self._search(_append_end_assert(self.pattern), string, pos, default(endpos, -1), sticky=True)
+        return self._search(_append_end_assert(self.pattern), string, pos, endpos, sticky=True)
 
     def __sanitize_out_type(self, elem):
         """Helper function for findall and split. Ensures that the type of the elements of the
@@ -344,101 +344,140 @@ class SRE_Pattern():
         else:
             return str(elem)
 
-    def finditer(self, string, pos=0, endpos=-1):
+    @staticmethod
+    def __bounded(string, endpos):
+        """Returns the subject restricted to [0, endpos) and the clamped endpos. None and values
+           past the end select the whole subject, negative values are clamped to 0."""
+        length = len(string)
+        if endpos is None or endpos >= length:
+            return string, length
+        # restrict matching to [0, endpos) without copying the subject
+        endpos = max(endpos, 0)
+        return tregex_bounded_input(string, endpos), endpos
+
+    def finditer(self, string, pos=0, endpos=None):
         self.__check_input_type(string)
-        if endpos > len(string) or len(string) == 0:
-            endpos = len(string)
-        elif endpos < 0:
-            endpos = endpos % len(string) + 1
-        while pos < endpos:
-            compiled_regex = self.__tregex_compile(self.pattern)
-            result = tregex_call_exec(compiled_regex.exec, string, pos)
-            if not result.isMatch:
-                break
-            else:
-                yield SRE_Match(self, pos, endpos, result, string, compiled_regex)
-            no_progress = (result.getStart(0) == result.getEnd(0))
-            pos = result.getEnd(0) + no_progress
+        subject, endpos = self.__bounded(string, endpos)
+        compiled_regex = self.__tregex_compile(self.pattern)
+        group_count = compiled_regex.groupCount
+        bounds = tregex_search_all(compiled_regex.exec, subject, pos, endpos, group_count, 0)
+        stride = 2 * group_count
+        for i in range(0, len(bounds), stride):
+            result = _RegexResult(string, True, group_count, bounds[i:i + stride:2], bounds[i + 1:i + stride:2])
+            yield SRE_Match(self, pos, endpos, result, string, compiled_regex)
         return
 
-    def findall(self, string, pos=0, endpos=-1):
+    def findall(self, string, pos=0, endpos=None):
         self.__check_input_type(string)
-        if endpos > len(string):
-            endpos = len(string)
-        elif endpos < 0 and len(string) > 0:
-            endpos = endpos % len(string) + 1
+        subject, endpos = self.__bounded(string, endpos)
+        compiled_regex = self.__tregex_compile(self.pattern)
+        group_count = compiled_regex.groupCount
+        bounds = tregex_search_all(compiled_regex.exec, subject, pos, endpos, group_count, 0)
+        stride = 2 * group_count
+        sanitize = self.__sanitize_out_type
+        if group_count <= 2:
+            # report the whole match, or the only group
+            offset = 0 if group_count == 1 else 2
+            # unmatched groups have bounds (-1, -1) and thus yield an empty slice
+            return [sanitize(string[bounds[i]:bounds[i + 1]]) for i in range(offset, len(bounds), stride)]
         matchlist = []
-        while pos < endpos:
-            compiled_regex = self.__tregex_compile(self.pattern)
-            result = tregex_call_exec(compiled_regex.exec, string, pos)
-            if not result.isMatch:
-                break
-            elif compiled_regex.groupCount == 1:
-                matchlist.append(self.__sanitize_out_type(string[result.getStart(0):result.getEnd(0)]))
-            elif compiled_regex.groupCount == 2:
-                matchlist.append(self.__sanitize_out_type(string[result.getStart(1):result.getEnd(1)]))
-            else:
-                matchlist.append(tuple(map(self.__sanitize_out_type, SRE_Match(self, pos, endpos, result, string, compiled_regex).groups())))
-            no_progress = (result.getStart(0) == result.getEnd(0))
-            pos = result.getEnd(0) + no_progress
+        for i in range(0, len(bounds), stride):
+            groups = []
+            for j in range(i + 2, i + stride, 2):
+                groups.append(sanitize(string[bounds[j]:bounds[j + 1]]))
+            matchlist.append(tuple(groups))
         return matchlist
 
-    def __replace_groups(self, repl, string, match_result, pattern):
-        def group(pattern, match_result, group_nr, string):
-            if group_nr >= pattern.groupCount:
-                return None
-            group_start = match_result.getStart(group_nr)
-            group_end = match_result.getEnd(group_nr)
-            return string[group_start:group_end]
-
+    def __compile_template(self, repl, pattern):
+        """Compiles a replacement string into a list of literal chunks and group indices. Literal
+           chunks have the type of the pattern, group references are represented as ints."""
+        if self.__binary:
+            # work on a latin-1 view so that bytes and str templates share one parser
+            repl = bytes(repl).decode('latin-1')
+        template = []
+        literal = []
         n = len(repl)
-        result = b"" if self.__binary else ""
-        start = 0
-        backslash = b'\\' if self.__binary else '\\'
-        pos = repl.find(backslash, start)
-        while pos != -1 and start < n:
-            if pos+1 < n:
-                if repl[pos + 1].isdigit() and pattern.groupCount > 0:
-                    # TODO: Should handle backreferences longer than 1 digit and fall back to octal escapes.
-                    group_nr = int(repl[pos+1].decode('ascii')) if self.__binary else int(repl[pos+1])
-                    group_str = group(pattern, match_result, group_nr, string)
-                    if group_str is None:
-                        raise error("invalid group reference %s at position %s" % (group_nr, pos))
-                    result += repl[start:pos] + group_str
-                    start = pos + 2
-                elif repl[pos + 1] == (b'g' if self.__binary else 'g'):
-                    group_ref, group_ref_end, digits_only = self.__extract_groupname(repl, pos + 2)
-                    if group_ref:
-                        group_str = group(pattern, match_result, int(group_ref) if digits_only else pattern.groups[group_ref], string)
-                        if group_str is None:
-                            raise error("invalid group reference %s at position %s" % (group_ref, pos))
-                        result += repl[start:pos] + group_str
-                    start = group_ref_end + 1
-                elif repl[pos + 1] == backslash:
-                    result += repl[start:pos] + backslash
-                    start = pos + 2
+        i = 0
+        while i < n:
+            c = repl[i]
+            i += 1
+            if c != '\\':
+                literal.append(c)
+                continue
+            if i >= n:
+                raise error("bad escape (end of pattern)", repl, i - 1)
+            c = repl[i]
+            i += 1
+            if c == 'g':
+                if i >= n or repl[i] != '<':
+                    raise error("missing <", repl, i)
+                close = repl.find('>', i + 1)
+                if close == -1:
+                    raise error("missing >, unterminated name", repl, i + 1)
+                name = repl[i + 1:close]
+                if not name:
+                    raise error("missing group name", repl, i + 1)
+                if name.isdigit():
+                    group_nr = int(name)
+                elif name in self.groupindex:
+                    group_nr = self.groupindex[name]
+                elif name.isidentifier():
+                    raise IndexError("unknown group name '%s'" % name)
                 else:
-                    assert False, "unexpected escape in re.sub"
-            pos = repl.find(backslash, start)
-        result += repl[start:]
-        return result
-
-
-    def __extract_groupname(self, repl, pos):
-        if repl[pos] == (b'<' if self.__binary else '<'):
-            digits_only = True
-            n = len(repl)
-            i = pos + 1
-            while i < n and repl[i] != (b'>' if self.__binary else '>'):
-                digits_only = digits_only and repl[i].isdigit()
-                i += 1
-            if i < n:
-                # found '>'
-                group_ref = repl[pos + 1 : i]
-                group_ref_str = group_ref.decode('ascii') if self.__binary else group_ref
-                return group_ref_str, i, digits_only
-        return None, pos, False
-
+                    raise error("bad character in group name '%s'" % name, repl, i + 1)
+                i = close + 1
+            elif c == '0':
+                # octal escape of up to three digits
+                value = 0
+                digits = 0
+                while digits < 2 and i < n and repl[i] in '01234567':
+                    value = value * 8 + int(repl[i])
+                    i += 1
+                    digits += 1
+                literal.append(chr(value))
+                continue
+            elif c.isdigit():
+                group_nr = int(c)
+                if i < n and repl[i].isdigit():
+                    if c in '01234567' and repl[i] in '01234567' and i + 1 < n and repl[i + 1] in '01234567':
+                        value = int(repl[i - 1:i + 2], 8)
+                        if value > 0o377:
+                            raise error("octal escape value \\%s outside of range 0-0o377" % repl[i - 1:i + 2], repl, i - 2)
+                        literal.append(chr(value))
+                        i += 2
+                        continue
+                    group_nr = group_nr * 10 + int(repl[i])
+                    i += 1
+            elif c in _TEMPLATE_ESCAPES:
+                literal.append(_TEMPLATE_ESCAPES[c])
+                continue
+            elif c in _ASCII_LETTERS:
+                raise error("bad escape \\%s" % c, repl, i - 2)
+            else:
+                # unknown non-letter escapes are kept as they are
+                literal.append('\\' + c)
+                continue
+            if group_nr >= pattern.groupCount:
+                raise error("invalid group reference %s" % group_nr, repl, i - 1)
+            if literal:
+                template.append("".join(literal))
+                literal = []
+            template.append(group_nr)
+        if literal:
+            template.append("".join(literal))
+        if self.__binary:
+            template = [item.encode('latin-1') if isinstance(item, str) else item for item in template]
+        return template
+
+    def __get_template(self, repl, pattern):
+        key = repl if isinstance(repl, (str, bytes)) else bytes(repl)
+        template = self.__templates.get(key)
+        if template is None:
+            template = self.__compile_template(repl, pattern)
+            if len(self.__templates) >= _MAXTEMPLATES:
+                self.__templates.clear()
+            self.__templates[key] = template
+        return template
 
     def sub(self, repl, string, count=0):
         return self.subn(repl, string, count)[0]
@@ -452,10 +491,7 @@ class SRE_Pattern():
         is_string_rep = isinstance(repl, str) or _is_bytes_like(repl)
         if is_string_rep:
             self.__check_input_type(repl)
-            try:
-                repl = _process_escape_sequences(repl)
-            except ValueError as e:
-                raise error(str(e))
+            template = self.__get_template(repl, pattern)
         while (count == 0 or n < count) and pos <= len(string):
             match_result = tregex_call_exec(pattern.exec, string, pos)
             if not match_result.isMatch:
@@ -465,7 +501,13 @@ class SRE_Pattern():
             end = match_result.getEnd(0)
             result.append(string[pos:start])
             if is_string_rep:
-                result.append(self.__replace_groups(repl, string, match_result, pattern))
+                for item in template:
+                    if item.__class__ is int:
+                        group_start = match_result.getStart(item)
+                        if group_start >= 0:
+                            result.append(string[group_start:match_result.getEnd(item)])
+                    else:
+                        result.append(item)
             else:
                 _srematch = SRE_Match(self, pos, -1, match_result, string, pattern)
                 _repl = repl(_srematch)
@@ -482,31 +524,24 @@ class SRE_Pattern():
             return ("".join(result), n)
 
     def split(self, string, maxsplit=0):
-        n = 0
         pattern = self.__tregex_compile(self.pattern)
+        group_count = pattern.groupCount
+        bounds = tregex_search_all(pattern.exec, string, 0, len(string), group_count, maxsplit)
+        stride = 2 * group_count
+        sanitize = self.__sanitize_out_type
         result = []
         collect_pos = 0
-        search_pos = 0
-        while (maxsplit == 0 or n < maxsplit) and search_pos <= len(string):
-            match_result = tregex_call_exec(pattern.exec, string, search_pos)
-            if not match_result.isMatch:
-                break
-            n += 1
-            start = match_result.getStart(0)
-            end = match_result.getEnd(0)
-            result.append(self.__sanitize_out_type(string[collect_pos:start]))
+        for i in range(0, len(bounds), stride):
+            result.append(sanitize(string[collect_pos:bounds[i]]))
             # add all group strings
-            for i in range(1, pattern.groupCount):
-                groupStart = match_result.getStart(i)
-                if groupStart >= 0:
-                    result.append(self.__sanitize_out_type(string[groupStart:match_result.getEnd(i)]))
+            for j in range(i + 2, i + stride, 2):
+                group_start = bounds[j]
+                if group_start >= 0:
+                    result.append(sanitize(string[group_start:bounds[j + 1]]))
                 else:
                     result.append(None)
-            collect_pos = end
-            search_pos = end
-            if start == end:
-                search_pos = search_pos + 1
-        result.append(self.__sanitize_out_type(string[collect_pos:]))
+            collect_pos = bounds[i + 1]
+        result.append(sanitize(string[collect_pos:]))
         return result
 
 
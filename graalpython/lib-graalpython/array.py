@@ -37,13 +37,24 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-def frombytes(self, bytesLike):
-    for b in bytesLike:
-        self.append(b)
+def fromfile(self, f, n):
+    if not isinstance(n, int):
+        raise TypeError("an integer is required")
+    if n < 0:
+        raise ValueError("negative count")
+    itemsize = self.itemsize
+    nbytes = n * itemsize
+    b = f.read(nbytes)
+    if not isinstance(b, bytes):
+        raise TypeError("read() didn't return bytes")
+    self.frombytes(b[:len(b) - len(b) % itemsize])
+    if len(b) != nbytes:
+        raise EOFError("read() didn't return enough bytes")
 
 
-def fromfile(self, f, n):
-    self.frombytes(f.read(n))
+def tofile(self, f):
+    f.write(self.tobytes())
+
 
-array.frombytes = frombytes
 array.fromfile = fromfile
+array.tofile = tofile
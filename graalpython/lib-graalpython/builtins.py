@@ -76,4 +76,3 @@ __import__("%s/property.py", "builtins")
 __import__("%s/exceptions.py", "builtins")
 __import__("%s/super.py", "builtins")
 __import__("%s/ellipsis.py", "builtins")
-__import__("%s/timsort.py", "builtins")
@@ -47,4 +47,3 @@ def strip(self, what=None):
 
 
 bytearray.strip = strip
-bytearray.rfind = bytes.rfind
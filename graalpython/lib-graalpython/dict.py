@@ -37,28 +37,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-def update(self, E=None, **F):
-    """
-    D.update([E, ]**F) -> None.  Update D from dict/iterable E and F.
-    If E is present and has a .keys() method, then does:  for k in E: D[k] = E[k]
-    If E is present and lacks a .keys() method, then does:  for k, v in E: D[k] = v
-    In either case, this is followed by: for k in F:  D[k] = F[k]
-    """
-    if E is not None:
-        if hasattr(E, "keys"):
-            for k in E: self[k] = E[k]
-        else:
-            for k,v in E: self[k] = v
-    for k in F: self[k] = F[k]
-    return None
-
-
-def fromkeys(cls, seq, value=None):
-    if not hasattr(seq, '__iter__'):
-        raise TypeError("'%s' object is not iterable" % seq)
-    return cls([(k, value) for k in seq])
-
-
 def dictview_str(dictview):
     if len(dictview):
         s = type(dictview).__name__ + "(["
@@ -75,8 +53,6 @@ def dictview_str(dictview):
         return ""
 
 
-dict.update = update
-dict.fromkeys = classmethod(fromkeys)
 type(dict().keys()).__repr__ = dictview_str
 type(dict().values()).__repr__ = dictview_str
 type(dict().items()).__repr__ = dictview_str
@@ -39,39 +39,6 @@ class repeat():
         return self.obj
 
 
-class chain():
-    """
-    Return a chain object whose .__next__() method returns elements from the
-    first iterable until it is exhausted, then elements from the next
-    iterable, until all of the iterables are exhausted.
-    """
-    def __init__(self, *iterables):
-        self._iterables = iterables
-        self._len = len(iterables)
-        if self._len > 0:
-            self._current = iter(self._iterables[0])
-        self._idx = 0
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        if self._idx >= self._len:
-            raise StopIteration
-        try:
-            return next(self._current)
-        except (StopIteration, IndexError):
-            self._idx += 1
-            if self._idx >= self._len:
-                raise StopIteration
-            self._current = iter(self._iterables[self._idx])
-            return self.__next__()
-
-    @classmethod
-    def from_iterable(cls, arg):
-        return cls(*iter(arg))
-
-
 class starmap():
     """starmap(function, sequence) --> starmap object
 
@@ -90,22 +57,6 @@ class starmap():
         return self.fun(*obj)
 
 
-class islice(object):
-    def __init__(self, iterable, *args):
-        self._iterable = enumerate(iter(iterable))
-        self._indexes = iter(range(*args))
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        index = next(self._indexes) # may raise StopIteration
-        while True:
-            i, element = next(self._iterable) # may raise StopIteration
-            if i == index:
-                return element
-
-
 class count(object):
     def __init__(self, start=0, step=1):
         if not isinstance(start, (int, float)) or \
@@ -368,33 +319,6 @@ class product():
         self.lst = lst
 
 
-class accumulate(object):
-    """
-    "accumulate(iterable) --> accumulate object
-
-    Return series of accumulated sums."""
-
-    def __init__(self, iterable, func=None):
-        self.iterable = iter(iterable)
-        self.func = func
-        self.total = None
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        value = next(self.iterable)
-        if self.total is None:
-            self.total = value
-            return value
-
-        if self.func is None:
-            self.total += value
-        else:
-            self.total = self.func(total, value)
-        return self.total
-
-
 class dropwhile(object):
     """
     dropwhile(predicate, iterable) --> dropwhile object
@@ -472,88 +396,6 @@ class takewhile(object):
         return value
 
 
-class groupby(object):
-    """Make an iterator that returns consecutive keys and groups from the
-    iterable. The key is a function computing a key value for each
-    element. If not specified or is None, key defaults to an identity
-    function and returns the element unchanged. Generally, the
-    iterable needs to already be sorted on the same key function.
-
-    The returned group is itself an iterator that shares the
-    underlying iterable with groupby(). Because the source is shared,
-    when the groupby object is advanced, the previous group is no
-    longer visible. So, if that data is needed later, it should be
-    stored as a list:
-
-       groups = []
-       uniquekeys = []
-       for k, g in groupby(data, keyfunc):
-           groups.append(list(g))      # Store group iterator as a list
-           uniquekeys.append(k)
-    """
-    def __init__(self, iterable, key=None):
-        self._iterator = iter(iterable)
-        self._keyfunc = key
-        self._tgtkey = self._currkey = self._currvalue = None
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        self._skip_to_next_iteration_group()
-        key = self._tgtkey = self._currkey
-        grouper = _groupby(self, key)
-        return (key, grouper)
-
-    def _skip_to_next_iteration_group(self):
-        while True:
-            if self._currkey is None:
-                pass
-            elif self._tgtkey is None:
-                break
-            else:
-                if not self._tgtkey == self._currkey:
-                    break
-
-            newvalue = next(self._iterator)
-            if self._keyfunc is None:
-                newkey = newvalue
-            else:
-                newkey = self._keyfunc(newvalue)
-
-            self._currkey = newkey
-            self._currvalue = newvalue
-
-
-class _groupby():
-    def __init__(self, groupby, tgtkey):
-        self.groupby = groupby
-        self.tgtkey = tgtkey
-
-    def __iter__(self):
-        return self
-
-    def __next__(self):
-        groupby = self.groupby
-        if groupby._currvalue is None:
-            newvalue = next(groupby._iterator)
-            if groupby._keyfunc is None:
-                newkey = newvalue
-            else:
-                newkey = groupby._keyfunc(newvalue)
-            assert groupby._currvalue is None
-            groupby._currkey = newkey
-            groupby._currvalue = newvalue
-
-        assert groupby._currkey is not None
-        if not self.tgtkey == groupby._currkey:
-            raise StopIteration(None)
-        result = groupby._currvalue
-        groupby._currvalue = None
-        groupby._currkey = None
-        return result
-
-
 class combinations():
     """
     combinations(iterable, r) --> combinations object
@@ -645,53 +487,6 @@ class combinations_with_replacement(combinations):
         return self.indices[j - 1]
 
 
-class zip_longest():
-    """
-    zip_longest(iter1 [,iter2 [...]], [fillvalue=None]) --> zip_longest object
-
-    Return a zip_longest object whose .next() method returns a tuple where
-    the i-th element comes from the i-th iterable argument.  The .next()
-    method continues until the longest iterable in the argument sequence
-    is exhausted and then it raises StopIteration.  When the shorter iterables
-    are exhausted, the fillvalue is substituted in their place.  The fillvalue
-    defaults to None or can be specified by a keyword argument.
-    """
-
-    def __iter__(self):
-        return self
-
-    def _fetch(self, index):
-        it = self.iterators[index]
-        if it is not None:
-            try:
-                return next(it)
-            except StopIteration:
-                self.active -= 1
-                if self.active <= 0:
-                    # It was the last active iterator
-                    raise
-                self.iterators[index] = None
-        return self.fillvalue
-
-    def __next__(self):
-        if self.active <= 0:
-            raise StopIteration
-        nb = len(self.iterators)
-        if nb == 0:
-            raise StopIteration
-        result = []
-        for index in range(nb):
-            result.append(self._fetch(index))
-        return tuple(result)
-
-    def __new__(subtype, iter1, *args, fillvalue=None):
-        self = object.__new__(subtype)
-        self.fillvalue = fillvalue
-        self.active = len(args) + 1
-        self.iterators = [iter(iter1)] + [iter(arg) for arg in args]
-        return self
-
-
 class cycle():
     """
     Make an iterator returning elements from the iterable and
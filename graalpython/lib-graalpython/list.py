@@ -43,24 +43,3 @@ def copy(self):
 
 
 list.copy = copy
-
-
-def sort(self, key=None, reverse=False):
-    if reverse:
-        if key:
-            lt = lambda a,b: key(a) > key(b)
-        else:
-            lt = lambda a,b: a > b
-    else:
-        if key:
-            lt = lambda a,b: key(a) < key(b)
-        else:
-            lt = lambda a,b: a < b
-    origLen = len(self)
-    TimSort(self, lt=lt).sort()
-    if(origLen != len(self)):
-        raise ValueError("list modified during sort")
-    return None
-
-
-list.sort = sort
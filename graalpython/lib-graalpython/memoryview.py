@@ -37,34 +37,349 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-# memoryview is mainly implemented in C
-from python_cext import PyTruffle_SetAttr
+# memoryview over bytes, bytearray and mmap is implemented here on top of the
+# exporter's own item access, so it never needs the C API. All other exporters
+# are delegated to the C memoryview in module '_memoryview'.
+from python_cext import PyTruffle_SetAttr, PyTruffle_ByteArray_AddExports
+from _weakref import ReferenceType
 
 
 c_memoryview_module = None
+mmap_type = None
 
 
-def __memoryview_init(self, *args, **kwargs):
-    import _memoryview
+def _c_memoryview_module():
     global c_memoryview_module
-    c_memoryview_module = _memoryview
-    PyTruffle_SetAttr(memoryview, "__init__", __memoryview_init2)
-    return __memoryview_init2(self, *args, **kwargs)
+    if c_memoryview_module is None:
+        import _memoryview
+        c_memoryview_module = _memoryview
+    return c_memoryview_module
 
 
-def __memoryview_init2(self, *args, **kwargs):
-    # NOTE: DO NOT CHANGE THE NAME OF PROPERTY '__c_memoryview'
-    # it is also referenced in native code and Java code
-    if args and isinstance(args[0], c_memoryview_module.nativememoryview):
+def _is_managed_exporter(obj):
+    global mmap_type
+    if isinstance(obj, (bytes, bytearray)):
+        return True
+    if mmap_type is None:
+        import mmap
+        mmap_type = mmap.mmap
+    return isinstance(obj, mmap_type)
+
+
+_byte_formats = ("B", "b", "c")
+
+
+# A bytearray cannot be resized while views of it exist. The exports of live views
+# are kept here by the id of a weak reference to the view, so that a view that is
+# collected without being released still gives up its export.
+_exports = {}
+
+
+def _add_export(view, obj):
+    PyTruffle_ByteArray_AddExports(obj, 1)
+    ref = ReferenceType(view, _release_export)
+    _exports[id(ref)] = (ref, obj)
+    return ref
+
+
+def _release_export(ref):
+    entry = _exports.pop(id(ref), None)
+    if entry is not None:
+        PyTruffle_ByteArray_AddExports(entry[1], -1)
+
+
+class _ManagedView():
+    """
+    A one-dimensional view of items start, start + step, ... of a byte-addressed
+    exporter. Slicing creates a new view on the same exporter without copying.
+    """
+
+    def __init__(self, obj, start, step, length, fmt, readonly):
+        self.obj = obj
+        self.start = start
+        self.step = step
+        self.length = length
+        self.fmt = fmt
+        self.is_readonly = readonly
+        self.released = False
+        self.native = None
+        self.export = _add_export(self, obj) if isinstance(obj, bytearray) else None
+
+    def check_released(self):
+        if self.released:
+            raise ValueError("operation forbidden on released memoryview object")
+
+    def is_contiguous(self):
+        self.check_released()
+        return self.step == 1 or self.length <= 1
+
+    def bytearray_window(self):
+        """
+        Returns (bytearray, start, length) if this is a writable, contiguous view of
+        a bytearray, so that its items can be written directly. Otherwise None.
+        """
+        if self.released or self.is_readonly or not isinstance(self.obj, bytearray):
+            return None
+        if not self.is_contiguous():
+            return None
+        return (self.obj, self.start, self.length)
+
+    def _slice(self):
+        if self.length == 0:
+            return slice(0, 0)
+        stop = self.start + self.length * self.step
+        return slice(self.start, stop if stop >= 0 else None, self.step)
+
+    def _unpack(self, value):
+        fmt = self.fmt
+        if fmt == "B":
+            return value
+        elif fmt == "b":
+            return value - 256 if value > 127 else value
+        return bytes((value,))
+
+    def _pack(self, value):
+        fmt = self.fmt
+        if fmt == "c":
+            if not isinstance(value, bytes):
+                raise TypeError("memoryview: invalid type for format 'c'")
+            if len(value) != 1:
+                raise ValueError("memoryview: invalid value for format 'c'")
+            return value[0]
+        if not hasattr(type(value), "__index__"):
+            raise TypeError("memoryview: invalid type for format '%s'" % fmt)
+        value = value.__index__()
+        if fmt == "B" and 0 <= value <= 255:
+            return value
+        elif fmt == "b" and -128 <= value <= 127:
+            return value & 0xff
+        raise ValueError("memoryview: invalid value for format '%s'" % fmt)
+
+    def _index(self, key):
+        if isinstance(key, tuple):
+            if key and all(isinstance(k, slice) for k in key):
+                raise NotImplementedError("multi-dimensional slicing is not implemented")
+            if len(key) != 1:
+                raise TypeError("cannot index 1-dimension view with %d-element tuple" % len(key))
+            key = key[0]
+        if not hasattr(type(key), "__index__"):
+            raise TypeError("memoryview: invalid slice key")
+        idx = key.__index__()
+        if idx < 0:
+            idx += self.length
+        if not 0 <= idx < self.length:
+            raise IndexError("index out of bounds on dimension 1")
+        return self.start + idx * self.step
+
+    def __len__(self):
+        self.check_released()
+        return self.length
+
+    def __getitem__(self, key):
+        self.check_released()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            return _ManagedView(self.obj, self.start + start * self.step, self.step * step,
+                                len(range(start, stop, step)), self.fmt, self.is_readonly)
+        elif key is Ellipsis:
+            return _ManagedView(self.obj, self.start, self.step, self.length, self.fmt, self.is_readonly)
+        return self._unpack(self.obj[self._index(key)])
+
+    def __setitem__(self, key, value):
+        self.check_released()
+        if self.is_readonly:
+            raise TypeError("cannot modify read-only memory")
+        if not isinstance(key, slice):
+            idx = self._index(key)
+            self.obj[idx] = self._pack(value)
+            return
+        start, stop, step = key.indices(self.length)
+        n = len(range(start, stop, step))
+        if isinstance(value, memoryview):
+            if value.format.lstrip("@") != self.fmt or value.ndim != 1:
+                raise ValueError("memoryview assignment: lvalue and rvalue have different structures")
+            data = value.tobytes()
+        elif isinstance(value, (bytes, bytearray)):
+            if self.fmt == "c":
+                raise ValueError("memoryview assignment: lvalue and rvalue have different structures")
+            data = bytes(value)
+        else:
+            data = memoryview(value).tobytes()
+        if len(data) != n:
+            raise ValueError("memoryview assignment: lvalue and rvalue have different structures")
+        first = self.start + start * self.step
+        total_step = self.step * step
+        if total_step == 1:
+            self.obj[first:first + n] = data
+        else:
+            obj = self.obj
+            for i in range(n):
+                obj[first + i * total_step] = data[i]
+
+    def tobytes(self, order=None):
+        self.check_released()
+        return bytes(self.obj[self._slice()])
+
+    def tolist(self):
+        data = self.tobytes()
+        if self.fmt == "B":
+            return list(data)
+        return [self._unpack(b) for b in data]
+
+    def hex(self):
+        return self.tobytes().hex()
+
+    def cast(self, fmt, shape=None):
+        self.check_released()
+        if not self.is_contiguous():
+            raise TypeError("memoryview: casts are restricted to C-contiguous views")
+        if isinstance(fmt, str) and fmt.lstrip("@") in _byte_formats and shape in (None, [self.length], (self.length,)):
+            return _ManagedView(self.obj, self.start, 1, self.length, fmt.lstrip("@"), self.is_readonly)
+        native = self.to_native()
+        return native.cast(fmt) if shape is None else native.cast(fmt, shape)
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            if self.export is not None:
+                _release_export(self.export)
+                self.export = None
+            if self.native is not None:
+                self.native.release()
+
+    def to_native(self):
+        self.check_released()
+        if self.native is None:
+            native = _c_memoryview_module().nativememoryview(self.obj)
+            if self.start != 0 or self.step != 1 or self.length != len(native):
+                native = native[self._slice()]
+            if self.fmt != "B":
+                native = native.cast(self.fmt)
+            self.native = native
+        return self.native
+
+    @property
+    def format(self):
+        self.check_released()
+        return self.fmt
+
+    @property
+    def readonly(self):
+        self.check_released()
+        return self.is_readonly
+
+    @property
+    def nbytes(self):
+        self.check_released()
+        return self.length
+
+    @property
+    def itemsize(self):
+        self.check_released()
+        return 1
+
+    @property
+    def ndim(self):
+        self.check_released()
+        return 1
+
+    @property
+    def shape(self):
+        self.check_released()
+        return (self.length,)
+
+    @property
+    def strides(self):
+        self.check_released()
+        return (self.step,)
+
+    @property
+    def suboffsets(self):
+        self.check_released()
+        return ()
+
+    c_contiguous = f_contiguous = contiguous = property(is_contiguous)
+
+
+def _delegate(mv):
+    # NOTE: DO NOT CHANGE THE NAME OF PROPERTY '__memoryview_delegate'
+    return mv.__memoryview_delegate
+
+
+def _is_view(obj):
+    return type(obj) is _ManagedView or (c_memoryview_module is not None and isinstance(obj, c_memoryview_module.nativememoryview))
+
+
+def __memoryview_init(self, object):
+    if _is_view(object):
         # wrapping case
-        PyTruffle_SetAttr(self, "__c_memoryview", args[0])
+        delegate = object
+    elif _is_managed_exporter(object):
+        delegate = _ManagedView(object, 0, 1, len(object), "B", isinstance(object, bytes))
     else:
-        PyTruffle_SetAttr(self, "__c_memoryview", c_memoryview_module.nativememoryview(*args, **kwargs))
+        delegate = _c_memoryview_module().nativememoryview(object)
+    PyTruffle_SetAttr(self, "__memoryview_delegate", delegate)
+
+
+def __memoryview_c_memoryview(self):
+    # NOTE: DO NOT CHANGE THE NAME OF PROPERTY '__c_memoryview'
+    # it is also referenced in native code and Java code; managed views create
+    # their native counterpart only once it is requested here
+    delegate = _delegate(self)
+    if type(delegate) is _ManagedView:
+        return delegate.to_native()
+    return delegate
+
+
+def __memoryview_bytearray_window(self):
+    # NOTE: DO NOT CHANGE THE NAME OF PROPERTY '__bytearray_window'
+    # it is read by Java code (socket.recv_into) to receive into the bytearray directly
+    delegate = _delegate(self)
+    if type(delegate) is _ManagedView:
+        return delegate.bytearray_window()
+    return None
 
 
 def __memoryview_getitem(self, key):
-    res = self.__c_memoryview.__getitem__(key)
-    return memoryview(res) if isinstance(res, type(self.__c_memoryview)) else res
+    res = _delegate(self).__getitem__(key)
+    return memoryview(res) if _is_view(res) else res
+
+
+def __memoryview_enter(self):
+    delegate = _delegate(self)
+    if type(delegate) is _ManagedView:
+        delegate.check_released()
+    else:
+        delegate.__enter__()
+    return self
+
+
+def __memoryview_exit(self, exc_type, exc_value, traceback):
+    _delegate(self).release()
+
+
+def __memoryview_eq(self, other):
+    if self is other:
+        return True
+    if not isinstance(other, memoryview):
+        try:
+            other = memoryview(other)
+        except TypeError:
+            return NotImplemented
+    try:
+        return self.shape == other.shape and self.tolist() == other.tolist()
+    except ValueError:
+        # at least one of them was released
+        return False
+
+
+def __memoryview_repr(self):
+    delegate = _delegate(self)
+    if type(delegate) is _ManagedView and delegate.released:
+        return "<released memory at 0x%x>" % id(self)
+    elif type(delegate) is _ManagedView:
+        return "<memory at 0x%x>" % id(self)
+    return delegate.__repr__()
 
 
 getsetdescriptor = type(type(__memoryview_init).__code__)
@@ -72,7 +387,7 @@ getsetdescriptor = type(type(__memoryview_init).__code__)
 
 def make_property(name):
     def getter(self):
-        return getattr(self.__c_memoryview, name)
+        return getattr(_delegate(self), name)
 
     error_string = "attribute '%s' of 'memoryview' objects is not writable" % name
     def setter(self, value):
@@ -88,17 +403,22 @@ for p in ["nbytes", "readonly", "itemsize", "format", "ndim", "shape", "strides"
 
 def make_delegate0(p):
     def delegate(self):
-        return getattr(self.__c_memoryview, p)()
+        return getattr(_delegate(self), p)()
     delegate.__name__ = p
     return delegate
 
-for p in ["__repr__", "__len__", "release", "tobytes", "hex", "tolist", "__enter__"]:
+for p in ["__len__", "release", "tobytes", "hex", "tolist"]:
     setattr(memoryview, p, make_delegate0(p))
 
 
 # other delegate methods
 memoryview.__init__ = __memoryview_init
+memoryview.__c_memoryview = getsetdescriptor(fget=__memoryview_c_memoryview, name="__c_memoryview", owner=memoryview)
+memoryview.__bytearray_window = getsetdescriptor(fget=__memoryview_bytearray_window, name="__bytearray_window", owner=memoryview)
 memoryview.__getitem__ = __memoryview_getitem
-memoryview.__setitem__ = lambda self, key, value: self.__c_memoryview.__setitem__(key, value)
-memoryview.cast = lambda self, *args: memoryview(self.__c_memoryview.cast(*args))
-memoryview.__exit__ = lambda self, exc_type, exc_value, traceback: self.__c_memoryview.__exit__(exc_type, exc_value, traceback)
+memoryview.__setitem__ = lambda self, key, value: _delegate(self).__setitem__(key, value)
+memoryview.cast = lambda self, *args: memoryview(_delegate(self).cast(*args))
+memoryview.__enter__ = __memoryview_enter
+memoryview.__exit__ = __memoryview_exit
+memoryview.__eq__ = __memoryview_eq
+memoryview.__repr__ = __memoryview_repr
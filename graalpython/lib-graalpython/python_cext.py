@@ -135,15 +135,11 @@ def PyDict_New():
 def PyDict_Next(dictObj, pos):
     if not isinstance(dictObj, dict):
         return native_null
-    curPos = 0
-    max = len(dictObj)
-    if pos >= max:
+    entry = PyTruffle_Dict_Next(dictObj, pos)
+    if entry is None:
         return native_null
-    for key in dictObj:
-        if curPos == pos:
-            return key, dictObj[key], hash(key)
-        curPos = curPos + 1
-    return native_null
+    key, value, next_pos = entry
+    return key, value, hash(key), next_pos
 
 
 @may_raise(-1)
@@ -0,0 +1,285 @@
+# Copyright (c) 2019, Oracle and/or its affiliates. All rights reserved.
+# DO NOT ALTER OR REMOVE COPYRIGHT NOTICES OR THIS FILE HEADER.
+#
+# The Universal Permissive License (UPL), Version 1.0
+#
+# Subject to the condition set forth below, permission is hereby granted to any
+# person obtaining a copy of this software, associated documentation and/or
+# data (collectively the "Software"), free of charge and under any and all
+# copyright rights in the Software, and any and all patent rights owned or
+# freely licensable by each licensor hereunder covering either (i) the
+# unmodified Software as contributed to or provided by such licensor, or (ii)
+# the Larger Works (as defined below), to deal in both
+#
+# (a) the Software, and
+#
+# (b) any piece of software and/or hardware listed in the lrgrwrks.txt file if
+# one is included with the Software each a "Larger Work" to which the Software
+# is contributed by such licensors),
+#
+# without restriction, including without limitation the rights to copy, create
+# derivative works of, display, perform, and distribute the Software and make,
+# use, sell, offer for sale, import, export, have made, and have sold the
+# Software and the Larger Work(s), and to sublicense the foregoing rights on
+# either these or other terms.
+#
+# This license is subject to the following condition:
+#
+# The above copyright notice and either this complete permission notice or at a
+# minimum a reference to the UPL must be included in all copies or substantial
+# portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys as _sys
+
+_os = _sys.modules.get("posix", _sys.modules.get("nt"))
+
+error = OSError
+
+POLLIN = 0x001
+POLLPRI = 0x002
+POLLOUT = 0x004
+POLLERR = 0x008
+POLLHUP = 0x010
+POLLNVAL = 0x020
+POLLRDNORM = 0x040
+POLLRDBAND = 0x080
+POLLWRNORM = 0x100
+POLLWRBAND = 0x200
+POLLMSG = 0x400
+POLLRDHUP = 0x2000
+
+EPOLLIN = POLLIN
+EPOLLPRI = POLLPRI
+EPOLLOUT = POLLOUT
+EPOLLERR = POLLERR
+EPOLLHUP = POLLHUP
+EPOLLRDNORM = POLLRDNORM
+EPOLLRDBAND = POLLRDBAND
+EPOLLWRNORM = POLLWRNORM
+EPOLLWRBAND = POLLWRBAND
+EPOLLMSG = POLLMSG
+EPOLLRDHUP = POLLRDHUP
+EPOLLEXCLUSIVE = 1 << 28
+EPOLLONESHOT = 1 << 30
+EPOLLET = 1 << 31
+EPOLL_CLOEXEC = 0o2000000
+
+_READ_EVENTS = POLLIN | POLLPRI | POLLRDNORM | POLLRDBAND
+_WRITE_EVENTS = POLLOUT | POLLWRNORM | POLLWRBAND
+
+
+def _fileno(obj):
+    if isinstance(obj, int):
+        fd = obj
+    else:
+        try:
+            fileno = obj.fileno
+        except AttributeError:
+            raise TypeError("argument must be an int, or have a fileno() method.")
+        fd = fileno()
+        if not isinstance(fd, int):
+            raise TypeError("fileno() returned a non-integer")
+    if fd < 0:
+        raise ValueError("file descriptor cannot be a negative integer (%d)" % fd)
+    return fd
+
+
+def _ceil(value):
+    # round up to wait *at least* the given time
+    result = int(value)
+    if result < value:
+        result += 1
+    return result
+
+
+def _to_millis(seconds):
+    return _ceil(seconds * 1000)
+
+
+def _events(mask):
+    # only readability and writability can be waited for on Java channels
+    events = 0
+    if mask & _READ_EVENTS:
+        events |= POLLIN
+    if mask & _WRITE_EVENTS:
+        events |= POLLOUT
+    return events
+
+
+def _wait(registered, timeout):
+    # 'registered' maps fds to event masks, 'timeout' is in milliseconds
+    fds = list(registered)
+    return _poll(fds, [_events(registered[fd]) for fd in fds], timeout)
+
+
+def _check_epoll_events(eventmask, modify):
+    if eventmask & EPOLLET:
+        # a Java selector only reports whether a channel is ready, not whether it became
+        # ready since the last wait
+        raise NotImplementedError("edge-triggered notification (EPOLLET) is not supported")
+    # EPOLLEXCLUSIVE has no effect otherwise, because every epoll object waits on its own
+    # selector and so a wakeup is never shared with other epoll objects
+    if eventmask & EPOLLEXCLUSIVE and (modify or eventmask & EPOLLONESHOT):
+        raise OSError(22, "Invalid argument")
+
+
+# Java channels cannot report exceptional conditions like out-of-band data, so the
+# fds in 'xlist' are only checked to be valid and are never returned as ready.
+def select(rlist, wlist, xlist, timeout=None):
+    if timeout is None:
+        millis = -1
+    else:
+        if timeout < 0:
+            raise ValueError("timeout must be non-negative")
+        millis = _to_millis(timeout)
+    rlist = [(_fileno(obj), obj) for obj in rlist]
+    wlist = [(_fileno(obj), obj) for obj in wlist]
+    xlist = [(_fileno(obj), obj) for obj in xlist]
+    registered = {}
+    for fd, _ in xlist:
+        registered[fd] = 0
+    for fd, _ in rlist:
+        registered[fd] = registered.get(fd, 0) | POLLIN
+    for fd, _ in wlist:
+        registered[fd] = registered.get(fd, 0) | POLLOUT
+    ready = {}
+    for fd, revents in _wait(registered, millis):
+        if revents & POLLNVAL:
+            raise OSError(9, "Bad file descriptor")
+        ready[fd] = revents
+    return ([obj for fd, obj in rlist if ready.get(fd, 0) & (POLLIN | POLLERR)],
+            [obj for fd, obj in wlist if ready.get(fd, 0) & (POLLOUT | POLLERR)],
+            [])
+
+
+class poll(object):
+    _fd = -1
+
+    def __init__(self):
+        self._registered = {}
+        # the poller keeps the channels registered between calls of 'poll'
+        self._fd = _poller()
+
+    def __del__(self):
+        if self._fd >= 0:
+            _os.close(self._fd)
+
+    def register(self, fd, eventmask=POLLIN | POLLPRI | POLLOUT):
+        fd = _fileno(fd)
+        _poller_register(self._fd, fd, _events(eventmask))
+        self._registered[fd] = eventmask
+
+    def modify(self, fd, eventmask):
+        fd = _fileno(fd)
+        if fd not in self._registered:
+            raise FileNotFoundError(2, "No such file or directory")
+        _poller_register(self._fd, fd, _events(eventmask))
+        self._registered[fd] = eventmask
+
+    def unregister(self, fd):
+        fd = _fileno(fd)
+        del self._registered[fd]
+        _poller_unregister(self._fd, fd)
+
+    def poll(self, timeout=None):
+        # unlike the other timeouts in this module, this one is in milliseconds
+        if timeout is None:
+            millis = -1
+        elif not isinstance(timeout, (int, float)):
+            raise TypeError("timeout must be an integer or None")
+        elif timeout < 0:
+            millis = -1
+        else:
+            millis = _ceil(timeout)
+        return _poller_wait(self._fd, millis)
+
+
+class epoll(object):
+    _fd = -1
+
+    def __init__(self, sizehint=-1, flags=0):
+        if sizehint == 0 or sizehint < -1:
+            raise ValueError("negative sizehint")
+        self._registered = {}
+        self._fd = _poller()
+
+    def __del__(self):
+        self.close()
+
+    def _check_closed(self):
+        if self._fd < 0:
+            raise ValueError("I/O operation on closed epoll object")
+
+    @property
+    def closed(self):
+        return self._fd < 0
+
+    def close(self):
+        if self._fd >= 0:
+            fd = self._fd
+            self._fd = -1
+            self._registered.clear()
+            _os.close(fd)
+
+    def fileno(self):
+        self._check_closed()
+        return self._fd
+
+    def register(self, fd, eventmask=EPOLLIN | EPOLLPRI | EPOLLOUT):
+        self._check_closed()
+        fd = _fileno(fd)
+        if fd in self._registered:
+            raise FileExistsError(17, "File exists")
+        _check_epoll_events(eventmask, False)
+        _poller_register(self._fd, fd, _events(eventmask))
+        self._registered[fd] = eventmask
+
+    def modify(self, fd, eventmask):
+        self._check_closed()
+        fd = _fileno(fd)
+        if fd not in self._registered:
+            raise FileNotFoundError(2, "No such file or directory")
+        # an fd registered with EPOLLEXCLUSIVE cannot be modified either
+        _check_epoll_events(eventmask | (self._registered[fd] & EPOLLEXCLUSIVE), True)
+        _poller_register(self._fd, fd, _events(eventmask))
+        self._registered[fd] = eventmask
+
+    def unregister(self, fd):
+        self._check_closed()
+        fd = _fileno(fd)
+        if fd not in self._registered:
+            raise FileNotFoundError(2, "No such file or directory")
+        del self._registered[fd]
+        _poller_unregister(self._fd, fd)
+
+    def poll(self, timeout=-1, maxevents=-1):
+        self._check_closed()
+        if timeout is None or timeout < 0:
+            millis = -1
+        else:
+            millis = _to_millis(timeout)
+        if maxevents == 0 or maxevents < -1:
+            raise ValueError("maxevents must be greater than 0, got %d" % maxevents)
+        result = _poller_wait(self._fd, millis)
+        if maxevents != -1:
+            result = result[:maxevents]
+        for fd, _ in result:
+            if self._registered[fd] & EPOLLONESHOT:
+                # disabled until it is re-armed with 'modify'
+                _poller_register(self._fd, fd, 0)
+        return result
+
+    def __enter__(self):
+        self._check_closed()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
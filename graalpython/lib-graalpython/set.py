@@ -38,46 +38,6 @@
 # SOFTWARE.
 
 
-def update(self, *others):
-    for seq in others:
-        if not hasattr(seq, '__iter__'):
-            raise TypeError("'%s' object is not iterable" % seq)
-        iterator = seq.__iter__()
-        for el in iterator:
-            self.add(el)
-
-
-def difference(self, *others):
-    diff_set = self
-    for seq in others:
-        diff_set = set(el for el in diff_set if el not in set(seq))
-    return diff_set
-
-
-def difference_update(self, *others):
-    for seq in others:
-        other_set = set(seq)
-        self_copy = set(self)
-        for el in self_copy:
-            if el in other_set:
-                self.remove(el)
-
-
-def frozenset_difference(self, *others):
-    return frozenset(difference(self, *others))
-
-
-def intersection(self, *others):
-    intersect_set = self
-    for seq in others:
-        intersect_set = set(el for el in intersect_set if el in set(seq))
-    return intersect_set
-
-
-def frozenset_intersection(self, *others):
-    return frozenset(intersection(self, *others))
-
-
 def set_repr(self):
     if len(self):
         s = "{"
@@ -116,14 +76,8 @@ def frozenset_copy(self):
     return frozenset(self)
 
 
-set.update = update
-set.difference = difference
-set.difference_update = difference_update
-set.intersection = intersection
 set.__repr__ = set_repr
 set.copy = set_copy
 
-frozenset.difference = frozenset_difference
-frozenset.intersection = frozenset_intersection
 frozenset.__repr__ = frozenset_repr
 frozenset.copy = frozenset_copy
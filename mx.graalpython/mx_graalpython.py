@@ -41,8 +41,8 @@ import mx_unittest
 import mx_sdk
 import mx_subst
 from mx_gate import Task
-from mx_graalpython_bench_param import PATH_MESO, BENCHMARKS
-from mx_graalpython_benchmark import PythonBenchmarkSuite, python_vm_registry, CPythonVm, PyPyVm, GraalPythonVm, \
+from mx_graalpython_bench_param import PATH_MESO, BENCHMARKS, STARTUP_BENCHMARK_SUITES
+from mx_graalpython_benchmark import PythonBenchmarkSuite, PythonStartupBenchmarkSuite, python_vm_registry, CPythonVm, PyPyVm, GraalPythonVm, \
     CONFIGURATION_DEFAULT, CONFIGURATION_SANDBOXED, CONFIGURATION_NATIVE, \
     CONFIGURATION_DEFAULT_MULTI, CONFIGURATION_SANDBOXED_MULTI, CONFIGURATION_NATIVE_MULTI
 
@@ -1070,6 +1070,8 @@ def _register_vms(namespace):
 def _register_bench_suites(namespace):
     for py_bench_suite in PythonBenchmarkSuite.get_benchmark_suites(BENCHMARKS):
         mx_benchmark.add_bm_suite(py_bench_suite)
+    for py_bench_suite in PythonStartupBenchmarkSuite.get_benchmark_suites(STARTUP_BENCHMARK_SUITES):
+        mx_benchmark.add_bm_suite(py_bench_suite)
 
 
 def mx_post_parse_cmd_line(namespace):
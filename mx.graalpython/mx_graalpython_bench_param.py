@@ -39,6 +39,8 @@ PATH_MACRO = os.path.join(_BASE_PATH, 'macro')
 
 PATH_INTEROP = os.path.join(_BASE_PATH, 'host_interop')
 
+PATH_STARTUP = os.path.join(_BASE_PATH, 'startup')
+
 # ----------------------------------------------------------------------------------------------------------------------
 #
 # the python micro benchmarks
@@ -62,6 +64,9 @@ MICRO_BENCHMARKS = {
     'class_access': ITER_15 + ['1000'],
     'call-method-polymorphic': ITER_10 + ['1000'],
     'for-range': ITER_15 + ['50000'],
+    'itertools-chain': ITER_10 + ['10000'],
+    'itertools-groupby': ITER_10 + ['1000'],
+    'itertools-islice': ITER_10 + ['10000'],
     'function-call': ITER_10 + [],
     'generator-expression': ITER_10 + [],
     'generator-notaligned': ITER_10 + [],
@@ -153,6 +158,12 @@ INTEROP_BENCHMARKS = {
     'image-magix-java': ITER_10 + ['10000'],
 }
 
+# each iteration of a startup benchmark runs in a new process
+STARTUP_BENCHMARKS = {
+    'startup-hello': ITER_10 + [],
+    'startup-imports': ITER_10 + [],
+}
+
 # ----------------------------------------------------------------------------------------------------------------------
 #
 # the benchmarks
@@ -165,3 +176,7 @@ BENCHMARKS = {
     "macro": [PATH_MACRO, MACRO_BENCHMARKS],
     "interop": [PATH_INTEROP, INTEROP_BENCHMARKS],
 }
+
+STARTUP_BENCHMARK_SUITES = {
+    "startup": [PATH_STARTUP, STARTUP_BENCHMARKS],
+}
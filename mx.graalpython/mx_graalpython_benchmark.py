@@ -25,6 +25,7 @@ from __future__ import print_function
 
 import os
 import re
+import time
 from abc import ABCMeta, abstractproperty, abstractmethod
 from os.path import join
 
@@ -517,3 +518,37 @@ class PythonBenchmarkSuite(VmBenchmarkSuite, AveragingBenchmarkMixin):
         assert isinstance(benchmarks, dict), "benchmarks must be a dict: {suite: [path, {bench: args, ... }], ...}"
         return [cls(suite_name, suite_info[0], suite_info[1])
                 for suite_name, suite_info in benchmarks.items()]
+
+
+class PythonStartupBenchmarkSuite(PythonBenchmarkSuite):
+    """
+    Measures the wall-clock time of complete VM runs. Each benchmark is a short script that is executed directly (not
+    through the harness) in a new process per iteration, so the reported durations include context creation and
+    the loading of the core library.
+    """
+
+    def createVmCommandLineArgs(self, benchmarks, bmSuiteArgs):
+        if not benchmarks or len(benchmarks) != 1:
+            mx.abort("Please run a specific benchmark (mx benchmark {}:<benchmark-name>) or all the benchmarks "
+                     "(mx benchmark {}:*)".format(self.name(), self.name()))
+        vm_options, _ = self.postprocess_run_args(self.runArgs(bmSuiteArgs))
+        return vm_options + self.vmArgs(bmSuiteArgs) + [join(self._bench_path, "{}.py".format(benchmarks[0]))]
+
+    def _iterations(self, benchmark, bmSuiteArgs):
+        run_args = self.runArgs(bmSuiteArgs)
+        if "-i" in run_args and run_args.index("-i") + 1 < len(run_args):
+            return int(run_args[run_args.index("-i") + 1])
+        return self.defaultIterations(benchmark) + self.getExtraIterationCount(self.defaultIterations(benchmark))
+
+    def runAndReturnStdOut(self, benchmarks, bmSuiteArgs):
+        benchmark = benchmarks[0]
+        lines = []
+        ret_code, out, dims = 0, "", {}
+        for iteration in range(self._iterations(benchmark, bmSuiteArgs)):
+            start = time.time()
+            ret_code, out, dims = super(PythonStartupBenchmarkSuite, self).runAndReturnStdOut(benchmarks, bmSuiteArgs)
+            duration = time.time() - start
+            if ret_code != 0:
+                return ret_code, out, dims
+            lines.append("### iteration={}, name={}, duration={:.6f}".format(iteration, benchmark, duration))
+        return ret_code, "\n".join(lines) + "\n", dims